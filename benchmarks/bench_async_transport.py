@@ -0,0 +1,96 @@
+"""
+bench_async_transport.py:
+
+Measures bytes/second received by transport clients from a local tcp server streaming framed downlink traffic to all
+registered clients. ThreadedTCPSocketClient, running a receive thread per client, is compared against
+AsyncTCPSocketClient, sharing one event loop thread between all clients. Timing starts once all clients are registered
+and stops when every client has dispatched all bytes to its registrant.
+"""
+import argparse
+import socket
+import threading
+
+from bench_utils import build_dictionaries, make_traffic, report, timed
+from fprime_gds.common.async_transport import AsyncTCPSocketClient, EventLoopThread
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.common.transport import RoutingTag, ThreadedTCPSocketClient
+
+
+class Counter(DataHandler):
+    """Registrant counting the bytes and batches it receives"""
+
+    def __init__(self, expected):
+        self.expected = expected
+        self.size = 0
+        self.batches = 0
+        self.done = threading.Event()
+
+    def data_callback(self, data, sender=None):
+        self.size += len(data)
+        self.batches += 1
+        if self.size >= self.expected:
+            self.done.set()
+
+
+def stream(clients, factory, data, repeat):
+    """Connect clients built by factory to a local server streaming data to each, returning the batches received"""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(clients)
+    counters = [Counter(len(data) * repeat) for _ in range(clients)]
+    connected = []
+    for counter in counters:
+        client = factory()
+        client.register(counter)
+        client.connect(f"tcp://127.0.0.1:{server.getsockname()[1]}", RoutingTag.GUI, RoutingTag.FSW)
+        connection, _ = server.accept()
+        connection.recv(100)
+        connected.append((client, connection))
+
+    def send(connection):
+        for _ in range(repeat):
+            connection.sendall(data)
+
+    def run():
+        senders = [threading.Thread(target=send, args=(connection,)) for _, connection in connected]
+        for sender in senders:
+            sender.start()
+        for counter in counters:
+            counter.done.wait()
+        for sender in senders:
+            sender.join()
+
+    elapsed, _ = timed(run)
+    # Close the server side first, as threaded clients wait on their sockets while disconnecting
+    for client, connection in connected:
+        connection.close()
+        client.disconnect()
+    server.close()
+    return elapsed, sum(counter.batches for counter in counters)
+
+
+def main():
+    """Run the async transport benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000, help="Number of messages in the streamed traffic")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times the traffic is streamed to each client")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16], help="Client counts to measure")
+    args = parser.parse_args()
+
+    channels, events = build_dictionaries()
+    data = b"".join(make_traffic(args.messages, channels, events))
+    loop_thread = EventLoopThread()
+    for clients in args.clients:
+        total = len(data) * args.repeat * clients
+        for name, factory in [
+            ("ThreadedTCPSocketClient", ThreadedTCPSocketClient),
+            ("AsyncTCPSocketClient", lambda: AsyncTCPSocketClient(loop_thread)),
+        ]:
+            elapsed, batches = stream(clients, factory, data, args.repeat)
+            report(f"{name} x{clients}", total, elapsed, unit="bytes")
+            print(f"{'':<40} {batches:>10} batches dispatched")
+    loop_thread.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+bench_checksum.py:
+
+Measures the CFDP checksum throughput. The bulk CFDPChecksum is compared against the previous implementation, which
+unpacked one padded word at a time. Data is checksummed in chunks as the file uplink does, and a file is checksummed
+whole through the memory mapped CFDPChecksum.from_file.
+"""
+import argparse
+import os
+import struct
+import tempfile
+
+from bench_utils import report, timed
+from fprime_gds.common.files.helpers import CFDPChecksum
+
+
+class WordwiseChecksum:
+    """Checksum unpacking a padded word at a time, as CFDPChecksum used to"""
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, data, offset):
+        while data:
+            padding_len = offset % 4
+            calc_bytes = bytes([0] * padding_len) + data[: 4 - padding_len] + bytes([0, 0, 0, 0])
+            self.value = (self.value + struct.unpack_from(">I", calc_bytes, 0)[0]) & 0xFFFFFFFF
+            data = data[4 - padding_len :]
+            offset = offset + (4 - padding_len)
+
+
+def run(checksum_type, data, chunk):
+    """Checksum data in chunks returning the number of bytes checksummed"""
+    checksum = checksum_type()
+    for offset in range(0, len(data), chunk):
+        checksum.update(data[offset : offset + chunk], offset)
+    return len(data)
+
+
+def main():
+    """Run the checksum benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=4 * 1024 * 1024, help="Bytes checksummed in chunks")
+    parser.add_argument("--chunk", type=int, default=256, help="Bytes per chunk, as per file uplink packet")
+    parser.add_argument("--file-size", type=int, default=256 * 1024 * 1024, help="Bytes of the file checksummed")
+    args = parser.parse_args()
+
+    data = os.urandom(args.size)
+    for name, checksum_type in [("wordwise", WordwiseChecksum), ("bulk", CFDPChecksum)]:
+        elapsed, count = timed(run, checksum_type, data, args.chunk)
+        report(f"{name} {args.chunk} byte chunks", count, elapsed, unit="bytes")
+
+    with tempfile.NamedTemporaryFile() as file_handle:
+        block = os.urandom(1024 * 1024)
+        for _ in range(args.file_size // len(block)):
+            file_handle.write(block)
+        file_handle.flush()
+        elapsed, _ = timed(CFDPChecksum.from_file, file_handle.name)
+        report("bulk file (mmap)", os.path.getsize(file_handle.name), elapsed, unit="bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+bench_chrono_history.py:
+
+Measures inserts/second into ChronologicalHistory for a stream of FSW times that is mostly in-order with occasional
+out-of-order items, then time-indexed retrieval. The previous reverse-scan insertion, which copied the history on every
+insert, is run for comparison over a smaller count as it is quadratic.
+"""
+import argparse
+import random
+
+from bench_utils import report, timed
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.history.chrono import ChronologicalHistory
+
+
+class Item:
+    """Minimal history item carrying a time"""
+
+    def __init__(self, time):
+        self.time = time
+
+    def get_time(self):
+        return self.time
+
+
+def build_items(count, out_of_order, seed=0):
+    """Build items with increasing times, a fraction of which are moved back in time"""
+    rng = random.Random(seed)
+    items = []
+    for index in range(count):
+        micros = index * 1000
+        if rng.random() < out_of_order:
+            micros = max(0, micros - rng.randrange(1000000))
+        items.append(Item(TimeType(2, 0, micros // 1000000, micros % 1000000)))
+    return items
+
+
+def legacy_insert(data_object, ordered):
+    """Previous insertion scanning a reversed copy of the history"""
+    for i, item in reversed(list(enumerate(ordered))):
+        if item.get_time() < data_object.get_time():
+            ordered.insert(i + 1, data_object)
+            return i
+    ordered.insert(0, data_object)
+    return 0
+
+
+def insert_all(history, items):
+    """Insert every item into the history"""
+    for item in items:
+        history.data_callback(item)
+
+
+def legacy_insert_all(items):
+    """Insert every item using the legacy algorithm into both lists as the history did"""
+    objects, new_objects = [], []
+    for item in items:
+        legacy_insert(item, new_objects)
+        legacy_insert(item, objects)
+
+
+def retrieve_all(history, starts):
+    """Retrieve the history from each start time returning the number of retrieved items"""
+    return sum(len(history.retrieve(start)) for start in starts)
+
+
+def main():
+    """Run the chronological history benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000000, help="Number of items to insert")
+    parser.add_argument("--legacy-count", type=int, default=5000, help="Number of items for the legacy insertion")
+    parser.add_argument("--out-of-order", type=float, default=0.01, help="Fraction of out-of-order items")
+    parser.add_argument("--retrievals", type=int, default=1000, help="Number of time-indexed retrievals")
+    args = parser.parse_args()
+
+    items = build_items(args.count, args.out_of_order)
+    elapsed, _ = timed(legacy_insert_all, items[: args.legacy_count])
+    report("legacy reverse-scan insert", args.legacy_count, elapsed, unit="inserts")
+
+    history = ChronologicalHistory()
+    elapsed, _ = timed(insert_all, history, items)
+    report("ChronologicalHistory insert", args.count, elapsed, unit="inserts")
+
+    rng = random.Random(1)
+    last = items[-1].get_time().seconds
+    starts = [TimeType(2, 0, rng.randrange(last + 1), 0) for _ in range(args.retrievals)]
+    elapsed, _ = timed(retrieve_all, history, starts)
+    report("ChronologicalHistory retrieve(TimeType)", args.retrievals, elapsed, unit="retrieves")
+
+
+if __name__ == "__main__":
+    main()
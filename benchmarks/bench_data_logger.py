@@ -0,0 +1,59 @@
+"""
+bench_data_logger.py:
+
+Measures the time spent on the decoding thread logging channel samples and raw downlink chunks, comparing the
+synchronous DataLogger writing and flushing each item with the BatchedDataLogger queuing them for its writer thread.
+The time for the batched writer to drain its queue is reported separately.
+"""
+import argparse
+import tempfile
+
+from bench_utils import build_dictionaries, report, timed
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.logger.data_logger import BatchedDataLogger, DataLogger
+
+
+def build_items(count, channels):
+    """Build channel samples each followed by a raw chunk as logged on the downlink path"""
+    time_obj = TimeType(2, 0, 1234, 5678)
+    items = []
+    for index in range(count):
+        template = channels[index % len(channels)]
+        val_obj = template.get_type_obj()()
+        val_obj._val = 7
+        items.append(ChData(val_obj, time_obj, template))
+        items.append(b"\x00" * 64)
+    return items
+
+
+def log_all(logger, items):
+    """Log each item as the decoders and transport would"""
+    for item in items:
+        logger.data_callback(item)
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50000, help="Number of channel samples logged")
+    args = parser.parse_args()
+    channels, _ = build_dictionaries()
+    items = build_items(args.count, channels)
+
+    with tempfile.TemporaryDirectory() as directory:
+        logger = DataLogger(directory, verbose=True, csv=True, prefix="sync_")
+        elapsed, _ = timed(log_all, logger, items)
+        report("synchronous logger (caller)", len(items), elapsed, "items")
+
+        logger = BatchedDataLogger(directory, verbose=True, csv=True, prefix="batched_", queue_size=len(items))
+        elapsed, _ = timed(log_all, logger, items)
+        report("batched logger (caller)", len(items), elapsed, "items")
+        drained, _ = timed(logger.flush)
+        report("batched logger (caller + drain)", len(items), elapsed + drained, "items")
+        assert sum(logger.dropped.values()) == 0, "items were dropped"
+        logger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+bench_decoders.py:
+
+Measures items/second decoded by the generic ChDecoder/EventDecoder against the precompiled struct-based
+CompiledChDecoder/CompiledEventDecoder. Telemetry buffers carry several channels each, and a quarter of the events
+carry a string argument that takes the generic fallback path.
+"""
+import argparse
+
+from bench_utils import build_dictionaries, make_traffic, report, timed
+from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.compiled_decoder import CompiledChDecoder, CompiledEventDecoder
+from fprime_gds.common.decoders.event_decoder import EventDecoder
+from fprime_gds.common.utils.config_manager import ConfigManager
+from fprime_gds.common.utils.data_desc_type import DataDescType
+
+HEADER_SIZE = 8
+
+
+def payloads(messages, descriptor, per_buffer=1):
+    """Strip the framing header from messages of the descriptor and join per_buffer payloads into each buffer"""
+    stripped = [message[HEADER_SIZE:] for message in messages if message[7] == descriptor.value]
+    return [b"".join(stripped[i : i + per_buffer]) for i in range(0, len(stripped), per_buffer)]
+
+
+def decode_all(decoder, buffers):
+    """Decode all buffers returning the number of decoded items"""
+    return sum(len(decoder.decode_api(buffer)) for buffer in buffers)
+
+
+def main():
+    """Run the decoder benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=100000, help="Number of channels and events to decode")
+    parser.add_argument("--per-buffer", type=int, default=10, help="Channels packed into each telemetry buffer")
+    args = parser.parse_args()
+
+    config = ConfigManager()
+    channels, events = build_dictionaries()
+    messages = make_traffic(args.messages, channels, events, event_ratio=0.2)
+    channel_buffers = payloads(messages, DataDescType.FW_PACKET_TELEM, args.per_buffer)
+    event_buffers = payloads(messages, DataDescType.FW_PACKET_LOG)
+
+    for decoder_type, dictionary, buffers in [
+        (ChDecoder, channels, channel_buffers),
+        (CompiledChDecoder, channels, channel_buffers),
+        (EventDecoder, events, event_buffers),
+        (CompiledEventDecoder, events, event_buffers),
+    ]:
+        decoder = decoder_type(dictionary, config)
+        elapsed, count = timed(decode_all, decoder, buffers)
+        report(decoder_type.__name__, count, elapsed, unit="items")
+
+
+if __name__ == "__main__":
+    main()
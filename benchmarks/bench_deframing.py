@@ -0,0 +1,91 @@
+"""
+bench_deframing.py:
+
+Measures FpFramerDeframer.deframe_all throughput over clean and corrupted downlink streams. The corrupted fixtures
+interleave bursts of line noise and frames with bad checksums. Results are compared against the previous deframer,
+which resynchronized by dropping a single byte at a time and rebuilt the pool after each frame.
+"""
+import argparse
+import contextlib
+import io
+import random
+import struct
+import sys
+
+from bench_utils import chunk, report, timed
+from fprime_gds.common.communication.checksum import calculate_checksum
+from fprime_gds.common.communication.framing import FpFramerDeframer, FramerDeframer
+
+
+class LegacyFpFramerDeframer(FpFramerDeframer):
+    """Previous byte-rotating deframer kept as the baseline"""
+
+    def deframe(self, data, no_copy=False):
+        while len(data) >= self.HEADER_SIZE:
+            start, data_size = struct.unpack_from(self.HEADER_FORMAT, data)
+            total_size = self.HEADER_SIZE + data_size + self.CHECKSUM_SIZE
+            if start != self.START_TOKEN or data_size >= self.MAXIMUM_DATA_SIZE:
+                data = data[1:]
+                continue
+            elif len(data) >= total_size:
+                deframed, check = struct.unpack_from(f">{data_size}sI", data, self.HEADER_SIZE)
+                if check == calculate_checksum(data[: data_size + self.HEADER_SIZE]):
+                    return deframed, data[total_size:]
+                print("[WARNING] Checksum validation failed.", file=sys.stderr)
+                data = data[1:]
+                continue
+            return None, data
+        return None, data
+
+    def deframe_all(self, data, no_copy):
+        return FramerDeframer.deframe_all(self, data, no_copy)
+
+
+def build_stream(framer, count, noise_every, noise_size, corrupt_every, seed=0):
+    """Build a framed stream of count packets with optional noise bursts and corrupted frames"""
+    rng = random.Random(seed)
+    pieces = []
+    for index in range(count):
+        if noise_every and index % noise_every == 0:
+            pieces.append(bytes(rng.randrange(0x100) for _ in range(noise_size)))
+        framed = bytearray(framer.frame(bytes(rng.randrange(0x100) for _ in range(rng.randrange(20, 200)))))
+        if corrupt_every and index % corrupt_every == 0:
+            framed[-1] ^= 0xFF
+        pieces.append(bytes(framed))
+    return b"".join(pieces)
+
+
+def run(framer, chunks):
+    """Run the downlink deframing loop over the chunks returning the number of frames found"""
+    pool = b""
+    count = 0
+    for data in chunks:
+        pool += data
+        frames, pool = framer.deframe_all(pool, no_copy=True)
+        count += len(frames)
+    return count
+
+
+def main():
+    """Run the deframing benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=20000, help="Number of frames in each fixture")
+    args = parser.parse_args()
+
+    framer = FpFramerDeframer()
+    fixtures = {
+        "clean": build_stream(framer, args.frames, 0, 0, 0),
+        "noise bursts": build_stream(framer, args.frames, 100, 4096, 0),
+        "bad checksums": build_stream(framer, args.frames, 0, 0, 10),
+        "noise+checksums": build_stream(framer, args.frames, 50, 2048, 10),
+    }
+    for name, stream in fixtures.items():
+        chunks = chunk(stream, sizes=(1024, 8192, 65536))
+        for implementation in [LegacyFpFramerDeframer(), FpFramerDeframer()]:
+            with contextlib.redirect_stderr(io.StringIO()):
+                elapsed, count = timed(run, implementation, chunks)
+            report(f"{type(implementation).__name__} {name}", count, elapsed, unit="frames")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+bench_dictionary_cache.py:
+
+Measures the startup time spent loading a large XML dictionary, --components components each with --per-component
+commands, events and channels. Each load runs in a fresh interpreter, as the GDS, fprime-cli and seqgen do at startup.
+The cold load parses the XML and fills the dictionary cache, the warm load reads the cache.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+from bench_utils import report, write_xml_dictionary
+
+LOAD = """
+import time
+start = time.perf_counter()
+from fprime_gds.common.pipeline.dictionaries import Dictionaries
+dictionaries = Dictionaries()
+dictionaries.load_dictionaries({path!r}, None)
+print(time.perf_counter() - start, len(dictionaries.command_id) + len(dictionaries.event_id) + len(dictionaries.channel_id))
+"""
+
+
+def load(path, cache_dir):
+    """Load the dictionary in a fresh interpreter returning (elapsed seconds, number of templates)"""
+    environment = dict(os.environ, FPRIME_GDS_CACHE_DIR=cache_dir)
+    output = subprocess.check_output([sys.executable, "-c", LOAD.format(path=path)], env=environment, text=True)
+    elapsed, count = output.split()
+    return float(elapsed), int(count)
+
+
+def main():
+    """Run the dictionary cache benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--components", type=int, default=100, help="Number of components in the dictionary")
+    parser.add_argument("--per-component", type=int, default=30, help="Commands, events and channels per component")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "BenchTopologyAppDictionary.xml")
+        write_xml_dictionary(path, args.components, args.per_component)
+        cache_dir = os.path.join(directory, "cache")
+        for name in ["no cache", "cold cache", "warm cache"]:
+            elapsed, count = load(path, "" if name == "no cache" else cache_dir)
+            report(name, count, elapsed, unit="templates")
+
+
+if __name__ == "__main__":
+    main()
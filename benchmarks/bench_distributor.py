@@ -0,0 +1,87 @@
+"""
+bench_distributor.py:
+
+Measures messages/second through the Distributor and ZeroCopyDistributor with mixed FW_PACKET_TELEM/FW_PACKET_LOG
+traffic. Each distributor is run with counting consumers only (framing cost) and with the real channel and event
+decoders attached. A key-framed run with line noise between messages exercises resynchronization.
+"""
+import argparse
+import random
+import struct
+
+from bench_utils import build_dictionaries, chunk, make_traffic, report, timed
+from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.event_decoder import EventDecoder
+from fprime_gds.common.distributor.distributor import Distributor, ZeroCopyDistributor
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.common.utils.config_manager import ConfigManager
+
+KEY = 0xA5A5
+
+
+class Counter(DataHandler):
+    """Consumer counting the items it receives"""
+
+    def __init__(self):
+        self.count = 0
+
+    def data_callback(self, data, sender=None):
+        self.count += 1
+
+
+def build_distributor(distributor_type, config, channels, events, decode):
+    """Build a distributor of the given type with either counting consumers or real decoders attached"""
+    distributor = distributor_type(config)
+    counter = Counter()
+    if decode:
+        ch_decoder = ChDecoder(channels, config)
+        event_decoder = EventDecoder(events, config)
+        ch_decoder.register(counter)
+        event_decoder.register(counter)
+        distributor.register("FW_PACKET_TELEM", ch_decoder)
+        distributor.register("FW_PACKET_LOG", event_decoder)
+    else:
+        distributor.register("FW_PACKET_TELEM", counter)
+        distributor.register("FW_PACKET_LOG", counter)
+    return distributor, counter
+
+
+def feed(distributor, chunks):
+    """Feed all chunks to the distributor"""
+    for data in chunks:
+        distributor.on_recv(data)
+
+
+def main():
+    """Run the distributor benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=50000, help="Number of messages to distribute")
+    parser.add_argument("--noise", type=int, default=64, help="Maximum noise bytes between key-framed messages")
+    args = parser.parse_args()
+
+    channels, events = build_dictionaries()
+    messages = make_traffic(args.messages, channels, events)
+    plain_chunks = chunk(b"".join(messages))
+
+    rng = random.Random(1)
+    key = struct.pack(">H", KEY)
+    noisy = b"".join(bytes(rng.randrange(0x100) & 0x7F for _ in range(rng.randrange(args.noise + 1))) + key + msg
+                     for msg in messages)
+    noisy_chunks = chunk(noisy)
+
+    plain_config = ConfigManager()
+    key_config = ConfigManager()
+    key_config.set("framing", "use_key", "true")
+    key_config.set("framing", "key_val", hex(KEY))
+
+    for name, config, chunks in [("plain", plain_config, plain_chunks), ("key+noise", key_config, noisy_chunks)]:
+        for decode in [False, True]:
+            for distributor_type in [Distributor, ZeroCopyDistributor]:
+                distributor, counter = build_distributor(distributor_type, config, channels, events, decode)
+                elapsed, _ = timed(feed, distributor, chunks)
+                label = f"{distributor_type.__name__} {name}{' decode' if decode else ''}"
+                report(label, counter.count, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+bench_file_downlink.py:
+
+Measures file packets/second through the FileDownlinker. Each run downlinks --files files of --packets DATA packets
+between a START and an END packet: in order, with every pair of DATA packets swapped, and with the packets of the files
+interleaved, i.e. several downlinks in progress at once.
+"""
+import argparse
+import tempfile
+
+from bench_utils import report, timed
+from fprime_gds.common.data_types.file_data import DataPacketData, EndPacketData, StartPacketData
+from fprime_gds.common.files.downlinker import FileDownlinker
+
+
+def make_packets(name, packets, size, swapped):
+    """Make the packets downlinking a file, swapping each pair of DATA packets if asked"""
+    chunk = bytes(size)
+    data = [DataPacketData(index + 1, index * size, chunk) for index in range(packets)]
+    if swapped:
+        data[0::2], data[1::2] = data[1::2], data[0::2]
+    start = StartPacketData(0, packets * size, f"/src/{name}".encode(), name.encode())
+    return [start] + data + [EndPacketData(packets + 1, 0)]
+
+
+def run(streams, directory):
+    """Downlink the packet streams, interleaving their packets, returning the number of packets handled"""
+    downlinker = FileDownlinker(directory, log_dir=directory)
+    for packets in zip(*streams):
+        for packet in packets:
+            downlinker.data_callback(packet)
+    return sum(len(stream) for stream in streams)
+
+
+def main():
+    """Run the file downlink benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packets", type=int, default=20000, help="Number of DATA packets in each downlinked file")
+    parser.add_argument("--size", type=int, default=512, help="Bytes of data per DATA packet")
+    parser.add_argument("--files", type=int, default=4, help="Number of files downlinked at once when interleaved")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        runs = [
+            ("in order", [make_packets("ordered.bin", args.packets, args.size, False)]),
+            ("pairs swapped", [make_packets("swapped.bin", args.packets, args.size, True)]),
+            (
+                f"{args.files} files interleaved",
+                [make_packets(f"file{index}.bin", args.packets, args.size, False) for index in range(args.files)],
+            ),
+        ]
+        for name, streams in runs:
+            elapsed, count = timed(run, streams, directory)
+            report(name, count, elapsed, unit="pkts")
+
+
+if __name__ == "__main__":
+    main()
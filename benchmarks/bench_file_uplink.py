@@ -0,0 +1,94 @@
+"""
+bench_file_uplink.py:
+
+Measures the file uplink rate over a loopback link with simulated latency. The link handshakes every file packet back to
+the FileUplinker --latency seconds after it was sent, i.e. the round trip time of a real link. With a window of one
+packet the uplink rate is bound to one chunk per round trip. Larger windows keep several packets in flight and larger
+chunks carry more data per handshake. Each run uplinks one --size bytes file.
+"""
+import argparse
+import collections
+import os
+import tempfile
+import threading
+import time
+
+from bench_utils import report, timed
+from fprime_gds.common.encoders.file_encoder import FileEncoder
+from fprime_gds.common.files.uplinker import FileUplinker
+from fprime_gds.common.handlers import DataHandler
+
+
+class LatencyLink(DataHandler):
+    """Link handshaking each packet to the uplinker once its round trip time passed"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.uplinker = None
+        self.in_flight = collections.deque()
+        self.condition = threading.Condition()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def data_callback(self, data, sender=None):
+        with self.condition:
+            self.in_flight.append((time.perf_counter() + self.latency, data[8:]))
+            self.condition.notify()
+
+    def run(self):
+        """Deliver the handshakes in order as they come due"""
+        while self.running:
+            with self.condition:
+                while not self.in_flight and self.running:
+                    self.condition.wait(0.1)
+                if not self.in_flight:
+                    continue
+                due, handshake = self.in_flight.popleft()
+            time.sleep(max(0.0, due - time.perf_counter()))
+            self.uplinker.data_callback(handshake)
+
+    def stop(self):
+        self.running = False
+
+
+def run(window, chunk, size, latency, directory):
+    """Uplink a file returning the number of bytes uplinked"""
+    encoder = FileEncoder()
+    link = LatencyLink(latency)
+    encoder.register(link)
+    uplinker = FileUplinker(encoder, chunk=chunk, window=window)
+    link.uplinker = uplinker
+    # The uplinker removes files once uplinked
+    source = os.path.join(directory, f"source-{window}-{chunk}.bin")
+    with open(source, "wb") as file_handle:
+        file_handle.write(os.urandom(size))
+    try:
+        uplinker.enqueue(source, "/dest.bin")
+        while not uplinker.current_files() or uplinker.current_files()[0]["state"] not in ("FINISHED", "TIMEOUT"):
+            time.sleep(0.001)
+        assert uplinker.current_files()[0]["state"] == "FINISHED", "Uplink timed out"
+        return size
+    finally:
+        uplinker.exit()
+        link.stop()
+
+
+def main():
+    """Run the file uplink benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=128 * 1024, help="Bytes of the uplinked file")
+    parser.add_argument("--latency", type=float, default=0.010, help="Round trip time of the link in seconds")
+    parser.add_argument("--windows", type=int, nargs="+", default=[1, 4, 16, 64], help="Windows to measure")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[256, 1024], help="Chunk sizes to measure")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for chunk in args.chunks:
+            for window in args.windows:
+                elapsed, count = timed(run, window, chunk, args.size, args.latency, directory)
+                report(f"window {window} chunk {chunk}", count, elapsed, unit="bytes")
+
+
+if __name__ == "__main__":
+    main()
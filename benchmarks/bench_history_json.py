@@ -0,0 +1,120 @@
+"""
+bench_history_json.py:
+
+Measures the time for a number of concurrent polling sessions to fetch the same events and channels through the flask
+history endpoints. The cached JSON path, encoding each item once, is compared with the previous path re-processing and
+re-encoding every item for every session.
+"""
+import argparse
+import threading
+
+import flask
+import flask_restful
+from bench_utils import build_dictionaries, report, timed
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.history.ram import RamHistory
+from fprime_gds.flask.channels import ChannelHistory
+from fprime_gds.flask.events import EventHistory
+from fprime_gds.flask.json import GDSJsonEncoder
+
+
+class LegacyMixin:
+    """Previous GET handler processing each item and returning it for encoding by flask_restful"""
+
+    def get(self):
+        args = self.parser.parse_args()
+        session = args.get("session")
+        new_items = self.history.retrieve(session, int(args.get("limit") or 2000))
+        returned_items = [self.process(item) for item in new_items]
+        return {"history": returned_items, "validation": -1, "errors": []}
+
+
+class LegacyEventHistory(LegacyMixin, EventHistory):
+    """Legacy event endpoint"""
+
+
+class LegacyChannelHistory(LegacyMixin, ChannelHistory):
+    """Legacy channel endpoint"""
+
+
+def build_items(count, channels, events):
+    """Build a mix of channel and event items, one in ten being an event"""
+    time_obj = TimeType(2, 0, 1234, 5678)
+    items = []
+    for index in range(count):
+        if index % 10 == 0:
+            template = events[index % len(events)]
+            args = tuple(arg_type() for _, _, arg_type in template.get_args())
+            for arg in args:
+                arg._val = 5 if not isinstance(arg._val, str) else "hello"
+            items.append(EventData(args, time_obj, template))
+        else:
+            template = channels[index % len(channels)]
+            val_obj = template.get_type_obj()()
+            val_obj._val = 7
+            items.append(ChData(val_obj, time_obj, template))
+    return items
+
+
+def build_app(event_resource, channel_resource):
+    """Build a flask app serving the supplied resources over fresh histories"""
+    histories = {"events": RamHistory(), "channels": RamHistory()}
+    app = flask.Flask(__name__)
+    app.json_encoder = GDSJsonEncoder
+    app.config["RESTFUL_JSON"] = {"cls": app.json_encoder}
+    api = flask_restful.Api(app)
+    api.add_resource(event_resource, "/events", resource_class_args=[histories["events"]])
+    api.add_resource(channel_resource, "/channels", resource_class_args=[histories["channels"]])
+    return app, histories
+
+
+def run_sessions(app, histories, items, sessions, rounds):
+    """Feed the items in rounds, each session polling both endpoints from its own thread after each round"""
+    clients = [app.test_client() for _ in range(sessions)]
+    for index, client in enumerate(clients):
+        client.get(f"/events?session={index}")
+        client.get(f"/channels?session={index}")
+    per_round = len(items) // rounds
+    received = [0] * sessions
+
+    def poll(index):
+        for endpoint in ["events", "channels"]:
+            body = clients[index].get(f"/{endpoint}?session={index}&limit=100000").get_json()
+            received[index] += len(body["history"])
+
+    for round_index in range(rounds):
+        for item in items[round_index * per_round : (round_index + 1) * per_round]:
+            history = histories["events"] if isinstance(item, EventData) else histories["channels"]
+            history.data_callback(item)
+        threads = [threading.Thread(target=poll, args=(index,)) for index in range(sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return sum(received)
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20000, help="Number of items fed to the histories")
+    parser.add_argument("--sessions", type=int, default=20, help="Number of concurrent polling sessions")
+    parser.add_argument("--rounds", type=int, default=10, help="Number of polling rounds")
+    args = parser.parse_args()
+
+    channels, events = build_dictionaries()
+    for name, resources in [
+        ("legacy per-session encoding", (LegacyEventHistory, LegacyChannelHistory)),
+        ("cached JSON", (EventHistory, ChannelHistory)),
+    ]:
+        items = build_items(args.items, channels, events)
+        app, histories = build_app(*resources)
+        elapsed, received = timed(run_sessions, app, histories, items, args.sessions, args.rounds)
+        assert received == args.sessions * len(items), f"{name} received {received} items"
+        report(f"{name} ({args.sessions} sessions)", received, elapsed, "items")
+
+
+if __name__ == "__main__":
+    main()
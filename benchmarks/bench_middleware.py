@@ -0,0 +1,106 @@
+"""
+bench_middleware.py:
+
+Measures the fan-out of the tcp middleware server: one FSW client streams downlink messages to the server which sends
+them to every registered GUI client (32 by default). The event loop server (fprime_gds.common.middleware) is compared
+against the threaded server, both run as `python -m fprime_gds.executables.tcpserver` processes. Reported are the bytes
+delivered to all GUI clients per second. Timing stops once all clients received everything, or once deliveries stall
+for two seconds as the threaded server drops data on partial sends. With --stalled, additional GUI clients register but
+never read, showing whether stalled clients hold up the others.
+"""
+import argparse
+import selectors
+import socket
+import subprocess
+import sys
+import time
+
+from bench_utils import build_dictionaries, make_traffic, report
+
+
+def free_port():
+    """Find a free tcp port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def connect(port, name):
+    """Connect to the server, retrying while it starts, and register"""
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            sock = socket.create_connection(("127.0.0.1", port))
+            break
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+    sock.sendall(b"Register %s\n" % name)
+    return sock
+
+
+def run(threaded, clients, stream, expected, stalled=0):
+    """Stream data through a server to clients returning (elapsed seconds, bytes delivered)"""
+    port = free_port()
+    args = [sys.executable, "-m", "fprime_gds.executables.tcpserver", "--port", str(port)]
+    server = subprocess.Popen(args + (["--threaded"] if threaded else []), stdout=subprocess.DEVNULL)
+    try:
+        fsw = connect(port, b"FSW")
+        guis = [connect(port, b"GUI") for _ in range(clients)]
+        stalled_guis = [connect(port, b"GUI") for _ in range(stalled)]
+        # The threaded server registers on its client threads, allow those to run
+        time.sleep(1)
+        selector = selectors.DefaultSelector()
+        for gui in guis:
+            gui.setblocking(False)
+            selector.register(gui, selectors.EVENT_READ)
+        received = 0
+        framed = memoryview(stream)
+
+        start = time.perf_counter()
+        last_progress = start
+        fsw.setblocking(False)
+        sent = 0
+        while received < expected and time.perf_counter() - last_progress < 2.0:
+            if sent < len(framed):
+                try:
+                    sent += fsw.send(framed[sent : sent + 65536])
+                except BlockingIOError:
+                    pass
+            for key, _ in selector.select(0.01):
+                try:
+                    received += len(key.fileobj.recv(262144))
+                    last_progress = time.perf_counter()
+                except BlockingIOError:
+                    pass
+        elapsed = (last_progress if received < expected else time.perf_counter()) - start
+        for sock in guis + stalled_guis + [fsw]:
+            sock.close()
+        return elapsed, received
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    """Run the middleware benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000, help="Number of messages streamed by the FSW client")
+    parser.add_argument("--clients", type=int, default=32, help="Number of GUI clients")
+    parser.add_argument("--stalled", type=int, default=0, help="Number of additional GUI clients never reading")
+    args = parser.parse_args()
+
+    channels, events = build_dictionaries()
+    stream = b"".join(b"A5A5 GUI " + message for message in make_traffic(args.messages, channels, events))
+    delivered = (len(stream) - 9 * args.messages) * args.clients
+    for threaded in [True, False]:
+        name = "threaded server" if threaded else "event loop server"
+        elapsed, received = run(threaded, args.clients, stream, delivered, args.stalled)
+        report(f"{name} x{args.clients}", received, elapsed, unit="bytes")
+        if received < delivered:
+            print(f"{'':<40} {delivered - received:>10} bytes lost")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+bench_sharded_distributor.py:
+
+Measures messages/second decoded through the ShardedDistributor, decoding channels and events in worker processes,
+against the in-process Distributor and ZeroCopyDistributor. Timing includes starting and stopping the workers, such
+that all decoded items have been delivered to the consumers. Worker processes only help given free cores: on a single
+core the sharded distributor measures the overhead of moving messages and packed items between processes.
+"""
+import argparse
+import os
+
+from bench_utils import build_dictionaries, chunk, make_traffic, report, timed
+from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.event_decoder import EventDecoder
+from fprime_gds.common.distributor.distributor import Distributor, ShardedDistributor, ZeroCopyDistributor
+from fprime_gds.common.handlers import DataHandler
+
+
+class Counter(DataHandler):
+    """Consumer counting the items it receives"""
+
+    def __init__(self):
+        self.count = 0
+
+    def data_callback(self, data, sender=None):
+        self.count += 1
+
+
+def run(distributor, channels, events, chunks):
+    """Decode all chunks with the distributor returning the number of items delivered"""
+    counter = Counter()
+    ch_decoder = ChDecoder(channels, None)
+    event_decoder = EventDecoder(events, None)
+    ch_decoder.register(counter)
+    event_decoder.register(counter)
+    distributor.register("FW_PACKET_TELEM", ch_decoder)
+    distributor.register("FW_PACKET_LOG", event_decoder)
+    for data in chunks:
+        distributor.on_recv(data)
+    distributor.close()
+    return counter.count
+
+
+def main():
+    """Run the sharded distributor benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=50000, help="Number of messages to distribute")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to measure")
+    args = parser.parse_args()
+
+    channels, events = build_dictionaries()
+    chunks = chunk(b"".join(make_traffic(args.messages, channels, events)))
+    print(f"Available cores: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}")
+    for distributor_type in [Distributor, ZeroCopyDistributor]:
+        elapsed, count = timed(run, distributor_type(), channels, events, chunks)
+        report(distributor_type.__name__, count, elapsed)
+    for shard in ShardedDistributor.SHARD_MODES:
+        for workers in args.workers:
+            distributor = ShardedDistributor(workers=workers, shard=shard, id_range=16)
+            elapsed, count = timed(run, distributor, channels, events, chunks)
+            report(f"ShardedDistributor {shard} x{workers}", count, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+bench_string_util.py:
+
+Measures format_string_template on a set of event format strings, comparing the compiled template cache with the
+previous path converting the template with a regular expression on every call.
+"""
+import argparse
+import logging
+
+from bench_utils import report, timed
+from fprime_gds.common.utils.string_util import compile_template, convert_template, format_string_template
+
+TEMPLATES = [
+    ("Opcode 0x%04X dispatched to port %d and value %f", (181, 8, 1.234)),
+    ("Count %d value %f text %s", (12, 0.5, "hello")),
+    ("Something %lu something %llu something else %lu", (123456, 123457, 123458)),
+    ("%.2f%%, %.2f%%", (1.23456, 1.23456)),
+    ("Mode %d", ("ENUM_VALUE",)),
+]
+
+
+def legacy_format(format_str, values):
+    """Previous formatting converting the template on each call, including the integer fallback"""
+    try:
+        return convert_template(format_str, ignore_int=False).format(*values).replace("%%", "%")
+    except Exception:
+        return convert_template(format_str, ignore_int=True).format(*values).replace("%%", "%")
+
+
+def format_all(function, count):
+    """Format each template count times"""
+    for _ in range(count):
+        for template, values in TEMPLATES:
+            function(template, values)
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000, help="Number of times each template is formatted")
+    args = parser.parse_args()
+    # The integer fallback logs a warning on each call, keep it out of the measurement
+    logging.getLogger("string_util_logger").setLevel(logging.CRITICAL)
+
+    total = args.count * len(TEMPLATES)
+    elapsed, _ = timed(format_all, legacy_format, args.count)
+    report("legacy per-call conversion", total, elapsed, "fmts")
+    compile_template.cache_clear()
+    elapsed, _ = timed(format_all, format_string_template, args.count)
+    report("compiled template cache", total, elapsed, "fmts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+bench_utils.py:
+
+Helpers shared by the GDS benchmarks. Builds a small synthetic dictionary of channels and events along with the
+matching downlink traffic such that benchmarks can drive the real distributor and decoders without a deployment. Large
+synthetic XML dictionaries may be written for the benchmarks of dictionary loading.
+
+Benchmarks are standalone scripts run as: `python benchmarks/<benchmark>.py --help`
+"""
+import random
+import struct
+import time
+
+from fprime.common.models.serialize.numerical_types import F32Type, I16Type, U32Type, U8Type
+from fprime.common.models.serialize.string_type import StringType
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.templates.event_template import EventTemplate
+from fprime_gds.common.utils.data_desc_type import DataDescType
+from fprime_gds.common.utils.event_severity import EventSeverity
+
+CHANNEL_TYPES = [(U32Type, ">I", 7), (F32Type, ">f", 1.5), (I16Type, ">h", -3), (U8Type, ">B", 9)]
+
+
+def build_dictionaries(channel_count=100, event_count=20):
+    """
+    Build a synthetic channel and event id dictionary
+
+    :param channel_count: number of channels to build
+    :param event_count: number of events to build
+    :return: tuple of channel id dictionary, event id dictionary
+    """
+    channels = {}
+    for index in range(channel_count):
+        type_obj = CHANNEL_TYPES[index % len(CHANNEL_TYPES)][0]
+        channels[index] = ChTemplate(index, f"Channel{index}", "benchComp", type_obj, "%d")
+    string_type = StringType.construct_type("BenchString", 40)
+    events = {}
+    for index in range(event_count):
+        args = [("count", None, U32Type), ("value", None, F32Type)]
+        fmt = "Count %d value %f"
+        if index % 4 == 0:
+            args.append(("text", None, string_type))
+            fmt += " text %s"
+        events[index] = EventTemplate(index, f"Event{index}", "benchComp", args, EventSeverity.ACTIVITY_HI, fmt)
+    return channels, events
+
+
+def frame(descriptor, payload):
+    """Prefix a payload with the default U32 length and U32 descriptor header"""
+    return struct.pack(">II", len(payload) + 4, descriptor.value) + payload
+
+
+def make_traffic(count, channels, events, event_ratio=0.1, seed=0):
+    """
+    Build a stream of mixed FW_PACKET_TELEM/FW_PACKET_LOG messages with the default framing
+
+    :param count: number of messages to build
+    :param channels: channel id dictionary produced by build_dictionaries
+    :param events: event id dictionary produced by build_dictionaries
+    :param event_ratio: fraction of the messages that are events
+    :param seed: random seed used to make traffic repeatable
+    :return: list of framed messages
+    """
+    rng = random.Random(seed)
+    time_bytes = TimeType(2, 0, 1234, 5678).serialize()
+    messages = []
+    for _ in range(count):
+        if rng.random() < event_ratio:
+            event_id = rng.randrange(len(events))
+            payload = struct.pack(">I", event_id) + time_bytes + struct.pack(">If", rng.randrange(1000), 0.5)
+            if event_id % 4 == 0:
+                payload += struct.pack(">H", 5) + b"hello"
+            messages.append(frame(DataDescType.FW_PACKET_LOG, payload))
+        else:
+            ch_id = rng.randrange(len(channels))
+            _, fmt, value = CHANNEL_TYPES[ch_id % len(CHANNEL_TYPES)]
+            payload = struct.pack(">I", ch_id) + time_bytes + struct.pack(fmt, value)
+            messages.append(frame(DataDescType.FW_PACKET_TELEM, payload))
+    return messages
+
+
+def write_xml_dictionary(path, components=50, per_component=20):
+    """
+    Write a synthetic topology XML dictionary, sized like a large deployment's
+
+    Each component defines an enum, a serializable and an array type and per_component commands, events and channels,
+    with arguments and channels of those types and of strings.
+
+    :param path: path to write the dictionary to
+    :param components: number of components
+    :param per_component: number of commands, events and channels per component
+    """
+    enums, serializables, arrays, commands, events, channels = [], [], [], [], [], []
+    for comp in range(components):
+        name = f"comp{comp}"
+        items = "".join(f'<item name="STATE{value}" value="{value}"/>' for value in range(8))
+        enums.append(f'<enum type="{name}::State">{items}</enum>')
+        serializables.append(
+            f'<serializable type="{name}::Status"><members>'
+            f'<member name="state" type="{name}::State" format_specifier="%s"/>'
+            '<member name="count" type="U32" format_specifier="%d"/>'
+            '<member name="value" type="F32" format_specifier="%f"/>'
+            "</members></serializable>"
+        )
+        values = "".join("<value>0</value>" for _ in range(4))
+        arrays.append(f'<array name="{name}::Values" type="U32" size="4" format="%d"><defaults>{values}</defaults></array>')
+        for index in range(per_component):
+            ident = comp * per_component + index + 1
+            commands.append(
+                f'<command component="{name}" mnemonic="CMD_{index}" opcode="{hex(ident)}"><args>'
+                f'<arg name="state" type="{name}::State"/><arg name="count" type="U32"/>'
+                '<arg name="text" type="string" len="40"/></args></command>'
+            )
+            events.append(
+                f'<event component="{name}" name="Event{index}" id="{hex(ident)}" severity="ACTIVITY_HI" '
+                f'format_string="State %s status %s text %s"><args><arg name="state" type="{name}::State"/>'
+                f'<arg name="status" type="{name}::Status"/><arg name="text" type="string" len="40"/></args></event>'
+            )
+            channel_type = [f"{name}::State", f"{name}::Status", f"{name}::Values", "U32"][index % 4]
+            channels.append(f'<channel component="{name}" name="Channel{index}" id="{ident}" type="{channel_type}"/>')
+    sections = [
+        ("enums", enums),
+        ("serializables", serializables),
+        ("arrays", arrays),
+        ("commands", commands),
+        ("events", events),
+        ("channels", channels),
+    ]
+    with open(path, "w") as file_handle:
+        file_handle.write('<dictionary topology="Bench" framework_version="3.1.0" project_version="1.0.0">\n')
+        for section, items in sections:
+            file_handle.write(f"<{section}>\n" + "\n".join(items) + f"\n</{section}>\n")
+        file_handle.write("</dictionary>\n")
+
+
+def chunk(data, sizes=(512, 1024, 4096), seed=0):
+    """Split a byte stream into randomly sized chunks like those read off a socket"""
+    rng = random.Random(seed)
+    chunks = []
+    offset = 0
+    while offset < len(data):
+        size = rng.choice(sizes)
+        chunks.append(data[offset : offset + size])
+        offset += size
+    return chunks
+
+
+def timed(function, *args, **kwargs):
+    """Run function returning a tuple of (elapsed seconds, result)"""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def report(name, count, elapsed, unit="msgs"):
+    """Print a single benchmark result line"""
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{name:<40} {count:>10} {unit} in {elapsed:8.3f}s  {rate:>14,.0f} {unit}/s")
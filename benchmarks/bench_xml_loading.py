@@ -0,0 +1,58 @@
+"""
+bench_xml_loading.py:
+
+Measures building the dictionaries of a large XML dictionary, --components components each with --per-component
+commands, events and channels, with the dictionary cache disabled. Separate loaders each parse the file and resolve its
+types, as before the shared parse context. The shared context parses once for all loaders, and loading only the events,
+as fprime-cli events does, skips building the commands and channels.
+"""
+import argparse
+import os
+import tempfile
+
+from bench_utils import report, timed, write_xml_dictionary
+from fprime_gds.common.loaders.ch_xml_loader import ChXmlLoader
+from fprime_gds.common.loaders.cmd_xml_loader import CmdXmlLoader
+from fprime_gds.common.loaders.event_xml_loader import EventXmlLoader
+from fprime_gds.common.loaders.xml_loader import XmlParseContext
+from fprime_gds.common.pipeline.dictionaries import Dictionaries
+
+LOADERS = [CmdXmlLoader, EventXmlLoader, ChXmlLoader]
+
+
+def separate(path):
+    """Build all dictionaries with loaders each parsing the file, returning the number of templates"""
+    return sum(len(loader().get_id_dict(path)) for loader in LOADERS)
+
+
+def shared(path):
+    """Build all dictionaries with loaders sharing a parse context, returning the number of templates"""
+    context = XmlParseContext(path)
+    return sum(len(loader(context).get_id_dict(path)) for loader in LOADERS)
+
+
+def events_only(path):
+    """Load the dictionaries using only the events, returning the number of templates"""
+    dictionaries = Dictionaries()
+    dictionaries.load_dictionaries(path, None)
+    return len(dictionaries.event_id)
+
+
+def main():
+    """Run the XML loading benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--components", type=int, default=100, help="Number of components in the dictionary")
+    parser.add_argument("--per-component", type=int, default=30, help="Commands, events and channels per component")
+    args = parser.parse_args()
+
+    os.environ["FPRIME_GDS_CACHE_DIR"] = ""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "BenchTopologyAppDictionary.xml")
+        write_xml_dictionary(path, args.components, args.per_component)
+        for name, function in [("separate loaders", separate), ("shared context", shared), ("events only", events_only)]:
+            elapsed, count = timed(function, path)
+            report(name, count, elapsed, unit="templates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+bench_zmq_transport.py:
+
+Measures the ZeroMQ link between comm.py and the GDS. A ZmqGround, as used by the comm layer, sends downlink packets
+in the batches the Downlinker drains from its queue at a target packet rate (50k packets/s by default). A ZmqClient, as
+used by the GDS, receives them into a ZeroCopyDistributor that counts the messages it splits out. The single message
+per packet mode is compared against the batched mode (--zmq-batch), reporting the achieved packet rate and the CPU time
+spent per packet by both ends. Use --rate 0 to send as fast as possible.
+"""
+import argparse
+import tempfile
+import threading
+import time
+
+from bench_utils import build_dictionaries, make_traffic, report
+from fprime_gds.common.distributor.distributor import ZeroCopyDistributor
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.common.transport import RoutingTag
+from fprime_gds.common.zmq_transport import ZmqClient, ZmqGround
+
+
+class Counter(DataHandler):
+    """Consumer counting the messages it receives, signalling once the expected count arrived"""
+
+    def __init__(self):
+        self.count = 0
+        self.expected = None
+        self.done = threading.Event()
+
+    def data_callback(self, data, sender=None):
+        self.count += 1
+        if self.expected is not None and self.count >= self.expected:
+            self.done.set()
+
+
+def run(packets, rate, tick, batched):
+    """Stream packets from a ground handler to a client returning (elapsed seconds, messages, cpu seconds)"""
+    directory = tempfile.mkdtemp()
+    urls = [f"ipc://{directory}/in", f"ipc://{directory}/out"]
+    ground = ZmqGround(urls, batched)
+    ground.make_server()
+    ground.open()
+    ground.receive_all()
+    ground.send_all([])
+
+    counter = Counter()
+    distributor = ZeroCopyDistributor()
+    distributor.register("FW_PACKET_TELEM", counter)
+    distributor.register("FW_PACKET_LOG", counter)
+    client = ZmqClient(batched)
+    client.register(distributor)
+    client.connect(urls, RoutingTag.GUI, RoutingTag.FSW)
+    # Subscription handshake with a packet the distributor ignores
+    while not counter.count:
+        ground.send_all([packets[0]])
+        time.sleep(0.01)
+    counter.count = 0
+    counter.expected = len(packets)
+
+    per_tick = max(1, int(rate * tick)) if rate else 1000
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for index, offset in enumerate(range(0, len(packets), per_tick)):
+        if rate:
+            delay = start + index * tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        ground.send_all(packets[offset : offset + per_tick])
+    counter.done.wait(60)
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    client.disconnect()
+    ground.close()
+    return elapsed, counter.count, cpu
+
+
+def main():
+    """Run the ZeroMQ transport benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packets", type=int, default=250000, help="Number of packets to send")
+    parser.add_argument("--rate", type=int, default=50000, help="Target packets/second, 0 sends unpaced")
+    parser.add_argument("--tick", type=float, default=0.001, help="Seconds between batches drained by the downlinker")
+    args = parser.parse_args()
+
+    channels, events = build_dictionaries()
+    # Downlinked packets carry no size, the ground handler adds it
+    packets = [message[4:] for message in make_traffic(args.packets, channels, events)]
+    for batched in [False, True]:
+        name = "ZMQ batched" if batched else "ZMQ per packet"
+        elapsed, count, cpu = run(packets, args.rate, args.tick, batched)
+        report(name, count, elapsed, unit="pkts")
+        print(f"{'':<40} {cpu / max(count, 1) * 1e6:10.2f} us cpu/pkt")
+
+
+if __name__ == "__main__":
+    main()
@@ -83,6 +83,7 @@ integrated configuration with ground in-the-loop.
         "console_scripts": [
             "fprime-cli = fprime_gds.executables.fprime_cli:main",
             "fprime-seqgen = fprime_gds.common.tools.seqgen:main",
+            "fprime-replay = fprime_gds.executables.replay:main",
         ],
     },
     ####
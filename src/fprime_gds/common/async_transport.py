@@ -0,0 +1,367 @@
+"""
+fprime_gds.common.async_transport:
+
+Transport clients running on an asyncio event loop rather than on a receive thread each. ThreadedTransportClient
+implementations dedicate a thread to every client, which loops on recv with a timeout and reads small chunks. The
+clients here instead share a single event loop thread (EventLoopThread.shared()), receive into large reusable buffers
+and dispatch everything read per wake-up to their registrants as one batch. Registrants are called on the event loop
+thread and are handed bytes objects they may keep.
+
+Two implementations are provided:
+
+1. AsyncTCPSocketClient: client of the threaded tcp server (see ThreadedTCPSocketClient)
+2. AsyncZmqClient: client of the ZeroMQ transport (see ZmqClient) built on zmq.asyncio
+
+Both may be selected as StandardPipeline.transport_implementation.
+"""
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+
+from fprime_gds.common.transport import RoutingTag, TransportationException, TransportClient
+
+try:
+    import zmq
+    import zmq.asyncio
+except ImportError:
+    zmq = None
+
+
+class EventLoopThread:
+    """
+    Thread running an asyncio event loop. Transport clients schedule their work on the loop from any thread through
+    the thread safe methods below. One shared instance is used unless clients are given their own.
+    """
+
+    __SHARED = None
+    __SHARED_LOCK = threading.Lock()
+
+    def __init__(self, name="TransportEventLoop"):
+        """Create the event loop and start its thread"""
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.__run, name=name, daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def shared(cls):
+        """Get the event loop thread shared by all clients not supplied with their own, starting it if needed"""
+        with cls.__SHARED_LOCK:
+            if cls.__SHARED is None or not cls.__SHARED.thread.is_alive():
+                cls.__SHARED = cls()
+            return cls.__SHARED
+
+    def __run(self):
+        """Run the loop until stopped"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def in_loop(self):
+        """Check if the caller is running on the event loop thread"""
+        return threading.current_thread() is self.thread
+
+    def run(self, coroutine, timeout=None):
+        """
+        Run a coroutine on the loop and wait for its result
+
+        :param coroutine: coroutine to run
+        :param timeout: seconds to wait for the result, None waits forever
+        :return: result of the coroutine
+        """
+        assert not self.in_loop(), "Cannot wait for the event loop from the event loop thread"
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def call(self, function, *args):
+        """Call a function on the loop, immediately when already on the loop thread"""
+        if self.in_loop():
+            function(*args)
+        else:
+            self.loop.call_soon_threadsafe(function, *args)
+
+    def stop(self):
+        """Stop the loop and join its thread"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class AsyncTransportClient(TransportClient, ABC):
+    """
+    Transport client receiving on an event loop. Subclasses implement the asynchronous open_async, receive_async and
+    close_async methods, which run on the loop. Once connected, a receive task dispatches each batch of data received
+    to the registrants. Sending may be done from any thread.
+
+    recv is provided for compatibility with TransportClient and reads one batch without dispatching. It may not be used
+    while the receive task dispatches data, i.e. only with dispatch set to False before connecting.
+    """
+
+    def __init__(self, loop_thread=None, buffer_size=65536):
+        """
+        Constructor
+
+        :param loop_thread: event loop thread to run on. Defaults to the shared EventLoopThread.
+        :param buffer_size: size of the receive buffer, i.e. the largest batch dispatched at once
+        """
+        super().__init__()
+        self.loop_thread = loop_thread if loop_thread is not None else EventLoopThread.shared()
+        self.buffer_size = buffer_size
+        self.dispatch = True
+        self.dest = None
+        self.__task = None
+
+    def connect(
+        self,
+        connection_uri,
+        incoming_routing=RoutingTag.GUI,
+        outgoing_routing=RoutingTag.FSW,
+    ):
+        """
+        Connect on the event loop and start dispatching received data
+
+        :param connection_uri: connection URI for setting up this client
+        :param incoming_routing: routing tag for the incoming (received) data
+        :param outgoing_routing: routing tag for the outgoing (sent) data
+        """
+        self.dest = outgoing_routing.value
+        try:
+            self.loop_thread.run(self.open_async(connection_uri, incoming_routing, outgoing_routing))
+        except TransportationException:
+            raise
+        except Exception as exc:
+            raise TransportationException(f"Failed to connect to transportation layer at: {connection_uri}. {exc}")
+        if self.dispatch:
+            self.__task = self.loop_thread.run(self.__start_dispatch())
+
+    async def __start_dispatch(self):
+        """Create the dispatch task on the loop"""
+        return asyncio.get_running_loop().create_task(self.__dispatch())
+
+    async def __dispatch(self):
+        """Receive task passing each batch of data received to the registrants"""
+        while True:
+            data = await self.receive_async()
+            if data is None:
+                return
+            if data:
+                self.send_to_all(data)
+
+    async def __stop_dispatch(self):
+        """Cancel the receive task"""
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+        await self.close_async()
+
+    def disconnect(self):
+        """Stop dispatching and close the connection"""
+        if self.loop_thread.in_loop():
+            asyncio.ensure_future(self.__stop_dispatch(), loop=self.loop_thread.loop)
+        else:
+            self.loop_thread.run(self.__stop_dispatch())
+
+    def recv(self, timeout=None):
+        """
+        Receive one batch of data without dispatching it
+
+        :param timeout: timeout in milliseconds before returning b"". None waits until data arrives.
+        :return: data received, b"" on timeout or when closed
+        """
+        assert self.__task is None, "Cannot recv data while the client dispatches received data"
+
+        async def receive():
+            try:
+                data = await asyncio.wait_for(self.receive_async(), None if timeout is None else timeout / 1000)
+            except asyncio.TimeoutError:
+                return b""
+            return data or b""
+
+        return self.loop_thread.run(receive())
+
+    @abstractmethod
+    async def open_async(self, connection_uri, incoming_routing, outgoing_routing):
+        """Open the connection, run on the event loop"""
+
+    @abstractmethod
+    async def receive_async(self):
+        """
+        Wait for data and receive everything available, run on the event loop
+
+        :return: bytes received, or None when the connection was closed
+        """
+
+    @abstractmethod
+    async def close_async(self):
+        """Close the connection, run on the event loop"""
+
+
+class BatchingProtocol(asyncio.BufferedProtocol):
+    """
+    Protocol receiving into a reusable buffer. Data received by the transport between two reads of the client is
+    accumulated in the buffer and handed out as one batch.
+    """
+
+    def __init__(self, buffer_size):
+        """Allocate the receive buffer"""
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.filled = 0
+        self.transport = None
+        self.closed = False
+        self.ready = asyncio.Event()
+
+    def connection_made(self, transport):
+        """Keep the transport"""
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        """Supply the free space of the buffer to the transport"""
+        return self.view[self.filled :]
+
+    def buffer_updated(self, nbytes):
+        """Account for the bytes received, pausing reads while the buffer is full"""
+        self.filled += nbytes
+        if self.filled == len(self.buffer):
+            self.transport.pause_reading()
+        self.ready.set()
+
+    def connection_lost(self, exc):
+        """Wake the reader on close"""
+        self.closed = True
+        self.ready.set()
+
+    async def take(self):
+        """
+        Wait for data and take everything buffered
+
+        :return: bytes received, or None when the connection was closed and all data was taken
+        """
+        while not self.filled:
+            if self.closed:
+                return None
+            self.ready.clear()
+            await self.ready.wait()
+        data = bytes(self.view[: self.filled])
+        if self.filled == len(self.buffer) and not self.closed:
+            self.transport.resume_reading()
+        self.filled = 0
+        return data
+
+
+class AsyncTCPSocketClient(AsyncTransportClient):
+    """
+    Event loop client of the threaded tcp server, speaking the same protocol as ThreadedTCPSocketClient. Received data
+    is read into a buffer of buffer_size bytes, instead of in chunks of 1024 bytes.
+    """
+
+    def __init__(self, loop_thread=None, buffer_size=65536):
+        """
+        Constructor
+
+        :param loop_thread: event loop thread to run on. Defaults to the shared EventLoopThread.
+        :param buffer_size: size of the receive buffer, i.e. the largest batch dispatched at once
+        """
+        super().__init__(loop_thread, buffer_size)
+        self.protocol = None
+
+    async def open_async(self, connection_uri, incoming_routing, outgoing_routing):
+        """Connect to the server at a connection uri of the form (tcp://)?host:port and register"""
+        try:
+            host, port = connection_uri.split("//", 1)[-1].split(":", 1)
+            port = int(port)
+        except ValueError as vle:
+            raise TransportationException(f"Failed to parse connection uri: {connection_uri}. {vle}")
+        loop = asyncio.get_running_loop()
+        _, self.protocol = await loop.create_connection(lambda: BatchingProtocol(self.buffer_size), host, port)
+        self.protocol.transport.write(b"Register %s\n" % incoming_routing.value)
+
+    async def receive_async(self):
+        """Wait for data and receive everything available"""
+        return await self.protocol.take()
+
+    async def close_async(self):
+        """Close the connection"""
+        if self.protocol is not None:
+            self.protocol.transport.close()
+
+    def send(self, data):
+        """
+        Send data to the server, adding the headers for the server to route it. The data is written from the event loop
+        and thus sending does not block.
+
+        :param data: the data to send (What you want the destination to receive)
+        """
+        assert self.dest is not None and self.protocol is not None, "Cannot send data before connect call"
+        self.loop_thread.call(self.protocol.transport.write, b"A5A5 %s %s" % (self.dest, data))
+
+
+class AsyncZmqClient(AsyncTransportClient):
+    """
+    Event loop client of the ZeroMQ transport, compatible with ZmqClient. All messages queued on the subscription
+    socket are drained per wake-up, up to buffer_size bytes, and dispatched as one batch with the topics removed.
+    """
+
+    def __init__(self, loop_thread=None, buffer_size=65536):
+        """
+        Constructor
+
+        :param loop_thread: event loop thread to run on. Defaults to the shared EventLoopThread.
+        :param buffer_size: number of bytes after which a batch is dispatched even when more messages are queued
+        """
+        assert zmq is not None, "ZeroMQ is not available. Install pyzmq."
+        super().__init__(loop_thread, buffer_size)
+        self.context = None
+        self.incoming = None
+        self.outgoing = None
+        self.pub_topic = None
+        self.sub_topic = None
+
+    async def open_async(self, transport_url, incoming_routing, outgoing_routing):
+        """Connect to the ZeroMQ network given the pair of urls of the ZmqWrapper"""
+        assert len(transport_url) == 2, f"Must supply a pair of URLs for ZeroMQ not '{transport_url}'"
+        self.sub_topic = incoming_routing.value
+        self.pub_topic = outgoing_routing.value
+        self.context = zmq.asyncio.Context()
+        self.outgoing = self.context.socket(zmq.PUB)
+        self.outgoing.setsockopt(zmq.SNDHWM, 0)
+        self.outgoing.connect(transport_url[0])
+        self.incoming = self.context.socket(zmq.SUB)
+        self.incoming.setsockopt(zmq.RCVHWM, 0)
+        self.incoming.setsockopt(zmq.SUBSCRIBE, self.sub_topic)
+        self.incoming.connect(transport_url[1])
+
+    async def receive_async(self):
+        """Wait for a message and drain the messages queued behind it"""
+        topic_size = len(self.sub_topic)
+        frames = [await self.incoming.recv(copy=False)]
+        size = len(frames[0].buffer) - topic_size
+        while size < self.buffer_size:
+            # Non-blocking receives of zmq.asyncio return completed futures, raising zmq.Again when empty
+            try:
+                frame = self.incoming.recv(zmq.NOBLOCK, copy=False).result()
+            except zmq.Again:
+                break
+            frames.append(frame)
+            size += len(frame.buffer) - topic_size
+        return b"".join(frame.buffer[topic_size:] for frame in frames)
+
+    async def close_async(self):
+        """Close the sockets and the context"""
+        for sock in [self.incoming, self.outgoing]:
+            if sock is not None:
+                sock.close(linger=0)
+        if self.context is not None:
+            self.context.term()
+
+    def send(self, data):
+        """
+        Send data to the ZeroMQ network. The data is sent from the event loop and thus sending does not block.
+
+        :param data: the data to send
+        """
+        assert self.outgoing is not None, "Cannot send data before connect call"
+        # Must strip out ZZZZ as that is a ThreadedTcpServer only property
+        if data[:4] == b"ZZZZ":
+            data = data[4:]
+        self.loop_thread.call(self.outgoing.send, self.pub_topic + data)
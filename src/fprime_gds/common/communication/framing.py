@@ -93,6 +93,7 @@ class FpFramerDeframer(FramerDeframer):
     TOKEN_TYPE = None
     HEADER_FORMAT = None
     START_TOKEN = None
+    START_TOKEN_BYTES = None
 
     def __init__(self):
         """Sets constants on construction."""
@@ -117,6 +118,9 @@ class FpFramerDeframer(FramerDeframer):
         else:
             raise ValueError(f"Invalid TOKEN_SIZE of {FpFramerDeframer.TOKEN_SIZE}")
         FpFramerDeframer.HEADER_FORMAT = ">" + (FpFramerDeframer.TOKEN_TYPE * 2)
+        FpFramerDeframer.START_TOKEN_BYTES = struct.pack(
+            ">" + FpFramerDeframer.TOKEN_TYPE, FpFramerDeframer.START_TOKEN
+        )
 
     def frame(self, data):
         """
@@ -142,49 +146,76 @@ class FpFramerDeframer(FramerDeframer):
         consumed up to the first start token found.
 
         :param data: framed data bytes
-        :param no_copy: (optional) will prevent extra copy if True, but "data" input will be destroyed.
+        :param no_copy: (optional) unused, data is never modified by this deframer
         :return: (packet as array of bytes or None, leftover bytes)
         """
-        if not no_copy:
-            data = copy.copy(data)
+        packet, offset = self.deframe_from(data, 0)
+        return packet, data[offset:]
+
+    def deframe_all(self, data, no_copy):
+        """
+        Deframes all available packets found in a single set of bytes. Walks the data with an offset such that the
+        remaining bytes are sliced off exactly once, rather than after every packet.
+
+        :param data: framed data bytes
+        :param no_copy: (optional) unused, data is never modified by this deframer
+        :return: list of packets, leftover bytes
+        """
+        packets = []
+        offset = 0
+        while True:
+            packet, offset = self.deframe_from(data, offset)
+            if packet is None:
+                return packets, data[offset:]
+            packets.append(packet)
+
+    def deframe_from(self, data, offset):
+        """
+        Deframes a single packet from data starting at offset. Line noise and frames failing validation are skipped by
+        jumping directly to the next start token candidate, found using bytes.find. Data is not copied nor modified.
+
+        :param data: framed data bytes (bytes or bytearray)
+        :param offset: offset into data to start deframing
+        :return: (packet as bytes or None, offset of the first unconsumed byte)
+        """
+        view = memoryview(data)
         # Continue until there is not enough data for the header, or until a packet is found (return)
-        while len(data) >= FpFramerDeframer.HEADER_SIZE:
+        while len(data) - offset >= FpFramerDeframer.HEADER_SIZE:
+            found = data.find(FpFramerDeframer.START_TOKEN_BYTES, offset)
+            # No start token, discard everything but a possible partial token at the end
+            if found < 0:
+                return None, max(offset, len(data) - FpFramerDeframer.TOKEN_SIZE + 1)
+            offset = found
+            if len(data) - offset < FpFramerDeframer.HEADER_SIZE:
+                break
             # Read header information including start token and size and check if we have enough for the total size
-            start, data_size = struct.unpack_from(FpFramerDeframer.HEADER_FORMAT, data)
+            _, data_size = struct.unpack_from(FpFramerDeframer.HEADER_FORMAT, data, offset)
             total_size = (
                 FpFramerDeframer.HEADER_SIZE
                 + data_size
                 + FpFramerDeframer.CHECKSUM_SIZE
             )
-            # Invalid frame, rotate away a Byte and keep processing
-            if (
-                start != FpFramerDeframer.START_TOKEN
-                or data_size >= FpFramerDeframer.MAXIMUM_DATA_SIZE
-            ):
-                data = data[1:]
-                continue
-            # If the pool is large enough to read the whole frame, then read it
-            elif len(data) >= total_size:
-                deframed, check = struct.unpack_from(
-                    f">{data_size}sI", data, FpFramerDeframer.HEADER_SIZE
-                )
-                # If the checksum is valid, return the packet. Otherwise continue to rotate
-                if check == calculate_checksum(
-                    data[: data_size + FpFramerDeframer.HEADER_SIZE]
-                ):
-                    data = data[total_size:]
-                    return deframed, data
-                else:
-                    print(
-                        "[WARNING] Checksum validation failed. Have you correctly set '--comm-checksum-type'",
-                        file=sys.stderr,
-                    )
-                # Bad checksum, rotate 1 and keep looking for non-garbage
-                data = data[1:]
+            # Invalid frame, skip this start token and keep processing
+            if data_size >= FpFramerDeframer.MAXIMUM_DATA_SIZE:
+                offset += 1
                 continue
             # Case of not enough data for a full packet, return hoping for more later
-            return None, data
-        return None, data
+            if len(data) - offset < total_size:
+                break
+            deframed, check = struct.unpack_from(
+                f">{data_size}sI", data, offset + FpFramerDeframer.HEADER_SIZE
+            )
+            # If the checksum is valid, return the packet. Otherwise continue to the next start token
+            if check == calculate_checksum(
+                view[offset : offset + data_size + FpFramerDeframer.HEADER_SIZE]
+            ):
+                return deframed, offset + total_size
+            print(
+                "[WARNING] Checksum validation failed. Have you correctly set '--comm-checksum-type'",
+                file=sys.stderr,
+            )
+            offset += 1
+        return None, offset
 
 
 class TcpServerFramerDeframer(FramerDeframer):
@@ -31,12 +31,13 @@ class ChData(sys_data.SysData):
         Returns:
             An initialized ChData object
         """
-        super().__init__()
         self.id = ch_temp.get_id()
         self.val_obj = ch_val_obj
         self.time = ch_time
         self.template = ch_temp
         self.pkt = None
+        # Set after the fields above such that SysData does not build throw-away defaults
+        super().__init__()
 
     @staticmethod
     def get_empty_obj(ch_temp):
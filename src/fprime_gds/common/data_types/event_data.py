@@ -34,11 +34,12 @@ class EventData(sys_data.SysData):
         Returns:
             An initialized EventData object
         """
-        super().__init__()
         self.id = event_temp.get_id()
         self.args = event_args
         self.time = event_time
         self.template = event_temp
+        # Set after the fields above such that SysData does not build throw-away defaults
+        super().__init__()
 
     def get_args(self):
         return self.args
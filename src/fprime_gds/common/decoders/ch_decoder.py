@@ -18,7 +18,15 @@ Example data that would be sent to a decoder that parses channels:
 """
 from fprime.common.models.serialize.time_type import TimeType
 from fprime_gds.common.data_types.ch_data import ChData
-from fprime_gds.common.decoders.decoder import Decoder, DecodingException
+from fprime_gds.common.decoders.decoder import (
+    Decoder,
+    DecodingException,
+    deserialize_value,
+    pack_time,
+    pack_values,
+    unpack_time,
+    unpack_values,
+)
 from fprime_gds.common.utils import config_manager
 
 
@@ -43,6 +51,7 @@ class ChDecoder(Decoder):
             config = config_manager.ConfigManager().get_instance()
 
         self.__dict = ch_dict
+        self.__config = config
         self.id_obj = config.get_type("ch_id")
 
     def decode_api(self, data):
@@ -65,30 +74,82 @@ class ChDecoder(Decoder):
         ch_list = []
 
         while (ptr < len(data)):
-
-            # Decode Ch ID here...
-            self.id_obj.deserialize(data, ptr)
-            ptr += self.id_obj.getSize()
-            ch_id = self.id_obj.val
-
-            # Decode time...
-            ch_time = TimeType()
-            ch_time.deserialize(data, ptr)
-            ptr += ch_time.getSize()
-
-            if ch_id not in self.__dict:
-                raise DecodingException(f"Channel {ch_id} not found in dictionary")
-            # Retrieve the template instance for this channel
-            ch_temp = self.__dict[ch_id]
-
-            try:
-                val_obj = self.decode_ch_val(data, ptr, ch_temp)
-            except Exception as exc:
-                raise DecodingException(f"Channel {ch_temp.name} failed to decode: {exc}")
-            ch_list.append(ChData(val_obj, ch_time, ch_temp))
-            ptr += val_obj.getSize()
+            ch_data, ptr = self.decode_item(data, ptr)
+            ch_list.append(ch_data)
         return ch_list
 
+    def decode_item(self, data, ptr):
+        """
+        Decodes a single channel telemetry item from the given data
+
+        Args:
+            data: Binary telemetry channel data to decode
+            ptr: Offset into data where the channel item starts
+
+        Returns:
+            Tuple of the ChData object and the offset just past the item
+        """
+        # Decode Ch ID here...
+        self.id_obj.deserialize(data, ptr)
+        ptr += self.id_obj.getSize()
+        ch_id = self.id_obj.val
+
+        # Decode time...
+        ch_time = TimeType()
+        ch_time.deserialize(data, ptr)
+        ptr += ch_time.getSize()
+
+        if ch_id not in self.__dict:
+            raise DecodingException(f"Channel {ch_id} not found in dictionary")
+        # Retrieve the template instance for this channel
+        ch_temp = self.__dict[ch_id]
+
+        try:
+            val_obj = self.decode_ch_val(data, ptr, ch_temp)
+        except Exception as exc:
+            raise DecodingException(f"Channel {ch_temp.name} failed to decode: {exc}")
+        return ChData(val_obj, ch_time, ch_temp), ptr + val_obj.getSize()
+
+    def worker_setup(self):
+        """
+        Describes how to construct this decoder in another process, used to start the worker processes decoding channels
+
+        Returns:
+            Tuple of the decoder type and its constructor arguments, pickled by dictionary_cache.dumps
+        """
+        return type(self), (self.__dict, self.__config)
+
+    def pack_item(self, ch_data):
+        """
+        Packs a decoded channel into a tuple of plain values, used to pass decoded channels between processes
+
+        Args:
+            ch_data: ChData object produced by this decoder
+
+        Returns:
+            Tuple of channel id, packed time and value, or None if the channel type cannot be packed
+        """
+        values = pack_values([ch_data.val_obj])
+        if values is None:
+            return None
+        return ch_data.id, pack_time(ch_data.time), values[0]
+
+    def unpack_item(self, packed, times=None):
+        """
+        Restores a channel packed by pack_item
+
+        Args:
+            packed: tuple produced by pack_item
+            times: optional cache of restored time tags, see unpack_time
+
+        Returns:
+            ChData object
+        """
+        ch_id, packed_time, value = packed
+        ch_temp = self.__dict[ch_id]
+        (val_obj,) = unpack_values([ch_temp.get_type_obj()], [value])
+        return ChData(val_obj, unpack_time(packed_time, times), ch_temp)
+
     @staticmethod
     def decode_ch_val(val_data, offset, template):
         """
@@ -106,5 +167,5 @@ class ChDecoder(Decoder):
             val field.
         """
         val_obj = template.get_type_obj()()
-        val_obj.deserialize(val_data, offset)
+        deserialize_value(val_obj, val_data, offset)
         return val_obj
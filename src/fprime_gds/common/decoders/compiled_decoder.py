@@ -0,0 +1,228 @@
+"""
+@brief Precompiled struct-based decoders for channels and events
+
+The standard decoders deserialize each item field by field, allocating a type object for the id, the time tag and
+every value. These decoders instead build one struct.Struct per channel or event id when they are constructed (i.e. at
+dictionary load time) covering the id, time tag and all fixed-size values. A telemetry buffer is then decoded in a
+single unpack_from loop. Items whose values are not fixed-size (strings, arrays and serializables) fall back to the
+generic decoding path of the parent decoder.
+
+These decoders are opt-in and are selected with EncodingDecoding.compiled_decoders.
+"""
+import struct
+
+from fprime.common.models.serialize.bool_type import BoolType
+from fprime.common.models.serialize.enum_type import EnumType
+from fprime.common.models.serialize.numerical_types import NumericalType
+from fprime.common.models.serialize.time_type import TimeType
+from fprime.common.models.serialize.type_exceptions import TypeRangeException
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.decoder import DecodingException
+from fprime_gds.common.decoders.event_decoder import EventDecoder
+
+# Struct format of the time tag: time base, time context, seconds, microseconds
+TIME_FORMAT = "HBII"
+
+
+def bool_value(raw):
+    """Converts a raw serialized boolean to its value"""
+    if raw == BoolType.TRUE:
+        return True
+    if raw == BoolType.FALSE:
+        return False
+    raise TypeRangeException(raw)
+
+
+def compile_values(type_classes):
+    """
+    Compiles the struct format of a list of value types along with the converters from raw struct values to the values
+    held by each type object.
+
+    Args:
+        type_classes: list of type classes derived from BaseType
+
+    Returns:
+        Tuple (format, [(type class, converter or None), ...]) or None if any of the types is not fixed-size
+    """
+    fmt = ""
+    converters = []
+    for type_class in type_classes:
+        if issubclass(type_class, NumericalType):
+            fmt += type_class.get_serialize_format().lstrip(">")
+            converters.append((type_class, None))
+        elif issubclass(type_class, BoolType):
+            fmt += "B"
+            converters.append((type_class, bool_value))
+        elif issubclass(type_class, EnumType):
+            fmt += "i"
+            reverse = {value: key for key, value in type_class.ENUM_DICT.items()}
+            converters.append((type_class, lambda raw, reverse=reverse: enum_value(reverse, raw)))
+        else:
+            return None
+    return fmt, converters
+
+
+def enum_value(reverse, raw):
+    """Converts a raw serialized enumeration to its name using the reverse lookup"""
+    try:
+        return reverse[raw]
+    except KeyError:
+        raise TypeRangeException(raw)
+
+
+def decode_time(times, raw_time):
+    """
+    Builds the TimeType for a raw time tag. Items within one buffer sharing a time tag share the TimeType object, as
+    is done for the channels of a telemetry packet.
+
+    Args:
+        times: dictionary of raw time tags to TimeType objects already built for the current buffer
+        raw_time: tuple of time base, time context, seconds, microseconds
+
+    Returns:
+        TimeType object for the time tag
+    """
+    time_obj = times.get(raw_time)
+    if time_obj is None:
+        time_obj = TimeType(*raw_time)
+        times[raw_time] = time_obj
+    return time_obj
+
+
+def build_values(converters, raw_values):
+    """
+    Builds the type objects for a set of raw values unpacked by a compiled struct
+
+    Args:
+        converters: list of (type class, converter) as produced by compile_values
+        raw_values: raw values unpacked from the data
+
+    Returns:
+        List of type objects holding the converted values
+    """
+    values = []
+    for (type_class, converter), raw in zip(converters, raw_values):
+        val_obj = type_class()
+        val_obj._val = raw if converter is None else converter(raw)
+        values.append(val_obj)
+    return values
+
+
+class CompiledChDecoder(ChDecoder):
+    """Channel decoder using a precompiled struct per channel for fixed-size channels"""
+
+    def __init__(self, ch_dict, config):
+        """
+        CompiledChDecoder class constructor. Compiles a struct for each fixed-size channel in the dictionary.
+
+        Args:
+            ch_dict: Channel telemetry dictionary. Channel IDs should be keys
+                     and ChTemplate objects should be values
+            config: Config manager with the types of the message fields
+
+        Returns:
+            An initialized compiled channel decoder object.
+        """
+        super().__init__(ch_dict, config)
+        id_format = self.id_obj.get_serialize_format().lstrip(">")
+        self.__id_struct = struct.Struct(">" + id_format)
+        self.__compiled = {}
+        for ch_id, template in ch_dict.items():
+            compiled = compile_values([template.get_type_obj()])
+            if compiled is not None:
+                fmt, converters = compiled
+                self.__compiled[ch_id] = (struct.Struct(">" + id_format + TIME_FORMAT + fmt), converters, template)
+
+    def decode_api(self, data):
+        """
+        Decodes the given data and returns the result. Fixed-size channels are decoded with their compiled struct, all
+        others are decoded by the generic ChDecoder path.
+
+        Args:
+            data: Binary telemetry channel data to decode
+
+        Returns:
+            Parsed version of the channel telemetry data in the form of a list
+            of ChData objects
+        """
+        ptr = 0
+        ch_list = []
+        times = {}
+        while ptr < len(data):
+            (ch_id,) = self.__id_struct.unpack_from(data, ptr)
+            compiled = self.__compiled.get(ch_id)
+            if compiled is None:
+                ch_data, ptr = self.decode_item(data, ptr)
+                ch_list.append(ch_data)
+                continue
+            record, converters, template = compiled
+            try:
+                raw_values = record.unpack_from(data, ptr)
+                (val_obj,) = build_values(converters, raw_values[5:])
+                ch_time = decode_time(times, raw_values[1:5])
+            except Exception as exc:
+                raise DecodingException(f"Channel {template.name} failed to decode: {exc}")
+            ch_list.append(ChData(val_obj, ch_time, template))
+            ptr += record.size
+        return ch_list
+
+
+class CompiledEventDecoder(EventDecoder):
+    """Event decoder using a precompiled struct per event for events with only fixed-size arguments"""
+
+    def __init__(self, event_dict, config=None):
+        """
+        CompiledEventDecoder class constructor. Compiles a struct for each event whose arguments are all fixed-size.
+
+        Args:
+            event_dict: Event dictionary. Event IDs should be keys and
+                        EventTemplate objects should be values
+            config: Config manager with the types of the message fields
+
+        Returns:
+            An initialized compiled event decoder object.
+        """
+        super().__init__(event_dict, config)
+        id_format = self.id_obj.get_serialize_format().lstrip(">")
+        self.__id_struct = struct.Struct(">" + id_format)
+        self.__compiled = {}
+        for event_id, template in event_dict.items():
+            compiled = compile_values([arg_type for _, _, arg_type in template.get_args()])
+            if compiled is not None:
+                fmt, converters = compiled
+                self.__compiled[event_id] = (struct.Struct(">" + id_format + TIME_FORMAT + fmt), converters, template)
+
+    def decode_api(self, data):
+        """
+        Decodes the given data and returns the result. Events with only fixed-size arguments are decoded with their
+        compiled struct, all others are decoded by the generic EventDecoder path.
+
+        Args:
+            data: Binary data to decode
+
+        Returns:
+            Parsed version of the event data in the form of a list of
+            EventData objects
+        """
+        ptr = 0
+        event_list = []
+        times = {}
+        while ptr < len(data):
+            (event_id,) = self.__id_struct.unpack_from(data, ptr)
+            compiled = self.__compiled.get(event_id)
+            if compiled is None:
+                event, ptr = self.decode_item(data, ptr)
+                event_list.append(event)
+                continue
+            record, converters, template = compiled
+            try:
+                raw_values = record.unpack_from(data, ptr)
+                args = tuple(build_values(converters, raw_values[5:]))
+                event_time = decode_time(times, raw_values[1:5])
+            except Exception as exc:
+                raise DecodingException(f"Event {template.name} failed to decode: {exc}")
+            event_list.append(EventData(args, event_time, template))
+            ptr += record.size
+        return event_list
@@ -23,10 +23,98 @@ allow consumers to receive raw data.
 import abc
 import logging
 
+from fprime.common.models.serialize.bool_type import BoolType
+from fprime.common.models.serialize.enum_type import EnumType
+from fprime.common.models.serialize.numerical_types import NumericalType
+from fprime.common.models.serialize.string_type import StringType
+from fprime.common.models.serialize.time_type import TimeType
+
 import fprime_gds.common.handlers
 
 LOGGER = logging.getLogger("decoder")
 
+# Types whose deserialize only uses struct.unpack_from and thus accept memoryview data directly
+VIEW_SAFE_TYPES = (NumericalType, BoolType, EnumType)
+
+
+def deserialize_value(val_obj, data, offset):
+    """
+    Deserializes val_obj from data at offset. Data may be a memoryview (as handed out by the ZeroCopyDistributor). Types
+    that slice and decode their data (strings and the compound types that may hold them) do not support memoryview, so
+    for those types the remainder of the data is copied before deserializing.
+
+    :param val_obj: type object to deserialize into
+    :param data: binary data (bytes, bytearray or memoryview)
+    :param offset: offset into data where val_obj starts
+    """
+    if isinstance(data, memoryview) and not isinstance(val_obj, VIEW_SAFE_TYPES):
+        data, offset = data[offset:].tobytes(), 0
+    val_obj.deserialize(data, offset)
+
+
+# Types whose value is a plain python value that fully restores the type object, see pack_values
+PACKABLE_TYPES = VIEW_SAFE_TYPES + (StringType,)
+
+
+def pack_time(time_obj):
+    """
+    Packs a time tag into a tuple of plain values restored by unpack_time
+
+    :param time_obj: TimeType object
+    :return: tuple of time base, time context, seconds, microseconds
+    """
+    return time_obj.timeBase.value, time_obj.timeContext, time_obj.seconds, time_obj.useconds
+
+
+def unpack_time(packed, times=None):
+    """
+    Restores a TimeType packed by pack_time
+
+    :param packed: tuple produced by pack_time
+    :param times: optional dictionary of packed time tags to TimeType objects already restored, such that items sharing
+                  a time tag share the TimeType object (as do the channels decoded from one telemetry packet)
+    :return: TimeType object
+    """
+    if times is None:
+        return TimeType(*packed)
+    time_obj = times.get(packed)
+    if time_obj is None:
+        time_obj = TimeType(*packed)
+        times[packed] = time_obj
+    return time_obj
+
+
+def pack_values(val_objs):
+    """
+    Packs decoded type objects into a list of their plain values, such that decoded items may be passed between
+    processes without pickling the (possibly dynamically created) type classes.
+
+    :param val_objs: iterable of type objects
+    :return: list of values or None when any of the types cannot be packed
+    """
+    values = []
+    for val_obj in val_objs:
+        if not isinstance(val_obj, PACKABLE_TYPES):
+            return None
+        values.append(val_obj._val)
+    return values
+
+
+def unpack_values(type_classes, values):
+    """
+    Restores the type objects packed by pack_values
+
+    :param type_classes: type classes of the packed values
+    :param values: packed values
+    :return: list of type objects
+    """
+    val_objs = []
+    for type_class, value in zip(type_classes, values):
+        val_obj = type_class()
+        val_obj._val = value
+        val_objs.append(val_obj)
+    return val_objs
+
 
 class DecodingException(Exception):
     """ Decoding Exception """
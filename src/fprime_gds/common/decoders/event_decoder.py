@@ -42,6 +42,7 @@ class EventDecoder(decoder.Decoder):
             config = config_manager.ConfigManager().get_instance()
 
         self.__dict = event_dict
+        self.__config = config
         self.id_obj = config.get_type("event_id")
 
     def decode_api(self, data):
@@ -59,32 +60,84 @@ class EventDecoder(decoder.Decoder):
             or None if the data is not decodable
         """
         ptr = 0
-        
+
         event_list = []
 
         while (ptr < len(data)):
+            event, ptr = self.decode_item(data, ptr)
+            event_list.append(event)
+        return event_list
 
-            # Decode event ID here...
-            self.id_obj.deserialize(data, ptr)
-            ptr += self.id_obj.getSize()
-            event_id = self.id_obj.val
+    def decode_item(self, data, ptr):
+        """
+        Decodes a single event from the given data
 
-            # Decode time...
-            event_time = time_type.TimeType()
-            event_time.deserialize(data, ptr)
-            ptr += event_time.getSize()
+        Args:
+            data: Binary data to decode
+            ptr: Offset into data where the event starts
 
-            if event_id not in self.__dict:
-                raise DecodingException(f"Event {event_id} not found in dictionary")
+        Returns:
+            Tuple of the EventData object and the offset just past the event
+        """
+        # Decode event ID here...
+        self.id_obj.deserialize(data, ptr)
+        ptr += self.id_obj.getSize()
+        event_id = self.id_obj.val
 
-            event_temp = self.__dict[event_id]
-            
-            (size, arg_vals) = self.decode_args(data, ptr, event_temp)
+        # Decode time...
+        event_time = time_type.TimeType()
+        event_time.deserialize(data, ptr)
+        ptr += event_time.getSize()
 
-            event_list.append(event_data.EventData(arg_vals, event_time, event_temp))
-            # add up argument sizes
-            ptr += size
-        return event_list
+        if event_id not in self.__dict:
+            raise decoder.DecodingException(f"Event {event_id} not found in dictionary")
+
+        event_temp = self.__dict[event_id]
+
+        # decode_args returns the offset just past the arguments
+        (ptr, arg_vals) = self.decode_args(data, ptr, event_temp)
+        return event_data.EventData(arg_vals, event_time, event_temp), ptr
+
+    def worker_setup(self):
+        """
+        Describes how to construct this decoder in another process, used to start the worker processes decoding events
+
+        Returns:
+            Tuple of the decoder type and its constructor arguments, pickled by dictionary_cache.dumps
+        """
+        return type(self), (self.__dict, self.__config)
+
+    def pack_item(self, event):
+        """
+        Packs a decoded event into a tuple of plain values, used to pass decoded events between processes
+
+        Args:
+            event: EventData object produced by this decoder
+
+        Returns:
+            Tuple of event id, packed time and argument values, or None if an argument type cannot be packed
+        """
+        values = decoder.pack_values(event.args)
+        if values is None:
+            return None
+        return event.id, decoder.pack_time(event.time), values
+
+    def unpack_item(self, packed, times=None):
+        """
+        Restores an event packed by pack_item
+
+        Args:
+            packed: tuple produced by pack_item
+            times: optional cache of restored time tags, see unpack_time
+
+        Returns:
+            EventData object
+        """
+        event_id, packed_time, values = packed
+        event_temp = self.__dict[event_id]
+        arg_types = [arg_type for _, _, arg_type in event_temp.get_args()]
+        args = tuple(decoder.unpack_values(arg_types, values))
+        return event_data.EventData(args, decoder.unpack_time(packed_time, times), event_temp)
 
     @staticmethod
     def decode_args(arg_data, offset, template):
@@ -116,10 +169,10 @@ class EventDecoder(decoder.Decoder):
             arg_obj = arg_type()
 
             try:
-                arg_obj.deserialize(arg_data, offset)
+                decoder.deserialize_value(arg_obj, arg_data, offset)
                 arg_results.append(arg_obj)
             except TypeException as e:
-                raise DecodingException(f"Event argument decoding failed {e.getMsg()}")
+                raise decoder.DecodingException(f"Event argument decoding failed {e.getMsg()}")
 
             offset = offset + arg_obj.getSize()
 
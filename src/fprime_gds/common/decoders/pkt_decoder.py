@@ -47,6 +47,16 @@ class PktDecoder(ChDecoder):
         self.__dict = pkt_name_dict
         self.id_obj = config.get_type("pkt_id")
 
+    def worker_setup(self):
+        """
+        Describes how to construct this decoder in another process, used to start the worker processes decoding packets
+
+        Returns:
+            Tuple of the decoder type and its constructor arguments, pickled by dictionary_cache.dumps
+        """
+        decoder_type, (ch_dict, config) = super().worker_setup()
+        return decoder_type, (self.__dict, ch_dict, config)
+
     def decode_api(self, data):
         """
         Decodes the given data and returns the result.
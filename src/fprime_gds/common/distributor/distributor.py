@@ -13,10 +13,19 @@ descriptor header will be passed on to the registered objects.
 
 @bug No known bugs
 """
+import collections
 import logging
+import multiprocessing
+import pickle
+import queue
+import struct
+import threading
+import time
+
 from fprime_gds.common.utils import config_manager, data_desc_type
 from fprime_gds.common.handlers import DataHandler
 from fprime_gds.common.decoders.decoder import DecodingException
+from fprime_gds.common.loaders import dictionary_cache
 
 
 LOGGER = logging.getLogger("distributor")
@@ -199,9 +208,520 @@ class Distributor(DataHandler):
             (length, data_desc, msg) = self.parse_raw_msg_api(raw_msg)
 
             data_desc_key = data_desc_type.DataDescType(data_desc).name
+            self.distribute(data_desc_key, msg)
+
+    def start(self):
+        """
+        Starts distributing once all decoders are registered, called by the pipeline at setup. The base distributor
+        distributes in the receiving thread and has nothing to start.
+        """
+
+    def close(self):
+        """
+        Releases any resources held by the distributor. The base distributor holds none.
+        """
+
+    def distribute(self, data_desc_key, msg):
+        """
+        Sends a single message to every decoder registered for the given descriptor. Decoding errors are logged and
+        skipped such that one bad message does not stop the distribution of the rest.
+
+        Args:
+            data_desc_key (string): name of the data descriptor of the message
+            msg: message data with the length and descriptor header removed
+        """
+        for d in self.__decoders[data_desc_key]:
+            try:
+                d.data_callback(msg)
+            except DecodingException as dexc:
+                LOGGER.warning("Decoding error occurred: %s. Skipping.", dexc)
+
+
+class ZeroCopyDistributor(Distributor):
+    """
+    Distributor that parses its receive buffer with an offset cursor instead of slicing out and deleting each message.
+    Decoders are handed memoryview slices into the buffer and the consumed region is compacted only once it grows past
+    a threshold. When key framing is enabled, the buffer is searched for the key with bytes.find rather than discarding
+    noise one byte at a time.
+
+    Note: decoders receive memoryview objects that are only valid for the duration of their data_callback. Decoders
+    that keep a slice of the data beyond the callback must copy it.
+    """
+
+    def __init__(self, config=None, compact_threshold=65536):
+        """
+        Sets up the receive buffer, read cursor and the precompiled header formats.
+
+        Args:
+            config (ConfigManager, default=None): Config manager with
+                   information on what types the message fields are. If None,
+                   defaults are used.
+            compact_threshold (int): number of consumed bytes allowed at the
+                   front of the buffer before it is compacted
+        """
+        super().__init__(config)
+        self.__ring = bytearray()
+        self.__cursor = 0
+        self.__compact_threshold = compact_threshold
+        self.__len_struct = struct.Struct(self.len_obj.get_serialize_format())
+        self.__desc_struct = struct.Struct(self.desc_obj.get_serialize_format())
+        self.__key_bytes = None
+        if self.key_frame is not None:
+            self.key_obj.val = self.key_frame
+            self.__key_bytes = self.key_obj.serialize()
+        self.__desc_names = {desc.value: desc.name for desc in data_desc_type.DataDescType}
+
+    def parse_frames(self, buffer, cursor):
+        """
+        Parses all complete raw messages in buffer starting at cursor without copying any data.
+
+        Args:
+            buffer (bytearray): buffer of received data
+            cursor (int): offset of the first unparsed byte in buffer
+
+        Returns:
+            (cursor, [(desc1, start1, end1), ..., (descN, startN, endN)])
+            Where cursor is the offset of the first byte that could not yet be
+            parsed, and each start/end pair bounds the message data (length and
+            descriptor header removed) of a message with descriptor descN.
+        """
+        len_size = self.__len_struct.size
+        desc_size = self.__desc_struct.size
+        key_bytes = self.__key_bytes
+        end = len(buffer)
+
+        frames = []
+        while True:
+            header = cursor
+            if key_bytes is not None:
+                found = buffer.find(key_bytes, cursor)
+                # No key in the buffer, drop the noise but keep a possible partial key at the end
+                if found < 0:
+                    cursor = max(cursor, end - len(key_bytes) + 1)
+                    break
+                cursor = found
+                header = found + len(key_bytes)
+            # Check if we have enough data to parse a length and then the whole message
+            if end - header < len_size:
+                break
+            (length,) = self.__len_struct.unpack_from(buffer, header)
+            msg_end = header + len_size + length
+            if msg_end > end:
+                break
+            if length < desc_size:
+                LOGGER.warning("Message of length %d too short for descriptor. Skipping.", length)
+            else:
+                (desc,) = self.__desc_struct.unpack_from(buffer, header + len_size)
+                frames.append((desc, header + len_size + desc_size, msg_end))
+            cursor = msg_end
+        return cursor, frames
+
+    def on_recv(self, data):
+        """
+        Called by the internal socket client when data is received from the socket client. Appends the data to the
+        receive buffer and hands each complete message to the registered decoders as a memoryview.
+
+        Arguments:
+            data {binary} -- the data received from the socket client. May contain
+                             more than one message.
+        """
+        self.__append(data)
+        self.__cursor, frames = self.parse_frames(self.__ring, self.__cursor)
+        view = memoryview(self.__ring)
+        try:
+            for desc, start, end in frames:
+                desc_key = self.__desc_names.get(desc)
+                if desc_key is None:
+                    LOGGER.warning("Unknown data descriptor %d. Skipping.", desc)
+                    continue
+                self.distribute(desc_key, view[start:end])
+        finally:
+            view.release()
+        self.__compact()
+
+    def __append(self, data):
+        """Appends data to the receive buffer, reallocating it when a decoder still holds a view into the buffer"""
+        try:
+            self.__ring.extend(data)
+        except BufferError:
+            self.__ring = self.__ring[self.__cursor :] + data
+            self.__cursor = 0
+
+    def __compact(self):
+        """Drops consumed data from the front of the buffer once enough of it has accumulated"""
+        if self.__cursor < self.__compact_threshold and self.__cursor != len(self.__ring):
+            return
+        try:
+            del self.__ring[: self.__cursor]
+        except BufferError:
+            self.__ring = self.__ring[self.__cursor :]
+        self.__cursor = 0
+
+# Outcomes of decoding a message in a decode worker
+DECODED, DECODE_ERROR, DECODE_LOCAL = range(3)
+
+
+def decode_worker(setup, jobs, results, shard):
+    """
+    Run loop of the worker processes of the ShardedDistributor. Decodes the messages of each job and returns the
+    decoded items packed by the decoder's pack_item.
+
+    Args:
+        setup: pickled dictionary of data descriptor name to the (type, arguments) constructing the decoder of that
+               descriptor, see the decoders' worker_setup
+        jobs: queue of (sequence, data, [(index, descriptor name, start, end), ...]) jobs, None stops the worker. Each
+              message is the slice start:end of data.
+        results: queue receiving (sequence, shard, [(index, outcome, packed items or error text), ...]) results
+        shard: index of the worker, returned with its results
+    """
+    decoders = {
+        desc_key: decoder_type(*arguments) for desc_key, (decoder_type, arguments) in pickle.loads(setup).items()
+    }
+    for sequence, data, messages in iter(jobs.get, None):
+        outcomes = []
+        for index, desc_key, start, end in messages:
+            decoder = decoders[desc_key]
+            try:
+                packed = [decoder.pack_item(item) for item in decoder.decode_api(data[start:end])]
+            except Exception as exc:
+                outcomes.append((index, DECODE_ERROR, str(exc)))
+                continue
+            # Items that cannot be packed are decoded again in the parent process
+            if None in packed:
+                outcomes.append((index, DECODE_LOCAL, None))
+            else:
+                outcomes.append((index, DECODED, packed))
+        results.put((sequence, shard, outcomes))
+
+
+class ShardedDistributor(ZeroCopyDistributor):
+    """
+    Distributor decoding messages in a pool of worker processes, such that decoding is not limited to the one core
+    available under the GIL. Messages are sharded to the workers by data descriptor or by ranges of the channel or
+    event id at the start of the message. Workers return the decoded items packed into plain tuples (see
+    ChDecoder.pack_item), which are restored and sent to the consumers of the registered decoders in this process.
+
+    Only descriptors with a single registered decoder providing pack_item/unpack_item (channels and events) are sent to
+    the workers, all other messages are decoded in this process. Messages are distributed to consumers in the order
+    they were received, regardless of the worker that decoded them, from a collector thread.
+
+    Workers are started by start, called by the pipeline once the decoders have been registered, or otherwise on the
+    first received data. Workers are started with the "forkserver" or "spawn" start method, as forking a process
+    running the transport and other threads may deadlock the child. Each worker constructs its decoders from their
+    worker_setup, pickled along with the dictionaries by dictionary_cache.dumps.
+
+    Jobs of a worker that died, or whose queue stays full past put_timeout, are failed over: their messages are
+    decoded in this process and counted in failed_over. Data received once closed is decoded in this process.
+    """
 
-            for d in self.__decoders[data_desc_key]:
-                try:
-                    d.data_callback(msg)
-                except DecodingException as dexc:
-                    LOGGER.warning("Decoding error occurred: %s. Skipping.", dexc)
\ No newline at end of file
+    SHARD_MODES = ["descriptor", "id"]
+    START_METHODS = ["forkserver", "spawn"]
+    POLL_INTERVAL = 0.25  # Seconds between the checks of the collector for dead workers
+
+    def __init__(
+        self,
+        config=None,
+        workers=2,
+        shard="descriptor",
+        id_range=256,
+        queue_size=64,
+        start_method=None,
+        put_timeout=1.0,
+    ):
+        """
+        Sets up the sharding of the distributor. Worker processes are started by start.
+
+        Args:
+            config (ConfigManager, default=None): Config manager with
+                   information on what types the message fields are. If None,
+                   defaults are used.
+            workers (int): number of decoding worker processes
+            shard (str): "descriptor" to shard by data descriptor, "id" to shard by ranges of channel or event ids
+            id_range (int): number of consecutive ids decoded by the same worker when sharding by id
+            queue_size (int): number of jobs queued per worker before receiving blocks
+            start_method (str): start method of the worker processes, one of START_METHODS. Default: the first
+                                available on this platform
+            put_timeout (float): seconds to wait for room in the queue of a worker before decoding the job in this
+                                 process
+        """
+        super().__init__(config)
+        assert shard in self.SHARD_MODES, f"Shard mode must be one of {self.SHARD_MODES}"
+        assert workers > 0, "Sharded distributor requires at least one worker"
+        if start_method is None:
+            start_method = next(
+                method for method in self.START_METHODS if method in multiprocessing.get_all_start_methods()
+            )
+        assert start_method in self.START_METHODS, f"Start method must be one of {self.START_METHODS}"
+        self.start_method = start_method
+        self.workers = workers
+        self.shard = shard
+        self.id_range = id_range
+        self.queue_size = queue_size
+        self.put_timeout = put_timeout
+        self.failed_over = 0
+        self.__registered = collections.defaultdict(list)
+        self.__desc_names = {desc.value: desc.name for desc in data_desc_type.DataDescType}
+        self.__buffer = bytearray()
+        self.__lock = threading.Lock()
+        self.__pending = {}
+        self.__next_sequence = 0
+        self.__next_emit = 0
+        self.__closed = False
+        # Set when started
+        self.__sharded = None
+        self.__jobs = []
+        self.__processes = []
+        self.__outstanding = []
+        self.__failed = set()
+        self.__results = None
+        self.__collector = None
+
+    def register(self, typeof, obj):
+        """
+        Register a decoder for a data descriptor
+
+        Args:
+            typeof (string): name of the data descriptor
+            obj: decoder to register
+        """
+        assert self.__sharded is None, "Cannot register decoders after the sharded distributor started"
+        super().register(typeof, obj)
+        self.__registered[typeof].append(obj)
+
+    def start(self):
+        """
+        Start the worker processes and the collector thread, once all decoders are registered. Raises a
+        pickle.PicklingError when the decoders cannot be set up in the workers.
+        """
+        if self.__sharded is not None:
+            return
+        sharded = {
+            desc_key: (decoders[0], struct.Struct(decoders[0].id_obj.get_serialize_format()), shard)
+            for shard, (desc_key, decoders) in enumerate(
+                (desc_key, decoders)
+                for desc_key, decoders in self.__registered.items()
+                if len(decoders) == 1
+                and all(hasattr(decoders[0], name) for name in ("pack_item", "id_obj", "worker_setup"))
+            )
+        }
+        setup = dictionary_cache.dumps(
+            {desc_key: decoder.worker_setup() for desc_key, (decoder, _, _) in sharded.items()}
+        )
+        self.__sharded = sharded
+        context = multiprocessing.get_context(self.start_method)
+        self.__results = context.Queue()
+        for shard in range(self.workers):
+            jobs = context.Queue(self.queue_size)
+            process = context.Process(
+                target=decode_worker, args=(setup, jobs, self.__results, shard), name="DecodeWorker", daemon=True
+            )
+            process.start()
+            self.__jobs.append(jobs)
+            self.__processes.append(process)
+            self.__outstanding.append(set())
+        self.__collector = threading.Thread(target=self.__collect, name="DecodeCollector", daemon=True)
+        self.__collector.start()
+
+    def shard_of(self, desc_key, data, start):
+        """
+        Select the worker decoding a message
+
+        Args:
+            desc_key (string): name of the data descriptor of the message
+            data: received data holding the message
+            start: offset of the message data, after the length and descriptor header, in data
+
+        Returns:
+            index of the worker
+        """
+        _, id_struct, shard = self.__sharded[desc_key]
+        if self.shard == "id":
+            (ident,) = id_struct.unpack_from(data, start)
+            shard = ident // self.id_range
+        return shard % self.workers
+
+    def on_recv(self, data):
+        """
+        Called by the internal socket client when data is received from the socket client. Sends the complete messages
+        to the workers decoding them and queues the rest to be decoded in this process once preceding messages are.
+
+        Arguments:
+            data {binary} -- the data received from the socket client. May contain
+                             more than one message.
+        """
+        if self.__sharded is None and not self.__closed:
+            self.start()
+        sharded = self.__sharded if not self.__closed else {}
+        self.__buffer.extend(data)
+        cursor, frames = self.parse_frames(self.__buffer, 0)
+        if not frames:
+            return
+        # One copy of the complete messages is shared by the jobs of this chunk
+        chunk = bytes(self.__buffer[:cursor])
+        del self.__buffer[:cursor]
+        entries = []
+        jobs = collections.defaultdict(list)
+        for desc, start, end in frames:
+            desc_key = self.__desc_names.get(desc)
+            if desc_key is None:
+                LOGGER.warning("Unknown data descriptor %d. Skipping.", desc)
+                continue
+            if desc_key in sharded and end - start >= sharded[desc_key][1].size:
+                jobs[self.shard_of(desc_key, chunk, start)].append((len(entries), desc_key, start, end))
+            entries.append((desc_key, start, end))
+        with self.__lock:
+            closed = self.__closed
+            if not closed:
+                # Jobs of dead workers are decoded in this process
+                jobs = {shard: messages for shard, messages in jobs.items() if shard not in self.__failed}
+                sequence = self.__next_sequence
+                self.__next_sequence += 1
+                self.__pending[sequence] = [chunk, entries, {}, len(jobs)]
+                for shard in jobs:
+                    self.__outstanding[shard].add(sequence)
+        # Once closed there is no collector left, the chunk is decoded here
+        if closed:
+            self.__emit(chunk, entries, {})
+            return
+        wake = not jobs
+        for shard, messages in jobs.items():
+            try:
+                self.__jobs[shard].put((sequence, chunk, messages), timeout=self.put_timeout)
+            except queue.Full:
+                with self.__lock:
+                    if self.__fail_over(shard, sequence):
+                        LOGGER.warning("Decode worker %d queue full, decoding its job in this process", shard)
+                        wake = True
+        # Wake the collector to distribute data decoded entirely in this process
+        if wake:
+            self.__results.put((sequence, None, None))
+
+    def __fail_over(self, shard, sequence):
+        """
+        Decode the messages of an outstanding job in this process rather than in its worker. Called with the lock held.
+
+        Args:
+            shard: index of the worker of the job
+            sequence: sequence of the chunk of the job
+
+        Returns:
+            True if the job was failed over, False if it was no longer outstanding
+        """
+        if sequence not in self.__outstanding[shard]:
+            return False
+        self.__outstanding[shard].remove(sequence)
+        self.__pending[sequence][3] -= 1
+        self.failed_over += 1
+        return True
+
+    def __check_workers(self):
+        """
+        Fail over the outstanding jobs of workers that died. Workers stopped by close exit normally once their results
+        are queued, and workers terminated by close have their jobs dropped. Called with the lock held.
+        """
+        for shard, process in enumerate(self.__processes):
+            if shard in self.__failed or process.is_alive() or process.exitcode == 0:
+                continue
+            self.__failed.add(shard)
+            outstanding = sorted(self.__outstanding[shard])
+            LOGGER.error(
+                "Decode worker %d exited with code %s, decoding its %d outstanding jobs in this process",
+                process.pid,
+                process.exitcode,
+                len(outstanding),
+            )
+            for sequence in outstanding:
+                self.__fail_over(shard, sequence)
+
+    def __collect(self):
+        """
+        Collector thread loop restoring decoded items and distributing them in order of reception. Results are polled
+        such that workers that died are noticed and their outstanding jobs failed over.
+        """
+        stopping = False
+        while not stopping:
+            try:
+                received = self.__results.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                received = (None, None, None)
+            # Workers have stopped once None is received, the results of those not terminated are all received
+            stopping = received is None
+            sequence, shard, outcomes = received or (None, None, None)
+            ready = []
+            with self.__lock:
+                # Chunks without jobs are only marked to wake this thread, and may have been distributed already.
+                # Results of jobs failed over are dropped, these jobs were decoded in this process.
+                if outcomes is not None and sequence in self.__outstanding[shard]:
+                    self.__outstanding[shard].remove(sequence)
+                    pending = self.__pending[sequence]
+                    pending[2].update((index, (outcome, result)) for index, outcome, result in outcomes)
+                    pending[3] -= 1
+                self.__check_workers()
+                while self.__next_emit in self.__pending and self.__pending[self.__next_emit][3] == 0:
+                    ready.append(self.__pending.pop(self.__next_emit))
+                    self.__next_emit += 1
+            for chunk, entries, decoded, _ in ready:
+                self.__emit(chunk, entries, decoded)
+
+    def __emit(self, chunk, entries, decoded):
+        """
+        Distribute the messages of one received chunk
+
+        Args:
+            chunk: received data holding the messages
+            entries: list of (descriptor name, start, end) of the messages in chunk
+            decoded: dictionary of entry index to (outcome, result) for the messages decoded by the workers
+        """
+        view = memoryview(chunk)
+        times = {}
+        for index, (desc_key, start, end) in enumerate(entries):
+            outcome, result = decoded.get(index, (DECODE_LOCAL, None))
+            try:
+                if outcome == DECODED:
+                    decoder = self.__sharded[desc_key][0]
+                    for packed in result:
+                        decoder.send_to_all(decoder.unpack_item(packed, times))
+                elif outcome == DECODE_ERROR:
+                    LOGGER.warning("Decoding error occurred: %s. Skipping.", result)
+                else:
+                    self.distribute(desc_key, view[start:end])
+            except Exception as exc:
+                LOGGER.warning("Failed to distribute %s message: %s. Skipping.", desc_key, exc)
+
+    def close(self, timeout=5.0):
+        """
+        Stop the workers once they decoded all queued messages and distribute the remaining results. Workers not done
+        within the timeout are terminated, dropping the messages they did not decode. Data received afterwards is
+        decoded in this process.
+
+        Args:
+            timeout (float): seconds to wait for the workers to finish
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+        if self.__sharded is None:
+            return
+        deadline = time.monotonic() + timeout
+        for jobs, process in zip(self.__jobs, self.__processes):
+            if not process.is_alive():
+                continue
+            try:
+                jobs.put(None, timeout=max(deadline - time.monotonic(), 0))
+            except queue.Full:
+                pass  # Worker is stuck and terminated below
+        for shard, process in enumerate(self.__processes):
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                LOGGER.warning("Decode worker %d did not stop within %.1fs. Terminating.", process.pid, timeout)
+                # Jobs of terminated workers are dropped rather than failed over
+                with self.__lock:
+                    self.__failed.add(shard)
+                process.terminate()
+                process.join()
+        # Collector only has the results already returned left to distribute
+        self.__results.put(None)
+        self.__collector.join(timeout)
+        if self.__collector.is_alive():
+            LOGGER.warning("Decode collector did not stop within %.1fs", timeout)
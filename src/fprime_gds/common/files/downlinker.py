@@ -12,12 +12,16 @@ to the correct log files and destination files
 
 import logging
 import os
+import threading
+import time
 
 import fprime.constants
 import fprime_gds.common.handlers
 from fprime_gds.common.data_types.file_data import FilePacketType
 from fprime_gds.common.files.helpers import (
     FileStates,
+    ReceivedRanges,
+    Timeout,
     TransmitFile,
     TransmitFileState,
     file_to_dict,
@@ -27,8 +31,47 @@ LOGGER = logging.getLogger("downlink")
 LOGGER.setLevel(logging.INFO)
 
 
+class Downlink:
+    """
+    State of one file being downlinked: the file written, the next sequence id expected, the ranges received, the
+    progress counters, when the downlink started and last received a packet, and the timeout of the downlink.
+    """
+
+    def __init__(self, transmit_file, timeout, callback, index):
+        """
+        Construct the downlink of a file whose START packet was received
+
+        :param transmit_file: TransmitFile opened for writing
+        :param timeout: seconds without packets before the downlink times out
+        :param callback: called with this downlink on timeout
+        :param index: index of the START packet among the packets received by the downlinker
+        """
+        self.file = transmit_file
+        self.sequence = 1
+        self.ranges = ReceivedRanges()
+        self.packets = 0
+        self.unordered = 0
+        self.started = index
+        self.last_index = index
+        self.last_packet = time.monotonic()
+        self.last_progress = self.last_packet
+        self.timer = Timeout()
+        self.timer.setup(callback, timeout, args=(self,))
+
+
 class FileDownlinker(fprime_gds.common.handlers.DataHandler):
-    """File writer class for decoded packets"""
+    """
+    File writer class for decoded packets. Several files may be downlinked at once, each keyed by its source path. As
+    only START packets carry the path, the other packets are attributed to the one downlink expecting their sequence
+    id, or else to the only downlink in progress. Packets are never attributed by guessing: downlinks expecting the same
+    sequence id, e.g. downlinks sent in lockstep, are aborted and packets matching none of several downlinks are
+    dropped. A downlink whose END packet was lost is canceled once another downlink starts and it receives no more
+    packets, so that the next file is received in full. DATA packets may arrive out of order, the ranges missing at
+    the end of a downlink are reported.
+    """
+
+    PROGRESS_INTERVAL = 1.0  # Seconds between the progress messages of a downlink
+    QUIET_INTERVAL = 2.0  # Seconds without packets after which a downlink is canceled when another starts
 
     def __init__(self, directory, timeout=20.0, log_dir=None):
         """
@@ -45,12 +88,11 @@ class FileDownlinker(fprime_gds.common.handlers.DataHandler):
         super().__init__()
         self.__directory = directory
         self.__log_dir = log_dir if log_dir is not None else directory
-        self.active = None
+        self.__timeout = timeout
+        self.__lock = threading.Lock()
+        self.__received = 0
+        self.downlinks = {}
         self.files = []
-        self.state = FileStates.IDLE
-        self.sequence = 0  # Keeps track of what the current sequence ID should be
-        self.timer = fprime_gds.common.files.helpers.Timeout()
-        self.timer.setup(self.timeout, timeout)
         os.makedirs(self.__directory, exist_ok=True)
 
     def data_callback(self, data, sender=None):
@@ -60,19 +102,81 @@ class FileDownlinker(fprime_gds.common.handlers.DataHandler):
         Args:
             data: Binary data that has been decoded and passed to the correct consumer
         """
-        self.timer.restart()  # Start or restart the timer
         packet_type = data.packetType
-        # Check the packet type, and route to the appropriate sub-function
-        if packet_type == FilePacketType.START:
-            self.handle_start(data)
-        elif packet_type == FilePacketType.DATA:
-            self.handle_data(data)
-        elif packet_type == FilePacketType.END:
-            self.handle_end(data)
-        elif packet_type == FilePacketType.CANCEL:
-            self.handle_cancel(data)
+        # Packets are also handled from the timer thread on timeout
+        with self.__lock:
+            self.__received += 1
+            # Check the packet type, and route to the appropriate sub-function
+            if packet_type == FilePacketType.START:
+                self.handle_start(data)
+                return
+            downlink = self.find(data)
+            if downlink is None:
+                return
+            downlink.timer.restart()
+            downlink.last_index = self.__received
+            downlink.last_packet = time.monotonic()
+            if packet_type == FilePacketType.DATA:
+                self.handle_data(downlink, data)
+            elif packet_type == FilePacketType.END:
+                self.handle_end(downlink, data)
+            elif packet_type == FilePacketType.CANCEL:
+                self.handle_cancel(downlink, data)
+            else:
+                LOGGER.warning("Invalid file detected descriptor detected: %d", packet_type)
+
+    def find(self, data):
+        """
+        Find the downlink a packet, other than a START packet, belongs to. Of downlinks expecting the same sequence id,
+        those that received DATA packets but none since another of them started are canceled as superseded. Others
+        cannot be told apart, they are aborted rather than mixing up their files.
+
+        :param data: packet to find the downlink of
+        :return: the one downlink expecting the sequence id of the packet, else the only downlink, or None
+        """
+        packet_type = data.packetType.name
+        expecting = [downlink for downlink in self.downlinks.values() if downlink.sequence == data.seqID]
+        receiving = [downlink for downlink in expecting if not self.superseded(downlink, expecting)]
+        if len(receiving) == 1:
+            for downlink in expecting:
+                if downlink is not receiving[0]:
+                    self.log(downlink, logging.WARNING, "No packets received since another downlink started, canceling")
+                    self.finish(downlink, "CANCELED")
+            return receiving[0]
+        if expecting:
+            LOGGER.warning(
+                "Received %s packet %d expected by %d downlinks, aborting them", packet_type, data.seqID, len(expecting)
+            )
+            for downlink in expecting:
+                self.log(downlink, logging.WARNING, "Packets cannot be told apart from another downlink, aborting")
+                self.finish(downlink, "CANCELED")
+            return None
+        if len(self.downlinks) == 1:
+            return next(iter(self.downlinks.values()))
+        if self.downlinks:
+            LOGGER.warning(
+                "Received %s packet %d expected by none of %d downlinks, dropping it",
+                packet_type,
+                data.seqID,
+                len(self.downlinks),
+            )
         else:
-            LOGGER.warning("Invalid file detected descriptor detected: %d", packet_type)
+            LOGGER.warning("Received unexpected %s packet", packet_type)
+        return None
+
+    @staticmethod
+    def superseded(downlink, others):
+        """
+        Check whether a downlink received DATA packets but none since another downlink started, e.g. its END packet
+        was lost before the next file was sent.
+
+        :param downlink: downlink to check
+        :param others: downlinks that may have started since
+        :return: True when the downlink was superseded, False otherwise
+        """
+        return downlink.packets > 0 and any(
+            downlink.last_index < other.started for other in others if other is not downlink
+        )
 
     def handle_start(self, data):
         """
@@ -84,103 +188,150 @@ class FileDownlinker(fprime_gds.common.handlers.DataHandler):
         size = data.size
         source_path = data.sourcePath.decode(fprime.constants.DATA_ENCODING)
         dest_path = data.destPath.decode(fprime.constants.DATA_ENCODING)
-        if self.state != FileStates.IDLE:
-            LOGGER.warning("File transfer already inprogress. Aborting original.")
-            self.finish()
+        if source_path in self.downlinks:
+            LOGGER.warning("File transfer of %s already inprogress. Aborting original.", source_path)
+            self.finish(self.downlinks[source_path], "CANCELED")
+        # Downlinks gone quiet most likely lost their END packet, do not let them clash with the new downlink
+        now = time.monotonic()
+        for downlink in list(self.downlinks.values()):
+            if now - downlink.last_packet >= self.QUIET_INTERVAL:
+                self.log(
+                    downlink,
+                    logging.WARNING,
+                    "No packets received for %.1f seconds as another downlink starts, canceling",
+                    now - downlink.last_packet,
+                )
+                self.finish(downlink, "CANCELED")
         # Create the destination file where the DATA packet data will be stored
-        assert self.active is None, "File is already open, something went wrong"
-        self.active = TransmitFile(
+        transmit_file = TransmitFile(
             source_path,
             os.path.join(self.__directory, self.sanitize(dest_path)),
             size,
             self.__log_dir,
         )
-        self.active.open(TransmitFileState.WRITE)
-        LOGGER.addHandler(self.active.log_handler)
+        transmit_file.open(TransmitFileState.WRITE)
+        downlink = Downlink(transmit_file, self.__timeout, self.timeout, self.__received)
         message = "Received START packet with metadata:\n"
         message += "\tSize: %d\n"
         message += "\tSource: %s\n"
         message += "\tDestination: %s"
-        LOGGER.info(message, size, source_path, dest_path)
-        self.files.append(self.active)
-        self.state = FileStates.RUNNING
-        self.sequence += 1
+        self.log(downlink, logging.INFO, message, size, source_path, dest_path)
+        self.files.append(transmit_file)
+        self.downlinks[source_path] = downlink
+        downlink.timer.start()
 
-    def handle_data(self, data):
+    def handle_data(self, downlink, data):
         """
-        Handle the data packet.
+        Handle the data packet. Instead of logging each packet, the progress is logged every PROGRESS_INTERVAL.
 
+        :param downlink: downlink the packet belongs to
         :param data: data packet
         """
         # Initialize all relevant DATA packet attributes into variables from file_data
         offset = data.offset
-        if self.state != FileStates.RUNNING:
-            LOGGER.warning("Received unexpected data packet for offset: %d", offset)
-        else:
-            if data.seqID != self.sequence:
-                LOGGER.warning(
-                    "Data packet has unexpected sequence id. Expected: %d got %d",
-                    self.sequence,
-                    data.seqID,
-                )
-            data_bytes = data.dataVar
-            # Write the data information to the file
-            self.active.write(data_bytes, offset)
-            self.active.seek = offset + len(data_bytes)
-            LOGGER.info(
-                "Received DATA packet writing %d bytes to offset %s",
-                len(data_bytes),
-                offset,
+        data_bytes = data.dataVar
+        if data.seqID != downlink.sequence:
+            downlink.unordered += 1
+        downlink.sequence = max(downlink.sequence, data.seqID + 1)
+        # Write the data information to the file
+        downlink.file.write(data_bytes, offset)
+        downlink.ranges.add(offset, len(data_bytes))
+        downlink.file.seek = downlink.ranges.received
+        downlink.packets += 1
+        now = time.monotonic()
+        if now - downlink.last_progress >= self.PROGRESS_INTERVAL:
+            downlink.last_progress = now
+            self.log(
+                downlink,
+                logging.INFO,
+                "Received %d of %d bytes in %d DATA packets",
+                downlink.ranges.received,
+                downlink.file.size,
+                downlink.packets,
             )
-        self.sequence += 1
 
-    def handle_cancel(self, _):
+    def handle_cancel(self, downlink, _):
         """
         Handle cancel packet.
 
+        :param downlink: downlink the packet belongs to
         :param _: data unused in cancel packet
         """
         # CANCEL Packets have no data
-        if self.state != FileStates.RUNNING:
-            LOGGER.warning("Received unexpected cancel packet")
-        else:
-            LOGGER.info("Received CANCEL packet, stopping downlink")
-            self.finish()
+        self.log(downlink, logging.INFO, "Received CANCEL packet, stopping downlink")
+        self.finish(downlink, "CANCELED")
 
-    def handle_end(self, data):
+    def handle_end(self, downlink, data):
         """
-        Handle the end packet.
+        Handle the end packet, reporting the ranges of the file never received.
 
+        :param downlink: downlink the packet belongs to
         :param data: end packet
         """
         # Initialize all relevant END packet attributes into variables from file_data
         # hashValue attribute is not relevant right now, but might be in the future
-        if self.state != FileStates.RUNNING:
-            LOGGER.warning("Received unexpected END packet")
-        else:
-            if data.seqID != self.sequence:
-                LOGGER.warning(
-                    "End packet has unexpected sequence id. Expected: %d got %d",
-                    self.sequence,
-                    data.seqID,
-                )
-            LOGGER.info("Received END packet, finishing downlink")
-            self.finish()
-
-    def timeout(self):
-        """Timeout the current downlink"""
-        LOGGER.warning("Timeout while downlinking file, aborting")
-        self.finish()
-
-    def finish(self):
-        """Finish the file downlink"""
-        self.timer.stop()
-        self.state = FileStates.IDLE
-        self.sequence = 0
-        self.active.state = "FINISHED"
-        LOGGER.removeHandler(self.active.log_handler)
-        self.active.close()
-        self.active = None
+        if data.seqID != downlink.sequence:
+            self.log(
+                downlink,
+                logging.WARNING,
+                "End packet has unexpected sequence id. Expected: %d got %d",
+                downlink.sequence,
+                data.seqID,
+            )
+        if downlink.unordered:
+            self.log(downlink, logging.WARNING, "Received %d DATA packets out of sequence", downlink.unordered)
+        missing = downlink.ranges.missing(downlink.file.size)
+        if missing:
+            self.log(
+                downlink,
+                logging.WARNING,
+                "Missing %d bytes in %d ranges (offset, length): %s",
+                sum(length for _, length in missing),
+                len(missing),
+                ", ".join(f"({offset}, {length})" for offset, length in missing),
+            )
+        self.log(
+            downlink,
+            logging.INFO,
+            "Received END packet, finishing downlink of %d bytes in %d DATA packets",
+            downlink.ranges.received,
+            downlink.packets,
+        )
+        self.finish(downlink)
+
+    def timeout(self, downlink):
+        """Timeout the given downlink"""
+        with self.__lock:
+            if self.downlinks.get(downlink.file.source) is downlink:
+                self.log(downlink, logging.WARNING, "Timeout while downlinking file, aborting")
+                self.finish(downlink, "TIMEOUT")
+
+    def finish(self, downlink, state="FINISHED"):
+        """Finish the given file downlink, in the given state: FINISHED, CANCELED or TIMEOUT"""
+        downlink.timer.stop()
+        downlink.file.state = state
+        downlink.file.close()
+        del self.downlinks[downlink.file.source]
+
+    @staticmethod
+    def log(downlink, level, message, *args):
+        """
+        Log a message of a downlink, both to the downlink logger and to the log file of the downlinked file
+
+        :param downlink: downlink the message is about
+        :param level: logging level of the message
+        :param message: message format string
+        :param args: message arguments
+        """
+        LOGGER.log(level, message, *args)
+        handler = downlink.file.log_handler
+        if handler is not None and LOGGER.isEnabledFor(level):
+            handler.handle(LOGGER.makeRecord(LOGGER.name, level, __file__, 0, message, args, None))
+
+    @property
+    def state(self):
+        """Running while any file is downlinking, idle otherwise"""
+        return FileStates.RUNNING if self.downlinks else FileStates.IDLE
 
     def current_files(self):
         """Return the current list of downlinked files"""
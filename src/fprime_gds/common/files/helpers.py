@@ -4,32 +4,118 @@ helpers.py:
 Helpers for file uplink, and downlink. This contains shared components, classes, and support architecture in order to
 enable both file uplink and downlink to share the same structures. This includes the following shared objects:
 
-1. Timeout: for managing timeouts and timeout responses
+1. Timeout: for managing timeouts and timeout responses, run by the shared TimerService
 2. FileStates: managing the state of an uplink or downlinking file
 3. CFDPChecksum: calculates the CFDP checksum for files
-4. TransmitFile:  file object for up and down
+4. ReceivedRanges: tracks the received, and thus the missing, ranges of a downlinking file
+5. TransmitFile:  file object for up and down
 
 @author mstarch, and Blake A. Harriman's work
 """
+import array
+import bisect
 import datetime
 import enum
+import heapq
+import itertools
 import logging
+import mmap
 import os
-import struct
+import sys
 import threading
+import time
 from pathlib import Path
 
+LOGGER = logging.getLogger("files")
+
+
+class TimerService:
+    """
+    Single thread expiring all the Timeouts of the process. Deadlines are kept in a heap, with at most one entry per
+    started Timeout. Restarting a Timeout only moves its deadline later, which the service picks up when the stale heap
+    entry comes due, so restarting on every file packet is O(1) and creates no thread. Stopping a Timeout removes its
+    entry, such that the heap does not hold on to stopped Timeouts and their callback arguments. Callbacks are run on
+    the service thread and should be short, as they delay the callbacks due after them.
+    """
+
+    __SHARED = None
+    __SHARED_LOCK = threading.Lock()
+
+    def __init__(self, name="TimerService"):
+        """Start the service thread"""
+        self.__heap = []
+        self.__counter = itertools.count()
+        self.__condition = threading.Condition()
+        self.__thread = threading.Thread(target=self.__run, name=name, daemon=True)
+        self.__thread.start()
+
+    @classmethod
+    def shared(cls):
+        """Get the timer service shared by all Timeouts not supplied with their own, starting it if needed"""
+        with cls.__SHARED_LOCK:
+            if cls.__SHARED is None:
+                cls.__SHARED = cls()
+            return cls.__SHARED
+
+    def __len__(self):
+        """Number of scheduled expiry checks"""
+        with self.__condition:
+            return len(self.__heap)
+
+    def schedule(self, timeout, generation, deadline):
+        """
+        Schedule an expiry check of a timeout
+
+        :param timeout: Timeout to check
+        :param generation: generation of the timeout the check is for, checks of older generations are ignored
+        :param deadline: time.monotonic time of the check
+        """
+        with self.__condition:
+            heapq.heappush(self.__heap, (deadline, next(self.__counter), timeout, generation))
+            if self.__heap[0][2] is timeout:
+                self.__condition.notify()
+
+    def cancel(self, timeout):
+        """
+        Remove the scheduled expiry checks of a timeout
+
+        :param timeout: Timeout stopped
+        """
+        with self.__condition:
+            heap = [entry for entry in self.__heap if entry[2] is not timeout]
+            if len(heap) != len(self.__heap):
+                heapq.heapify(heap)
+                self.__heap = heap
+
+    def __run(self):
+        """Wait for the next deadline and have its timeout expire, which reschedules itself when restarted since"""
+        while True:
+            with self.__condition:
+                while not self.__heap or self.__heap[0][0] > time.monotonic():
+                    self.__condition.wait(self.__heap[0][0] - time.monotonic() if self.__heap else None)
+                _, _, timeout, generation = heapq.heappop(self.__heap)
+            timeout.expire(generation)
+
 
 class Timeout:
     """
-    Starts a timeout thread and will respond with a callback to a function when the timeout expires.
+    Responds with a callback to a function when the timeout expires. Timeouts are run by a TimerService, by default
+    the one shared by the process, instead of a thread each. The state of the timeout is guarded by its lock, such that
+    a restart or stop racing the expiry either moves the deadline or prevents the callback.
     """
 
-    def __init__(self):
-        """Sets up needed member variables"""
-        self.__timer = None
+    def __init__(self, service=None):
+        """Sets up needed member variables
+
+        :param service: timer service running the timeout. Default: the shared TimerService
+        """
+        self.__service = service if service is not None else TimerService.shared()
+        self.__lock = threading.Lock()
         self.__timeout = None
         self.__callback = None
+        self.__deadline = None
+        self.__generation = 0
+        self.__running = False
         self.args = ()
 
     def setup(self, callback, timeout=5, args=()):
@@ -46,26 +132,60 @@ class Timeout:
 
     def start(self):
         """Starts the timeout after a previous setup."""
-        assert self.__timer is None, "Timer already started, call restart() instead"
+        with self.__lock:
+            self.__start()
+
+    def __start(self):
+        """Starts the timeout, called with the lock held"""
+        assert not self.__running, "Timer already started, call restart() instead"
         assert self.__callback is not None, "Setup timeout before calling start"
         assert self.__timeout is not None, "Setup timeout before calling start"
-        self.__timer = threading.Timer(self.__timeout, self.__callback, args=self.args)
-        self.__timer.start()
+        self.__generation += 1
+        self.__deadline = time.monotonic() + self.__timeout
+        self.__running = True
+        self.__service.schedule(self, self.__generation, self.__deadline)
 
     def restart(self):
         """
-        Restarts the given timer first canceling and then starting it again.
+        Restarts the given timer. A running timer only has its deadline moved, which the timer service sees when the
+        previous deadline comes.
         """
-        self.stop()
-        self.start()
+        with self.__lock:
+            if self.__running:
+                self.__deadline = time.monotonic() + self.__timeout
+            else:
+                self.__start()
 
     def stop(self):
         """
         Stops the timeout preventing a callback to the stored function.
         """
-        if self.__timer is not None:
-            self.__timer.cancel()
-            self.__timer = None
+        with self.__lock:
+            running = self.__running
+            self.__running = False
+            self.__generation += 1
+            if running:
+                self.__service.cancel(self)
+
+    def expire(self, generation):
+        """
+        Expire the timeout on behalf of the timer service once a deadline of the given generation came. The timeout is
+        rescheduled when restarted since, and ignored when stopped since.
+
+        :param generation: generation the deadline was scheduled for
+        """
+        with self.__lock:
+            if generation != self.__generation or not self.__running:
+                return
+            if self.__deadline > time.monotonic():
+                self.__service.schedule(self, generation, self.__deadline)
+                return
+            self.__running = False
+            self.__generation += 1
+        try:
+            self.__callback(*self.args)
+        except Exception as exc:
+            LOGGER.exception("Timeout callback failed: %s", exc)
 
 
 class FileStates(enum.Enum):
@@ -80,31 +200,134 @@ class FileStates(enum.Enum):
 
 
 class CFDPChecksum:
-    """Class running the CFDG checksum"""
+    """
+    Class running the CFDP checksum: the sum, modulo 2^32, of the file as big-endian 32 bit words with each byte
+    placed in its word by its offset in the file and partial words zero padded. The aligned body of the data is summed
+    in bulk as an array of words, only the unaligned head and tail are handled bytewise.
+    """
+
+    BLOCK_SIZE = 16 * 1024 * 1024  # Bytes of a file summed at once by from_file
+    WORD_TYPE = "I" if array.array("I").itemsize == 4 else "L"
 
     def __init__(self):
         """Set initial value as zero"""
         self.__value = 0
 
     def update(self, data, offset):
-        """Update the checksum"""
-        while data:
-            padding_len = offset % 4
-            calc_bytes = (
-                bytes([0] * padding_len) + data[: 4 - padding_len] + bytes([0, 0, 0, 0])
-            )
-            self.__value = (
-                self.__value + struct.unpack_from(">I", calc_bytes, 0)[0]
-            ) & 0xFFFFFFFF
-            # Update pointers
-            data = data[4 - padding_len :]
-            offset = offset + (4 - padding_len)
+        """
+        Update the checksum
+
+        :param data: bytes-like data to add
+        :param offset: offset of the data in the file
+        """
+        data = memoryview(data).cast("B")
+        total = 0
+        # Unaligned head, filling the word at offset up to the next word boundary
+        padding_len = offset % 4
+        head_len = min(len(data), (4 - padding_len) % 4)
+        if head_len:
+            total += int.from_bytes(data[:head_len], "big") << (8 * (4 - padding_len - head_len))
+        # Aligned body, summed as words
+        body_len = (len(data) - head_len) & ~3
+        if body_len:
+            words = array.array(self.WORD_TYPE)
+            words.frombytes(data[head_len : head_len + body_len])
+            if sys.byteorder == "little":
+                words.byteswap()
+            total += sum(words)
+        # Unaligned tail, the start of the word after the body
+        tail = data[head_len + body_len :]
+        if tail:
+            total += int.from_bytes(tail, "big") << (8 * (4 - len(tail)))
+        self.__value = (self.__value + total) & 0xFFFFFFFF
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Checksum a whole file. The file is memory mapped and summed a block at a time, such that files larger than the
+        memory available can be summed.
+
+        :param path: path to the file
+        :return: CFDPChecksum of the file
+        """
+        checksum = cls()
+        with open(path, "rb") as file_handle:
+            if os.fstat(file_handle.fileno()).st_size == 0:
+                return checksum  # Empty files cannot be mapped
+            with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                for offset in range(0, len(view), cls.BLOCK_SIZE):
+                    with view[offset : offset + cls.BLOCK_SIZE] as block:
+                        checksum.update(block, offset)
+        return checksum
 
     @property
     def value(self):
         return self.__value
 
 
+class ReceivedRanges:
+    """
+    Tracks the byte ranges of a file received so far as sorted, disjoint [start, end) ranges. Data received in order
+    only extends the last range. Data received out of order is merged with the ranges it overlaps or touches. The
+    missing ranges are the gaps left between the received ones.
+    """
+
+    def __init__(self):
+        """Start with nothing received"""
+        self.__starts = []
+        self.__ends = []
+        self.__received = 0
+
+    def add(self, offset, length):
+        """
+        Add a received range, data received more than once is only counted once
+
+        :param offset: offset of the received data
+        :param length: length of the received data
+        """
+        if length <= 0:
+            return
+        end = offset + length
+        if self.__ends and self.__ends[-1] == offset:
+            self.__ends[-1] = end
+            self.__received += length
+            return
+        # Ranges overlapping or touching the new range, [first, last), are merged into one
+        first = bisect.bisect_left(self.__ends, offset)
+        last = bisect.bisect_right(self.__starts, end)
+        start = offset
+        covered = 0
+        if first < last:
+            start = min(offset, self.__starts[first])
+            end = max(end, self.__ends[last - 1])
+            covered = sum(self.__ends[index] - self.__starts[index] for index in range(first, last))
+        self.__starts[first:last] = [start]
+        self.__ends[first:last] = [end]
+        self.__received += end - start - covered
+
+    def missing(self, size):
+        """
+        Get the ranges not received of a file of the given size
+
+        :param size: size of the file
+        :return: list of (offset, length) tuples of the missing ranges
+        """
+        gaps = []
+        position = 0
+        for start, end in zip(self.__starts, self.__ends):
+            if start > position:
+                gaps.append((position, start - position))
+            position = max(position, end)
+        if position < size:
+            gaps.append((position, size - position))
+        return gaps
+
+    @property
+    def received(self):
+        """Number of distinct bytes received"""
+        return self.__received
+
+
 class TransmitFileState(enum.Enum):
     READ = 0
     WRITE = 1
@@ -112,9 +335,12 @@ class TransmitFileState(enum.Enum):
 
 class TransmitFile:
     """
-    Wraps the file information needed for the uplink and downlinking processes.
+    Wraps the file information needed for the uplink and downlinking processes. Writes are buffered, consecutive writes
+    are collected in the write buffer and only writes out of order seek, flushing it.
     """
 
+    WRITE_BUFFER_SIZE = 64 * 1024
+
     def __init__(self, source, destination, size=None, log_dir=None):
         """Construct the uplink file"""
         self.__mode = None
@@ -126,6 +352,7 @@ class TransmitFile:
         self.__seek = 0
         self.__state = "QUEUED"
         self.__fd = None
+        self.__position = 0
         self.__checksum = CFDPChecksum()
         self.__log_dir = log_dir
         self.__log_handler = None
@@ -140,12 +367,15 @@ class TransmitFile:
             filepath = self.__destination
             Path(filepath).touch(exist_ok=True)
             filemode = "rb+"
+            buffering = self.WRITE_BUFFER_SIZE
         else:
             filepath = self.__source
             filemode = "rb"
+            buffering = -1
 
         self.__state = "TRANSMITTING"
-        self.__fd = open(filepath, filemode)
+        self.__fd = open(filepath, filemode, buffering=buffering)
+        self.__position = 0
         self.__start = datetime.datetime.utcnow()
         if self.__log_dir is not None:
             self.__log_handler = logging.FileHandler(
@@ -168,8 +398,10 @@ class TransmitFile:
         """
         assert self.__fd is not None, "Must open file before writing"
         assert self.__mode == TransmitFileState.WRITE, "Cannot write in READ mode"
-        self.__fd.seek(offset)
+        if offset != self.__position:
+            self.__fd.seek(offset)
         self.__fd.write(chunk)
+        self.__position = offset + len(chunk)
 
     def close(self):
         """
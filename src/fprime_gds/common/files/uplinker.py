@@ -3,7 +3,9 @@ uplinker.py:
 
 Contains the code necessary to uplink files through the F prime ground system to a running deployment. The file uplink
 process will read in a file from the OS, and uplink it in chunks. The system throttles chunks of the file requiring a
-handshake packet in return before the next chunk is sent out.
+handshake packet in return for each chunk sent out. By default only one chunk is outstanding at a time, such that the
+uplink rate is one chunk per round trip. A window of several outstanding chunks may be configured to keep links with
+real latency busy.
 
 @author lestarch
 """
@@ -148,19 +150,30 @@ class FileUplinker(fprime_gds.common.handlers.DataHandler):
     """
 
     CHUNK_SIZE = 256
+    MAX_CHUNK_SIZE = 0xFFFF  # DATA packets carry a U16 length
 
-    def __init__(self, file_encoder, chunk=CHUNK_SIZE, timeout=20):
+    def __init__(self, file_encoder, chunk=CHUNK_SIZE, timeout=20, window=1):
         """
         Constructor to build the file uplinker.
+
+        :param file_encoder: encoder sending the file packets
+        :param chunk: bytes of file data per DATA packet
+        :param timeout: seconds without handshake before the uplink times out
+        :param window: number of DATA packets sent ahead of their handshakes
         """
+        assert 0 < chunk <= self.MAX_CHUNK_SIZE, f"Chunk size must be within 1 and {self.MAX_CHUNK_SIZE}"
+        assert window > 0, "Window must be at least one packet"
         self.state = FileStates.IDLE
         self.queue = UplinkQueue(self)
         self.active = None
         self.sequence = 0
         self.chunk = chunk
+        self.window = window
         self.file_encoder = file_encoder
         self.__destination_dir = "/"
-        self.__expected = []
+        self.__expected = set()
+        self.__read_all = False
+        self.__lock = threading.RLock()
         self.__timeout = Timeout()
         self.__timeout.setup(self.timeout, timeout)
 
@@ -232,26 +245,30 @@ class FileUplinker(fprime_gds.common.handlers.DataHandler):
             raise FileUplinkerBusyException(
                 f"Currently uplinking file '{self.active.source}' cannot start uplinking '{file_obj.source}'"
             )
-        self.state = FileStates.RUNNING
-        self.active = file_obj
-        self.active.open(TransmitFileState.READ)
-        self.send(
-            StartPacketData(
-                self.get_next_sequence(),
-                self.active.size,
-                self.active.source,
-                self.active.destination,
+        with self.__lock:
+            self.state = FileStates.RUNNING
+            self.active = file_obj
+            self.active.open(TransmitFileState.READ)
+            self.__read_all = False
+            self.__expected.clear()
+            self.send(
+                StartPacketData(
+                    self.get_next_sequence(),
+                    self.active.size,
+                    self.active.source,
+                    self.active.destination,
+                )
             )
-        )
 
     def send(self, packet_data):
         """
-        A function to send the packet out.  Starts timeout and then pushes the packet to the file encoder.
+        A function to send the packet out.  Starts timeout and then pushes the packet to the file encoder. The handshake
+        of the packet is then expected alongside those of the other outstanding packets.
 
         :param packet_data: packet data to send that will be pushed to the encoder
         """
         self.__timeout.restart()
-        self.__expected = self.file_encoder.data_callback(packet_data)[8:]
+        self.__expected.add(bytes(self.file_encoder.data_callback(packet_data)[8:]))
 
     def data_callback(self, data, sender=None):
         """
@@ -260,35 +277,44 @@ class FileUplinker(fprime_gds.common.handlers.DataHandler):
 
         :param data: data from handshake packet to be verified against that previously sent
         """
-        # Ignore handshakes not for us
-        if not self.valid_handshake(data):
-            return
-        # If it is an end-wait or a cancel state, respond without reading next chunk
-        if self.state == FileStates.END_WAIT:
-            self.active.state = (
-                "FINISHED" if self.active.state != "CANCELED" else "CANCELED"
-            )
-            self.state = FileStates.IDLE
-            self.queue.busy.release()  # Allow the queue to continue
-            self.__timeout.stop()
-            return
-        elif self.state == FileStates.CANCELED:
-            self.send(CancelPacketData(self.get_next_sequence()))
-            self.finish()
-            return
-        # Read next chunk of data.  b'' means the file is empty
-        outgoing = self.active.read(self.chunk)
-        if outgoing == b"":
-            self.send(
-                EndPacketData(self.get_next_sequence(), self.active.checksum.value)
-            )
-            self.finish()
-        else:
-            self.active.checksum.update(outgoing, self.active.seek)
-            self.send(
-                DataPacketData(self.get_next_sequence(), self.active.seek, outgoing)
-            )
-            self.active.seek += len(outgoing)
+        # Handshakes of a window may arrive while the window is still being sent
+        with self.__lock:
+            # Ignore handshakes not for us
+            if not self.valid_handshake(data):
+                return
+            self.__expected.discard(bytes(data))
+            # If it is an end-wait or a cancel state, respond without reading next chunk
+            if self.state == FileStates.END_WAIT:
+                self.active.state = (
+                    "FINISHED" if self.active.state != "CANCELED" else "CANCELED"
+                )
+                self.state = FileStates.IDLE
+                self.queue.busy.release()  # Allow the queue to continue
+                self.__timeout.stop()
+                return
+            elif self.state == FileStates.CANCELED:
+                # Outstanding packets are abandoned, only the cancel handshake is awaited
+                self.__expected.clear()
+                self.send(CancelPacketData(self.get_next_sequence()))
+                self.finish()
+                return
+            # Refill the window with the next chunks of data. b'' means the whole file was read
+            while len(self.__expected) < self.window and not self.__read_all:
+                outgoing = self.active.read(self.chunk)
+                if outgoing == b"":
+                    self.__read_all = True
+                    break
+                self.active.checksum.update(outgoing, self.active.seek)
+                self.send(
+                    DataPacketData(self.get_next_sequence(), self.active.seek, outgoing)
+                )
+                self.active.seek += len(outgoing)
+            # End once all data was handshaken, as the END packet carries the checksum of the whole file
+            if self.__read_all and not self.__expected:
+                self.send(
+                    EndPacketData(self.get_next_sequence(), self.active.checksum.value)
+                )
+                self.finish()
 
     def cancel(self):
         """
@@ -303,8 +329,9 @@ class FileUplinker(fprime_gds.common.handlers.DataHandler):
 
     def timeout(self):
         """Handles timeout o file packet by finishing the upload immediately, and setting the state to timeout"""
-        self.finish(False)
-        self.active.state = "TIMEOUT"
+        with self.__lock:
+            self.finish(False)
+            self.active.state = "TIMEOUT"
 
     def finish(self, wait_for_handshake=True):
         """
@@ -320,7 +347,7 @@ class FileUplinker(fprime_gds.common.handlers.DataHandler):
         # Immediate termination items
         if not wait_for_handshake:
             self.state = FileStates.IDLE
-            self.__expected = []
+            self.__expected.clear()
             self.queue.busy.release()
             self.__timeout.stop()
 
@@ -333,12 +360,13 @@ class FileUplinker(fprime_gds.common.handlers.DataHandler):
     def valid_handshake(self, data):
         """
         Check the handshake data and ensure that it is as expected. This will allow us to only handle handshakes that
-        we expected. This will ensure that the handshake data is an exact match of the send data.
+        we expected. This will ensure that the handshake data is an exact match of the data of one of the packets sent
+        and awaiting their handshake.
 
         :param data: data to check against what was transmitted
         :return: True, if proper handshake, False otherwise
         """
-        return data == self.__expected
+        return bytes(data) in self.__expected
 
     @property
     def destination_dir(self):
@@ -4,14 +4,19 @@ chrono.py:
 A chronologically-ordered history that relies on predicates to provide filtering, searching, and
 retrieval operations. This history will re-order itself based on FSW time.
 
+Objects are kept sorted alongside a parallel list of numeric time keys, such that insertion and time lookup are
+bisections rather than scans of the history.
+
 :author: koran
 """
+import bisect
+
 from fprime.common.models.serialize.time_type import TimeType
-from fprime_gds.common.history.history import History
+from fprime_gds.common.history.history import AwaitableHistory
 from fprime_gds.common.testing_fw import predicates
 
 
-class ChronologicalHistory(History):
+class ChronologicalHistory(AwaitableHistory):
     """
     A chronological history to support the GDS test api. This history adds support for specifying
     start with predicates and python's bracket notation.
@@ -28,8 +33,12 @@ class ChronologicalHistory(History):
         Args:
             filter_pred: an optional predicate to filter incoming data_objects
         """
+        super().__init__()
         self.objects = []
         self.new_objects = []
+        # Sorted time keys paralleling the objects and new_objects lists
+        self.__keys = []
+        self.__new_keys = []
 
         self.filter = predicates.always_true()
         if filter_pred is not None:
@@ -50,9 +59,12 @@ class ChronologicalHistory(History):
             sender: unused API value
         """
         if self.filter(data):
-            self.__insert_chrono(data, self.new_objects)
-            index = self.__insert_chrono(data, self.objects)
-            self.retrieved_cursor = min(index, self.retrieved_cursor)
+            key = self.time_key(data.get_time())
+            with self.condition:
+                self.__insert_chrono(data, key, self.new_objects, self.__new_keys)
+                index = self.__insert_chrono(data, key, self.objects, self.__keys)
+                self.retrieved_cursor = min(index, self.retrieved_cursor)
+                self.notify_update()
 
     def retrieve(self, start=None):
         """
@@ -66,10 +78,12 @@ class ChronologicalHistory(History):
         Returns:
             a list of objects in chronological order
         """
-        index = 0 if start is None else self.__get_index(start, self.objects)
-        self.retrieved_cursor = self.size()
-        self.new_objects.clear()
-        return self.objects[index:]
+        with self.condition:
+            index = 0 if start is None else self.__get_index(start, self.objects, self.__keys)
+            self.retrieved_cursor = self.size()
+            self.new_objects.clear()
+            self.__new_keys.clear()
+            return self.objects[index:]
 
     def retrieve_new(self, repeats=False):
         """
@@ -79,16 +93,19 @@ class ChronologicalHistory(History):
         Returns:
             a list of objects in chronological order
         """
-        index = self.retrieved_cursor
-        self.retrieved_cursor = self.size()
+        with self.condition:
+            index = self.retrieved_cursor
+            self.retrieved_cursor = self.size()
 
-        if repeats:
-            self.new_objects.clear()
-            return self.objects[index:]
-        else:
-            new = self.new_objects
-            self.new_objects = []
-            return new
+            if repeats:
+                self.new_objects.clear()
+                self.__new_keys.clear()
+                return self.objects[index:]
+            else:
+                new = self.new_objects
+                self.new_objects = []
+                self.__new_keys = []
+                return new
 
     def clear(self, start=None):
         """
@@ -103,16 +120,18 @@ class ChronologicalHistory(History):
             start: start: an optional indicator for the first item to remove. Can be a predicate, a
                 TimeType or an index in the ordering
         """
-        index = self.__clear_list(start, self.objects)
+        with self.condition:
+            index = self.__clear_list(start, self.objects, self.__keys)
 
-        if len(self.objects) > 0:
-            start = self.objects[0].get_time()
-            self.__clear_list(start, self.new_objects)
-        else:
-            self.new_objects.clear()
+            if len(self.objects) > 0:
+                start = self.objects[0].get_time()
+                self.__clear_list(start, self.new_objects, self.__new_keys)
+            else:
+                self.new_objects.clear()
+                self.__new_keys.clear()
 
-        self.retrieved_cursor -= index
-        self.retrieved_cursor = max(self.retrieved_cursor, 0)
+            self.retrieved_cursor -= index
+            self.retrieved_cursor = max(self.retrieved_cursor, 0)
 
     def size(self):
         """
@@ -149,46 +168,63 @@ class ChronologicalHistory(History):
     #   helper methods
     ###########################################################################
     @staticmethod
-    def __insert_chrono(data_object, ordered):
+    def time_key(time):
         """
-        traverses the existing order (back to front) and inserts the data object in the correct
-        position chronologically.
+        Computes a numeric key for a time that orders identically to TimeType comparison: by time base, seconds,
+        microseconds and then time context.
+
+        Args:
+            time: a TimeType
+        Returns:
+            the numeric key (int)
+        """
+        return (
+            ((time.timeBase.value << 32) + time.seconds) * 1000000 + time.useconds
+        ) * 256 + time.timeContext
+
+    @staticmethod
+    def __insert_chrono(data_object, key, ordered, keys):
+        """
+        bisects the existing order and inserts the data object in the correct position chronologically. Objects are
+        inserted before any object with an equal time.
         Args:
             data_object: an item to insert in the history. Must have a get_time() method.
+            key: the time key of data_object
             ordered: a list to insert the item into.
+            keys: the sorted time keys of ordered
         Returns:
-            the index that the item was inserted at (int)
+            the index of the item preceding the inserted item, or 0 if it is the earliest (int)
         """
-        for i, item in reversed(list(enumerate(ordered))):
-            if item.get_time() < data_object.get_time():
-                ordered.insert(i + 1, data_object)
-                return i
-        # If the data object is the earliest in the list or the list was empty
-        ordered.insert(0, data_object)
-        return 0
+        index = bisect.bisect_left(keys, key)
+        keys.insert(index, key)
+        ordered.insert(index, data_object)
+        return max(index - 1, 0)
 
-    def __clear_list(self, start, ordered):
+    def __clear_list(self, start, ordered, keys):
         """
         finds the index that start specifies
         Args:
             start: an optional indicator for the first item to remove. Can be a predicate, a
                 TimeType or an index in the ordering
             ordered: the list to clear
+            keys: the sorted time keys of ordered
         Returns:
             the index in the given list that start refers to
         """
-        index = len(ordered) if start is None else self.__get_index(start, ordered)
+        index = len(ordered) if start is None else self.__get_index(start, ordered, keys)
         del ordered[:index]
+        del keys[:index]
         return index
 
-    @staticmethod
-    def __get_index(start, ordered):
+    @classmethod
+    def __get_index(cls, start, ordered, keys):
         """
         finds the index that start specifies
         Args:
             start: an indicator of a position in an order can be a predicate, a TimeType time
                 stamp or an index in the ordering
             ordered: the list to clear
+            keys: the sorted time keys of ordered
         Returns:
             the index in the given list that start refers to
         """
@@ -198,9 +234,6 @@ class ChronologicalHistory(History):
                 index += 1
             return index
         elif isinstance(start, TimeType):
-            index = 0
-            while index < len(ordered) and ordered[index].get_time() < start:
-                index += 1
-            return index
+            return bisect.bisect_left(keys, cls.time_key(start))
         else:
             return start
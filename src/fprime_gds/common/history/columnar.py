@@ -0,0 +1,327 @@
+"""
+columnar.py:
+
+A bounded-memory history storing channel samples in per-channel ring buffers of columns. Each channel keeps the time
+base, time context, seconds, microseconds and value of its last `capacity` samples in `array.array` columns rather than
+as individual ChData objects, each carrying its own TimeType and value object. ChData objects are materialized only
+when retrieved.
+
+Channels whose values are not fixed-size numbers, booleans or enumerations (e.g. strings, serializables) as well as
+non-channel items (events, commands) are kept as objects in per-id rings of the same capacity. Thus, this history may
+be used for all histories via `Histories.implementation`.
+
+Note: like the RAM history, this history treats "start" as a session token remembering where it was last fetched from.
+Sessions that fall more than `capacity` samples of a channel behind lose the overwritten samples. Like the
+SelfCleaningRamHistory, sessions not retrieved for the clear time are forgotten once set with `set_clear_time`.
+"""
+import abc
+import array
+import heapq
+import threading
+import time
+
+from fprime.common.models.serialize.bool_type import BoolType
+from fprime.common.models.serialize.enum_type import EnumType
+from fprime.common.models.serialize.numerical_types import NumericalType
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.history.history import History
+
+
+def column_typecode(type_class):
+    """
+    Get the array typecode used to store values of the given type, or None when values must be stored as objects
+
+    :param type_class: type class of the channel
+    :return: array typecode or None
+    """
+    if issubclass(type_class, NumericalType):
+        fmt = type_class.get_serialize_format()[-1]
+        if fmt in "fd":
+            return "d"
+        return "q" if fmt.islower() else "Q"
+    if issubclass(type_class, (BoolType, EnumType)):
+        return "q"
+    return None
+
+
+class Ring(abc.ABC):
+    """Base ring of the last `capacity` items of one channel (or id) ordered by their sequence number"""
+
+    def __init__(self, capacity):
+        """Constructor allocating the ring's sequence column
+
+        :param capacity: maximum number of items stored
+        """
+        self.capacity = capacity
+        self.head = 0
+        self.count = 0
+        self.sequences = array.array("Q", bytes(8 * capacity))
+
+    def physical(self, index):
+        """Physical position of the logical index where 0 is the oldest stored item"""
+        return (self.head - self.count + index) % self.capacity
+
+    def advance(self, sequence):
+        """Claim the next position in the ring for an item with the given sequence number, returning the position"""
+        position = self.head
+        self.sequences[position] = sequence
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return position
+
+    def first_at_or_after(self, sequence):
+        """Logical index of the first stored item whose sequence number is at least the given sequence"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.sequences[self.physical(middle)] < sequence:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def drop_before(self, sequence):
+        """Forget stored items whose sequence number is less than the given sequence"""
+        dropped = self.first_at_or_after(sequence)
+        for index in range(dropped):
+            self.release(self.physical(index))
+        self.count -= dropped
+
+    def iterate(self, sequence):
+        """Yield (sequence, logical index, ring) of items at or after the given sequence number in order"""
+        for index in range(self.first_at_or_after(sequence), self.count):
+            yield self.sequences[self.physical(index)], index, self
+
+    @abc.abstractmethod
+    def append(self, sequence, item):
+        """Store an item with the given sequence number overwriting the oldest item when full"""
+        raise NotImplementedError("Ring must implement append")
+
+    def release(self, position):
+        """Release references held at the given position"""
+
+    @abc.abstractmethod
+    def materialize(self, index):
+        """Get the item at the given logical index"""
+        raise NotImplementedError("Ring must implement materialize")
+
+
+class ItemRing(Ring):
+    """Ring of the last `capacity` items of one channel (or id) stored as objects"""
+
+    def __init__(self, capacity):
+        """Constructor allocating the ring's item storage
+
+        :param capacity: maximum number of items stored
+        """
+        super().__init__(capacity)
+        self.items = [None] * capacity
+
+    def append(self, sequence, item):
+        """Store an item with the given sequence number overwriting the oldest item when full"""
+        self.items[self.advance(sequence)] = item
+
+    def release(self, position):
+        """Release the item held at the given position"""
+        self.items[position] = None
+
+    def materialize(self, index):
+        """Get the item at the given logical index"""
+        return self.items[self.physical(index)]
+
+
+class ChannelRing(Ring):
+    """Ring of the last `capacity` samples of one fixed-size channel stored as time and value columns"""
+
+    def __init__(self, template, typecode, capacity):
+        """Constructor allocating the ring's columns
+
+        :param template: channel template of the stored channel
+        :param typecode: array typecode of the value column
+        :param capacity: maximum number of samples stored
+        """
+        super().__init__(capacity)
+        self.template = template
+        self.type_class = template.get_type_obj()
+        self.bases = array.array("H", bytes(2 * capacity))
+        self.contexts = array.array("B", bytes(capacity))
+        self.seconds = array.array("I", bytes(array.array("I").itemsize * capacity))
+        self.useconds = array.array("I", bytes(array.array("I").itemsize * capacity))
+        self.values = array.array(typecode, bytes(8 * capacity))
+        self.is_bool = issubclass(self.type_class, BoolType)
+        self.enum_names = None
+        if issubclass(self.type_class, EnumType):
+            self.enum_names = {value: name for name, value in self.type_class.ENUM_DICT.items()}
+
+    def append(self, sequence, item):
+        """Store the time and value of a ChData sample overwriting the oldest sample when full"""
+        item_time = item.time
+        value = item.val_obj.val
+        if self.enum_names is not None:
+            value = self.type_class.ENUM_DICT[value]
+        position = self.advance(sequence)
+        self.bases[position] = item_time.timeBase.value
+        self.contexts[position] = item_time.timeContext
+        self.seconds[position] = item_time.seconds
+        self.useconds[position] = item_time.useconds
+        self.values[position] = value
+
+    def materialize(self, index):
+        """Build the ChData object for the sample at the given logical index"""
+        position = self.physical(index)
+        value = self.values[position]
+        if self.enum_names is not None:
+            value = self.enum_names[value]
+        elif self.is_bool:
+            value = bool(value)
+        val_obj = self.type_class()
+        val_obj._val = value
+        item_time = TimeType(
+            self.bases[position],
+            self.contexts[position],
+            self.seconds[position],
+            self.useconds[position],
+        )
+        return ChData(val_obj, item_time, self.template)
+
+
+class ColumnarHistory(History):
+    """
+    Bounded-memory history storing the last `capacity` samples of each channel in columnar ring buffers. Items are
+    returned in the order they were received.
+    """
+
+    # Default number of samples retained per channel (or per event/command id)
+    CAPACITY = 10000
+
+    def __init__(self, capacity=None):
+        """
+        Constructor used to set-up the rings of the history
+
+        :param capacity: number of samples retained per channel. Defaults to ColumnarHistory.CAPACITY
+        """
+        self.lock = threading.RLock()
+        self.capacity = capacity if capacity is not None else self.CAPACITY
+        self.rings = {}
+        self.next_sequence = 0
+        self.retrieved_cursors = {}
+        self.last_request = {}
+        self.clear_time = -1
+
+    def set_clear_time(self, clear_time):
+        """Update the time in seconds after which sessions not retrieved are forgotten, negative never forgets"""
+        self.clear_time = clear_time
+
+    def data_callback(self, data, sender=None):
+        """
+        Data callback to store
+
+        :param data: object to store
+        """
+        with self.lock:
+            ring = self.rings.get(data.id)
+            if ring is None:
+                ring = self.rings[data.id] = self.new_ring(data)
+            ring.append(self.next_sequence, data)
+            self.next_sequence += 1
+
+    def new_ring(self, data):
+        """
+        Build the ring used to store items like the supplied item
+
+        :param data: first item to store in the ring
+        :return: columnar ring for fixed-size channels, object ring otherwise
+        """
+        if isinstance(data, ChData) and data.val_obj is not None:
+            typecode = column_typecode(data.template.get_type_obj())
+            if typecode is not None:
+                return ChannelRing(data.template, typecode, self.capacity)
+        return ItemRing(self.capacity)
+
+    def gather(self, sequence, limit=None):
+        """
+        Gather stored items with a sequence number of at least sequence in order, materializing them
+
+        :param sequence: first sequence number to return
+        :param limit: maximum number of items to return
+        :return: tuple of list of items, sequence number just past the last returned item
+        """
+        iterators = [ring.iterate(sequence) for ring in self.rings.values()]
+        items = []
+        for seq, index, ring in heapq.merge(*iterators):
+            if limit is not None and len(items) >= limit:
+                break
+            items.append(ring.materialize(index))
+            sequence = seq + 1
+        return items, sequence
+
+    def retrieve(self, start=None, limit=None):
+        """
+        Retrieve objects from this history. 'start' is the session token for retrieving new elements. If session is not
+        specified, all elements are retrieved. If session is specified, then unseen elements are returned. If the
+        session itself is new, it is recorded and set to the newest data.
+
+        :param start: return all objects newer than given start session key
+        :param limit: limit (count) of returned results
+        :return: a list of objects
+        """
+        with self.lock:
+            sequence = 0
+            if start is not None:
+                self.last_request[start] = time.time()
+                sequence = self.retrieved_cursors.get(start, self.next_sequence)
+            objs, self.retrieved_cursors[start] = self.gather(sequence, limit)
+        return objs
+
+    def retrieve_new(self):
+        """
+        Retrieves a chronological order of objects that haven't been accessed through retrieve or
+        retrieve_new before.
+
+        Returns:
+            a list of objects in the order received
+        """
+        with self.lock:
+            sequence = max(self.retrieved_cursors.values(), default=0)
+            return self.gather(sequence)[0]
+
+    def clear(self, start=None):
+        """
+        Clears objects from the history. It clears upto the earliest session. If session is supplied, the session id
+        will be deleted as well. Sessions not retrieved for the clear time are deleted too, unless it is negative.
+
+        Args:
+            start: a session token
+        """
+        current = time.time()
+        with self.lock:
+            expired = [
+                key
+                for key, last in self.last_request.items()
+                if self.clear_time > 0 and (last + self.clear_time) < current
+            ]
+            for key in expired + ([start] if start is not None else []):
+                self.retrieved_cursors.pop(key, None)
+                self.last_request.pop(key, None)
+            earliest = min(self.retrieved_cursors.values(), default=0)
+            for ring in self.rings.values():
+                ring.drop_before(earliest)
+
+    def sessions(self):
+        """
+        Accessor for the number of stored sessions
+
+        Returns:
+            number of tracked sessions
+        """
+        return len(self.retrieved_cursors)
+
+    def size(self):
+        """
+        Accessor for the number of objects in the history
+        Returns:
+            the number of objects (int)
+        """
+        with self.lock:
+            return sum(ring.count for ring in self.rings.values())
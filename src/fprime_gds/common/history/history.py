@@ -6,6 +6,7 @@ An ordered history that defines what interfaces a history should have within the
 :author: koran
 """
 import abc
+import threading
 
 import fprime_gds.common.handlers
 
@@ -67,3 +68,38 @@ class History(fprime_gds.common.handlers.DataHandler):
             the number of objects (int)
         """
         raise NotImplementedError("This history didn't override the size method.")
+
+
+class AwaitableHistory(History):
+    """
+    A history that notifies waiting threads as items are added. Each accepted item increments an update count, and
+    waiters block on a condition variable until the count moves past the count they last saw. This allows searches to
+    wake as soon as new items arrive rather than polling, with float timeouts usable from any thread.
+
+    Implementers must call `notify_update` after storing an item, and may hold `condition` to make their stores and
+    retrievals atomic.
+    """
+
+    def __init__(self):
+        """Constructor setting up the condition variable and update count"""
+        self.condition = threading.Condition(threading.RLock())
+        self.update_count = 0
+
+    def notify_update(self):
+        """Record an update to the history and wake all waiting threads"""
+        with self.condition:
+            self.update_count += 1
+            self.condition.notify_all()
+
+    def wait_for_update(self, seen, timeout=None):
+        """
+        Block until the history has been updated beyond the seen update count, or the timeout elapses.
+
+        Args:
+            seen: the update count last seen by the caller (read before its last retrieval)
+            timeout: maximum number of seconds to wait (float). None waits indefinitely.
+        Returns:
+            True if the history was updated, False on timeout
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: self.update_count != seen, timeout)
@@ -0,0 +1,76 @@
+"""
+latest.py:
+
+An index of the latest value of each channel. Displays only interested in the current value of each channel (e.g. the
+channels table) may retrieve the channels updated since they last looked rather than every sample received.
+
+Each update increments a monotonically increasing counter. Channels are kept in the order of their last update such
+that retrieving the channels changed since a counter only visits the changed channels.
+"""
+import collections
+import threading
+
+from fprime_gds.common.handlers import DataHandler
+
+
+class LatestValueIndex(DataHandler):
+    """
+    Index of the most recently received item of each id along with an update counter. Items are ordered by reception,
+    not by time tag.
+    """
+
+    def __init__(self):
+        """Constructor used to set-up the index"""
+        self.lock = threading.Lock()
+        self.latest = collections.OrderedDict()
+        self.counter = 0
+
+    def data_callback(self, data, sender=None):
+        """
+        Data callback recording the item as the latest of its id
+
+        :param data: item to record
+        :param sender: unused sender
+        """
+        with self.lock:
+            self.counter += 1
+            self.latest[data.id] = (self.counter, data)
+            self.latest.move_to_end(data.id)
+
+    def retrieve(self, since=None):
+        """
+        Retrieve the latest items of the ids updated after the given counter. Counters beyond the current counter were
+        issued by a previous index, and thus every latest item is returned.
+
+        :param since: counter returned by a previous retrieve. None retrieves the latest item of every id.
+        :return: tuple of current counter, list of latest items in order of update
+        """
+        with self.lock:
+            if since is None or since > self.counter:
+                return self.counter, [data for _, data in self.latest.values()]
+            changed = []
+            for counter, data in reversed(self.latest.values()):
+                if counter <= since:
+                    break
+                changed.append(data)
+            changed.reverse()
+            return self.counter, changed
+
+    def get(self, ident):
+        """
+        Get the latest item of an id
+
+        :param ident: id of the item
+        :return: latest item or None if never received
+        """
+        with self.lock:
+            entry = self.latest.get(ident)
+        return entry[1] if entry is not None else None
+
+    def size(self):
+        """
+        Accessor for the number of ids in the index
+
+        :return: number of ids (int)
+        """
+        return len(self.latest)
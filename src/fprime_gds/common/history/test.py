@@ -6,11 +6,11 @@ retrieval operations
 
 :author: koran
 """
-from fprime_gds.common.history.history import History
+from fprime_gds.common.history.history import AwaitableHistory
 from fprime_gds.common.testing_fw import predicates
 
 
-class TestHistory(History):
+class TestHistory(AwaitableHistory):
     """
     A receive-ordered history to support the GDS test api. This history adds support for specifying
     start with predicates and python's bracket notation.
@@ -29,6 +29,7 @@ class TestHistory(History):
         Args:
             filter_pred: an optional predicate to filter incoming data_objects
         """
+        super().__init__()
         self.objects = []
 
         self.filter = predicates.always_true()
@@ -49,7 +50,9 @@ class TestHistory(History):
             data: object to store
         """
         if self.filter(data):
-            self.objects.append(data)
+            with self.condition:
+                self.objects.append(data)
+                self.notify_update()
 
     def retrieve(self, start=None):
         """
@@ -63,9 +66,10 @@ class TestHistory(History):
         Returns:
             a list of objects in chronological order
         """
-        index = self.__get_index(start) if start is not None else 0
-        self.retrieved_cursor = self.size()
-        return self.objects[index:]
+        with self.condition:
+            index = self.__get_index(start) if start is not None else 0
+            self.retrieved_cursor = self.size()
+            return self.objects[index:]
 
     def retrieve_new(self):
         """
@@ -75,9 +79,10 @@ class TestHistory(History):
         Returns:
             a list of objects in chronological order
         """
-        index = self.retrieved_cursor
-        self.retrieved_cursor = self.size()
-        return self.objects[index:]
+        with self.condition:
+            index = self.retrieved_cursor
+            self.retrieved_cursor = self.size()
+            return self.objects[index:]
 
     def clear(self, start=None):
         """
@@ -91,12 +96,13 @@ class TestHistory(History):
         Args:
             start: clear all objects before start. start can either be an index or a predicate.
         """
-        index = self.__get_index(start) if start is not None else self.size()
+        with self.condition:
+            index = self.__get_index(start) if start is not None else self.size()
 
-        self.retrieved_cursor -= index
-        self.retrieved_cursor = max(self.retrieved_cursor, 0)
+            self.retrieved_cursor -= index
+            self.retrieved_cursor = max(self.retrieved_cursor, 0)
 
-        del self.objects[:index]
+            del self.objects[:index]
 
     def size(self):
         """
@@ -48,7 +48,7 @@ class ChXmlLoader(XmlLoader):
             (id_idct, name_dict). The keys are the channels' id and name fields
             respectively and the values are ChTemplate objects
         """
-        xml_tree = self.get_xml_tree(path)
+        xml_tree = self.get_context(path).root
         versions = xml_tree.attrib.get("framework_version", "unknown"), xml_tree.attrib.get("project_version", "unknown")
 
         # Check if xml dict has channels section
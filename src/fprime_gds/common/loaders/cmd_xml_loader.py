@@ -40,7 +40,7 @@ class CmdXmlLoader(XmlLoader):
             (id_dict, name_dict). The keys are the events' id and name fields
             respectively and the values are CmdTemplate objects
         """
-        xml_tree = self.get_xml_tree(path)
+        xml_tree = self.get_context(path).root
         versions = xml_tree.attrib.get("framework_version", "unknown"), xml_tree.attrib.get("project_version", "unknown")
 
         # Check if xml dict has commands section
@@ -62,7 +62,7 @@ class DictLoader:
         if path in self.saved_dicts:
             (id_dict, name_dict) = self.saved_dicts[path]
         else:
-            (id_dict, name_dict, self.versions) = self.construct_dicts(path)
+            (id_dict, name_dict, self.versions) = self.load_dicts(path)
             self.saved_dicts[path] = (id_dict, name_dict)
 
         return id_dict
@@ -87,7 +87,7 @@ class DictLoader:
         if path in self.saved_dicts:
             (id_dict, name_dict) = self.saved_dicts[path]
         else:
-            (id_dict, name_dict, self.versions) = self.construct_dicts(path)
+            (id_dict, name_dict, self.versions) = self.load_dicts(path)
             self.saved_dicts[path] = (id_dict, name_dict)
 
         return name_dict
@@ -96,6 +96,20 @@ class DictLoader:
         """ Get version tuple """
         return self.versions
 
+    def load_dicts(self, path):
+        """
+        Loads the python dictionaries keyed on id and name, constructing them
+        with construct_dicts. Derived classes may load them otherwise, e.g.
+        from a cache.
+
+        Args:
+            path: Path to the file system dictionary to convert to a python dict
+
+        Returns:
+            A tuple (id_dict, name_dict, versions) as from construct_dicts
+        """
+        return self.construct_dicts(path)
+
     def construct_dicts(self, path):
         """
         Constructs and returns python dictionaries keyed on id and name.
@@ -0,0 +1,224 @@
+"""
+@brief On-disk cache of the dictionaries constructed by loaders
+
+Constructing the dictionaries of a large XML dictionary takes seconds. The
+DictionaryCache pickles what a loader constructed, keyed by the hash of the
+dictionary's content, such that the next startup on an unchanged dictionary
+only unpickles it. Editing the dictionary changes its hash, so stale entries
+are never used. Entries are written to a temporary file and renamed into
+place, so concurrent writers and readers always see complete entries.
+
+The cache lives in $FPRIME_GDS_CACHE_DIR, defaulting to fprime-gds under
+$XDG_CACHE_HOME or ~/.cache. Setting FPRIME_GDS_CACHE_DIR to an empty string
+disables the cache. The cache is also disabled when the versions of the
+packages constructing the dictionaries cannot be determined, or when fprime
+does not track the types it constructed (DictionaryType._CONSTRUCTS).
+
+@bug No known bugs
+"""
+import abc
+import copyreg
+import functools
+import hashlib
+import io
+import logging
+import os
+import pickle
+import tempfile
+
+from fprime.common.models.serialize.type_base import DictionaryType
+
+LOGGER = logging.getLogger("dictionary_cache")
+
+
+@functools.lru_cache(maxsize=None)
+def _package_version(package):
+    """Version of an installed package, or None when unknown"""
+    try:
+        from importlib import metadata
+    except ImportError:  # Python 3.7
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            metadata = None
+    try:
+        if metadata is not None:
+            return metadata.version(package)
+        import pkg_resources
+
+        return pkg_resources.get_distribution(package).version
+    except Exception:
+        return None
+
+
+def _constructs():
+    """Types constructed from dictionaries by name, None when fprime does not track them"""
+    return getattr(DictionaryType, "_CONSTRUCTS", None)
+
+
+def types_picklable():
+    """Check if the types constructed from dictionaries can be pickled, see reduce_type"""
+    return isinstance(_constructs(), dict)
+
+
+def construct_type(parent_class, name, properties):
+    """
+    Construct a dictionary type when unpickling, returning the type already constructed under the name if identical
+
+    :param parent_class: base type of the type, e.g. EnumType
+    :param name: name of the type
+    :param properties: class properties of the type
+    :return: dictionary type
+    """
+    construct, original_properties = (_constructs() or {}).get(name, (None, None))
+    if construct is not None and construct.__bases__[0] is parent_class and original_properties == properties:
+        return construct
+    return DictionaryType.construct_type(parent_class, name, **properties)
+
+
+def reduce_type(cls):
+    """
+    Reduce a class for pickling. Types constructed from the dictionary (enums, serializables, arrays, strings) are
+    classes built at runtime, which pickle cannot find by name. They are pickled as the arguments constructing them.
+    Other classes are pickled by name as usual, as are all classes when fprime does not track the types it constructed,
+    failing for the types constructed.
+
+    :param cls: class to reduce
+    :return: reduce value for pickle
+    """
+    construct, properties = (_constructs() or {}).get(cls.__name__, (None, None))
+    if construct is cls:
+        return construct_type, (cls.__bases__[0], cls.__name__, properties)
+    return cls.__qualname__
+
+
+def dumps(value):
+    """
+    Pickle dictionaries or objects holding them, pickling the types constructed from the dictionary by their
+    construction arguments (see reduce_type)
+
+    :param value: value to pickle
+    :return: pickled bytes
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = DictionaryCache.DISPATCH_TABLE
+    pickler.dump(value)
+    return buffer.getvalue()
+
+
+class DictionaryCache:
+    """Content hash keyed cache of constructed dictionaries"""
+
+    FORMAT = 1  # Increment when the cached content changes
+    LIMIT = 16  # Entries kept, the least recently used are removed
+    DISPATCH_TABLE = {**copyreg.dispatch_table, abc.ABCMeta: reduce_type}
+
+    def __init__(self, directory=None):
+        """
+        Construct the cache
+
+        :param directory: directory of the cache entries. Default: the user cache directory, None when disabled
+        """
+        self.directory = directory if directory is not None else self.default_directory()
+
+    @staticmethod
+    def default_directory():
+        """Cache directory of the user, or None when disabled by an empty FPRIME_GDS_CACHE_DIR or unsupported"""
+        if not types_picklable() or None in (_package_version("fprime-gds"), _package_version("fprime-tools")):
+            return None
+        directory = os.environ.get("FPRIME_GDS_CACHE_DIR")
+        if directory is None:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            directory = os.path.join(base, "fprime-gds")
+        return os.path.join(directory, "dictionaries") if directory else None
+
+    def key(self, kind, path):
+        """
+        Key of the dictionaries constructed from a file
+
+        :param kind: kind of dictionaries, e.g. the loader class name
+        :param path: path to the dictionary file
+        :return: hex digest of the file content, kind, cache format and the versions of the packages constructing it
+        """
+        digest = hashlib.sha256()
+        for item in (kind, self.FORMAT, _package_version("fprime-gds"), _package_version("fprime-tools")):
+            digest.update(f"{item}\0".encode())
+        with open(path, "rb") as file_handle:
+            for block in iter(lambda: file_handle.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def contains(self, kind, path):
+        """
+        Check if the dictionaries of a file are cached
+
+        :param kind: kind of dictionaries
+        :param path: path to the dictionary file
+        :return: True when cached, False otherwise or when the cache is disabled
+        """
+        if self.directory is None:
+            return False
+        return os.path.isfile(os.path.join(self.directory, f"{self.key(kind, path)}.pickle"))
+
+    def load(self, kind, path):
+        """
+        Load the cached dictionaries of a file
+
+        :param kind: kind of dictionaries
+        :param path: path to the dictionary file
+        :return: cached dictionaries, or None when not cached
+        """
+        if self.directory is None:
+            return None
+        entry = os.path.join(self.directory, f"{self.key(kind, path)}.pickle")
+        try:
+            with open(entry, "rb") as file_handle:
+                value = pickle.load(file_handle)
+            os.utime(entry)
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            LOGGER.warning("Ignoring unreadable dictionary cache entry %s: %s", entry, exc)
+            return None
+
+    def store(self, kind, path, value):
+        """
+        Store the dictionaries of a file, failures only being logged as the cache is an optimization
+
+        :param kind: kind of dictionaries
+        :param path: path to the dictionary file
+        :param value: dictionaries to cache
+        """
+        if self.directory is None:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            entry = os.path.join(self.directory, f"{self.key(kind, path)}.pickle")
+            with tempfile.NamedTemporaryFile(dir=self.directory, prefix=".", suffix=".tmp", delete=False) as temp:
+                try:
+                    temp.write(dumps(value))
+                except BaseException:
+                    temp.close()
+                    os.remove(temp.name)
+                    raise
+            os.replace(temp.name, entry)
+            self.evict()
+        except Exception as exc:
+            LOGGER.warning("Failed to cache dictionary %s: %s", path, exc)
+
+    def evict(self):
+        """Remove the least recently used entries beyond the LIMIT"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pickle"):
+                try:
+                    entries.append((os.stat(os.path.join(self.directory, name)).st_mtime, name))
+                except FileNotFoundError:
+                    pass  # Removed by a concurrent eviction
+        for _, name in sorted(entries, reverse=True)[self.LIMIT :]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
@@ -42,7 +42,7 @@ class EventXmlLoader(XmlLoader):
             (id_idct, name_dict). The keys are the events' id and name fields
             respectively and the values are ChTemplate objects
         """
-        xml_tree = self.get_xml_tree(path)
+        xml_tree = self.get_context(path).root
         versions = xml_tree.attrib.get("framework_version", "unknown"), xml_tree.attrib.get("project_version", "unknown")
 
         # Check if xml dict has events section
@@ -91,7 +91,7 @@ class PktXmlLoader(XmlLoader):
             (id_dict, name_dict). The keys should be the packets' id and name
             fields respectively and the values should be PktTemplate objects.
         """
-        packet_list = self.get_xml_tree(path)
+        packet_list = self.get_context(path).root
         if packet_list.tag != self.PKT_LIST_TAG:
             raise exceptions.GseControllerParsingException(
                 f"expected packet list to have tag {self.PKT_LIST_TAG}, but found {packet_list.tag}"
@@ -8,13 +8,16 @@ parsing xml dictionaries.
 This class does not implement any core loader functions, it just adds common
 helper functions
 
+The XmlParseContext parses a dictionary file once and holds the types
+resolved from it, such that loaders sharing the context each build their
+dictionaries without parsing the file or resolving its types again.
+
 @date Created July 19, 2018
 @author R. Joseph Paetz
 
 @bug No known bugs
 """
 import os
-from lxml import etree
 
 from fprime.common.models.serialize.array_type import ArrayType
 from fprime.common.models.serialize.bool_type import BoolType
@@ -41,6 +44,7 @@ from fprime_gds.version import (
 
 # Custom Python Modules
 from . import dict_loader
+from .dictionary_cache import DictionaryCache
 
 
 class XmlLoader(dict_loader.DictLoader):
@@ -78,14 +82,20 @@ class XmlLoader(dict_loader.DictLoader):
 
     STR_LEN_TAG = "len"
 
-    def __init__(self):
+    def __init__(self, context=None):
         """
         Constructor
 
+        Args:
+            context (XmlParseContext): parse context shared with other loaders
+                                       of the same file. Default: a context
+                                       private to this loader is created.
+
         Returns:
             An initialized loader object
         """
         super().__init__()
+        self.context = context
 
         # These dicts hold already parsed enum objects so things don't need
         # to be parsed multiple times
@@ -93,6 +103,66 @@ class XmlLoader(dict_loader.DictLoader):
         self.serializable_types = {}
         self.array_types = {}
 
+    def get_context(self, path):
+        """
+        Gets the parse context of the given path, the shared context when it
+        is of this path and a new context otherwise. The type caches of this
+        loader are those of the context.
+
+        Args:
+            path (string): Path to the xml dictionary file
+
+        Returns:
+            The XmlParseContext of the path
+        """
+        if self.context is None or self.context.path != path:
+            self.context = XmlParseContext(path)
+        self.enums = self.context.enums
+        self.serializable_types = self.context.serializable_types
+        self.array_types = self.context.array_types
+        return self.context
+
+    def load_dicts(self, path):
+        """
+        Loads the dictionaries from the on-disk cache, keyed by the content of
+        the xml dictionary. When not cached, the dictionaries are constructed
+        and then cached for the next load.
+
+        Args:
+            path (string): Path to the xml dictionary file
+
+        Returns:
+            A tuple (id_dict, name_dict, versions) as from construct_dicts
+        """
+        if not os.path.isfile(path):
+            raise exceptions.GseControllerUndefinedFileException(path)
+        cache = DictionaryCache()
+        kind = self.cache_kind()
+        loaded = cache.load(kind, path)
+        if loaded is None:
+            loaded = self.construct_dicts(path)
+            cache.store(kind, path, loaded)
+        return loaded
+
+    @classmethod
+    def cache_kind(cls):
+        """Kind of the dictionaries built by this loader in the DictionaryCache"""
+        return cls.__qualname__
+
+    @classmethod
+    def is_cached(cls, path):
+        """
+        Checks whether the dictionaries this loader builds from the file are
+        cached, and thus were built from a successful parse of its content
+
+        Args:
+            path (string): Path to the xml dictionary file
+
+        Returns:
+            True when cached, False otherwise
+        """
+        return DictionaryCache().contains(cls.cache_kind(), path)
+
     @staticmethod
     def get_xml_tree(path):
         """
@@ -109,7 +179,9 @@ class XmlLoader(dict_loader.DictLoader):
         if not os.path.isfile(path):
             raise exceptions.GseControllerUndefinedFileException(path)
 
-        # Create xml parser
+        # Create xml parser. lxml is imported once parsing, as cached dictionaries need no parsing
+        from lxml import etree
+
         xml_parser = etree.XMLParser(remove_comments=True)
 
         with open(path) as fd:
@@ -151,6 +223,26 @@ class XmlLoader(dict_loader.DictLoader):
             (section for section in xml_root if section.tag == section_name), None
         )
 
+    def find_definitions(self, section_name, name_tag, type_name, xml_obj):
+        """
+        Finds the definitions of a type in a section of the xml dict. Trees of
+        the parse context are looked up in its index of the section, other
+        trees are searched.
+
+        Args:
+            section_name (string): Section defining the type, e.g. "enums"
+            name_tag (string): Attribute holding the name of the type
+            type_name (string): Name of the type to find
+            xml_obj (lxml etree root): Parsed Xml object to find the type in
+
+        Returns:
+            List of the definitions of the type, empty when not defined
+        """
+        if self.context is not None and self.context.is_root(xml_obj):
+            return self.context.definitions(section_name, name_tag).get(type_name, [])
+        section = self.get_xml_section(section_name, xml_obj)
+        return [] if section is None else list(section)
+
     def get_args_list(self, xml_obj, xml_tree, context=None):
         """
         Parses and returns a standard xml dict arguments section:
@@ -209,12 +301,7 @@ class XmlLoader(dict_loader.DictLoader):
         if enum_name in self.enums:
             return self.enums[enum_name]
 
-        # Check if the dictionary has an enum section
-        enum_section = self.get_xml_section(self.ENUM_SECT, xml_obj)
-        if enum_section is None:
-            return None
-
-        for enum in enum_section:
+        for enum in self.find_definitions(self.ENUM_SECT, self.ENUM_TYPE_TAG, enum_name, xml_obj):
             # Check enum name
             if enum.get(self.ENUM_TYPE_TAG) == enum_name:
                 # Go through all possible values of the enum
@@ -251,12 +338,7 @@ class XmlLoader(dict_loader.DictLoader):
         if type_name in self.serializable_types:
             return self.serializable_types[type_name]
 
-        # Check if the dictionary has an enum section
-        ser_section = self.get_xml_section(self.SER_SECT, xml_obj)
-        if ser_section is None:
-            return None
-
-        for ser_type in ser_section:
+        for ser_type in self.find_definitions(self.SER_SECT, self.SER_TYPE_TAG, type_name, xml_obj):
             # Check if this serializable matches the type name
             if ser_type.get(self.SER_TYPE_TAG) == type_name:
                 # Go through members
@@ -304,12 +386,7 @@ class XmlLoader(dict_loader.DictLoader):
         if type_name in self.array_types:
             return self.array_types[type_name]
 
-        # Check if the dictionary has an array section
-        arr_section = self.get_xml_section(self.ARR_SECT, xml_obj)
-        if arr_section is None:
-            return None
-
-        for arr_memb in arr_section:
+        for arr_memb in self.find_definitions(self.ARR_SECT, self.ARR_NAME_TAG, type_name, xml_obj):
             # Check if this array matches the name name
             if arr_memb.get(self.ARR_NAME_TAG) == type_name:
                 # Go through default members
@@ -402,6 +479,74 @@ class XmlLoader(dict_loader.DictLoader):
             )
 
 
+class XmlParseContext:
+    """
+    Parse of an xml dictionary shared by the loaders building dictionaries from it. The file is parsed once, on first
+    use, and the type definitions of each section are indexed by name once. Types resolved by one loader are reused by
+    the others through the shared type caches.
+    """
+
+    def __init__(self, path):
+        """
+        Constructor
+
+        Args:
+            path (string): Path to the xml dictionary file
+        """
+        self.path = path
+        self.enums = {}
+        self.serializable_types = {}
+        self.array_types = {}
+        self.__root = None
+        self.__definitions = {}
+
+    @property
+    def root(self):
+        """Root of the parsed xml dictionary, parsing it on first use"""
+        return self.parse()
+
+    def parse(self):
+        """
+        Parses the xml dictionary when not yet parsed. Raises an exception if
+        there is an error.
+
+        Returns:
+            The root of the parsed xml dictionary
+        """
+        if self.__root is None:
+            self.__root = XmlLoader.get_xml_tree(self.path)
+        return self.__root
+
+    @property
+    def versions(self):
+        """Tuple of the framework and project versions of the dictionary"""
+        return self.root.attrib.get("framework_version", "unknown"), self.root.attrib.get("project_version", "unknown")
+
+    def is_root(self, xml_obj):
+        """Check whether the given xml object is the root parsed by this context"""
+        return self.__root is not None and xml_obj is self.__root
+
+    def definitions(self, section_name, name_tag):
+        """
+        Index of the definitions in a section of the dictionary by name
+
+        Args:
+            section_name (string): Section to index, e.g. "enums"
+            name_tag (string): Attribute holding the name of each definition
+
+        Returns:
+            Dict of definition name to the list of its definitions
+        """
+        key = (section_name, name_tag)
+        if key not in self.__definitions:
+            index = {}
+            section = XmlLoader.get_xml_section(section_name, self.root)
+            for definition in section if section is not None else []:
+                index.setdefault(definition.get(name_tag), []).append(definition)
+            self.__definitions[key] = index
+        return self.__definitions[key]
+
+
 class UnsupportedDictionaryVersionException(Exception):
     """Dictionary is of unsupported version"""
 
@@ -1,8 +1,16 @@
 """
 @brief Class to log raw binary input and output as well as telemetry and events
+
+DataLogger formats and writes each item as it is received, flushing after every write. BatchedDataLogger instead queues
+the items for a background writer thread which formats them and writes them in batches, taking the disk latency off of
+the decoding path.
 """
 
+import logging
 import os
+import queue
+import threading
+import time
 
 import fprime_gds.common.handlers
 from fprime_gds.common.data_types.ch_data import ChData
@@ -10,6 +18,8 @@ from fprime_gds.common.data_types.cmd_data import CmdData
 from fprime_gds.common.data_types.event_data import EventData
 from fprime_gds.common.data_types.pkt_data import PktData
 
+LOGGER = logging.getLogger("data_logger")
+
 
 class DataLogger(fprime_gds.common.handlers.DataHandler):
     def __init__(self, logdir, verbose=False, csv=False, prefix=""):
@@ -31,10 +41,12 @@ class DataLogger(fprime_gds.common.handlers.DataHandler):
         self.f_command = open(self.logdir + os.sep + self.command_file, "a+")
 
     def __del__(self):
-        self.f_r.close()
-        self.f_s.close()
-        self.f_telem.close()
-        self.f_event.close()
+        self.close()
+
+    def close(self):
+        """Close the log files, flushing what was written"""
+        for handle in (self.f_r, self.f_s, self.f_telem, self.f_event, self.f_command):
+            handle.close()
 
     def data_callback(self, data, sender=None):
         if isinstance(data, (ChData, PktData)):
@@ -75,3 +87,173 @@ class DataLogger(fprime_gds.common.handlers.DataHandler):
 
         self.f_r.write(data)
         self.f_r.flush()
+
+    def flush(self):
+        """Ensure all received items are written to the log files. Items are written as they are received."""
+
+
+class BatchedDataLogger(DataLogger):
+    """
+    Data logger queuing items for a background writer thread. The writer formats the queued items and writes them to
+    the log files in batches. Batches are written and flushed once `flush_size` characters of text and bytes of binary
+    data are pending or `flush_interval` seconds have passed since the last write, whichever comes first.
+
+    The queue holds at most `queue_size` items. Items received when the queue is full are dropped rather than blocking
+    the caller. Dropped items are counted per log file in `dropped`, keyed as FILES. The logger must be closed, which
+    writes the queued items, stops the writer thread and closes the log files.
+    """
+
+    # Names of the log files mapped to the attributes holding them
+    FILES = {"telem": "f_telem", "event": "f_event", "command": "f_command", "recv": "f_r", "send": "f_s"}
+
+    def __init__(
+        self, logdir, verbose=False, csv=False, prefix="", flush_interval=0.5, flush_size=65536, queue_size=100000
+    ):
+        """
+        Constructor opening the log files and starting the writer thread
+
+        :param logdir: directory to write the log files to
+        :param verbose: verbose formatting of the logged items
+        :param csv: CSV formatting of the logged items
+        :param prefix: prefix of the log file names
+        :param flush_interval: maximum seconds items wait before being written
+        :param flush_size: pending characters of text and bytes of binary data causing a write before the interval
+        :param queue_size: maximum number of items queued for the writer
+        """
+        super().__init__(logdir, verbose, csv, prefix)
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.closed = False
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.dropped = {name: 0 for name in self.FILES}
+        self.written = {name: 0 for name in self.FILES}
+        self.__lock = threading.Lock()
+        self.__writer = threading.Thread(target=self.__write_loop, name="DataLoggerWriter", daemon=True)
+        self.__writer.start()
+
+    def __enqueue(self, name, data):
+        """Queue an item to be written to the named log file, dropping it when the queue is full or the logger closed"""
+        try:
+            if self.closed:
+                raise queue.Full()
+            self.queue.put_nowait((name, data))
+        except queue.Full:
+            with self.__lock:
+                self.dropped[name] += 1
+
+    def data_callback(self, data, sender=None):
+        """Queue the item for writing to the log file of its type"""
+        if isinstance(data, (ChData, PktData)):
+            self.__enqueue("telem", data)
+        elif isinstance(data, EventData):
+            self.__enqueue("event", data)
+        elif isinstance(data, CmdData):
+            self.__enqueue("command", data)
+        elif isinstance(data, (bytes, bytearray)):
+            self.on_recv(data)
+
+    def send(self, data, dest):
+        """Queue sent binary data for writing
+
+        Arguments:
+            data {bin} -- binary data packet
+            dest {string} -- where the data will be sent by the server
+        """
+        self.__enqueue("send", bytes(data))
+
+    def on_recv(self, data):
+        """Queue received binary data for writing
+
+        Arguments:
+            data {bin} --binary data string that was received
+        """
+        self.__enqueue("recv", bytes(data))
+
+    def flush(self, timeout=None):
+        """Block until the items received before this call are written to the log files
+
+        :param timeout: maximum seconds to wait. None waits until written.
+        :return: True when written, False on timeout
+        """
+        if not self.__writer.is_alive():
+            return True
+        written = threading.Event()
+        try:
+            self.queue.put((None, written), timeout=timeout)
+        except queue.Full:
+            return False
+        return written.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """Write the queued items, stop the writer thread and close the log files, reporting the items dropped
+
+        :param timeout: maximum seconds to wait for the writer to write the queued items
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.__writer.is_alive():
+            try:
+                self.queue.put((None, None), timeout=timeout)
+            except queue.Full:
+                LOGGER.error("Data logger writer did not drain its queue, closing with items unwritten")
+            self.__writer.join(timeout)
+        if self.__writer.is_alive():
+            LOGGER.error("Data logger writer did not stop, closing with items unwritten")
+        if any(self.dropped.values()):
+            LOGGER.warning(
+                "Data logger dropped %d items with its queue full: %s",
+                sum(self.dropped.values()),
+                ", ".join(f"{name} {count}" for name, count in self.dropped.items() if count),
+            )
+        super().close()
+
+    def format(self, data):
+        """Format a queued item into the text or bytes written to its log file"""
+        if isinstance(data, bytes):
+            return data
+        return data.get_str(verbose=self.verbose, csv=self.csv) + "\n"
+
+    def __write_loop(self):
+        """Writer thread gathering queued items into batches and writing them"""
+        pending = {name: [] for name in self.FILES}
+        pending_size = 0
+        deadline = time.monotonic() + self.flush_interval
+        stop = False
+        while not stop:
+            flushed = None
+            try:
+                name, data = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                if name is None:
+                    # A flush carries the event set once written, a close carries None
+                    flushed = data
+                    stop = data is None
+                else:
+                    try:
+                        record = self.format(data)
+                        pending[name].append(record)
+                        pending_size += len(record)
+                    except Exception as exc:
+                        LOGGER.warning("Failed to format %s for logging: %s", type(data).__name__, exc)
+            except queue.Empty:
+                pass
+            if stop or flushed is not None or pending_size >= self.flush_size or time.monotonic() >= deadline:
+                self.__write(pending)
+                pending_size = 0
+                deadline = time.monotonic() + self.flush_interval
+            if flushed is not None:
+                flushed.set()
+
+    def __write(self, pending):
+        """Write and flush the pending records of each log file, clearing them"""
+        for name, records in pending.items():
+            if not records:
+                continue
+            handle = getattr(self, self.FILES[name])
+            try:
+                handle.write((b"" if isinstance(records[0], bytes) else "").join(records))
+                handle.flush()
+                self.written[name] += len(records)
+            except Exception as exc:
+                LOGGER.error("Failed to write %d records to %s: %s", len(records), handle.name, exc)
+            records.clear()
@@ -0,0 +1,277 @@
+"""
+@brief Indexed record-oriented recording of the downlink
+
+recv.bin holds the raw downlink bytes without message boundaries or receive times, such that finding the data received
+at a given time requires decoding the whole file. RecordingLogger instead writes each downlinked message as a record:
+
+    +------------------------------+
+    | Record length (U32)          |
+    +------------------------------+
+    | Ground receive time (F64)    |  seconds since the epoch
+    +------------------------------+
+    | Descriptor (U32)             |
+    +------------------------------+
+    | Raw message (length bytes)   |  length and descriptor header included as received
+    +------------------------------+
+
+following a file header of the RECORDING_MAGIC bytes and a U32 version. The raw messages of consecutive records form
+a valid stream for Distributor.on_recv (without key framing, as keys are not recorded).
+
+Every `index_interval` records, an entry of ground time, file offset and record number (F64, U64, U64) is appended to a
+sidecar index file. RecordingReader memory maps the recording and bisects the index to seek to a ground time or record
+number in O(log n) followed by a scan of at most `index_interval` records. Records past the last index entry, e.g. when
+the recording was not closed cleanly, are indexed by scanning them when the reader is opened.
+
+Note: ground times are expected not to decrease through a recording, as is the case when the system clock is not set
+backwards while recording.
+"""
+import bisect
+import collections
+import mmap
+import os
+import struct
+import time
+
+from fprime_gds.common.distributor.distributor import ZeroCopyDistributor
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.common.utils import config_manager
+
+RECORDING_MAGIC = b"FPRIMREC"
+RECORDING_VERSION = 1
+FILE_HEADER = struct.Struct(">8sI")
+RECORD_HEADER = struct.Struct(">IdI")
+INDEX_ENTRY = struct.Struct(">dQQ")
+
+Record = collections.namedtuple("Record", ["number", "time", "descriptor", "data"])
+
+
+class RecordingFormatException(Exception):
+    """Raised when a recording is not in the recording format"""
+
+
+class RecordingLogger(DataHandler):
+    """
+    Logger writing the downlinked messages to an indexed recording. Registered with the transport client to receive the
+    raw downlink, which is split into messages following the framing configuration.
+    """
+
+    def __init__(self, logdir, config=None, prefix="", index_interval=256):
+        """
+        Constructor opening the recording and its index
+
+        :param logdir: directory to write the recording to
+        :param config: config manager with the types of the message fields. Defaults to the config singleton.
+        :param prefix: prefix of the recording file names
+        :param index_interval: number of records between index entries
+        """
+        if config is None:
+            config = config_manager.ConfigManager().get_instance()
+        self.path = os.path.join(logdir, f"{prefix}recv.rec")
+        self.index_path = self.path + ".idx"
+        self.index_interval = index_interval
+        self.__parser = ZeroCopyDistributor(config)
+        self.__header_size = config.get_type("msg_len").getSize() + config.get_type("msg_desc").getSize()
+        self.__buffer = bytearray()
+        self.__cursor = 0
+
+        # Continue existing recordings after their last record
+        self.count = 0
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            with RecordingReader(self.path, index_interval=index_interval) as reader:
+                self.count = len(reader)
+                self.offset = reader.end
+                # Rewrite the index as read, dropping any entries past the last complete record
+                with open(self.index_path, "wb") as file_handle:
+                    for entry in zip(reader.times, reader.offsets, reader.numbers):
+                        file_handle.write(INDEX_ENTRY.pack(*entry))
+        else:
+            with open(self.path, "wb") as file_handle:
+                file_handle.write(FILE_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION))
+            with open(self.index_path, "wb"):
+                pass
+            self.offset = FILE_HEADER.size
+        self.f_rec = open(self.path, "r+b")
+        self.f_rec.seek(self.offset)
+        self.f_rec.truncate()
+        self.f_idx = open(self.index_path, "ab")
+
+    def data_callback(self, data, sender=None):
+        """Records binary data received"""
+        if isinstance(data, (bytes, bytearray)):
+            self.on_recv(data)
+
+    def on_recv(self, data):
+        """
+        Records the complete messages in the received data, keeping partial messages until completed
+
+        Arguments:
+            data {bin} -- binary data received
+        """
+        receive_time = time.time()
+        self.__buffer.extend(data)
+        self.__cursor, frames = self.__parser.parse_frames(self.__buffer, self.__cursor)
+        chunks = []
+        index = bytearray()
+        for desc, start, end in frames:
+            raw = self.__buffer[start - self.__header_size : end]
+            if self.count % self.index_interval == 0:
+                index += INDEX_ENTRY.pack(receive_time, self.offset, self.count)
+            chunks.append(RECORD_HEADER.pack(len(raw), receive_time, desc))
+            chunks.append(raw)
+            self.offset += RECORD_HEADER.size + len(raw)
+            self.count += 1
+        del self.__buffer[: self.__cursor]
+        self.__cursor = 0
+        if chunks:
+            self.f_rec.write(b"".join(chunks))
+            self.f_rec.flush()
+        # The index is written after its records such that entries never reference unwritten records
+        if index:
+            self.f_idx.write(index)
+            self.f_idx.flush()
+
+    def close(self):
+        """Close the recording and its index"""
+        self.f_rec.close()
+        self.f_idx.close()
+
+
+class RecordingReader:
+    """
+    Reader of a recording written by RecordingLogger. The recording is memory mapped and records are read in place.
+    Use as a context manager or call close when done.
+    """
+
+    def __init__(self, path, index_path=None, index_interval=256):
+        """
+        Open the recording and load its index
+
+        :param path: path to the recording
+        :param index_path: path to the index. Defaults to the recording path with ".idx" appended.
+        :param index_interval: number of records between index entries built for records missing from the index
+        """
+        self.path = path
+        self.index_interval = index_interval
+        self.__file = open(path, "rb")
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise RecordingFormatException(f"{path} is empty")
+        if len(self.__map) < FILE_HEADER.size or FILE_HEADER.unpack_from(self.__map, 0)[0] != RECORDING_MAGIC:
+            self.close()
+            raise RecordingFormatException(f"{path} is not a recording")
+
+        self.times = []
+        self.offsets = []
+        self.numbers = []
+        index_path = index_path if index_path is not None else path + ".idx"
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as file_handle:
+                index = file_handle.read()
+            complete = len(index) - len(index) % INDEX_ENTRY.size
+            for entry_time, offset, number in INDEX_ENTRY.iter_unpack(index[:complete]):
+                if offset + RECORD_HEADER.size > len(self.__map):
+                    break
+                self.times.append(entry_time)
+                self.offsets.append(offset)
+                self.numbers.append(number)
+        self.count, self.end = self.__index_tail()
+
+    def __index_tail(self):
+        """Index the records after the last index entry returning the record count and offset after the last record"""
+        offset, number = (self.offsets[-1], self.numbers[-1]) if self.offsets else (FILE_HEADER.size, 0)
+        while True:
+            record = self.read(offset, number)
+            if record is None:
+                return number, offset
+            if number % self.index_interval == 0 and (not self.numbers or number > self.numbers[-1]):
+                self.times.append(record[0].time)
+                self.offsets.append(offset)
+                self.numbers.append(number)
+            offset = record[1]
+            number += 1
+
+    def read(self, offset, number):
+        """
+        Read the record at the given offset
+
+        :param offset: file offset of the record
+        :param number: record number of the record
+        :return: tuple of the Record and the offset of the next record, or None when no complete record is at offset
+        """
+        if offset + RECORD_HEADER.size > len(self.__map):
+            return None
+        length, record_time, descriptor = RECORD_HEADER.unpack_from(self.__map, offset)
+        start = offset + RECORD_HEADER.size
+        if start + length > len(self.__map):
+            return None
+        return Record(number, record_time, descriptor, self.__map[start : start + length]), start + length
+
+    def __scan(self, entry):
+        """Generate the records from the given index entry to the end of the recording"""
+        if entry < 0:
+            offset, number = FILE_HEADER.size, 0
+        else:
+            offset, number = self.offsets[entry], self.numbers[entry]
+        while number < self.count:
+            record, offset = self.read(offset, number)
+            yield record
+            number += 1
+
+    def records(self, start=0, stop=None):
+        """
+        Generate the records numbered from start up to, not including, stop
+
+        :param start: number of the first record
+        :param stop: number after the last record. Defaults to the end of the recording.
+        :return: generator of Record
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        for record in self.__scan(bisect.bisect_right(self.numbers, start) - 1):
+            if record.number >= stop:
+                break
+            if record.number >= start:
+                yield record
+
+    def seek_time(self, ground_time):
+        """
+        Find the first record received at or after the given ground time
+
+        :param ground_time: ground receive time in seconds since the epoch
+        :return: record number, which is the record count when all records were received before ground_time
+        """
+        for record in self.__scan(bisect.bisect_left(self.times, ground_time) - 1):
+            if record.time >= ground_time:
+                return record.number
+        return self.count
+
+    def records_between(self, start_time, end_time=None):
+        """
+        Generate the records received from start_time up to, not including, end_time
+
+        :param start_time: ground time of the first record
+        :param end_time: ground time after the last record. Defaults to the end of the recording.
+        :return: generator of Record
+        """
+        for record in self.records(self.seek_time(start_time)):
+            if end_time is not None and record.time >= end_time:
+                break
+            yield record
+
+    def __len__(self):
+        """Number of records in the recording"""
+        return self.count
+
+    def close(self):
+        """Close the recording"""
+        self.__map.close()
+        self.__file.close()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit closing the recording"""
+        self.close()
@@ -6,7 +6,8 @@ by the test API to log events, asserts, test cases and user messages. The docume
 can be found here:
 https://openpyxl.readthedocs.io/en/stable/index.html
 
-If the openpyxl library isn't installed, this class does nothing.
+If the openpyxl library isn't installed, this class does nothing. The library is imported once a TestLogger is
+constructed, such that importing the test API does not pay its import time when no log is written.
 
 This class uses a write-only optimization that should allow for creating large log files without
 hogging too much memory. Write-only optimization can be found here:
@@ -15,21 +16,26 @@ https://openpyxl.readthedocs.io/en/stable/optimized.html#write-only-mode
 :author: koran
 """
 import datetime
+import importlib.util
 import os
 import threading
 import time
 
 # If openpyxl isn't installed, ignore all functionality in this module
-try:
+MODULE_INSTALLED = importlib.util.find_spec("openpyxl") is not None
+
+# openpyxl names, imported by import_openpyxl once a TestLogger is constructed
+Workbook = PatternFill = Font = Alignment = WriteOnlyCell = WorkbookAlreadySaved = None
+
+
+def import_openpyxl():
+    """Import the openpyxl names used by the TestLogger into this module"""
+    global Workbook, PatternFill, Font, Alignment, WriteOnlyCell, WorkbookAlreadySaved
     from openpyxl import Workbook
-    from openpyxl.styles import PatternFill, Font, Alignment
     from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, PatternFill
     from openpyxl.utils.exceptions import WorkbookAlreadySaved
 
-    MODULE_INSTALLED = True
-except ImportError:
-    MODULE_INSTALLED = False
-
 
 class TestLogger:
     """
@@ -54,10 +60,8 @@ class TestLogger:
     ITALICS = "ITALICS"
     UNDERLINED = "UNDERLINED"
 
-    if MODULE_INSTALLED:
-        __align = Alignment(vertical="top", wrap_text=True)
-        __font_name = "calibri"
-        __time_fmt = "%H:%M:%S.%f"
+    __font_name = "calibri"
+    __time_fmt = "%H:%M:%S.%f"
 
     def __init__(self, output_path, time_format=None, font_name=None):
         """
@@ -70,6 +74,8 @@ class TestLogger:
         """
         if not MODULE_INSTALLED:
             return
+        import_openpyxl()
+        self.__align = Alignment(vertical="top", wrap_text=True)
 
         if not isinstance(output_path, str):
             raise TypeError(
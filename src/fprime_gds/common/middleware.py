@@ -0,0 +1,469 @@
+"""
+fprime_gds.common.middleware:
+
+Event loop implementation of the threaded tcp server middleware (see fprime_gds.executables.tcpserver). The threaded
+server runs a thread per client, takes a global lock for every message and sends each message to each destination with
+a blocking send. MiddlewareServer instead serves all clients from a single thread multiplexing the sockets with the
+selectors module. Messages are routed without any lock: each message is copied once out of the receive buffer and that
+same bytes object is queued on the output buffer of every destination client. Output buffers are written once all
+readable sockets were processed, gathering all queued messages of a client into a single sendmsg call.
+
+The protocol is that of the threaded tcp server:
+
+1. "Register <name>\\n": registers the client as FSW or GUI client, named <name>_<id>
+2. "A5A5 GUI <U32 size><data>": sends <U32 size><data> to all GUI clients
+3. "A5A5 FSW <U32 descriptor><U32 size><data>": sends <U32 descriptor><U32 size><data> to all FSW clients
+4. "List\\n": answers with the names of registered clients
+5. "Quit\\n": answers 0xA5A5A5A5 and shuts down the server
+6. "Stat\\n": answers the U32 size prefixed JSON of the per-client counters, see MiddlewareClient.statistics
+
+The output buffer of each client is bounded in bytes and messages. A client not keeping up with the messages routed to
+it thus cannot hold up the other clients, nor grow the server without bounds: once a buffer is full, the overflow policy
+of the server drops the oldest messages queued, drops the new message or disconnects the client. Messages are dropped
+whole, such that the stream sent to a client stays intact. Drops are reported on the console as they start, then at
+most every DROP_REPORT_INTERVAL seconds while they continue and when the client disconnects.
+
+Datagrams sent to the same port in the format "A5A5 GUI <U32 size><data>" are sent to all GUI clients.
+"""
+import collections
+import json
+import os
+import selectors
+import socket
+import struct
+import time
+
+from fprime.constants import DATA_ENCODING
+
+SIZE_STRUCT = struct.Struct(">I")
+QUIT_MESSAGE = struct.pack(">I", 0xA5A5A5A5)
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+OVERFLOW_POLICIES = ["drop-oldest", "drop-newest", "disconnect"]
+DROP_REPORT_INTERVAL = 10.0
+
+
+class MiddlewareClient:
+    """
+    Connection to a client of the middleware server. Holds the receive buffer of the connection and the bounded output
+    buffer of the messages queued for the client, counting the messages queued, sent and dropped.
+    """
+
+    def __init__(self, sock, address, max_bytes=0, max_messages=0, policy="drop-oldest"):
+        """
+        Constructor
+
+        :param sock: non-blocking socket connected to the client
+        :param address: address of the client
+        :param max_bytes: maximum bytes in the output buffer, 0 for no limit
+        :param max_messages: maximum messages in the output buffer, 0 for no limit
+        :param policy: overflow policy, one of OVERFLOW_POLICIES
+        """
+        assert policy in OVERFLOW_POLICIES, f"Invalid overflow policy {policy}"
+        self.sock = sock
+        self.address = address
+        self.name = None
+        self.kind = None
+        self.id = 0
+        self.inbuf = bytearray()
+        self.outbuf = collections.deque()
+        self.out_size = 0
+        self.partial = False
+        self.writing = False
+        self.closing = False
+        self.max_bytes = max_bytes
+        self.max_messages = max_messages
+        self.policy = policy
+        self.queued_messages = 0
+        self.queued_bytes = 0
+        self.sent_messages = 0
+        self.sent_bytes = 0
+        self.dropped_messages = 0
+        self.dropped_bytes = 0
+        self.reported_messages = 0
+        self.reported_bytes = 0
+        self.report_time = None
+
+    def exceeds(self, size, messages=1):
+        """Check if the output buffer would exceed its limits with size more bytes in messages more messages"""
+        return bool(self.max_bytes and self.out_size + size > self.max_bytes) or bool(
+            self.max_messages and len(self.outbuf) + messages > self.max_messages
+        )
+
+    def queue(self, message, force=False):
+        """
+        Queue a message to be sent to the client, applying the overflow policy when the output buffer is full
+
+        :param message: message to queue
+        :param force: queue the message regardless of the limits, used for replies to the client
+        :return: False when the client overflowed and must be disconnected, True otherwise
+        """
+        if not force and self.exceeds(len(message)):
+            if self.policy == "disconnect":
+                return False
+            if self.policy == "drop-newest":
+                self.dropped_messages += 1
+                self.dropped_bytes += len(message)
+                return True
+            self.__drop_oldest(len(message))
+        self.outbuf.append(message)
+        self.out_size += len(message)
+        self.queued_messages += 1
+        self.queued_bytes += len(message)
+        return True
+
+    def __drop_oldest(self, size):
+        """Drop the oldest messages until size more bytes fit, keeping a partially sent message to not corrupt the stream"""
+        head = self.outbuf.popleft() if self.partial else None
+        while self.outbuf and self.exceeds(size, 2 if head is not None else 1):
+            dropped = self.outbuf.popleft()
+            self.out_size -= len(dropped)
+            self.dropped_messages += 1
+            self.dropped_bytes += len(dropped)
+        if head is not None:
+            self.outbuf.appendleft(head)
+
+    def drop_report(self, force=False):
+        """
+        Report of the messages dropped since the last report, rate limited to one report per DROP_REPORT_INTERVAL
+
+        :param force: report regardless of the rate limit, used when the client disconnects
+        :return: report text, or None when nothing is to be reported
+        """
+        now = time.monotonic()
+        if self.dropped_messages == self.reported_messages or (
+            not force and self.report_time is not None and now - self.report_time < DROP_REPORT_INTERVAL
+        ):
+            return None
+        report = (
+            f"Client {self.name.decode(DATA_ENCODING)} overflowed its output buffer, dropped "
+            f"{self.dropped_messages - self.reported_messages} messages "
+            f"({self.dropped_bytes - self.reported_bytes} bytes), {self.dropped_messages} in total."
+        )
+        self.reported_messages = self.dropped_messages
+        self.reported_bytes = self.dropped_bytes
+        self.report_time = now
+        return report
+
+    def statistics(self):
+        """Get the counters of the client as a dictionary"""
+        return {
+            "address": f"{self.address[0]}:{self.address[1]}",
+            "pending_messages": len(self.outbuf),
+            "pending_bytes": self.out_size,
+            "queued_messages": self.queued_messages,
+            "queued_bytes": self.queued_bytes,
+            "sent_messages": self.sent_messages,
+            "sent_bytes": self.sent_bytes,
+            "dropped_messages": self.dropped_messages,
+            "dropped_bytes": self.dropped_bytes,
+        }
+
+    def flush(self):
+        """
+        Send as much of the output buffer as the socket accepts, gathering the queued messages into one sendmsg call
+
+        :return: True when the output buffer was emptied, False otherwise
+        """
+        while self.outbuf:
+            buffers = list(self.outbuf) if len(self.outbuf) <= IOV_MAX else [self.outbuf[i] for i in range(IOV_MAX)]
+            if hasattr(self.sock, "sendmsg"):
+                sent = self.sock.sendmsg(buffers)
+            else:
+                sent = self.sock.send(b"".join(buffers))
+            self.out_size -= sent
+            self.sent_bytes += sent
+            # Drop the buffers fully sent, keeping a view of the remainder of the last one
+            while sent:
+                head = self.outbuf[0]
+                if sent < len(head):
+                    self.outbuf[0] = memoryview(head)[sent:]
+                    self.partial = True
+                    return False
+                sent -= len(head)
+                self.outbuf.popleft()
+                self.partial = False
+                self.sent_messages += 1
+        return True
+
+
+class MiddlewareServer:
+    """
+    Single threaded middleware server routing messages between FSW and GUI clients. serve_forever runs the server until
+    shutdown is called, from any thread or from a signal handler.
+    """
+
+    def __init__(self, address, udp=True, recv_size=65536, max_bytes=0, max_messages=0, policy="drop-oldest"):
+        """
+        Listen for tcp clients and, if udp is set, datagrams on the address
+
+        :param address: tuple of host and port to listen on. Port 0 picks a free port, see server_address.
+        :param udp: also receive datagrams on the port
+        :param recv_size: maximum number of bytes read from a client at once
+        :param max_bytes: maximum bytes in the output buffer of each client, 0 for no limit
+        :param max_messages: maximum messages in the output buffer of each client, 0 for no limit
+        :param policy: overflow policy of the output buffers, one of OVERFLOW_POLICIES
+        """
+        assert policy in OVERFLOW_POLICIES, f"Invalid overflow policy {policy}"
+        self.recv_size = recv_size
+        self.limits = {"max_bytes": max_bytes, "max_messages": max_messages, "policy": policy}
+        self.selector = selectors.DefaultSelector()
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(address)
+        self.listener.listen(128)
+        self.listener.setblocking(False)
+        self.server_address = self.listener.getsockname()
+        self.selector.register(self.listener, selectors.EVENT_READ, self.__accept)
+        self.datagrams = None
+        if udp:
+            self.datagrams = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.datagrams.bind(self.server_address)
+            self.datagrams.setblocking(False)
+            self.selector.register(self.datagrams, selectors.EVENT_READ, self.__receive_datagrams)
+        self.__wake_read, self.__wake_write = socket.socketpair()
+        self.__wake_read.setblocking(False)
+        self.__wake_write.setblocking(False)
+        self.selector.register(self.__wake_read, selectors.EVENT_READ, self.__wake)
+        self.clients = {b"FSW": [], b"GUI": []}
+        self.registered = {}
+        self.__pending = set()
+        self.__running = False
+
+    def serve_forever(self, poll_interval=0.5):
+        """
+        Serve clients until shutdown is called
+
+        :param poll_interval: seconds between checks of the shutdown request
+        """
+        self.__running = True
+        while self.__running:
+            for key, events in self.selector.select(poll_interval):
+                if isinstance(key.data, MiddlewareClient):
+                    self.__service(key.data, events)
+                else:
+                    key.data(key.fileobj, events)
+            # Write out all messages routed while handling this round of events
+            pending, self.__pending = self.__pending, set()
+            for client in pending:
+                self.__flush(client)
+
+    def shutdown(self):
+        """Request serve_forever to return, safe to call from any thread"""
+        self.__running = False
+        try:
+            self.__wake_write.send(b"\0")
+        except OSError:
+            pass
+
+    def server_close(self):
+        """Close all clients and the listening sockets"""
+        for key in list(self.selector.get_map().values()):
+            if isinstance(key.data, MiddlewareClient):
+                self.__close(key.data)
+        for sock in [self.listener, self.datagrams, self.__wake_read, self.__wake_write]:
+            if sock is not None:
+                sock.close()
+        self.selector.close()
+
+    def __wake(self, sock, _):
+        """Drain the wake up socket"""
+        try:
+            sock.recv(4096)
+        except BlockingIOError:
+            pass
+
+    def __accept(self, sock, _):
+        """Accept a new client"""
+        try:
+            connection, address = sock.accept()
+        except BlockingIOError:
+            return
+        connection.setblocking(False)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = MiddlewareClient(connection, address, **self.limits)
+        self.selector.register(connection, selectors.EVENT_READ, client)
+
+    def __service(self, client, events):
+        """Handle the events of a client socket"""
+        if events & selectors.EVENT_WRITE:
+            self.__flush(client)
+        if events & selectors.EVENT_READ and not client.closing:
+            try:
+                data = client.sock.recv(self.recv_size)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as err:
+                print(f"Socket error {err.errno} occurred on recv().")
+                data = b""
+            if not data:
+                self.__close(client)
+                return
+            client.inbuf += data
+            self.__process(client)
+
+    def __process(self, client):
+        """Process the complete commands and messages in the receive buffer of a client"""
+        buffer = client.inbuf
+        view = memoryview(buffer)
+        offset = 0
+        try:
+            while not client.closing:
+                if client.name is None:
+                    end = buffer.find(b"\n", offset)
+                    if end < 0:
+                        break
+                    self.__register(client, bytes(view[offset:end]))
+                    offset = end + 1
+                    continue
+                if len(buffer) - offset < 5:
+                    break
+                header = bytes(view[offset : offset + 5])
+                if header == b"List\n":
+                    self.__list(client)
+                    offset += 5
+                    continue
+                if header == b"Stat\n":
+                    self.__statistics(client)
+                    offset += 5
+                    continue
+                if header == b"Quit\n":
+                    self.__quit(client)
+                    offset += 5
+                    break
+                if header[:4] != b"A5A5":
+                    print(f"Invalid header from client {client.name.decode(DATA_ENCODING)}, closing.")
+                    self.__close(client)
+                    break
+                if len(buffer) - offset < 9:
+                    break
+                destination = bytes(view[offset + 5 : offset + 9]).strip(b" ")
+                # FSW messages carry a descriptor ahead of the size
+                size_offset = offset + (13 if destination == b"FSW" else 9)
+                if destination not in self.clients:
+                    print(f"Unrecognized destination {destination.decode(DATA_ENCODING)}, closing.")
+                    self.__close(client)
+                    break
+                if len(buffer) < size_offset + SIZE_STRUCT.size:
+                    break
+                end = size_offset + SIZE_STRUCT.size + SIZE_STRUCT.unpack_from(buffer, size_offset)[0]
+                if len(buffer) < end:
+                    break
+                self.__route(destination, bytes(view[offset + 9 : end]))
+                offset = end
+        finally:
+            view.release()
+        del buffer[:offset]
+
+    def __register(self, client, command):
+        """Register a client given its "Register <name>" command, ignoring other commands"""
+        params = command.split()
+        if len(params) < 2 or params[0] != b"Register":
+            return
+        name = params[1]
+        kind = b"FSW" if b"FSW" in name else b"GUI" if b"GUI" in name else None
+        if kind is not None:
+            client.kind = kind
+            client.id = max([other.id for other in self.clients[kind]], default=-1) + 1
+            self.clients[kind].append(client)
+        client.name = name + b"_%d" % client.id
+        self.registered[client.name] = client
+        print(f"Registered client {client.name.decode(DATA_ENCODING)}")
+
+    def __route(self, destination, message):
+        """Queue a message on the output buffer of all clients of the destination"""
+        overflowed = []
+        for client in self.clients[destination]:
+            if client.queue(message):
+                self.__pending.add(client)
+                if client.dropped_messages != client.reported_messages:
+                    self.__report_drops(client)
+            else:
+                overflowed.append(client)
+        for client in overflowed:
+            print(f"Client {client.name.decode(DATA_ENCODING)} overflowed its output buffer, disconnecting.")
+            self.__close(client)
+
+    @staticmethod
+    def __report_drops(client, force=False):
+        """Print the drops of a client, see MiddlewareClient.drop_report"""
+        report = client.drop_report(force)
+        if report is not None:
+            print(report)
+
+    def __list(self, client):
+        """Answer the names of all registered clients"""
+        print("List of registered clients: ")
+        for name, registered in self.registered.items():
+            counters = registered.statistics()
+            print(
+                f"\t{name.decode(DATA_ENCODING)} queued: {counters['queued_messages']} "
+                f"sent: {counters['sent_messages']} dropped: {counters['dropped_messages']}"
+            )
+            entry = b"List " + name
+            client.queue(struct.pack("i%ds" % len(entry), len(entry), entry), force=True)
+        self.__pending.add(client)
+
+    def __statistics(self, client):
+        """Answer the counters of all registered clients"""
+        report = json.dumps(self.statistics()).encode(DATA_ENCODING)
+        client.queue(SIZE_STRUCT.pack(len(report)) + report, force=True)
+        self.__pending.add(client)
+
+    def statistics(self):
+        """Get the counters of all registered clients keyed by client name"""
+        return {name.decode(DATA_ENCODING): client.statistics() for name, client in self.registered.items()}
+
+    def __quit(self, client):
+        """Answer the quit request and shut down the server"""
+        print("Quit received!")
+        client.queue(QUIT_MESSAGE, force=True)
+        self.__flush(client)
+        self.shutdown()
+
+    def __flush(self, client):
+        """Write out the output buffer of a client, waiting for the socket to be writable when it is full"""
+        if client.closing:
+            return
+        try:
+            done = client.flush()
+        except (BlockingIOError, InterruptedError):
+            done = False
+        except OSError as err:
+            print(f"Socket error {err.errno} occurred on send().")
+            self.__close(client)
+            return
+        if client.writing == done:
+            client.writing = not done
+            events = selectors.EVENT_READ | selectors.EVENT_WRITE if client.writing else selectors.EVENT_READ
+            self.selector.modify(client.sock, events, client)
+
+    def __close(self, client):
+        """Unregister and close a client"""
+        if client.closing:
+            return
+        client.closing = True
+        if client.kind is not None:
+            self.clients[client.kind].remove(client)
+        if client.name is not None:
+            del self.registered[client.name]
+            self.__report_drops(client, force=True)
+            print(f"Closed {client.name.decode(DATA_ENCODING)} connection.")
+        self.__pending.discard(client)
+        self.selector.unregister(client.sock)
+        client.sock.close()
+
+    def __receive_datagrams(self, sock, _):
+        """Route the datagrams sent to the GUI clients"""
+        while True:
+            try:
+                packet = sock.recv(self.recv_size)
+            except (BlockingIOError, InterruptedError):
+                return
+            if packet[:9] != b"A5A5 GUI " or len(packet) < 13:
+                print("Invalid datagram, dropping.")
+                continue
+            (size,) = SIZE_STRUCT.unpack_from(packet, 9)
+            self.__route(b"GUI", packet[9 : 13 + size])
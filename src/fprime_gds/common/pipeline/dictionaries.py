@@ -2,11 +2,12 @@
 dictionaries.py:
 
 Helps the standard pipeline wrangle dictionaries by encapsulating the functionality of dictionary loading into a single
-class called "Dictionaries".
+class called "Dictionaries". XML dictionaries are parsed once, and each kind of dictionary is only built once used.
 
 @author mstarch
 """
 import os
+import threading
 
 import fprime_gds.common.loaders.ch_py_loader
 import fprime_gds.common.loaders.ch_xml_loader
@@ -33,8 +34,18 @@ class Dictionaries:
     5. Event IDs to Events
     6. Event names to Events
     7. Packet IDs to Packets
+
+    XML dictionaries are built lazily. The commands, events, channels or packets are only built when first used, from a
+    parse of the XML file shared by their loaders. Tools using only one kind skip building the others. The file is
+    parsed when loaded, unless all kinds are cached, such that a malformed file is reported by load_dictionaries.
     """
 
+    XML_LOADERS = [
+        fprime_gds.common.loaders.cmd_xml_loader.CmdXmlLoader,
+        fprime_gds.common.loaders.event_xml_loader.EventXmlLoader,
+        fprime_gds.common.loaders.ch_xml_loader.ChXmlLoader,
+    ]
+
     def __init__(self):
         """Constructor of the dictionaries object"""
         self._command_id_dict = None
@@ -45,6 +56,9 @@ class Dictionaries:
         self._channel_name_dict = None
         self._packet_dict = None
         self._versions = None
+        self._xml_context = None
+        self._packet_spec = None
+        self._lock = threading.RLock()
 
     def load_dictionaries(self, dictionary, packet_spec):
         """
@@ -80,75 +94,122 @@ class Dictionaries:
             self._channel_name_dict = channel_loader.get_name_dict(
                 os.path.join(dictionary, "channels")
             )
-        # XML dictionaries
+            self._xml_context = None
+        # XML dictionaries, built from a shared parse once used
         elif os.path.isfile(dictionary):
-            # Events
-            event_loader = fprime_gds.common.loaders.event_xml_loader.EventXmlLoader()
-            self._event_id_dict = event_loader.get_id_dict(dictionary)
-            self._event_name_dict = event_loader.get_name_dict(dictionary)
-            self._versions = event_loader.get_versions()
-            # Commands
-            command_loader = fprime_gds.common.loaders.cmd_xml_loader.CmdXmlLoader()
-            self._command_id_dict = command_loader.get_id_dict(dictionary)
-            self._command_name_dict = command_loader.get_name_dict(dictionary)
-            assert self._versions == command_loader.get_versions(), "Version mismatch while loading"
-            # Channels
-            channel_loader = fprime_gds.common.loaders.ch_xml_loader.ChXmlLoader()
-            self._channel_id_dict = channel_loader.get_id_dict(dictionary)
-            self._channel_name_dict = channel_loader.get_name_dict(dictionary)
-            assert self._versions == channel_loader.get_versions(), "Version mismatch while loading"
+            self._xml_context = fprime_gds.common.loaders.xml_loader.XmlParseContext(dictionary)
+            # Parse now such that errors surface here and not on first use, possibly on a decoding thread. Dictionaries
+            # cached were built from a successful parse of the same content, they need no parse.
+            if not all(loader.is_cached(dictionary) for loader in self.XML_LOADERS):
+                self._xml_context.parse()
+            self._event_id_dict = self._event_name_dict = None
+            self._command_id_dict = self._command_name_dict = None
+            self._channel_id_dict = self._channel_name_dict = None
+            self._versions = None
         else:
             raise Exception(f"[ERROR] Dictionary '{dictionary}' does not exist.")
-        # Check for packet specification
-        if packet_spec is not None:
-            packet_loader = fprime_gds.common.loaders.pkt_xml_loader.PktXmlLoader()
-            self._packet_dict = packet_loader.get_id_dict(
-                packet_spec, self._channel_name_dict
-            )
-        else:
-            self._packet_dict = None
+        # Packet specification, built once used
+        self._packet_spec = packet_spec
+        self._packet_dict = None
+
+    def _load_xml(self, loader_class):
+        """
+        Builds the id and name dictionaries of a loader from the shared parse of the XML dictionary
+
+        :param loader_class: XmlLoader subclass building the dictionaries
+        :return: tuple of id dictionary, name dictionary
+        """
+        path = self._xml_context.path
+        loader = loader_class(self._xml_context)
+        id_dict, name_dict = loader.get_id_dict(path), loader.get_name_dict(path)
+        if self._versions is None:
+            self._versions = loader.get_versions()
+        assert self._versions == loader.get_versions(), "Version mismatch while loading"
+        return id_dict, name_dict
+
+    def _load_events(self):
+        """Build the event dictionaries when not yet built"""
+        with self._lock:
+            if self._event_id_dict is None and self._xml_context is not None:
+                self._event_id_dict, self._event_name_dict = self._load_xml(
+                    fprime_gds.common.loaders.event_xml_loader.EventXmlLoader
+                )
+
+    def _load_commands(self):
+        """Build the command dictionaries when not yet built"""
+        with self._lock:
+            if self._command_id_dict is None and self._xml_context is not None:
+                self._command_id_dict, self._command_name_dict = self._load_xml(
+                    fprime_gds.common.loaders.cmd_xml_loader.CmdXmlLoader
+                )
+
+    def _load_channels(self):
+        """Build the channel dictionaries when not yet built"""
+        with self._lock:
+            if self._channel_id_dict is None and self._xml_context is not None:
+                self._channel_id_dict, self._channel_name_dict = self._load_xml(
+                    fprime_gds.common.loaders.ch_xml_loader.ChXmlLoader
+                )
 
     @property
     def command_id(self):
         """Command dictionary by ID"""
+        self._load_commands()
         return self._command_id_dict
 
     @property
     def event_id(self):
         """Event dictionary by ID"""
+        self._load_events()
         return self._event_id_dict
 
     @property
     def channel_id(self):
         """Channel dictionary by ID"""
+        self._load_channels()
         return self._channel_id_dict
 
     @property
     def command_name(self):
         """Command dictionary by name"""
+        self._load_commands()
         return self._command_name_dict
 
     @property
     def event_name(self):
         """Event dictionary by name"""
+        self._load_events()
         return self._event_name_dict
 
     @property
     def channel_name(self):
         """Channel dictionary by name"""
+        self._load_channels()
         return self._channel_name_dict
 
+    def _load_versions(self):
+        """Read the versions of the XML dictionary when not yet known, without building any dictionary"""
+        with self._lock:
+            if self._versions is None and self._xml_context is not None:
+                self._versions = self._xml_context.versions
+
     @property
     def project_version(self):
         """Project version in dictionary"""
+        self._load_versions()
         return self._versions[1]
 
     @property
     def framework_version(self):
         """Framework version in dictionary"""
+        self._load_versions()
         return self._versions[0]
 
     @property
     def packet(self):
         """Packet dictionary"""
+        with self._lock:
+            if self._packet_dict is None and self._packet_spec is not None:
+                packet_loader = fprime_gds.common.loaders.pkt_xml_loader.PktXmlLoader()
+                self._packet_dict = packet_loader.get_id_dict(self._packet_spec, self.channel_name)
         return self._packet_dict
@@ -7,6 +7,7 @@ and decoding into a single component that the be composed into the standard pipe
 @mstarch
 """
 import fprime_gds.common.decoders.ch_decoder
+import fprime_gds.common.decoders.compiled_decoder
 import fprime_gds.common.decoders.event_decoder
 import fprime_gds.common.decoders.file_decoder
 import fprime_gds.common.decoders.pkt_decoder
@@ -40,6 +41,8 @@ class EncodingDecoding:
         self.file_decoder = None
         self.packet_decoder = None
         self.command_subscribers = []
+        # Use the precompiled struct-based channel and event decoders
+        self.compiled_decoders = False
 
     def setup_coders(self, dictionaries, distributor, sender, config):
         """
@@ -58,10 +61,13 @@ class EncodingDecoding:
         self.command_encoder = fprime_gds.common.encoders.cmd_encoder.CmdEncoder(
             config=config
         )
-        self.event_decoder = fprime_gds.common.decoders.event_decoder.EventDecoder(
-            dictionaries.event_id, config=config
-        )
-        self.channel_decoder = fprime_gds.common.decoders.ch_decoder.ChDecoder(
+        event_decoder_type = fprime_gds.common.decoders.event_decoder.EventDecoder
+        channel_decoder_type = fprime_gds.common.decoders.ch_decoder.ChDecoder
+        if self.compiled_decoders:
+            event_decoder_type = fprime_gds.common.decoders.compiled_decoder.CompiledEventDecoder
+            channel_decoder_type = fprime_gds.common.decoders.compiled_decoder.CompiledChDecoder
+        self.event_decoder = event_decoder_type(dictionaries.event_id, config=config)
+        self.channel_decoder = channel_decoder_type(
             dictionaries.channel_id, config=config
         )
         self.file_decoder = fprime_gds.common.decoders.file_decoder.FileDecoder()
@@ -8,6 +8,7 @@ to compose in this code.
 """
 from typing import Type
 from fprime_gds.common.history.history import History
+from fprime_gds.common.history.latest import LatestValueIndex
 from fprime_gds.common.history.ram import RamHistory
 
 
@@ -18,6 +19,8 @@ class Histories:
     1. Channel history
     2. Event history
     3. Command history (short-circuited feedback from encoder)
+
+    Additionally, the latest value of each channel is indexed for displays needing only the current values.
     """
 
     def __init__(self):
@@ -26,7 +29,9 @@ class Histories:
         self._command_hist = None
         self._event_hist = None
         self._channel_hist = None
+        self._latest_channels = None
         self._implementation_type = RamHistory
+        self._implementation_arguments = {}
 
     def setup_histories(self, coders):
         """
@@ -37,9 +42,11 @@ class Histories:
         """
         self.coders = coders
         # Create histories, RAM histories for now
-        self.commands = self._implementation_type()
-        self.events = self._implementation_type()
-        self.channels = self._implementation_type()
+        self.commands = self._implementation_type(**self._implementation_arguments)
+        self.events = self._implementation_type(**self._implementation_arguments)
+        self.channels = self._implementation_type(**self._implementation_arguments)
+        self._latest_channels = LatestValueIndex()
+        self.coders.register_channel_consumer(self._latest_channels)
 
     @property
     def implementation(self):
@@ -56,6 +63,21 @@ class Histories:
         ), "Cannot setup implementation types after setup"
         self._implementation_type = implementation_type
 
+    @property
+    def implementation_arguments(self):
+        """Get keyword arguments constructing the implementation type, e.g. the capacity of a ColumnarHistory"""
+        return self._implementation_arguments
+
+    @implementation_arguments.setter
+    def implementation_arguments(self, arguments: dict):
+        """Set keyword arguments constructing the implementation type"""
+        assert (
+            self._command_hist is None
+            and self._event_hist is None
+            and self._channel_hist is None
+        ), "Cannot setup implementation arguments after setup"
+        self._implementation_arguments = dict(arguments)
+
     @property
     def events(self):
         """
@@ -96,6 +118,13 @@ class Histories:
         self._channel_hist = history
         self.coders.register_channel_consumer(self._channel_hist)
 
+    @property
+    def latest_channels(self):
+        """
+        Latest channel value index property
+        """
+        return self._latest_channels
+
     @property
     def commands(self):
         """
@@ -16,6 +16,7 @@ import fprime.common.models.serialize.time_type
 import fprime_gds.common.data_types.cmd_data
 import fprime_gds.common.distributor.distributor
 import fprime_gds.common.logger.data_logger
+import fprime_gds.common.logger.recording
 
 # Local imports for the sake of composition
 from . import dictionaries, encoding, files, histories
@@ -42,12 +43,16 @@ class StandardPipeline:
         self.distributor = None
         self.client_socket = None
         self.logger = None
+        self.recorder = None
+        self.record_downlink = False
 
         self.__dictionaries = dictionaries.Dictionaries()
         self.__coders = encoding.EncodingDecoding()
         self.__histories = histories.Histories()
         self.__filing = files.Filing()
         self.__transport_type = ThreadedTCPSocketClient
+        self.__distributor_type = fprime_gds.common.distributor.distributor.Distributor
+        self.__logger_type = fprime_gds.common.logger.data_logger.DataLogger
 
     def setup(
         self, config, dictionary, down_store, logging_prefix=None, packet_spec=None
@@ -64,7 +69,7 @@ class StandardPipeline:
         """
         assert dictionary is not None and Path(dictionary).is_file(), f"Dictionary {dictionary} does not exist"
         # Loads the distributor and client socket
-        self.distributor = fprime_gds.common.distributor.distributor.Distributor(config)
+        self.distributor = self.__distributor_type(config)
         self.client_socket = self.__transport_type()
         # Setup dictionaries encoders and decoders
         self.dictionaries.load_dictionaries(dictionary, packet_spec)
@@ -79,11 +84,12 @@ class StandardPipeline:
             self.distributor,
             logging_prefix,
         )
-        # Register distributor to client socket
+        # Register distributor to client socket, starting it now that the decoders are registered
         self.client_socket.register(self.distributor)
+        self.distributor.start()
         # Final setup step is to make a logging directory, and register in the logger
         if logging_prefix:
-            self.setup_logging(logging_prefix)
+            self.setup_logging(logging_prefix, config)
 
     @property
     def transport_implementation(self):
@@ -98,6 +104,30 @@ class StandardPipeline:
         ), "Cannot setup transport implementation type after setup"
         self.__transport_type = transport_type
 
+    @property
+    def distributor_implementation(self):
+        """Get implementation type for distributor"""
+        return self.__distributor_type
+
+    @distributor_implementation.setter
+    def distributor_implementation(self, distributor_type: Type[None]):
+        """Set the implementation type for distributor"""
+        assert (
+            self.distributor is None
+        ), "Cannot setup distributor implementation type after setup"
+        self.__distributor_type = distributor_type
+
+    @property
+    def logger_implementation(self):
+        """Get implementation type for the data logger"""
+        return self.__logger_type
+
+    @logger_implementation.setter
+    def logger_implementation(self, logger_type: Type[None]):
+        """Set the implementation type for the data logger (e.g. BatchedDataLogger)"""
+        assert self.logger is None, "Cannot setup logger implementation type after setup"
+        self.__logger_type = logger_type
+
     @classmethod
     def get_dated_logging_dir(cls, prefix=os.path.expanduser("~")):
         """
@@ -114,22 +144,25 @@ class StandardPipeline:
             os.makedirs(log_dir)
         return log_dir
 
-    def setup_logging(self, log_dir):
+    def setup_logging(self, log_dir, config=None):
         """
-        Setup logging based on the logging prefix supplied
+        Setup logging based on the logging prefix supplied. Alongside the log files, the downlink is recorded into an
+        indexed recording (see fprime_gds.common.logger.recording) when record_downlink is set before setup.
 
         :param log_dir: logging output directory
+        :param config: config object describing the framing of the recorded downlink. Defaults to the config singleton.
         """
         # Setup the logging pipeline (register it to all its data sources)
-        logger = fprime_gds.common.logger.data_logger.DataLogger(
-            log_dir, verbose=True, csv=True
-        )
+        logger = self.__logger_type(log_dir, verbose=True, csv=True)
         self.logger = logger
         self.coders.register_channel_consumer(self.logger)
         self.coders.register_event_consumer(self.logger)
         self.coders.register_command_consumer(self.logger)
         self.coders.register_packet_consumer(self.logger)
         self.client_socket.register(self.logger)
+        if self.record_downlink:
+            self.recorder = fprime_gds.common.logger.recording.RecordingLogger(log_dir, config)
+            self.client_socket.register(self.recorder)
 
     def connect(
         self, connection_uri, incoming_tag=RoutingTag.GUI, outgoing_tag=RoutingTag.FSW
@@ -161,6 +194,12 @@ class StandardPipeline:
         try:
             if self.client_socket is not None:
                 self.client_socket.disconnect()
+            if self.distributor is not None:
+                self.distributor.close()
+            if self.logger is not None:
+                self.logger.close()
+            if self.recorder is not None:
+                self.recorder.close()
         finally:
             if self.files is not None and self.files.uplinker is not None:
                 self.files.uplinker.exit()
@@ -7,12 +7,12 @@ telemetry and dictionaries.
 
 :author: koran
 """
-import signal
 import time
 
 from fprime.common.models.serialize.time_type import TimeType
 from fprime_gds.common.handlers import DataHandler
 from fprime_gds.common.history.chrono import ChronologicalHistory
+from fprime_gds.common.history.history import AwaitableHistory
 from fprime_gds.common.history.test import TestHistory
 from fprime_gds.common.logger.test_logger import TestLogger
 from fprime_gds.common.testing_fw import predicates
@@ -356,7 +356,7 @@ class IntegrationTestAPI(DataHandler):
             args: a list of command arguments.
             channels: a single or a sequence of channel specs (event_predicates, mnemonics, or IDs)
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
 
         Returns:
             The channel update or updates found by the search
@@ -384,7 +384,7 @@ class IntegrationTestAPI(DataHandler):
             args: a list of command arguments.
             events: a single or a sequence of event specifiers (event_predicates, mnemonics, or IDs)
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
 
         Returns:
             The event or events found by the search
@@ -415,7 +415,7 @@ class IntegrationTestAPI(DataHandler):
             args: a list of command arguments.
             channels: a single or a sequence of channel specs (event_predicates, mnemonics, or IDs)
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
 
         Returns:
             The channel update or updates found by the search
@@ -444,7 +444,7 @@ class IntegrationTestAPI(DataHandler):
             args: a list of command arguments.
             events: a single or a sequence of event specifiers (event_predicates, mnemonics, or IDs)
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
 
         Returns:
             The event or events found by the search
@@ -537,7 +537,7 @@ class IntegrationTestAPI(DataHandler):
             time_pred: an optional predicate to specify the flight software timestamp
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             the ChData object found during the search, otherwise, None
         """
@@ -562,7 +562,7 @@ class IntegrationTestAPI(DataHandler):
             channels: an ordered list of channel specifiers (mnemonic, id, or predicate)
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             an ordered list of ChData objects that satisfies the sequence
         """
@@ -589,7 +589,7 @@ class IntegrationTestAPI(DataHandler):
             channels: a channel specifier or list of channel specifiers (mnemonic, ID, or predicate)
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             a list of the ChData objects that were counted
         """
@@ -623,7 +623,7 @@ class IntegrationTestAPI(DataHandler):
             time_pred: an optional predicate to specify the flight software timestamp
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             the ChData object found during the search
         """
@@ -648,7 +648,7 @@ class IntegrationTestAPI(DataHandler):
             channels: an ordered list of channel specifiers (mnemonic, id, or predicate)
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             an ordered list of ChData objects that satisfies the sequence
         """
@@ -671,7 +671,7 @@ class IntegrationTestAPI(DataHandler):
             channels: a channel specifier or list of channel specifiers (mnemonic, ID, or predicate)
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             a list of the ChData objects that were counted
         """
@@ -773,7 +773,7 @@ class IntegrationTestAPI(DataHandler):
             time_pred: an optional predicate to specify the flight software timestamp
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             the EventData object found during the search, otherwise, None
         """
@@ -798,7 +798,7 @@ class IntegrationTestAPI(DataHandler):
             events: an ordered list of event specifiers (mnemonic, id, or predicate)
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             an ordered list of EventData objects that satisfies the sequence
         """
@@ -825,7 +825,7 @@ class IntegrationTestAPI(DataHandler):
             events: an event specifier or list of event specifiers (mnemonic, ID, or predicate)
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             a list of the EventData objects that were counted
         """
@@ -867,7 +867,7 @@ class IntegrationTestAPI(DataHandler):
             time_pred: an optional predicate to specify the flight software timestamp
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             the EventData object found during the search
         """
@@ -890,7 +890,7 @@ class IntegrationTestAPI(DataHandler):
             events: an ordered list of event specifiers (mnemonic, id, or predicate)
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             an ordered list of EventData objects that satisfied the sequence
         """
@@ -913,7 +913,7 @@ class IntegrationTestAPI(DataHandler):
             events: optional event specifier or list of specifiers (mnemonic, id, or predicate)
             history: if given, a substitute history that the function will search and await
             start: an optional index or predicate to specify the earliest item to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             a list of the EventData objects that were counted
         """
@@ -968,11 +968,12 @@ class IntegrationTestAPI(DataHandler):
 
     class TimeoutException(Exception):
         """
-        This exception is used by the history searches to signal the end of the timeout.
+        This exception was used by the history searches to signal the end of the timeout. Searches
+        now track their deadline directly and this exception is retained for compatibility.
         """
 
-    def __timeout_sig_handler(self, signum, frame):
-        raise self.TimeoutException()
+    # Interval in seconds at which histories that do not notify their updates are polled by searches
+    POLL_INTERVAL = 0.1
 
     def __search_test_history(self, searcher, name, history, start=None, timeout=0):
         """
@@ -991,7 +992,10 @@ class IntegrationTestAPI(DataHandler):
 
         timeout is a specification of how long to await future items in seconds. Specifying a
         timeout of 0 will ignore all future items. The timeout specifies an increment of time
-        relative to the local clock, not the embedded application's clock.
+        relative to the local clock, not the embedded application's clock, and may be fractional.
+        Histories that notify their updates (i.e. AwaitableHistory) wake the search as soon as new
+        items arrive, other histories are polled. Since no signals are used, searches may be run
+        from any thread.
         Note: the API does not try to check for edge cases where the final item in a search is
         received as the search times out. The user should ensure that their timeouts are sufficient
         to complete any awaiting searches.
@@ -1005,7 +1009,7 @@ class IntegrationTestAPI(DataHandler):
             history: the TestHistory object to conduct the search on
             start: an index, a predicate, the NOW variable, or a TimeType timestamp to pick the
                 first item to search
-            timeout: the number of seconds to await future items
+            timeout: the number of seconds to await future items (int or float)
         """
         if start == self.NOW:
             start = history.size()
@@ -1022,22 +1026,28 @@ class IntegrationTestAPI(DataHandler):
         if timeout:
             self.__log(f"{name} now awaiting for at most {timeout} s.")
             check_repeats = isinstance(history, ChronologicalHistory)
-            try:
-                signal.signal(signal.SIGALRM, self.__timeout_sig_handler)
-                signal.alarm(timeout)
-                while True:
-                    if check_repeats:
-                        new_items = history.retrieve_new(searcher.requires_repeats())
-                    else:
-                        new_items = history.retrieve_new()
-                    for item in new_items:
-                        if searcher.incremental_search(item):
-                            return searcher.get_return_value()
-                    time.sleep(0.1)
-            except self.TimeoutException:
-                self.__log(f'{name} timed out and ended unsuccessfully.', TestLogger.YELLOW)
-            finally:
-                signal.alarm(0)
+            awaitable = isinstance(history, AwaitableHistory)
+            deadline = time.monotonic() + timeout
+            while True:
+                # Read the update count before retrieving such that items arriving afterwards wake the wait below
+                seen = history.update_count if awaitable else None
+                if check_repeats:
+                    new_items = history.retrieve_new(searcher.requires_repeats())
+                else:
+                    new_items = history.retrieve_new()
+                for item in new_items:
+                    if searcher.incremental_search(item):
+                        return searcher.get_return_value()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if awaitable:
+                    # Items arriving after the deadline are not searched
+                    if not history.wait_for_update(seen, remaining):
+                        break
+                else:
+                    time.sleep(min(self.POLL_INTERVAL, remaining))
+            self.__log(f'{name} timed out and ended unsuccessfully.', TestLogger.YELLOW)
         else:
             self.__log(f'{name} ended unsuccessfully.', TestLogger.YELLOW)
         return searcher.get_return_value()
@@ -1052,7 +1062,7 @@ class IntegrationTestAPI(DataHandler):
             search_pred: a predicate to specify a history item.
             history: the history that the function will search and await
             start: an index or predicate to specify the earliest item from the history to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             the data object found during the search, otherwise, None
         """
@@ -1096,7 +1106,7 @@ class IntegrationTestAPI(DataHandler):
             seq_preds: an ordered list of predicate objects to specify a sequence
             history: the history that the function will search and await
             start: an index or predicate to specify the earliest item from the history to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             a list of data objects that satisfied the sequence
         """
@@ -1152,7 +1162,7 @@ class IntegrationTestAPI(DataHandler):
             history: the history that the function will search and await
             search_pred: a predicate to specify which items to count. If left blank, all will count
             start: an index or predicate to specify the earliest item from the history to search
-            timeout: the number of seconds to wait before terminating the search (int)
+            timeout: the number of seconds to wait before terminating the search (int or float)
         Returns:
             a list of data objects that were counted during the search
         """
@@ -7,41 +7,34 @@ Utility functions to process strings to be used in FPrime GDS
 Note: This function has an identical copy in fprime-gds
 """
 
+import functools
 import re
 import logging
 
 LOGGER = logging.getLogger("string_util_logger")
 
+# Pattern of C-string conversions, see format_string_template
+TEMPLATE_PATTERN = re.compile(
+    r"(?<!%)(?:%%)*%([\-\+0\ \#])?(\d+|\*)?(\.\*|\.\d+)?([hLIw]|l{1,2}|I32|I64)?([cCdiouxXeEfgGaAnpsSZ])"
+)
 
-def format_string_template(format_str, given_values):
-    r"""
-    Function to convert C-string style to python format
-    without using python interpolation
-    Considered the following format for C-string:
-    %[flags][width][.precision][length]type
+# Number of compiled templates kept by compile_template
+TEMPLATE_CACHE_SIZE = 4096
 
-    0- %:                (?<!%)(?:%%)*%
-    1- flags:            ([\-\+0\ \#])?
-    2- width:            (\d+|\*)?
-    3- .precision:       (\.\*|\.\d+)?
-    4- length:          `([hLIw]|l{1,2}|I32|I64)?`
-    5- conversion_type: `([cCdiouxXeEfgGaAnpsSZ])`
-
-    Note:
-    This function will keep the flags, width, and .precision of C-string
-    template.
 
-    It will keep f, d, x, o, and e flags and remove all other types.
-    Other types will be duck-typed by python
-    interpreter.
+def convert_template(format_str, ignore_int):
+    """
+    Convert a C-string style template to a python format string as described in format_string_template
 
-    lengths will also be removed since they are not meaningful to Python interpreter.
-    `See: https://docs.python.org/3/library/stdtypes.html#printf-style-string-formatting`
+    Args:
+        format_str: C-string style template
+        ignore_int: remove the `d` conversion types such that values are duck-typed (e.g. ENUMs with %d)
 
-    `Regex Source: https://www.regexlib.com/REDetails.aspx?regexp_id=3363`
+    Returns:
+        python format string
     """
 
-    def convert(match_obj, ignore_int):
+    def convert(match_obj):
         if match_obj.group() is None:
             return match_obj
         flags, width, precision, length, conversion_type = match_obj.groups()
@@ -68,12 +61,56 @@ def format_string_template(format_str, given_values):
 
         return "{}" if format_template == "" else "{:" + format_template + "}"
 
-    def convert_include_all(match_obj):
-        return convert(match_obj, ignore_int=False)
+    return re.sub(TEMPLATE_PATTERN, convert, format_str)
 
-    def convert_ignore_int(match_obj):
-        return convert(match_obj, ignore_int=True)
 
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(format_str):
+    """
+    Compile a C-string style template into ready-to-use formatters. Templates are compiled once and kept in a least
+    recently used cache of TEMPLATE_CACHE_SIZE templates, as the same templates are formatted for every event.
+
+    Args:
+        format_str: C-string style template
+
+    Returns:
+        tuple of formatter including all types, formatter ignoring integer types
+    """
+    return (
+        convert_template(format_str, ignore_int=False).format,
+        convert_template(format_str, ignore_int=True).format,
+    )
+
+
+def format_string_template(format_str, given_values):
+    r"""
+    Function to convert C-string style to python format
+    without using python interpolation
+    Considered the following format for C-string:
+    %[flags][width][.precision][length]type
+
+    0- %:                (?<!%)(?:%%)*%
+    1- flags:            ([\-\+0\ \#])?
+    2- width:            (\d+|\*)?
+    3- .precision:       (\.\*|\.\d+)?
+    4- length:          `([hLIw]|l{1,2}|I32|I64)?`
+    5- conversion_type: `([cCdiouxXeEfgGaAnpsSZ])`
+
+    Note:
+    This function will keep the flags, width, and .precision of C-string
+    template.
+
+    It will keep f, d, x, o, and e flags and remove all other types.
+    Other types will be duck-typed by python
+    interpreter.
+
+    lengths will also be removed since they are not meaningful to Python interpreter.
+    `See: https://docs.python.org/3/library/stdtypes.html#printf-style-string-formatting`
+
+    Converted templates are cached by compile_template.
+
+    `Regex Source: https://www.regexlib.com/REDetails.aspx?regexp_id=3363`
+    """
     # Allowing single, list and tuple inputs
     if not isinstance(given_values, (list, tuple)):
         values = (given_values,)
@@ -82,14 +119,10 @@ def format_string_template(format_str, given_values):
     else:
         values = given_values
 
-    pattern = r"(?<!%)(?:%%)*%([\-\+0\ \#])?(\d+|\*)?(\.\*|\.\d+)?([hLIw]|l{1,2}|I32|I64)?([cCdiouxXeEfgGaAnpsSZ])"
-
-    match = re.compile(pattern)
-
     # First try to include all types
     try:
-        formatted_str = re.sub(match, convert_include_all, format_str)
-        result = formatted_str.format(*values)
+        include_all, _ = compile_template(format_str)
+        result = include_all(*values)
         result = result.replace("%%", "%")
         return result
     except Exception as exc:
@@ -104,8 +137,8 @@ def format_string_template(format_str, given_values):
     # This will resolve failing ENUMs with %d
     # but will fail on other types.
     try:
-        formatted_str = re.sub(match, convert_ignore_int, format_str)
-        result = formatted_str.format(*values)
+        _, ignore_int = compile_template(format_str)
+        result = ignore_int(*values)
         result = result.replace("%%", "%")
         return result
     except ValueError as e:
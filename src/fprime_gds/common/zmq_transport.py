@@ -7,6 +7,12 @@ replace the ThreadedTcpServer for several reasons as described below.
 2. ZeroMQ does not require a separate process and may be used w/o tcp sockets
 3. ZeroMQ will not reorder packets at high data rates
 
+By default every packet is sent as a single message prefixed with the routing topic. In batched mode (--zmq-batch) all
+packets sent together are sent as one multipart message: a topic frame followed by a single frame carrying the packets
+back to back, which the receiver takes without copying. Packets are not sent as a frame each, as pyzmq handles every
+frame of a multipart message separately and small frames cost more than single messages. Both ends of the network must
+agree on the mode.
+
 @author lestarch
 """
 import logging
@@ -22,6 +28,7 @@ from fprime_gds.common.transport import (
     TransportationException,
 )
 LOGGER = logging.getLogger("transport")
+SIZE_STRUCT = struct.Struct(">I")
 
 class ZmqWrapper(object):
     """Handler for ZMQ functions for use in other objects"""
@@ -36,8 +43,12 @@ class ZmqWrapper(object):
         self.sub_topic = None
         self.transport_url = None
         self.server = False
+        self.batched = False
+        self.poller = None
+        self.max_batch = 65536
+        self.mismatches = 0
 
-    def configure(self, transport_url: Tuple[str], sub_topic: bytes, pub_topic: bytes):
+    def configure(self, transport_url: Tuple[str], sub_topic: bytes, pub_topic: bytes, batched: bool = False):
         """Configure the ZeroMQ wrapper
 
         Configures the ZeroMQ wrapper, but notably does not connect it. This has been separated out because ZeroMQ
@@ -48,8 +59,10 @@ class ZmqWrapper(object):
             transport_url: url of the ZeroMQ network to connect to
             sub_topic: subscription topic used to filter incoming messages
             pub_topic: publication topic supplied for remote subscription filters
+            batched: send and receive multipart messages carrying many packets
         """
         assert len(transport_url) == 2, f"Must supply a pair of URLs for ZeroMQ not '{transport_url}'"
+        self.batched = batched
         self.pub_topic = pub_topic
         self.sub_topic = sub_topic
         self.transport_url = transport_url
@@ -114,6 +127,8 @@ class ZmqWrapper(object):
         else:
             LOGGER.info("Incoming connecting to: %s", (self.transport_url[1]))
             self.zmq_socket_incoming.connect(self.transport_url[1])
+        self.poller = zmq.Poller()
+        self.poller.register(self.zmq_socket_incoming, zmq.POLLIN)
 
     def disconnect_outgoing(self):
         """Disconnect the ZeroMQ sockets"""
@@ -127,23 +142,95 @@ class ZmqWrapper(object):
         """ Terminate the ZeroMQ context"""
         self.context.term()
 
-    def recv(self, timeout=None):
-        """Receive single packet from ZMQ"""
-        try:
-            self.zmq_socket_incoming.setsockopt(
-                zmq.RCVTIMEO, timeout if timeout is not None else -1
+    def mismatch(self, frames):
+        """Count and log a message sent in the other mode, which is dropped
+
+        Args:
+            frames: number of frames of the message
+        """
+        self.mismatches += 1
+        # Log the first few only, every message of a mismatched peer is dropped
+        if self.mismatches <= 3:
+            LOGGER.error(
+                "ZMQ batch mode mismatch: received a %d frame message in %s mode, dropping it. Run both ends with or "
+                "without --zmq-batch",
+                frames,
+                "batched" if self.batched else "unbatched",
             )
-            message = self.zmq_socket_incoming.recv()[len(self.sub_topic) :]
 
-        except zmq.Again:
+    def receive_message(self, copy=True):
+        """Receive the data of one message without waiting, None when dropped as sent in the other batch mode
+
+        Batched messages are a topic frame followed by a data frame, unbatched messages are a single frame of the topic
+        followed by the data. Raises zmq.Again when no message is queued.
+
+        Args:
+            copy: copy the data frame of batched messages, otherwise return a memoryview of the frame
+        Returns:
+            data of the message without its topic, or None
+        """
+        frames = self.zmq_socket_incoming.recv_multipart(zmq.NOBLOCK, copy=copy)
+        if len(frames) != (2 if self.batched else 1):
+            self.mismatch(len(frames))
+            return None
+        if self.batched:
+            return frames[1] if copy else frames[1].buffer
+        data = frames[0] if copy else frames[0].bytes
+        return memoryview(data)[len(self.sub_topic) :]
+
+    def recv(self, timeout=None):
+        """Receive single packet from ZMQ"""
+        if not self.poller.poll(timeout):
             return b""
-        return message
+        data = self.receive_message()
+        return b"" if data is None else bytes(data)
+
+    def recv_all(self, timeout=None):
+        """Receive all available packets from ZMQ
+
+        Waits up to timeout for a message and then drains the messages queued behind it without waiting, until at least
+        max_batch bytes were received. The data of each message is returned as a memoryview, such that the topic is
+        removed without copying. In batched mode the data frames are received without copies too, small single packet
+        messages are cheaper to copy.
+
+        Args:
+            timeout: milliseconds to wait for the first message, None waits forever
+        Returns:
+            list of memoryviews, one per message: a packet or, in batched mode, the packets sent together
+        """
+        messages = []
+        if not self.poller.poll(timeout):
+            return messages
+        size = 0
+        while size < self.max_batch:
+            try:
+                data = self.receive_message(copy=not self.batched)
+            except zmq.Again:
+                break
+            if data is not None:
+                messages.append(data)
+                size += len(data)
+        return messages
 
     def send(self, data):
         """Send single message through ZMQ"""
+        if self.batched:
+            return self.zmq_socket_outgoing.send_multipart([self.pub_topic, data])
         message_out = self.pub_topic + data
         return self.zmq_socket_outgoing.send(message_out)
 
+    def send_all(self, packets):
+        """Send packets through ZMQ, as one message in batched mode
+
+        Args:
+            packets: list of bytes packets to send
+        """
+        if not self.batched:
+            for packet in packets:
+                self.send(packet)
+        elif packets:
+            self.zmq_socket_outgoing.send_multipart([self.pub_topic, b"".join(packets)], copy=False)
+
 
 class ZmqClient(ThreadedTransportClient):
     """ZeroMQ client to the transport layer
@@ -155,16 +242,21 @@ class ZmqClient(ThreadedTransportClient):
     Note: implementation delegates to a zmq wrapper
     """
 
-    def __init__(self):
-        """Create ZMQ wrapper"""
+    def __init__(self, batched=False):
+        """Create ZMQ wrapper
+
+        Args:
+            batched: use the batched ZeroMQ mode
+        """
         super().__init__()
         self.zmq = ZmqWrapper()
+        self.batched = batched
 
     def connect(
         self, transport_url: Tuple[str], sub_routing: RoutingTag, pub_routing: RoutingTag
     ):
         """Connects to the ZeroMQ network"""
-        self.zmq.configure(transport_url, sub_routing.value, pub_routing.value)
+        self.zmq.configure(transport_url, sub_routing.value, pub_routing.value, self.batched)
         self.zmq.connect_outgoing() # Outgoing socket, for clients, exists on the current thread
         super().connect(transport_url, sub_routing, pub_routing)
 
@@ -180,8 +272,8 @@ class ZmqClient(ThreadedTransportClient):
         self.zmq.send(data)  # Must strip out ZZZZ as that is a ThreadedTcpServer only property
 
     def recv(self, timeout=None):
-        """Receives data from ZeroMQ"""
-        return self.zmq.recv(timeout)
+        """Receives all available data from ZeroMQ as a single chunk"""
+        return b"".join(self.zmq.recv_all(timeout))
 
     def recv_thread(self):
         """ Overrides the recv_thread method
@@ -206,15 +298,17 @@ class ZmqGround(GroundHandler):
     to ensure that it binds to resources for the network. This is not forced in case of multiple FSW connections.
     """
 
-    def __init__(self, transport_url):
+    def __init__(self, transport_url, batched=False):
         """Initialize this interface with the transport_url needed to connect
 
         Args:
             transport_url: transport url passed into the zeromq connection
+            batched: use the batched ZeroMQ mode
         """
         super().__init__()
         self.zmq = ZmqWrapper()
         self.transport_url = transport_url
+        self.batched = batched
         self.timeout = 10
 
     def open(self):
@@ -228,7 +322,7 @@ class ZmqGround(GroundHandler):
         """
         try:
             self.zmq.configure(
-                self.transport_url, RoutingTag.FSW.value, RoutingTag.GUI.value
+                self.transport_url, RoutingTag.FSW.value, RoutingTag.GUI.value, self.batched
             )
         except TransportationException:
             return False
@@ -257,17 +351,21 @@ class ZmqGround(GroundHandler):
         """
         if self.zmq.zmq_socket_incoming is None:
             self.zmq.connect_incoming()
-        messages = []
-        data = None
-        while data != b"":
-            data = self.zmq.recv(timeout=self.timeout)
-            if data != b"":
-                # TODO: we need to fix where this is being pulled off, should be done in the framing protocol for uplink
-                data = data[
-                    4:
-                ]  # Strip off the size as this will be re-added by the framing protocol
-                messages.append(data)
-        return messages
+        messages = self.zmq.recv_all(timeout=self.timeout)
+        # TODO: we need to fix where this is being pulled off, should be done in the framing protocol for uplink
+        # Strip off the size as this will be re-added by the framing protocol
+        if not self.batched:
+            return [bytes(message[4:]) for message in messages]
+        # Batched messages carry size prefixed packets back to back
+        packets = []
+        for message in messages:
+            offset = 0
+            while offset + SIZE_STRUCT.size <= len(message):
+                (size,) = SIZE_STRUCT.unpack_from(message, offset)
+                offset += SIZE_STRUCT.size
+                packets.append(bytes(message[offset : offset + size]))
+                offset += size
+        return packets
 
     def send_all(self, frames):
         """Send all the data frames to GUI
@@ -280,9 +378,6 @@ class ZmqGround(GroundHandler):
         """
         if self.zmq.zmq_socket_outgoing is None:
             self.zmq.connect_outgoing()
-        for packet in frames:
-            # TODO: we need to fix where this is being pulled off, should be done in the framing protocol for uplink
-            size_bytes = struct.pack(
-                ">I", len(packet)
-            )  # Add in size bytes as it was stripped in the downlink protocol
-            self.zmq.send(size_bytes + packet)
+        # TODO: we need to fix where this is being pulled off, should be done in the framing protocol for uplink
+        # Add in size bytes as it was stripped in the downlink protocol
+        self.zmq.send_all([SIZE_STRUCT.pack(len(packet)) + packet for packet in frames])
@@ -13,6 +13,7 @@ import copy
 import datetime
 import errno
 import importlib
+import importlib.util
 import os
 import re
 import sys
@@ -21,17 +22,17 @@ import fprime_gds.common.communication.adapters.base
 # Include basic adapters
 import fprime_gds.common.communication.adapters.ip
 import fprime_gds.common.communication.checksum
+import fprime_gds.common.loaders.dictionary_cache
 import fprime_gds.common.logger
 import fprime_gds.common.utils.config_manager
+import fprime_gds.executables.startup_profile
 
 try:
     import fprime_gds.common.communication.adapters.uart
 except ImportError:
     pass
-try:
-    import zmq
-except ImportError:
-    zmq = None
+# ZeroMQ is only checked for, it is imported by the processes using it
+ZMQ_AVAILABLE = importlib.util.find_spec("zmq") is not None
 # Try to import each GUI type, and if it can be imported
 # it will be provided to the user as an option
 GUIS = ["none", "html"]
@@ -257,6 +258,42 @@ class CommParser(ParserBase):
         return args
 
 
+class StartupProfileParser(ParserBase):
+    """
+    A parser for the '--startup-profile' flag, which prints the time spent in each startup phase of the executable and
+    its slowest imports.
+    """
+
+    @staticmethod
+    def get_parser():
+        """
+        Creates a parser that reads the '--startup-profile' flag
+
+        :return: parser with the startup profile flag
+        """
+        parser = argparse.ArgumentParser(
+            description="Process arguments profiling the startup", add_help=False
+        )
+        parser.add_argument(
+            fprime_gds.executables.startup_profile.FLAG,
+            dest="startup_profile",
+            action="store_true",
+            default=False,
+            help="Print the time spent in each startup phase and the slowest imports",
+        )
+        return parser
+
+    @classmethod
+    def handle_arguments(cls, args, **kwargs):
+        """
+        Nothing to handle, the executables profile their startup when the flag is present
+
+        :param args: parsed argument namespace
+        :return: args namespace
+        """
+        return args
+
+
 class LogDeployParser(ParserBase):
     """
     A parser that handles log files by reading in a '--logs' directory or a '--deploy' directory to put the logs into
@@ -350,7 +387,7 @@ class MiddleWareParser(ParserBase):
             add_help=False,
         )
         # May use ZMQ transportation layer if zmq package is available
-        if zmq is not None:
+        if ZMQ_AVAILABLE:
             parser.add_argument(
                 "--zmq",
                 dest="zmq",
@@ -373,6 +410,13 @@ class MiddleWareParser(ParserBase):
                 default=["ipc:///tmp/fprime-server-in", "ipc:///tmp/fprime-server-out"],
                 metavar=("serverInUrl", "serverOutUrl")
             )
+            parser.add_argument(
+                "--zmq-batch",
+                dest="zmq_batch",
+                action="store_true",
+                help="Send packets over ZMQ as multipart messages carrying many packets. Must be set on both ends.",
+                default=False,
+            )
         parser.add_argument(
             "--tts-port",
             dest="tts_port",
@@ -401,7 +445,7 @@ class MiddleWareParser(ParserBase):
         :return: args namespace
         """
         # Check ZMQ settings
-        if args.zmq and zmq is None:
+        if args.zmq and not ZMQ_AVAILABLE:
             print("[ERROR] ZeroMQ is not available. Install pyzmq.", file=sys.stderr)
             sys.exit(-1)
         elif args.zmq:
@@ -490,6 +534,84 @@ class GdsParser(ParserBase):
             type=str,
             help="Set the GUI server address [default: %(default)s]",
         )
+        parser.add_argument(
+            "--decode-workers",
+            dest="decode_workers",
+            action="store",
+            default=0,
+            type=int,
+            help="Decode channels and events in this many worker processes, 0 decodes in the GUI process [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--decode-shard",
+            dest="decode_shard",
+            choices=["descriptor", "id"],
+            default="descriptor",
+            help="Shard messages to the decode workers by data descriptor or by channel/event id range [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--decode-id-range",
+            dest="decode_id_range",
+            action="store",
+            default=256,
+            type=int,
+            help="Number of consecutive channel/event ids decoded by the same worker with --decode-shard id [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--file-uplink-window",
+            dest="file_uplink_window",
+            action="store",
+            default=1,
+            type=int,
+            help="Number of file uplink packets sent ahead of their handshakes [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--file-uplink-chunk",
+            dest="file_uplink_chunk",
+            action="store",
+            default=256,
+            type=int,
+            help="Bytes of file data per file uplink packet, must fit the deployment's file buffers [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--log-mode",
+            dest="log_mode",
+            choices=["direct", "batched"],
+            default="direct",
+            help="Write the data logs as items arrive, or batched on a writer thread [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--log-flush-interval",
+            dest="log_flush_interval",
+            action="store",
+            default=0.5,
+            type=float,
+            help="Maximum seconds items wait before being written with --log-mode batched [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--log-flush-size",
+            dest="log_flush_size",
+            action="store",
+            default=65536,
+            type=int,
+            help="Pending characters and bytes written before the flush interval with --log-mode batched "
+            "[default: %(default)s]",
+        )
+        parser.add_argument(
+            "--log-queue-size",
+            dest="log_queue_size",
+            action="store",
+            default=100000,
+            type=int,
+            help="Items queued for writing with --log-mode batched, items beyond are dropped [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--record-downlink",
+            dest="record_downlink",
+            action="store_true",
+            default=False,
+            help="Record the downlink into an indexed recording (recv.rec) in the logging directory, for replay",
+        )
 
         return parser
 
@@ -507,6 +629,21 @@ class GdsParser(ParserBase):
         if args.dictionary is not None and not os.path.exists(args.dictionary):
             raise ValueError(f"Dictionary file {args.dictionary} does not exist")
 
+        if getattr(args, "decode_workers", 0) < 0:
+            raise ValueError("Number of decode workers must not be negative")
+        if getattr(args, "decode_workers", 0) > 0 and not fprime_gds.common.loaders.dictionary_cache.types_picklable():
+            raise ValueError("Decode workers are not supported by the installed fprime-tools version")
+        if getattr(args, "decode_id_range", 1) < 1:
+            raise ValueError("Decode id range must be positive")
+        if getattr(args, "file_uplink_window", 1) < 1:
+            raise ValueError("File uplink window must be positive")
+        if not 0 < getattr(args, "file_uplink_chunk", 1) <= 0xFFFF:
+            raise ValueError("File uplink chunk must be within 1 and 65535 bytes")
+        if getattr(args, "log_flush_interval", 1) <= 0:
+            raise ValueError("Log flush interval must be positive")
+        if getattr(args, "log_flush_size", 1) < 1 or getattr(args, "log_queue_size", 1) < 1:
+            raise ValueError("Log flush size and queue size must be positive")
+
         # Handle configuration arguments
         config = fprime_gds.common.utils.config_manager.ConfigManager()
         if args.config is not None:
@@ -583,3 +720,129 @@ class BinaryDeployment(ParserBase):
                 f"F prime artifacts root directory '{args.root_dir}' does not exist"
             )
         return args
+
+
+class ReplayParser(ParserBase):
+    """
+    Parsing subclass used to read the arguments of the recording replay. The replay target is selected here, while the
+    transport of the "ground" target is read by the MiddleWareParser.
+    """
+
+    @staticmethod
+    def get_parser():
+        """
+        Creates a parser to handle the arguments required to replay a downlink recording.
+
+        :return: parser for arguments
+        """
+        parser = argparse.ArgumentParser(
+            description="Process arguments needed to replay a downlink recording",
+            add_help=False,
+        )
+        parser.add_argument(
+            "recording",
+            type=str,
+            help="Path to the recording to replay, an indexed recording (recv.rec) or a raw recv.bin",
+        )
+        parser.add_argument(
+            "--target",
+            dest="target",
+            choices=["pipeline", "ground"],
+            default="pipeline",
+            help="Replay into a pipeline decoding in this process, or to a running GDS as the flight software "
+            "[default: %(default)s]",
+        )
+        parser.add_argument(
+            "--speed",
+            dest="speed",
+            type=float,
+            default=None,
+            help="Replay speed relative to the recording, 0 replays as fast as possible [default: 1 for an indexed "
+            "recording, 0 for a raw recv.bin which holds no receive times]",
+        )
+        parser.add_argument(
+            "--start",
+            dest="start",
+            type=float,
+            default=None,
+            help="Seconds into the recording at which to start replaying",
+        )
+        parser.add_argument(
+            "--end",
+            dest="end",
+            type=float,
+            default=None,
+            help="Seconds into the recording at which to stop replaying",
+        )
+        parser.add_argument(
+            "--batch-bytes",
+            dest="batch_bytes",
+            type=int,
+            default=65536,
+            help="Maximum bytes sent at once [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--dictionary",
+            dest="dictionary",
+            action="store",
+            default=None,
+            type=str,
+            help="Path to dictionary. Required by the pipeline target.",
+        )
+        parser.add_argument(
+            "--packet-spec",
+            dest="packet_spec",
+            action="store",
+            default=None,
+            type=str,
+            help="Path to packet specification.",
+        )
+        parser.add_argument(
+            "-c",
+            "--config",
+            dest="config",
+            action="store",
+            default=None,
+            type=str,
+            help="Configuration of the message field types.",
+        )
+        parser.add_argument(
+            "--json",
+            dest="json",
+            action="store",
+            default=None,
+            type=str,
+            help="Write the replay statistics as JSON to the given path",
+        )
+        parser.add_argument(
+            "--fail-on-drop",
+            dest="fail_on_drop",
+            action="store_true",
+            default=False,
+            help="Exit with a failure when any data was dropped",
+        )
+        return parser
+
+    @classmethod
+    def handle_arguments(cls, args, **kwargs):
+        """
+        Checks the recording and dictionary exist and loads the configuration.
+
+        :param args: parsed arguments in namespace
+        :return: args namespace
+        """
+        args = copy.copy(args)
+        if not os.path.isfile(args.recording):
+            raise ValueError(f"Recording {args.recording} does not exist")
+        if args.speed is not None and args.speed < 0:
+            raise ValueError("Replay speed must not be negative")
+        if args.target == "pipeline" and (args.dictionary is None or not os.path.isfile(args.dictionary)):
+            raise ValueError("Replaying into the pipeline requires an existing --dictionary")
+        config = fprime_gds.common.utils.config_manager.ConfigManager()
+        if args.config is not None:
+            if os.path.isfile(args.config):
+                config.set_configs(args.config)
+            else:
+                raise ValueError(f"Configuration file {args.config} not found")
+        args.config = config
+        return args
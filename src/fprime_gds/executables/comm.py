@@ -72,7 +72,7 @@ def main():
         print("[ERROR] ZeroMQ is not available. Install pyzmq.", file=sys.stderr)
         sys.exit(-1)
     elif args.zmq:
-        ground = fprime_gds.common.zmq_transport.ZmqGround(args.zmq_transport)
+        ground = fprime_gds.common.zmq_transport.ZmqGround(args.zmq_transport, args.zmq_batch)
         # Check for need to make this a server
         if args.zmq_server:
             ground.make_server()
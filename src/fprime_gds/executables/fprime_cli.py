@@ -14,15 +14,15 @@ import sys
 import platform
 from typing import Callable, List, Union
 
-import argcomplete
-
 # NOTE: These modules are now only lazily loaded below as needed, due to slow
 # performance when importing them
+# import argcomplete
 # import fprime_gds.common.gds_cli.channels as channels
 # import fprime_gds.common.gds_cli.command_send as command_send
 # import fprime_gds.common.gds_cli.events as events
 # from fprime_gds.common.pipeline.dictionaries import Dictionaries
-from fprime_gds.executables.cli import GdsParser
+# from fprime_gds.executables.cli import GdsParser
+from fprime_gds.executables.startup_profile import FLAG, StartupProfile
 from fprime_gds.executables.utils import get_artifacts_root, find_dict
 
 
@@ -120,6 +120,8 @@ def get_dictionary_path(current_args: argparse.Namespace) -> Union[str, None]:
     or the first one found in the current working directory. Raises an
     exception if neither one is found.
     """
+    from fprime_gds.executables.cli import GdsParser
+
     args = deepcopy(current_args)
     if not hasattr(args, "dictionary"):
         args.dictionary = None
@@ -265,6 +267,8 @@ class CommandSendParser(CliCommandParserBase):
         try:
             dict_path = get_dictionary_path(parsed_args)
         except ValueError:
+            import argcomplete
+
             argcomplete.warn("No dictionary found to get command names from")
             return []
 
@@ -364,6 +368,11 @@ def create_parser():
         description="provides utilities for interacting with the F' Ground Data System (GDS)"
     )
     parser.add_argument("-V", "--version", action="version", version="0.0.2")
+    parser.add_argument(
+        FLAG,
+        action="store_true",
+        help="print the time spent in each startup phase and the slowest imports",
+    )
 
     # Add subcommands to the parser
     subparsers = parser.add_subparsers(dest="func")
@@ -393,23 +402,34 @@ def parse_args(parser: argparse.ArgumentParser, arguments):
 
 
 def main():
+    profile = StartupProfile.from_arguments()
     # parse arguments, not including the name of this script
-    parser = create_parser()
-    argcomplete.autocomplete(parser)
-    args = parse_args(parser, sys.argv[1:])
+    with profile.phase("parse arguments"):
+        parser = create_parser()
+        # Only completing arguments needs argcomplete, signaled by its environment variable
+        if "_ARGCOMPLETE" in os.environ:
+            import argcomplete
+
+            argcomplete.autocomplete(parser)
+        args = parse_args(parser, sys.argv[1:])
 
     # call the selected function with the args provided
     function = args.func
     argument_dict = vars(args)
-    # Remove function and argument validation args
+    # Remove function, argument validation and profiling args
     del argument_dict["func"]
     del argument_dict["validate"]
+    del argument_dict["startup_profile"]
 
     if argument_dict["dictionary"] is None:
         root = get_artifacts_root() / platform.system()
         argument_dict["dictionary"] = find_dict(root)
 
-    function(**argument_dict)
+    try:
+        with profile.phase("run command"):
+            function(**argument_dict)
+    finally:
+        profile.report()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,450 @@
+"""
+replay.py:
+
+Replays a downlink recording through the ground system at a controlled rate. The recording is either an indexed
+recording (recv.rec written by RecordingLogger when fprime-gds runs with --record-downlink) or the raw recv.bin written
+by the data logger. Replayed messages are sent to one of two targets:
+
+1. pipeline: messages are handed to the Distributor.on_recv of a standard pipeline built in this process, exercising
+   the distributor, decoders and histories without any transport
+2. ground: messages are published over the TCP server or ZeroMQ transport acting as the flight software side, such
+   that a running GDS receives them as it would from the communications layer
+
+Messages are paced by their recorded ground receive times: a speed of 1 replays in real time, a speed of N replays N
+times faster and a speed of 0 replays as fast as possible. Indexed recordings replay in real time by default. recv.bin
+holds no receive times and is therefore only replayed as fast as possible, which is its default. Messages due at the
+same time are sent together, as they would have been read from the socket, in batches of up to `batch_bytes`.
+
+On completion the replay reports its throughput, the time spent in each stage and the data dropped along the way
+(decoding errors, messages without a decoder and truncated data at the end of the recording). Statistics may be written
+as JSON and `--fail-on-drop` sets a failing exit code when any data was dropped, such that recordings double as
+regression tests of the decoding path.
+"""
+import collections
+import json
+import sys
+import tempfile
+import time
+
+import fprime_gds.executables.cli
+from fprime_gds.common.decoders.decoder import DecodingException
+from fprime_gds.common.distributor.distributor import ZeroCopyDistributor
+from fprime_gds.common.logger.recording import FILE_HEADER, RECORDING_MAGIC, RecordingReader
+from fprime_gds.common.utils import config_manager
+from fprime_gds.common.utils.data_desc_type import DataDescType
+
+# Size of the reads of raw recv.bin recordings
+READ_SIZE = 65536
+
+
+class ReplayStatistics:
+    """
+    Statistics of a replay: counts of the messages and bytes sent, the time spent in each stage and the data dropped.
+    Stages nest: the time of "decode" is included in "send" and "consumers" is included in "decode".
+    """
+
+    STAGES = ["read", "pace", "send", "decode", "consumers"]
+
+    def __init__(self):
+        """Constructor zeroing the statistics"""
+        self.messages = 0
+        self.bytes = 0
+        self.batches = 0
+        self.items = 0
+        self.decode_errors = 0
+        self.undecoded = 0
+        self.truncated_bytes = 0
+        self.max_lag = 0.0
+        self.elapsed = 0.0
+        self.recorded_span = 0.0
+        self.descriptors = collections.Counter()
+        self.stages = {stage: 0.0 for stage in self.STAGES}
+
+    def add_time(self, stage, seconds):
+        """Add time spent in a stage"""
+        self.stages[stage] += seconds
+
+    @property
+    def dropped(self):
+        """Number of messages dropped, not counting truncated data"""
+        return self.decode_errors + self.undecoded
+
+    def to_dict(self):
+        """Statistics as a dictionary suitable for JSON output"""
+        elapsed = max(self.elapsed, 1e-9)
+        return {
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "batches": self.batches,
+            "items": self.items,
+            "elapsed": self.elapsed,
+            "messages_per_second": self.messages / elapsed,
+            "bytes_per_second": self.bytes / elapsed,
+            "achieved_speed": self.recorded_span / elapsed if self.recorded_span else None,
+            "max_lag": self.max_lag,
+            "dropped": {
+                "decode_errors": self.decode_errors,
+                "undecoded": self.undecoded,
+                "truncated_bytes": self.truncated_bytes,
+            },
+            "descriptors": dict(self.descriptors),
+            "stages": dict(self.stages),
+        }
+
+    def __str__(self):
+        """Human readable report of the statistics"""
+        stats = self.to_dict()
+        lines = [
+            f"Replayed {self.messages} messages ({self.bytes} bytes) in {self.batches} batches "
+            f"over {self.elapsed:.3f}s",
+            f"  Throughput: {stats['messages_per_second']:.1f} messages/s, {stats['bytes_per_second']:.1f} bytes/s",
+        ]
+        if stats["achieved_speed"] is not None:
+            lines.append(f"  Achieved speed: {stats['achieved_speed']:.2f}x, max lag {self.max_lag * 1000:.1f}ms")
+        if self.items:
+            lines.append(f"  Decoded items: {self.items}")
+        lines.append(
+            f"  Dropped: {self.decode_errors} decode errors, {self.undecoded} undecoded messages, "
+            f"{self.truncated_bytes} truncated bytes"
+        )
+        lines.append("  Messages by descriptor:")
+        lines.extend(f"    {name}: {count}" for name, count in sorted(self.descriptors.items()))
+        lines.append("  Stage times:")
+        for depth, stage in zip([0, 0, 0, 1, 2], self.STAGES):
+            lines.append(f"    {'  ' * depth}{stage}: {self.stages[stage]:.3f}s")
+        return "\n".join(lines)
+
+
+def descriptor_name(descriptor):
+    """Name of a descriptor value, or the value as text when unknown"""
+    try:
+        return DataDescType(descriptor).name
+    except ValueError:
+        return str(descriptor)
+
+
+def is_indexed_recording(path):
+    """Check if the file at path is an indexed recording rather than a raw recv.bin"""
+    with open(path, "rb") as file_handle:
+        header = file_handle.read(FILE_HEADER.size)
+    return len(header) == FILE_HEADER.size and FILE_HEADER.unpack(header)[0] == RECORDING_MAGIC
+
+
+def read_indexed(path, start=None, end=None):
+    """
+    Generate the messages of an indexed recording
+
+    :param path: path to the recording
+    :param start: seconds after the first record at which to start. Defaults to the first record.
+    :param end: seconds after the first record at which to stop. Defaults to the last record.
+    :return: generator of (ground time, descriptor, raw message) tuples
+    """
+    with RecordingReader(path) as reader:
+        if len(reader) == 0:
+            return
+        first = next(reader.records()).time
+        start_time = first + (start or 0.0)
+        end_time = first + end if end is not None else None
+        for record in reader.records_between(start_time, end_time):
+            yield record.time, record.descriptor, bytes(record.data)
+
+
+def read_raw(path, config=None, statistics=None):
+    """
+    Generate the messages of a raw recv.bin recording. Raw recordings hold no receive times.
+
+    :param path: path to the recording
+    :param config: config manager with the types of the message fields. Defaults to the config singleton.
+    :param statistics: statistics counting the truncated bytes at the end of the recording
+    :return: generator of (None, descriptor, raw message) tuples
+    """
+    if config is None:
+        config = config_manager.ConfigManager().get_instance()
+    parser = ZeroCopyDistributor(config)
+    header_size = config.get_type("msg_len").getSize() + config.get_type("msg_desc").getSize()
+    buffer = bytearray()
+    with open(path, "rb") as file_handle:
+        for data in iter(lambda: file_handle.read(READ_SIZE), b""):
+            buffer.extend(data)
+            cursor, frames = parser.parse_frames(buffer, 0)
+            for desc, start, end in frames:
+                yield None, desc, bytes(buffer[start - header_size : end])
+            del buffer[:cursor]
+    if statistics is not None:
+        statistics.truncated_bytes += len(buffer)
+
+
+class DistributorSink:
+    """
+    Replay target handing messages to a distributor. The supplied decoders are instrumented to time the decode and
+    consumer stages and count decoding errors.
+    """
+
+    def __init__(self, distributor, decoders, statistics):
+        """
+        Constructor instrumenting the decoders
+
+        :param distributor: distributor receiving the replayed data (e.g. the distributor of a standard pipeline)
+        :param decoders: dictionary of descriptor name to decoder registered with the distributor
+        :param statistics: statistics updated by the sink
+        """
+        self.distributor = distributor
+        self.statistics = statistics
+        self.decodable = set()
+        for name, decoder in decoders.items():
+            if decoder is not None:
+                self.decodable.add(DataDescType[name].value)
+                self.instrument(decoder)
+
+    def instrument(self, decoder):
+        """Wrap the data_callback and send_to_all of a decoder instance to time its stages"""
+        statistics = self.statistics
+        data_callback = decoder.data_callback
+        send_to_all = decoder.send_to_all
+
+        def timed_data_callback(data, sender=None):
+            start = time.perf_counter()
+            try:
+                return data_callback(data, sender)
+            except DecodingException:
+                statistics.decode_errors += 1
+                raise
+            finally:
+                statistics.add_time("decode", time.perf_counter() - start)
+
+        def timed_send_to_all(data, sender=None):
+            start = time.perf_counter()
+            try:
+                return send_to_all(data, sender)
+            finally:
+                statistics.items += 1
+                statistics.add_time("consumers", time.perf_counter() - start)
+
+        decoder.data_callback = timed_data_callback
+        decoder.send_to_all = timed_send_to_all
+
+    def send(self, messages):
+        """
+        Send a batch of messages to the distributor as one read from the transport
+
+        :param messages: list of (descriptor, raw message) tuples
+        """
+        self.statistics.undecoded += sum(1 for desc, _ in messages if desc not in self.decodable)
+        self.distributor.on_recv(b"".join(message for _, message in messages))
+
+    def close(self):
+        """Nothing to close"""
+
+
+class PipelineSink(DistributorSink):
+    """Replay target handing messages to the distributor of a standard pipeline that has been setup but not connected"""
+
+    def __init__(self, pipeline, statistics):
+        """
+        Constructor instrumenting the decoders of the pipeline
+
+        :param pipeline: standard pipeline after setup
+        :param statistics: statistics updated by the sink
+        """
+        decoders = {
+            "FW_PACKET_LOG": pipeline.coders.event_decoder,
+            "FW_PACKET_TELEM": pipeline.coders.channel_decoder,
+            "FW_PACKET_FILE": pipeline.coders.file_decoder,
+            "FW_PACKET_PACKETIZED_TLM": pipeline.coders.packet_decoder,
+        }
+        super().__init__(pipeline.distributor, decoders, statistics)
+        self.pipeline = pipeline
+
+    def close(self):
+        """Stop the pipeline"""
+        self.pipeline.disconnect()
+
+
+class GroundSink:
+    """
+    Replay target publishing messages over a ground handler (TCPGround or ZmqGround) as the flight software side. The
+    ground handlers add the length of each packet, so it is removed from the recorded messages.
+    """
+
+    def __init__(self, ground, config=None):
+        """
+        Constructor
+
+        :param ground: opened ground handler
+        :param config: config manager with the types of the message fields. Defaults to the config singleton.
+        """
+        if config is None:
+            config = config_manager.ConfigManager().get_instance()
+        self.ground = ground
+        self.length_size = config.get_type("msg_len").getSize()
+
+    def send(self, messages):
+        """
+        Send a batch of messages to the ground system
+
+        :param messages: list of (descriptor, raw message) tuples
+        """
+        self.ground.send_all([message[self.length_size :] for _, message in messages])
+
+    def close(self):
+        """Close the ground handler"""
+        self.ground.close()
+
+
+class Replayer:
+    """
+    Paces recorded messages to a replay target. Messages due at the same time are sent as one batch of at most
+    batch_bytes bytes.
+    """
+
+    def __init__(self, sink, statistics, speed=1.0, batch_bytes=65536, clock=time.monotonic, sleep=time.sleep):
+        """
+        Constructor
+
+        :param sink: replay target with a send(messages) method
+        :param statistics: statistics updated by the replay
+        :param speed: replay speed relative to real time, 0 replays as fast as possible
+        :param batch_bytes: maximum number of bytes sent in one batch
+        :param clock: monotonic clock in seconds
+        :param sleep: function sleeping for the given number of seconds
+        """
+        self.sink = sink
+        self.statistics = statistics
+        self.speed = speed
+        self.batch_bytes = batch_bytes
+        self.clock = clock
+        self.sleep = sleep
+
+    def __flush(self, batch, batch_size):
+        """Send a batch of messages to the sink"""
+        if not batch:
+            return
+        start = time.perf_counter()
+        self.sink.send(batch)
+        self.statistics.add_time("send", time.perf_counter() - start)
+        self.statistics.batches += 1
+        self.statistics.messages += len(batch)
+        self.statistics.bytes += batch_size
+
+    def run(self, source):
+        """
+        Replay the messages of a source
+
+        :param source: iterable of (ground time, descriptor, raw message) tuples, ground time may be None
+        :return: statistics of the replay
+        """
+        statistics = self.statistics
+        batch = []
+        batch_size = 0
+        first_time = None
+        last_time = None
+        wall_start = self.clock()
+        iterator = iter(source)
+        while True:
+            start = time.perf_counter()
+            entry = next(iterator, None)
+            statistics.add_time("read", time.perf_counter() - start)
+            if entry is None:
+                break
+            record_time, desc, message = entry
+            if record_time is not None:
+                first_time = record_time if first_time is None else first_time
+                last_time = record_time
+            if self.speed > 0 and record_time is not None:
+                due = wall_start + (record_time - first_time) / self.speed
+                now = self.clock()
+                if due > now:
+                    # Send everything due before waiting for this message
+                    self.__flush(batch, batch_size)
+                    batch, batch_size = [], 0
+                    start = time.perf_counter()
+                    self.sleep(max(due - self.clock(), 0.0))
+                    statistics.add_time("pace", time.perf_counter() - start)
+                else:
+                    statistics.max_lag = max(statistics.max_lag, now - due)
+            statistics.descriptors[descriptor_name(desc)] += 1
+            batch.append((desc, message))
+            batch_size += len(message)
+            if batch_size >= self.batch_bytes:
+                self.__flush(batch, batch_size)
+                batch, batch_size = [], 0
+        self.__flush(batch, batch_size)
+        statistics.elapsed = self.clock() - wall_start
+        if first_time is not None:
+            statistics.recorded_span = last_time - first_time
+        return statistics
+
+
+def build_pipeline_sink(args, statistics, down_store):
+    """Build a standard pipeline from the arguments and a sink feeding its distributor"""
+    # Imported here as the pipeline is not needed when replaying to the ground
+    from fprime_gds.common.pipeline.standard import StandardPipeline
+
+    pipeline = StandardPipeline()
+    pipeline.setup(args.config, args.dictionary, down_store, packet_spec=args.packet_spec)
+    return PipelineSink(pipeline, statistics)
+
+
+def build_ground_sink(args):
+    """Build a sink publishing over the transport selected by the middleware arguments"""
+    if getattr(args, "zmq", False):
+        from fprime_gds.common.zmq_transport import ZmqGround
+
+        ground = ZmqGround(args.zmq_transport, args.zmq_batch)
+    else:
+        from fprime_gds.common.communication.ground import TCPGround
+
+        ground = TCPGround(args.tts_addr, args.tts_port)
+    if not ground.open():
+        print("[ERROR] Failed to connect to the ground system", file=sys.stderr)
+        sys.exit(-1)
+    return GroundSink(ground, args.config)
+
+
+def main():
+    """
+    Main program, replays the recording and reports the statistics
+
+    :return: return code
+    """
+    args, _ = fprime_gds.executables.cli.ParserBase.parse_args(
+        [fprime_gds.executables.cli.ReplayParser, fprime_gds.executables.cli.MiddleWareParser],
+        description="F prime downlink recording replay.",
+        client=True,
+    )
+    statistics = ReplayStatistics()
+    if is_indexed_recording(args.recording):
+        speed = 1.0 if args.speed is None else args.speed
+        source = read_indexed(args.recording, args.start, args.end)
+    elif args.start is not None or args.end is not None or args.speed not in (None, 0):
+        print(
+            "[ERROR] Raw recordings hold no receive times, replay them without --speed, --start or --end",
+            file=sys.stderr,
+        )
+        return -1
+    else:
+        speed = 0
+        source = read_raw(args.recording, args.config, statistics)
+
+    with tempfile.TemporaryDirectory() as down_store:
+        if args.target == "pipeline":
+            sink = build_pipeline_sink(args, statistics, down_store)
+        else:
+            sink = build_ground_sink(args)
+        try:
+            Replayer(sink, statistics, speed, args.batch_bytes).run(source)
+        except KeyboardInterrupt:
+            print("[INFO] Replay interrupted")
+        finally:
+            sink.close()
+    print(statistics)
+    if args.json is not None:
+        with open(args.json, "w") as file_handle:
+            json.dump(statistics.to_dict(), file_handle, indent=2)
+    if args.fail_on_drop and (statistics.dropped or statistics.truncated_bytes):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,11 +6,11 @@
 import os
 import platform
 import sys
-import webbrowser
 from pathlib import Path
 
 import fprime_gds.executables.cli
 import fprime_gds.executables.utils
+from fprime_gds.executables.startup_profile import StartupProfile
 
 
 def get_settings():
@@ -49,6 +49,7 @@ def parse_args():
         fprime_gds.executables.cli.MiddleWareParser,
         fprime_gds.executables.cli.BinaryDeployment,
         fprime_gds.executables.cli.CommParser,
+        fprime_gds.executables.cli.StartupProfileParser,
     ]
     # Parse the arguments, and refine through all handlers
     try:
@@ -192,6 +193,16 @@ def launch_html(
             "FLASK_APP": "fprime_gds.flask.app",
             "LOG_DIR": logs,
             "SERVE_LOGS": "YES",
+            "DECODE_WORKERS": str(extras.get("decode_workers", 0)),
+            "DECODE_SHARD": extras.get("decode_shard", "descriptor"),
+            "DECODE_ID_RANGE": str(extras.get("decode_id_range", 256)),
+            "FILE_UPLINK_WINDOW": str(extras.get("file_uplink_window", 1)),
+            "FILE_UPLINK_CHUNK": str(extras.get("file_uplink_chunk", 256)),
+            "LOG_MODE": extras.get("log_mode", "direct"),
+            "LOG_FLUSH_INTERVAL": str(extras.get("log_flush_interval", 0.5)),
+            "LOG_FLUSH_SIZE": str(extras.get("log_flush_size", 65536)),
+            "LOG_QUEUE_SIZE": str(extras.get("log_queue_size", 100000)),
+            "RECORD_DOWNLINK": "YES" if extras.get("record_downlink", False) else "NO",
         }
     )
     if tts_port is not None:
@@ -202,7 +213,12 @@ def launch_html(
             }
         )
     else:
-        gse_env.update({"ZMQ_TRANSPORT": "|".join(connect_address)})
+        gse_env.update(
+            {
+                "ZMQ_TRANSPORT": "|".join(connect_address),
+                "ZMQ_BATCH": "YES" if extras.get("zmq_batch", False) else "NO",
+            }
+        )
 
     gse_args = [
         sys.executable,
@@ -217,6 +233,8 @@ def launch_html(
     ]
     ret = launch_process(gse_args, name="HTML GUI", env=gse_env, launch_time=2)
     if extras["gui"] == "html":
+        import webbrowser
+
         webbrowser.open(
             f"http://{str(gui_addr)}:{str(gui_port)}/", new=0, autoraise=True
         )
@@ -249,6 +267,8 @@ def launch_comm(comm_adapter, tts_port, connect_address, logs, **all_args):
     transport_args = ["--tts-addr", connect_address, "--tts-port", str(tts_port)]
     if tts_port is None:
         transport_args = ["--zmq", "--zmq-transport", connect_address[0], connect_address[1], "--zmq-server"]
+        if all_args.get("zmq_batch", False):
+            transport_args.append("--zmq-batch")
     app_cmd = [
         sys.executable,
         "-u",
@@ -277,7 +297,9 @@ def main():
     """
     Main function used to launch processes.
     """
-    settings = vars(get_settings())
+    profile = StartupProfile.from_arguments()
+    with profile.phase("parse arguments"):
+        settings = vars(get_settings())
     launchers = []
     # Launch a gui, if specified
     if settings["zmq"]:
@@ -309,7 +331,11 @@ def main():
         raise Exception(f'Invalid GUI specified: {settings["gui"]}')
     # Launch launchers and wait for the last app to finish
     try:
-        procs = [launcher(**settings) for launcher in launchers]
+        procs = []
+        for launcher in launchers:
+            with profile.phase(launcher.__name__.replace("_", " ")):
+                procs.append(launcher(**settings))
+        profile.report()
         print("[INFO] F prime is now running. CTRL-C to shutdown all components.")
         procs[-1].wait()
     except KeyboardInterrupt:
@@ -0,0 +1,149 @@
+"""
+startup_profile.py:
+
+Profiles the startup of the fprime-gds and fprime-cli executables when run with --startup-profile. The executables time
+their startup phases, e.g. parsing arguments or loading a subcommand, and a meta path finder times every module imported
+while the profile runs. The breakdown of the phases and the slowest imports is printed to standard error once started.
+"""
+import contextlib
+import importlib.abc
+import sys
+import time
+
+FLAG = "--startup-profile"
+
+
+class TimedLoader(importlib.abc.Loader):
+    """Loader wrapping the loader of a module to time its import"""
+
+    def __init__(self, loader, profile):
+        """Wrap the loader reporting to the profile"""
+        self.loader = loader
+        self.profile = profile
+
+    def create_module(self, spec):
+        """Create the module, which is where extension modules are initialized"""
+        return self.profile.time_import(spec.name, self.loader.create_module, spec)
+
+    def exec_module(self, module):
+        """Execute the module, i.e. run its top level code including its own imports"""
+        self.profile.time_import(module.__name__, self.loader.exec_module, module)
+
+    def __getattr__(self, name):
+        """Delegate other loader functions, e.g. reading resources, to the wrapped loader"""
+        return getattr(self.loader, name)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """Finder delegating to the other finders, wrapping the loaders of the modules found to time their import"""
+
+    def __init__(self, profile):
+        """Construct the finder reporting to the profile"""
+        self.profile = profile
+
+    def find_spec(self, fullname, path, target=None):
+        """Find the module spec with the other finders, wrapping its loader"""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = TimedLoader(spec.loader, self.profile)
+                return spec
+        return None
+
+
+class StartupProfile:
+    """
+    Times the startup phases of an executable, and its imports when enabled. Phases are always timed as it is cheap,
+    and only reported when enabled, such that executables need not check whether the profile is enabled.
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Construct the profile, timing imports from now on when enabled
+
+        :param enabled: time imports and report the profile
+        """
+        self.enabled = enabled
+        self.before = time.process_time()
+        self.start = time.perf_counter()
+        self.phases = []
+        self.imports = {}
+        self.__stack = []
+        self.__timer = None
+        if enabled:
+            self.__timer = ImportTimer(self)
+            sys.meta_path.insert(0, self.__timer)
+
+    @classmethod
+    def from_arguments(cls, arguments=None):
+        """
+        Profile enabled by the --startup-profile flag in the arguments
+
+        :param arguments: command line arguments. Default: sys.argv
+        :return: startup profile
+        """
+        return cls(FLAG in (sys.argv if arguments is None else arguments))
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Time a phase of the startup
+
+        :param name: name of the phase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def time_import(self, name, function, *args):
+        """
+        Time importing a module, the time of nested imports being accounted to the importing module as well
+
+        :param name: name of the module
+        :param function: import step to time
+        :param args: arguments of the import step
+        :return: return of the import step
+        """
+        self.__stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self.__stack.pop()
+            if self.__stack:
+                self.__stack[-1] += elapsed
+            cumulative, own = self.imports.get(name, (0.0, 0.0))
+            self.imports[name] = (cumulative + elapsed, own + elapsed - nested)
+
+    def stop(self):
+        """Stop timing imports"""
+        if self.__timer is not None and self.__timer in sys.meta_path:
+            sys.meta_path.remove(self.__timer)
+        self.__timer = None
+
+    def report(self, limit=15, file=None):
+        """
+        Print the profile when enabled, stopping the import timing
+
+        :param limit: number of the slowest imports printed
+        :param file: file printed to. Default: standard error
+        """
+        if not self.enabled:
+            return
+        self.stop()
+        file = sys.stderr if file is None else file
+        print("[INFO] Startup profile (seconds):", file=file)
+        print(f"    {'before main (CPU time)':<48} {self.before:8.3f}", file=file)
+        for name, elapsed in self.phases:
+            print(f"    {name:<48} {elapsed:8.3f}", file=file)
+        print(f"    {'total since main':<48} {time.perf_counter() - self.start:8.3f}", file=file)
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        print(f"[INFO] Slowest of {len(self.imports)} imports (cumulative, self seconds):", file=file)
+        for name, (cumulative, own) in slowest:
+            print(f"    {name:<48} {cumulative:8.3f} {own:8.3f}", file=file)
@@ -11,6 +11,7 @@ import time
 from optparse import OptionParser
 
 from fprime.constants import DATA_ENCODING
+from fprime_gds.common.middleware import OVERFLOW_POLICIES, MiddlewareServer
 
 try:
     import socketserver
@@ -465,6 +466,24 @@ class DestObj:
         return self.socket
 
 
+def serve_event_loop(host, port, max_bytes=0, max_messages=0, policy="drop-oldest"):
+    """
+    Run the event loop middleware server until Ctrl-C or a Quit command
+    """
+    server = MiddlewareServer((host, port), max_bytes=max_bytes, max_messages=max_messages, policy=policy)
+
+    def stop(*_):
+        print("Ctrl-C received, server shutting down.")
+        server.shutdown()
+
+    signal.signal(signal.SIGINT, stop)
+    print(f"TCP Socket Server listening on host addr {host}, port {port}")
+    server.serve_forever()
+    print("shutdown from main thread")
+    server.server_close()
+    return 0
+
+
 def main(argv=None):
     global SERVER, LOCK
 
@@ -505,12 +524,47 @@ def main(argv=None):
             help="Set threaded tcp socket server ip [default: %default]",
             default="127.0.0.1",
         )
+        parser.add_option(
+            "--threaded",
+            dest="threaded",
+            action="store_true",
+            help="Serve each client on its own thread instead of the single threaded event loop server",
+            default=False,
+        )
+        parser.add_option(
+            "--max-queue-bytes",
+            dest="max_queue_bytes",
+            action="store",
+            type="int",
+            help="Maximum bytes queued for a client before overflowing, 0 for no limit [default: %default]",
+            default=64 * 1024 * 1024,
+        )
+        parser.add_option(
+            "--max-queue-messages",
+            dest="max_queue_messages",
+            action="store",
+            type="int",
+            help="Maximum messages queued for a client before overflowing, 0 for no limit [default: %default]",
+            default=0,
+        )
+        parser.add_option(
+            "--overflow-policy",
+            dest="overflow_policy",
+            action="store",
+            type="choice",
+            choices=OVERFLOW_POLICIES,
+            help=f"Handling of clients overflowing their queue, one of {', '.join(OVERFLOW_POLICIES)}. Dropped messages "
+            "are reported on the console. [default: %default]",
+            default="drop-oldest",
+        )
 
         # process options
         (opts, args) = parser.parse_args(argv)
 
         HOST = opts.host
         PORT = opts.port
+        if not opts.threaded:
+            return serve_event_loop(HOST, PORT, opts.max_queue_bytes, opts.max_queue_messages, opts.overflow_policy)
         server = ThreadedTCPServer((HOST, PORT), ThreadedTCPRequestHandler)
         udp_server = ThreadedUDPServer((HOST, PORT), ThreadedUDPRequestHandler)
         # Hopefully this will allow address reuse and server to restart immediately
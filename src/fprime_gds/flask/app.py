@@ -29,6 +29,7 @@ import fprime_gds.flask.logs
 import fprime_gds.flask.updown
 import fprime_gds.flask.sequence
 import fprime_gds.flask.stats
+import fprime_gds.flask.stream
 import fprime_gds.flask.errors
 
 from . import components
@@ -79,9 +80,30 @@ def construct_app():
         app.config["ADDRESS"],
         app.config["PORT"],
         app.config["ZMQ_TRANSPORT"],
-        app.config["PACKET_SPEC"]
+        app.config["PACKET_SPEC"],
+        app.config["DECODE_WORKERS"],
+        app.config["DECODE_SHARD"],
+        app.config["DECODE_ID_RANGE"],
+        app.config["ZMQ_BATCH"],
+        app.config["FILE_UPLINK_WINDOW"],
+        app.config["FILE_UPLINK_CHUNK"],
+        app.config["RECORD_DOWNLINK"],
+        app.config["LOG_MODE"],
+        app.config["LOG_FLUSH_INTERVAL"],
+        app.config["LOG_FLUSH_SIZE"],
+        app.config["LOG_QUEUE_SIZE"],
     )
 
+    # Streams pushed to subscribers of the streaming endpoint, fed alongside the histories
+    stream_hub = fprime_gds.flask.stream.StreamHub(app.config["STREAM_CAPACITY"])
+    pipeline.coders.register_event_consumer(
+        stream_hub.add_stream("events", fprime_gds.flask.events.process_event)
+    )
+    pipeline.coders.register_channel_consumer(
+        stream_hub.add_stream("channels", fprime_gds.flask.channels.process_channel)
+    )
+    pipeline.coders.register_command_consumer(stream_hub.add_stream("commands"))
+
     # Restful API registration
     api = fprime_gds.flask.errors.setup_error_handling(app)
     # File upload configuration, 1 set for everything
@@ -124,6 +146,16 @@ def construct_app():
         "/channels",
         resource_class_args=[pipeline.histories.channels],
     )
+    api.add_resource(
+        fprime_gds.flask.channels.ChannelLatest,
+        "/channels/latest",
+        resource_class_args=[pipeline.histories.latest_channels],
+    )
+    api.add_resource(
+        fprime_gds.flask.stream.HistoryStream,
+        "/stream",
+        resource_class_args=[stream_hub],
+    )
     api.add_resource(
         fprime_gds.flask.updown.Destination,
         "/upload/destination",
@@ -8,10 +8,19 @@
 #      Input Data: {
 #                      "start-time": "YYYY-MM-DDTHH:MM:SS.sss" #Start time for event listing
 #                  }
+#
+#  GET /channels/latest: list the latest value of channels updated since a counter
+#      Input Data: {
+#                      "since": 1234 #Counter returned by the previous request, omit for all channels
+#                  }
 ####
 import copy
+
+import flask_restful
+from flask_restful.reqparse import RequestParser
 from fprime.common.models.serialize.serializable_type import SerializableType
 from fprime.common.models.serialize.array_type import ArrayType
+from fprime_gds.flask.errors import build_error_object
 from fprime_gds.flask.resource import DictionaryResource, HistoryResourceBase
 
 
@@ -19,6 +28,21 @@ class ChannelDictionary(DictionaryResource):
     """Channel dictionary shares implementation"""
 
 
+def process_channel(chan):
+    """Process the channel and return a copy with display_text when needed"""
+    chan = copy.copy(chan)
+    # Setup display_text and when needed
+    if isinstance(chan.val_obj, (SerializableType, ArrayType)):
+        setattr(chan, "display_text", chan.val_obj.formatted_val)
+    elif chan.template.get_format_str() is not None:
+        setattr(
+            chan,
+            "display_text",
+            chan.template.get_format_str() % (chan.val_obj.val),
+        )
+    return chan
+
+
 class ChannelHistory(HistoryResourceBase):
     """
     Resource supplying the history of channels in the system. Includes `get_display_text` postprocessing to add in the
@@ -27,14 +51,37 @@ class ChannelHistory(HistoryResourceBase):
 
     def process(self, chan):
         """Process the channel to add get_display_text"""
-        chan = copy.copy(chan)
-        # Setup display_text and when needed
-        if isinstance(chan.val_obj, (SerializableType, ArrayType)):
-            setattr(chan, "display_text", chan.val_obj.formatted_val)
-        elif chan.template.get_format_str() is not None:
-            setattr(
-                chan,
-                "display_text",
-                chan.template.get_format_str() % (chan.val_obj.val),
-            )
-        return chan
+        return process_channel(chan)
+
+
+class ChannelLatest(flask_restful.Resource):
+    """
+    Resource supplying the latest value of each channel. Clients supply the counter returned by their previous request
+    and receive only the channels updated since, such that the response scales with the number of changed channels
+    rather than the number of samples received.
+    """
+
+    def __init__(self, index):
+        """Constructor
+
+        Args:
+            index: latest value index of the channels
+        """
+        self.parser = RequestParser()
+        self.parser.add_argument(
+            "since", required=False, type=int, help="Counter of the previous request", location="args"
+        )
+        self.index = index
+
+    def get(self):
+        """HTTP GET handler returning the latest values of changed channels"""
+        errors = []
+        returned_items = []
+        args = self.parser.parse_args()
+        counter, changed = self.index.retrieve(args.get("since"))
+        for chan in changed:
+            try:
+                returned_items.append(process_channel(chan))
+            except Exception as exc:
+                errors.append(build_error_object(exc))
+        return {"history": returned_items, "counter": counter, "errors": errors}
@@ -4,12 +4,15 @@ flask/components.py:
 This sets up the primary data components that allow Flask to connect into the system. This is where the standard
 pipeline and other components are created to interact with Flask.
 """
+import functools
 import os
 import sys
 from pathlib import Path
 
 import fprime_gds.common.pipeline.standard
+from fprime_gds.common.distributor.distributor import ShardedDistributor
 from fprime_gds.common.history.ram import SelfCleaningRamHistory
+from fprime_gds.common.logger.data_logger import BatchedDataLogger
 
 try:
     from fprime_gds.common.zmq_transport import ZmqClient
@@ -88,7 +91,18 @@ def setup_pipelined_components(
     tts_address,
     tts_port,
     zmq_transport,
-    packet_spec: Path
+    packet_spec: Path,
+    decode_workers=0,
+    decode_shard="descriptor",
+    decode_id_range=256,
+    zmq_batch=False,
+    file_uplink_window=1,
+    file_uplink_chunk=256,
+    record_downlink=False,
+    log_mode="direct",
+    log_flush_interval=0.5,
+    log_flush_size=65536,
+    log_queue_size=100000,
 ):
     """
     Setup the standard pipeline and related components. This is done once, and then the resulting singletons are
@@ -104,6 +118,17 @@ def setup_pipelined_components(
     :param tts_port: port of the middleware layer
     :param zmq_transport: set to zmq transport if using ZMQ or None to use TTS
     :param packet_spec: path to packet specification XML
+    :param decode_workers: number of processes decoding channels and events, 0 decodes in this process
+    :param decode_shard: sharding of messages to the decode workers, "descriptor" or "id"
+    :param decode_id_range: number of consecutive ids decoded by the same worker when sharding by id
+    :param zmq_batch: use the batched ZeroMQ mode, see fprime_gds.common.zmq_transport
+    :param file_uplink_window: number of file uplink packets sent ahead of their handshakes
+    :param file_uplink_chunk: bytes of file data per file uplink packet
+    :param record_downlink: record the downlink into an indexed recording in the log directory
+    :param log_mode: "direct" writes the data logs as items arrive, "batched" on a writer thread
+    :param log_flush_interval: maximum seconds items wait before being written in batched mode
+    :param log_flush_size: pending characters and bytes written before the flush interval in batched mode
+    :param log_queue_size: maximum items queued for writing in batched mode
     :return: F prime pipeline
     """
     global __PIPELINE
@@ -123,9 +148,23 @@ def setup_pipelined_components(
         pipeline = fprime_gds.common.pipeline.standard.StandardPipeline()
         pipeline.histories.implementation = FlaskEndpointRamHistory
         pipeline.transport_implementation = (
-            ZmqClient if zmq_transport is not None else ThreadedTCPSocketClient
+            functools.partial(ZmqClient, batched=zmq_batch) if zmq_transport is not None else ThreadedTCPSocketClient
         )
+        if decode_workers > 0:
+            pipeline.distributor_implementation = functools.partial(
+                ShardedDistributor, workers=decode_workers, shard=decode_shard, id_range=decode_id_range
+            )
+        if log_mode == "batched":
+            pipeline.logger_implementation = functools.partial(
+                BatchedDataLogger,
+                flush_interval=log_flush_interval,
+                flush_size=log_flush_size,
+                queue_size=log_queue_size,
+            )
+        pipeline.record_downlink = record_downlink
         pipeline.setup(config, dictionary, down_store, logging_prefix=log_dir, packet_spec=packet_spec)
+        pipeline.files.uplinker.window = file_uplink_window
+        pipeline.files.uplinker.chunk = file_uplink_chunk
 
         logger.info(
             f"Connecting to GDS at: { connection_uri } from pid: { os.getpid() }"
@@ -28,6 +28,7 @@ else:
 
 ZMQ_TRANSPORT = os.environ.get("ZMQ_TRANSPORT", None)
 ZMQ_TRANSPORT = None if ZMQ_TRANSPORT is None else ZMQ_TRANSPORT.split("|")
+ZMQ_BATCH = os.environ.get("ZMQ_BATCH", "NO") == "YES"
 PORT = int(os.environ.get("TTS_PORT", "50050"), 0)
 ADDRESS = os.environ.get("TTS_ADDR", "127.0.0.1")
 
@@ -37,6 +38,21 @@ UPLOADED_UPLINK_DEST = uplink_dir
 UPLOADS_DEFAULT_DEST = uplink_dir
 REMOTE_SEQ_DIRECTORY = "/seq"
 MAX_CONTENT_LENGTH = 32 * 1024 * 1024  # Max length of request is 32MiB
+STREAM_CAPACITY = int(os.environ.get("STREAM_CAPACITY", "10000"))  # Items retained per stream for /stream clients
+# Decoding in worker processes, see fprime_gds.common.distributor.distributor.ShardedDistributor
+DECODE_WORKERS = int(os.environ.get("DECODE_WORKERS", "0"))
+DECODE_SHARD = os.environ.get("DECODE_SHARD", "descriptor")
+DECODE_ID_RANGE = int(os.environ.get("DECODE_ID_RANGE", "256"))
+# Windowed file uplink, see fprime_gds.common.files.uplinker.FileUplinker
+FILE_UPLINK_WINDOW = int(os.environ.get("FILE_UPLINK_WINDOW", "1"))
+FILE_UPLINK_CHUNK = int(os.environ.get("FILE_UPLINK_CHUNK", "256"))
+# Batched data logging, see fprime_gds.common.logger.data_logger.BatchedDataLogger
+LOG_MODE = os.environ.get("LOG_MODE", "direct")
+LOG_FLUSH_INTERVAL = float(os.environ.get("LOG_FLUSH_INTERVAL", "0.5"))
+LOG_FLUSH_SIZE = int(os.environ.get("LOG_FLUSH_SIZE", "65536"))
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "100000"))
+# Indexed recording of the downlink, see fprime_gds.common.logger.recording.RecordingLogger
+RECORD_DOWNLINK = os.environ.get("RECORD_DOWNLINK", "NO") == "YES"
 
 # Gds config setup
 GDS_CONFIG = fprime_gds.common.utils.config_manager.ConfigManager()
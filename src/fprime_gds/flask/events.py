@@ -19,6 +19,19 @@ class EventDictionary(DictionaryResource):
     """Channel dictionary shares implementation"""
 
 
+def process_event(event):
+    """Process event and return a copy with display_text"""
+    event = copy.copy(event)
+    setattr(
+        event,
+        "display_text",
+        format_string_template(
+            event.template.format_str, tuple([arg.val for arg in event.args])
+        ),
+    )
+    return event
+
+
 class EventHistory(HistoryResourceBase):
     """
     Resource supplying the history of events in the system. Includes `get_display_text` postprocessing to add in the
@@ -27,12 +40,4 @@ class EventHistory(HistoryResourceBase):
 
     def process(self, event):
         """Process item and return one with get_display_text"""
-        event = copy.copy(event)
-        setattr(
-            event,
-            "display_text",
-            format_string_template(
-                event.template.format_str, tuple([arg.val for arg in event.args])
-            ),
-        )
-        return event
+        return process_event(event)
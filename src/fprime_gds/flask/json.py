@@ -3,6 +3,7 @@
 #
 # Encodes GDS objects as JSON.
 ####
+import json
 from abc import ABCMeta
 from enum import Enum
 from inspect import getmembers, isroutine
@@ -186,3 +187,35 @@ class GDSJsonEncoder(flask.json.JSONEncoder):
         elif isinstance(obj, ValueType):
             return obj.val
         return flask.json.JSONEncoder.default(self, obj)
+
+
+# Attribute of history items holding their cached JSON text
+JSON_CACHE_ATTRIBUTE = "_gds_json"
+
+
+def cached_json(item, process, encoder):
+    """ Encode a history item into JSON text at most once
+
+    History items are immutable once decoded, yet each is served to every polling session and stream subscriber. The
+    JSON text of the processed item is thus cached on the item itself the first time it is requested and reused
+    afterwards, such that responses may be assembled by concatenating the cached text. Items supporting no attributes
+    are encoded each time.
+
+    Note: the cache is not keyed by process nor encoder. An item must always be served with the same processing.
+
+    Args:
+        item: history item to encode
+        process: function converting the item to the object encoded (e.g. adding display_text)
+        encoder: JSON encoder class used to encode the processed item
+
+    Returns:
+        JSON text of the processed item
+    """
+    encoded = getattr(item, JSON_CACHE_ATTRIBUTE, None)
+    if encoded is None:
+        encoded = json.dumps(process(item), cls=encoder, separators=(",", ":"))
+        try:
+            setattr(item, JSON_CACHE_ATTRIBUTE, encoded)
+        except AttributeError:
+            pass
+    return encoded
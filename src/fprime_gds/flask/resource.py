@@ -5,9 +5,13 @@ establish standard patterns, and prevent replicated errors.
 
 @author lestarch
 """
+import json
+
+import flask
 from flask_restful import Resource
 from flask_restful.reqparse import RequestParser
 from fprime_gds.flask.errors import build_error_object
+from fprime_gds.flask.json import cached_json
 
 
 class DictionaryResource(Resource):
@@ -48,6 +52,9 @@ class HistoryResourceBase(Resource):
     calling `process` to allow subclasses to post-process the object for sending. Errors in process will be aggregated
     but will not fail the GET transaction, however; errors outside of process will result in a 500 error.
 
+    Processed objects are encoded to JSON once and cached on the history object (see `cached_json`), thus `process`
+    must produce the same result each time it is called on an object. Responses concatenate the cached JSON.
+
     The history base object also sets up the request parser to handle the session argument needed to track the pointer
     into the history. This session is automatically deleted when the DELETE handler is invoked such that the GDS is
     kept cleaned-up.
@@ -95,9 +102,11 @@ class HistoryResourceBase(Resource):
             self.history.clear()
 
         # Process each item from history aggregating but not failing on processing errors
+        encoder = flask.current_app.json_encoder
         for item in new_items:
             try:
-                returned_items.append(self.process(item))
+                returned_items.append(cached_json(item, self.process, encoder))
             except Exception as exc:
                 errors.append(build_error_object(exc))
-        return {"history": returned_items, "validation": validation, "errors": errors}
+        body = f'{{"history":[{",".join(returned_items)}],"validation":{validation},"errors":{json.dumps(errors)}}}'
+        return flask.Response(body, mimetype="application/json")
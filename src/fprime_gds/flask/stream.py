@@ -0,0 +1,281 @@
+""" stream.py: server-push streaming of histories to the browser
+
+The polling endpoints (/events, /channels, /commands) re-process and re-encode every item for every client on every
+poll. This module provides a Server-Sent Events (SSE) endpoint pushing batched deltas of these histories instead. Items
+are processed and JSON encoded once, as the first subscriber sends them, and the encoded text is shared by all
+subscribers (see `fprime_gds.flask.json.cached_json`).
+
+Each stream keeps the last `capacity` items numbered by a monotonically increasing cursor. A subscriber sends at most
+one batch per stream every `interval` seconds, of at most `limit` items. Writes to a slow client block only that
+client's generator, providing backpressure without blocking the pipeline: should a subscriber fall more than `capacity`
+items behind, the overwritten items are skipped and counted as "dropped" in its next batch.
+
+Each SSE message carries the cursors of the subscription as its id, e.g. "events:120,channels:5310,commands:4", which
+browsers return as the Last-Event-ID header on reconnection. The cursors may also be supplied as the "cursor" argument.
+Streams without a cursor start with the next item to arrive.
+
+The polling API remains available and is unaffected by this endpoint.
+"""
+import collections
+import itertools
+import json
+import logging
+import threading
+import time
+
+import flask
+import flask_restful
+from flask_restful.reqparse import RequestParser
+
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.flask.errors import build_error_object
+from fprime_gds.flask.json import cached_json
+
+LOGGER = logging.getLogger("stream")
+
+
+class StreamBuffer(DataHandler):
+    """
+    Bounded buffer of the latest items of one history stream. Items are numbered with a cursor increasing by one with
+    each item. The JSON text of each item is cached on the item, shared with the polling endpoints.
+    """
+
+    def __init__(self, hub, process, capacity):
+        """Constructor
+
+        Args:
+            hub: stream hub notified of new items
+            process: function converting an item to the object encoded for sending (e.g. adding display_text)
+            capacity: number of items retained for subscribers
+        """
+        self.hub = hub
+        self.process = process
+        self.items = collections.deque(maxlen=capacity)
+        self.next_cursor = 0
+
+    def data_callback(self, data, sender=None):
+        """Data callback storing the new item and notifying subscribers
+
+        Args:
+            data: item to store
+            sender: unused sender
+        """
+        with self.hub.condition:
+            self.items.append(data)
+            self.next_cursor += 1
+            self.hub.notify()
+
+    def resume(self, cursor):
+        """Get the cursor a subscription continues from given its last-seen cursor
+
+        Args:
+            cursor: last-seen cursor supplied by the client or None to start with the next item
+        Returns:
+            cursor of the next item to send to the subscription
+        """
+        with self.hub.condition:
+            if cursor is None:
+                return self.next_cursor
+            # Cursors past the end were issued by a previous server, send everything retained
+            return cursor if cursor <= self.next_cursor else self.next_cursor - len(self.items)
+
+    def pending(self, cursor):
+        """Check if items at or after the cursor are available"""
+        return cursor < self.next_cursor
+
+    def batch(self, cursor, limit, encoder):
+        """Produce the next batch of encoded items for a subscription
+
+        Args:
+            cursor: cursor of the next item to send to the subscription
+            limit: maximum number of items in the batch
+            encoder: JSON encoder class used to encode the items
+        Returns:
+            tuple of cursor after the batch, number of dropped items, list of encoded items, list of error objects
+        """
+        with self.hub.condition:
+            oldest = self.next_cursor - len(self.items)
+            dropped = max(oldest - cursor, 0)
+            cursor += dropped
+            items = list(itertools.islice(self.items, cursor - oldest, cursor - oldest + limit))
+        # Encoding happens outside the lock, concurrent subscribers encoding the same item produce identical text
+        encoded = []
+        errors = []
+        for item in items:
+            try:
+                encoded.append(cached_json(item, self.process, encoder))
+            except Exception as exc:
+                errors.append(build_error_object(exc))
+        return cursor + len(items), dropped, encoded, errors
+
+
+class StreamHub:
+    """
+    Collection of the stream buffers served by the streaming endpoint. Buffers share a condition variable such that a
+    subscription to several streams waits for an update on any of them. The number of open subscriptions is kept in
+    `subscribers` and logged as subscriptions open and close.
+    """
+
+    # Default number of items retained per stream
+    CAPACITY = 10000
+
+    def __init__(self, capacity=None):
+        """Constructor
+
+        Args:
+            capacity: number of items retained per stream. Defaults to StreamHub.CAPACITY
+        """
+        self.condition = threading.Condition()
+        self.capacity = capacity if capacity is not None else self.CAPACITY
+        self.buffers = {}
+        self.update_count = 0
+        self.subscribers = 0
+
+    def add_stream(self, name, process=None):
+        """Add a stream to the hub
+
+        Args:
+            name: name of the stream
+            process: function converting an item to the object encoded for sending. Defaults to the item itself.
+        Returns:
+            stream buffer to register as a consumer of the stream's data
+        """
+        buffer = StreamBuffer(self, process if process is not None else lambda item: item, self.capacity)
+        self.buffers[name] = buffer
+        return buffer
+
+    def notify(self):
+        """Wake subscriptions waiting for new items. Must be called with the condition held."""
+        self.update_count += 1
+        self.condition.notify_all()
+
+    def wait(self, seen, timeout):
+        """Wait for an update to any stream since the update count seen
+
+        Args:
+            seen: update count read before the subscription last checked the streams
+            timeout: maximum number of seconds to wait
+        Returns:
+            True if updated, False on timeout
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: self.update_count != seen, timeout)
+
+    @staticmethod
+    def parse_cursors(text):
+        """Parse the cursor text of a subscription i.e. "events:120,channels:5310"
+
+        Args:
+            text: cursor text, may be None or empty
+        Returns:
+            dictionary of stream name to cursor
+        """
+        cursors = {}
+        for token in (text or "").split(","):
+            name, _, value = token.partition(":")
+            try:
+                cursors[name.strip()] = int(value)
+            except ValueError:
+                continue
+        return cursors
+
+    @staticmethod
+    def format_cursors(cursors):
+        """Format the cursors of a subscription as accepted by parse_cursors"""
+        return ",".join(f"{name}:{cursor}" for name, cursor in cursors.items())
+
+    def subscribe(self, names, cursors, encoder, limit, interval, heartbeat):
+        """Generate the server-sent event stream of a subscription
+
+        Args:
+            names: names of the streams subscribed to
+            cursors: dictionary of last-seen cursors by stream name
+            encoder: JSON encoder class used to encode the items
+            limit: maximum number of items sent per stream in one message
+            interval: minimum number of seconds between batches
+            heartbeat: seconds of inactivity after which a comment is sent to keep the connection alive
+        Returns:
+            generator of server-sent event text
+        """
+        positions = {name: self.buffers[name].resume(cursors.get(name)) for name in names}
+        with self.condition:
+            self.subscribers += 1
+            LOGGER.info("Stream subscribed to %s, %d subscriptions open", ",".join(names), self.subscribers)
+        try:
+            yield f"retry: {int(interval * 1000) + 1000}\n\n"
+            while True:
+                seen = self.update_count
+                sent = False
+                for name in names:
+                    buffer = self.buffers[name]
+                    if not buffer.pending(positions[name]):
+                        continue
+                    positions[name], dropped, encoded, errors = buffer.batch(positions[name], limit, encoder)
+                    message = (
+                        f'{{"history":[{",".join(encoded)}],"dropped":{dropped},'
+                        f'"errors":{json.dumps(errors)},"cursor":{positions[name]}}}'
+                    )
+                    yield f"event: {name}\nid: {self.format_cursors(positions)}\ndata: {message}\n\n"
+                    sent = True
+                if sent:
+                    # Rate limit the subscription, items arriving meanwhile are sent as the next batch
+                    time.sleep(interval)
+                elif not self.wait(seen, heartbeat):
+                    yield ": heartbeat\n\n"
+        finally:
+            with self.condition:
+                self.subscribers -= 1
+                LOGGER.info("Stream to %s closed, %d subscriptions open", ",".join(names), self.subscribers)
+
+
+class HistoryStream(flask_restful.Resource):
+    """
+    Resource streaming history deltas to the client as server-sent events. One message is sent per stream and batch
+    with the event type set to the stream name and data:
+
+    {"history": [items], "dropped": count of skipped items, "errors": [errors], "cursor": next cursor}
+    """
+
+    def __init__(self, hub):
+        """Constructor
+
+        Args:
+            hub: stream hub supplying the streams
+        """
+        self.hub = hub
+        self.parser = RequestParser()
+        self.parser.add_argument(
+            "streams", required=False, help="Comma separated streams to subscribe to (default all)", location="args"
+        )
+        self.parser.add_argument(
+            "cursor", required=False, help="Last-seen cursors e.g. events:120,channels:5310", location="args"
+        )
+        self.parser.add_argument(
+            "limit", required=False, type=int, default=2000, help="Limit to items per message", location="args"
+        )
+        self.parser.add_argument(
+            "interval", required=False, type=float, default=0.1, help="Seconds between batches", location="args"
+        )
+
+    def get(self):
+        """HTTP GET handler opening the event stream"""
+        args = self.parser.parse_args()
+        names = list(self.hub.buffers.keys())
+        if args.get("streams"):
+            names = [name.strip() for name in args.get("streams").split(",")]
+            unknown = [name for name in names if name not in self.hub.buffers]
+            if unknown:
+                flask_restful.abort(400, message=f"Unknown streams: {', '.join(unknown)}")
+        cursor_text = flask.request.headers.get("Last-Event-ID", args.get("cursor"))
+        generator = self.hub.subscribe(
+            names,
+            self.hub.parse_cursors(cursor_text),
+            flask.current_app.json_encoder,
+            max(args.get("limit"), 1),
+            max(args.get("interval"), 0.0),
+            heartbeat=15,
+        )
+        response = flask.Response(generator, mimetype="text/event-stream")
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
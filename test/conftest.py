@@ -0,0 +1,12 @@
+"""
+Fixtures shared by all tests
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def dictionary_cache_directory(tmp_path_factory):
+    """Keep the dictionaries cached by the tests, including those set up per class, out of the user's cache directory"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("FPRIME_GDS_CACHE_DIR", str(tmp_path_factory.mktemp("dictionary-cache")))
+        yield
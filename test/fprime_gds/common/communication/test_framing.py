@@ -0,0 +1,49 @@
+"""
+Tests the F prime framer/deframer resynchronization and multi-frame deframing
+"""
+from fprime_gds.common.communication.framing import FpFramerDeframer
+
+
+def test_deframe_all_round_trip():
+    """Frames are recovered in order with leftover data preserved for the next pool"""
+    framer = FpFramerDeframer()
+    packets = [b"\x00\x01\x02", b"hello world", b"\xFF" * 100]
+    framed = b"".join(framer.frame(packet) for packet in packets)
+    partial = framer.frame(b"partial")
+
+    deframed, leftover = framer.deframe_all(framed + partial[:9], no_copy=True)
+    assert deframed == packets
+    assert leftover == partial[:9]
+
+    deframed, leftover = framer.deframe_all(leftover + partial[9:], no_copy=True)
+    assert deframed == [b"partial"]
+    assert leftover == b""
+
+
+def test_deframe_resync_on_noise_and_bad_checksum():
+    """Noise, bad checksums and false start tokens are skipped to reach the next valid frame"""
+    framer = FpFramerDeframer()
+    good = framer.frame(b"good packet")
+    corrupted = bytearray(framer.frame(b"corrupted"))
+    corrupted[-1] ^= 0xFF
+    noise = b"\x01\x02\xDE\xAD\x03" + b"\xDE\xAD\xBE\xEF\xFF\xFF\xFF\xFF" + b"\x55" * 50
+
+    deframed, leftover = framer.deframe_all(noise + bytes(corrupted) + good + noise[:3], no_copy=False)
+    assert deframed == [b"good packet"]
+    # Trailing data too short for a header is kept for the next pool
+    assert leftover == noise[:3]
+
+    # Noise without any start token is discarded but for a possible partial token
+    deframed, leftover = framer.deframe_all(b"\x55" * 20 + b"\xDE\xAD", no_copy=True)
+    assert deframed == []
+    assert leftover == b"\x55\xDE\xAD"
+
+
+def test_deframe_single():
+    """Deframe produces exactly one packet and returns the remaining bytes"""
+    framer = FpFramerDeframer()
+    first, second = framer.frame(b"one"), framer.frame(b"two")
+    packet, leftover = framer.deframe(b"\x00" * 7 + first + second)
+    assert packet == b"one"
+    assert leftover == second
+    assert framer.deframe(b"\xDE\xAD") == (None, b"\xDE\xAD")
@@ -0,0 +1,97 @@
+"""
+Tests the compiled channel and event decoders against the generic decoders
+"""
+import struct
+
+import pytest
+
+from fprime.common.models.serialize.bool_type import BoolType
+from fprime.common.models.serialize.enum_type import EnumType
+from fprime.common.models.serialize.numerical_types import F32Type, I16Type, U32Type, U64Type
+from fprime.common.models.serialize.string_type import StringType
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.compiled_decoder import CompiledChDecoder, CompiledEventDecoder
+from fprime_gds.common.decoders.decoder import DecodingException
+from fprime_gds.common.decoders.event_decoder import EventDecoder
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.templates.event_template import EventTemplate
+from fprime_gds.common.utils.config_manager import ConfigManager
+from fprime_gds.common.utils.event_severity import EventSeverity
+
+ENUM_TYPE = EnumType.construct_type("CompiledTestEnum", {"RED": 0, "GREEN": 5})
+STRING_TYPE = StringType.construct_type("CompiledTestString", 20)
+TIME_BIN = TimeType(2, 1, 1533758629, 123456).serialize()
+
+CHANNELS = {
+    1: ChTemplate(1, "u32", "comp", U32Type),
+    2: ChTemplate(2, "f32", "comp", F32Type),
+    3: ChTemplate(3, "bool", "comp", BoolType),
+    4: ChTemplate(4, "enum", "comp", ENUM_TYPE),
+    5: ChTemplate(5, "string", "comp", STRING_TYPE),
+    6: ChTemplate(6, "u64", "comp", U64Type),
+}
+
+EVENTS = {
+    1: EventTemplate(1, "fixed", "comp", [("a", None, I16Type), ("b", None, ENUM_TYPE), ("c", None, BoolType)],
+                     EventSeverity.DIAGNOSTIC, "%d %s %s"),
+    2: EventTemplate(2, "string", "comp", [("a", None, U32Type), ("b", None, STRING_TYPE)],
+                     EventSeverity.DIAGNOSTIC, "%d %s"),
+    3: EventTemplate(3, "empty", "comp", [], EventSeverity.DIAGNOSTIC, "empty"),
+}
+
+CHANNEL_DATA = b"".join([
+    struct.pack(">I", 1) + TIME_BIN + struct.pack(">I", 42),
+    struct.pack(">I", 2) + TIME_BIN + struct.pack(">f", 1.5),
+    struct.pack(">I", 3) + TIME_BIN + b"\xFF",
+    struct.pack(">I", 4) + TIME_BIN + struct.pack(">i", 5),
+    struct.pack(">I", 5) + TIME_BIN + struct.pack(">H", 5) + b"hello",
+    struct.pack(">I", 6) + TIME_BIN + struct.pack(">Q", 2**40),
+])
+
+EVENT_DATA = b"".join([
+    struct.pack(">I", 1) + TIME_BIN + struct.pack(">hiB", -7, 0, 0),
+    struct.pack(">I", 2) + TIME_BIN + struct.pack(">IH", 9, 3) + b"abc",
+    struct.pack(">I", 3) + TIME_BIN,
+])
+
+
+@pytest.mark.parametrize("data_type", [bytes, memoryview])
+def test_compiled_ch_decoder(data_type):
+    """Compiled channel decoding matches generic decoding, including string fallback"""
+    config = ConfigManager()
+    expected = ChDecoder(CHANNELS, config).decode_api(CHANNEL_DATA)
+    actual = CompiledChDecoder(CHANNELS, config).decode_api(data_type(CHANNEL_DATA))
+
+    assert [item.get_val() for item in actual] == [42, 1.5, True, "GREEN", "hello", 2**40]
+    assert [item.get_val() for item in actual] == [item.get_val() for item in expected]
+    for item in actual:
+        assert item.get_time() == TimeType(2, 1, 1533758629, 123456)
+        assert item.get_time().serialize() == TIME_BIN
+        assert type(item.get_val_obj()) is item.template.get_type_obj()
+
+
+@pytest.mark.parametrize("data_type", [bytes, memoryview])
+def test_compiled_event_decoder(data_type):
+    """Compiled event decoding matches generic decoding, including string fallback"""
+    config = ConfigManager()
+    expected = EventDecoder(EVENTS, config).decode_api(EVENT_DATA)
+    actual = CompiledEventDecoder(EVENTS, config).decode_api(data_type(EVENT_DATA))
+
+    values = [[arg.val for arg in item.get_args()] for item in actual]
+    assert values == [[-7, "RED", False], [9, "abc"], []]
+    assert values == [[arg.val for arg in item.get_args()] for item in expected]
+    for item in actual:
+        assert item.get_time() == TimeType(2, 1, 1533758629, 123456)
+
+
+def test_compiled_decoder_errors():
+    """Invalid values and unknown ids raise DecodingException"""
+    config = ConfigManager()
+    decoder = CompiledChDecoder(CHANNELS, config)
+    with pytest.raises(DecodingException):
+        decoder.decode_api(struct.pack(">I", 3) + TIME_BIN + b"\x01")
+    with pytest.raises(DecodingException):
+        decoder.decode_api(struct.pack(">I", 4) + TIME_BIN + struct.pack(">i", 3))
+    with pytest.raises(DecodingException):
+        decoder.decode_api(struct.pack(">I", 99) + TIME_BIN + struct.pack(">I", 3))
@@ -4,10 +4,26 @@ Tests the distributor
 Created on Jul 10, 2020
 @author: Josef Biberstein, Joseph Paetz, hpaulson
 """
+import logging
+import multiprocessing
+import struct
+import threading
+import time
 
+import pytest
+from fprime.common.models.serialize.numerical_types import U32Type
+from fprime.common.models.serialize.string_type import StringType
+from fprime.common.models.serialize.time_type import TimeType
 
-from fprime_gds.common.distributor.distributor import Distributor
+from fprime_gds.common.decoders.ch_decoder import ChDecoder
+from fprime_gds.common.decoders.event_decoder import EventDecoder
+from fprime_gds.common.distributor.distributor import Distributor, ShardedDistributor, ZeroCopyDistributor
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.common.templates.event_template import EventTemplate
 from fprime_gds.common.utils import config_manager
+from fprime_gds.common.utils.data_desc_type import DataDescType
+from fprime_gds.common.utils.event_severity import EventSeverity
 
 
 def test_distributor():
@@ -53,4 +69,195 @@ def test_distributor():
     assert test_desc_1 == desc_1, f"expected 1st desc to be {desc_1} but found {test_desc_1}"
     assert test_desc_2 == desc_2, f"expected 2nd desc to be {desc_2} but found {test_desc_2}"
     assert (test_msg_1 == data_1), f"expected 1st msg to be {list(data_1)} but found {list(test_msg_1)}"
-    assert (test_msg_2 == data_2), f"expected 2nd msg to be {list(data_2)} but found {list(test_msg_2)}"
\ No newline at end of file
+    assert (test_msg_2 == data_2), f"expected 2nd msg to be {list(data_2)} but found {list(test_msg_2)}"
+
+class CollectingDecoder(DataHandler):
+    """Decoder stand-in that records a copy of every message it is handed"""
+
+    def __init__(self):
+        self.msgs = []
+
+    def data_callback(self, data, sender=None):
+        assert isinstance(data, memoryview), "Zero copy distributor must hand out memoryviews"
+        self.msgs.append(bytes(data))
+
+
+def test_zero_copy_distributor():
+    """
+    Tests the zero copy distributor delivers the same messages as the standard distributor, even when split across
+    received chunks
+    """
+    config = config_manager.ConfigManager()
+    config.set("types", "msg_len", "U16")
+
+    dist = ZeroCopyDistributor(config, compact_threshold=8)
+    telem = CollectingDecoder()
+    log = CollectingDecoder()
+    dist.register("FW_PACKET_TELEM", telem)
+    dist.register("FW_PACKET_LOG", log)
+
+    msg_1 = b"\x00\x0A\x00\x00\x00\x01" + b"\x41\x42\x43\x44\x45\x46"
+    msg_2 = b"\x00\x07\x00\x00\x00\x02" + b"\x61\x62\x63"
+    data = (msg_1 + msg_2) * 3
+
+    # Feed data in uneven chunks to split headers and messages
+    for i in range(0, len(data), 5):
+        dist.on_recv(data[i : i + 5])
+
+    assert telem.msgs == [b"\x41\x42\x43\x44\x45\x46"] * 3
+    assert log.msgs == [b"\x61\x62\x63"] * 3
+
+
+def test_zero_copy_distributor_key_frame():
+    """
+    Tests the zero copy distributor resynchronizes on the key frame when noise is interleaved with messages
+    """
+    config = config_manager.ConfigManager()
+    config.set("types", "msg_len", "U16")
+    config.set("framing", "use_key", "true")
+    config.set("framing", "key_val", "0xA5A5")
+
+    dist = ZeroCopyDistributor(config)
+    telem = CollectingDecoder()
+    dist.register("FW_PACKET_TELEM", telem)
+
+    msg = b"\xA5\xA5" + b"\x00\x06\x00\x00\x00\x01" + b"\x01\x02"
+    dist.on_recv(b"\x00\xA5\x13" + msg + b"\xFF" * 7 + msg[:1])
+    assert telem.msgs == [b"\x01\x02"]
+    dist.on_recv(msg[1:] + b"\xA5")
+    assert telem.msgs == [b"\x01\x02"] * 2
+
+
+class ItemCollector(DataHandler):
+    """Consumer recording the id, time and values of decoded channels and events in order"""
+
+    def __init__(self):
+        self.items = []
+
+    def data_callback(self, data, sender=None):
+        values = [data.get_val()] if hasattr(data, "val_obj") else [arg.val for arg in data.get_args()]
+        self.items.append((type(data).__name__, data.id, data.time.seconds, values))
+
+
+def sharded_traffic():
+    """Build channels and events of several ids along with undecodable and file messages"""
+    time_bytes = TimeType(2, 0, 7, 0).serialize()
+    messages = []
+    for index in range(60):
+        if index % 7 == 0:
+            payload = struct.pack(">I", 1) + time_bytes + struct.pack(">I", index) + struct.pack(">H", 2) + b"hi"
+            messages.append((DataDescType.FW_PACKET_LOG, payload))
+        elif index % 13 == 0:
+            # Unknown channel id, failing to decode
+            messages.append((DataDescType.FW_PACKET_TELEM, struct.pack(">I", 99) + time_bytes + b"\x00" * 4))
+        elif index % 17 == 0:
+            messages.append((DataDescType.FW_PACKET_FILE, struct.pack(">I", index)))
+        else:
+            payload = struct.pack(">I", index % 5) + time_bytes + struct.pack(">I", index)
+            messages.append((DataDescType.FW_PACKET_TELEM, payload))
+    return b"".join(struct.pack(">II", len(payload) + 4, desc.value) + payload for desc, payload in messages)
+
+
+@pytest.mark.parametrize("shard", ShardedDistributor.SHARD_MODES)
+def test_sharded_distributor(shard):
+    """
+    Tests the sharded distributor delivers the same items, in the same order, as the standard distributor
+    """
+    channels = {ch_id: ChTemplate(ch_id, f"Channel{ch_id}", "comp", U32Type, "%d") for ch_id in range(5)}
+    string_type = StringType.construct_type("TestString", 10)
+    events = {
+        1: EventTemplate(1, "Event", "comp", [("count", None, U32Type), ("text", None, string_type)],
+                         EventSeverity.ACTIVITY_HI, "%d %s")
+    }
+    data = sharded_traffic()
+    results = []
+    for dist in [Distributor(), ShardedDistributor(workers=3, shard=shard, id_range=2, queue_size=2)]:
+        collector = ItemCollector()
+        files = ItemCollector()
+        ch_decoder = ChDecoder(channels, None)
+        event_decoder = EventDecoder(events, None)
+        ch_decoder.register(collector)
+        event_decoder.register(collector)
+        dist.register("FW_PACKET_TELEM", ch_decoder)
+        dist.register("FW_PACKET_LOG", event_decoder)
+        dist.register("FW_PACKET_FILE", CollectingFile(collector))
+        for i in range(0, len(data), 23):
+            dist.on_recv(data[i : i + 23])
+        dist.close()
+        results.append(collector.items)
+    assert len(results[0]) == 60 - 4
+    assert results[1] == results[0]
+
+
+def test_sharded_distributor_dead_worker(caplog):
+    """
+    Tests the jobs of a killed worker are decoded in this process, and data received once closed is still decoded
+    """
+    channels = {ch_id: ChTemplate(ch_id, f"Channel{ch_id}", "comp", U32Type, "%d") for ch_id in range(5)}
+    data = sharded_traffic()
+    split = len(data) // 2 // 23 * 23
+    halves = [[data[i : i + 23] for i in range(0, split, 23)], [data[i : i + 23] for i in range(split, len(data), 23)]]
+    distributors = [ZeroCopyDistributor(), ShardedDistributor(workers=2, shard="id", id_range=1, put_timeout=0.1)]
+    collectors = []
+    for dist in distributors:
+        collectors.append(ItemCollector())
+        ch_decoder = ChDecoder(channels, None)
+        ch_decoder.register(collectors[-1])
+        dist.register("FW_PACKET_TELEM", ch_decoder)
+        dist.start()
+    reference, collector = collectors
+    for chunk in halves[0]:
+        distributors[0].on_recv(chunk)
+    first_half = list(reference.items)
+    for chunk in halves[1]:
+        distributors[0].on_recv(chunk)
+
+    worker = next(process for process in multiprocessing.active_children() if process.name == "DecodeWorker")
+    worker.kill()
+    worker.join()
+    with caplog.at_level(logging.ERROR, logger="distributor"):
+        for chunk in halves[0]:
+            distributors[1].on_recv(chunk)
+        deadline = time.monotonic() + 10
+        while len(collector.items) < len(first_half) and time.monotonic() < deadline:
+            time.sleep(0.05)
+    assert "Decode worker %d exited" % worker.pid in caplog.text
+    assert collector.items == first_half
+    distributors[1].close()
+    for chunk in halves[1]:
+        distributors[1].on_recv(chunk)
+    assert collector.items == reference.items
+
+
+class CollectingFile(DataHandler):
+    """File decoder stand-in recording file messages in the same collector"""
+
+    def __init__(self, collector):
+        self.collector = collector
+
+    def data_callback(self, data, sender=None):
+        self.collector.items.append(("file", bytes(data)))
+
+
+class StuckChDecoder(ChDecoder):
+    """Channel decoder never finishing decoding, standing in for a hung worker"""
+
+    def decode_api(self, data):
+        time.sleep(60)
+
+
+@pytest.mark.parametrize("start_method", ShardedDistributor.START_METHODS)
+def test_sharded_distributor_close_timeout(start_method):
+    """
+    Tests the sharded distributor started explicitly terminates workers not stopping within the close timeout
+    """
+    channels = {0: ChTemplate(0, "Channel0", "comp", U32Type, "%d")}
+    dist = ShardedDistributor(workers=1, start_method=start_method)
+    dist.register("FW_PACKET_TELEM", StuckChDecoder(channels, None))
+    dist.start()
+    payload = struct.pack(">I", 0) + TimeType(2, 0, 7, 0).serialize() + struct.pack(">I", 1)
+    dist.on_recv(struct.pack(">II", len(payload) + 4, DataDescType.FW_PACKET_TELEM.value) + payload)
+    start = time.monotonic()
+    dist.close(timeout=1.0)
+    assert time.monotonic() - start < 10
+    assert not any(thread.name == "DecodeCollector" for thread in threading.enumerate())
@@ -0,0 +1,55 @@
+"""
+Tests the CFDP checksum is bit-exact with the wordwise definition for any alignment, chunking and file size
+"""
+import os
+import random
+import struct
+
+import pytest
+
+from fprime_gds.common.files.helpers import CFDPChecksum
+
+
+def reference_update(value, data, offset):
+    """Wordwise CFDP checksum update, zero padding each word the data only partially covers"""
+    while data:
+        padding_len = offset % 4
+        calc_bytes = bytes(padding_len) + data[: 4 - padding_len] + bytes(4)
+        value = (value + struct.unpack_from(">I", calc_bytes, 0)[0]) & 0xFFFFFFFF
+        data = data[4 - padding_len :]
+        offset = offset + (4 - padding_len)
+    return value
+
+
+@pytest.mark.parametrize("length", range(0, 13))
+@pytest.mark.parametrize("offset", range(0, 5))
+def test_update_alignment(length, offset):
+    """Test every combination of unaligned head and tail"""
+    data = os.urandom(length)
+    checksum = CFDPChecksum()
+    checksum.update(data, offset)
+    assert checksum.value == reference_update(0, data, offset)
+
+
+def test_update_chunks():
+    """Test uneven chunks, as bytes and memoryviews, sum to the checksum of the whole"""
+    generator = random.Random(2022)
+    data = os.urandom(100003)
+    checksum = CFDPChecksum()
+    offset = 0
+    while offset < len(data):
+        size = generator.randint(1, 1000)
+        chunk = data[offset : offset + size]
+        checksum.update(chunk if size % 2 else memoryview(chunk), offset)
+        offset += size
+    assert checksum.value == reference_update(0, data, 0)
+
+
+@pytest.mark.parametrize("size", [0, 1, 4099, 3 * 4096 + 2])
+def test_from_file(tmp_path, monkeypatch, size):
+    """Test checksumming a mapped file across unaligned blocks"""
+    monkeypatch.setattr(CFDPChecksum, "BLOCK_SIZE", 4097)
+    data = os.urandom(size)
+    path = tmp_path / "file.bin"
+    path.write_bytes(data)
+    assert CFDPChecksum.from_file(path).value == reference_update(0, data, 0)
@@ -0,0 +1,186 @@
+"""
+Tests downlinking several files at once with data arriving out of order
+"""
+import logging
+import os
+import time
+
+import pytest
+
+from fprime_gds.common.data_types.file_data import (
+    CancelPacketData,
+    DataPacketData,
+    EndPacketData,
+    StartPacketData,
+)
+from fprime_gds.common.files.downlinker import FileDownlinker
+from fprime_gds.common.files.helpers import FileStates, ReceivedRanges
+
+
+@pytest.fixture
+def downlinker(tmp_path):
+    """Downlinker writing to a temporary directory"""
+    downlinker = FileDownlinker(str(tmp_path / "down"), log_dir=str(tmp_path))
+    yield downlinker
+    for downlink in list(downlinker.downlinks.values()):
+        downlinker.finish(downlink)
+
+
+def packets(name, content, chunk=100):
+    """Make the START, DATA and END packets of downlinking content"""
+    start = StartPacketData(0, len(content), f"/src/{name}".encode(), name.encode())
+    data = [
+        DataPacketData(index + 1, offset, content[offset : offset + chunk])
+        for index, offset in enumerate(range(0, len(content), chunk))
+    ]
+    return start, data, EndPacketData(len(data) + 1, 0)
+
+
+def test_received_ranges():
+    """Test ranges received in and out of order merge and leave the gaps missing"""
+    ranges = ReceivedRanges()
+    assert ranges.missing(100) == [(0, 100)]
+    ranges.add(0, 10)
+    ranges.add(10, 10)
+    ranges.add(50, 10)
+    ranges.add(30, 5)
+    assert ranges.missing(100) == [(20, 10), (35, 15), (60, 40)]
+    ranges.add(15, 25)  # Overlaps two ranges
+    ranges.add(50, 10)  # Duplicate
+    assert ranges.missing(100) == [(40, 10), (60, 40)]
+    assert ranges.received == 50
+    ranges.add(40, 60)
+    assert ranges.missing(100) == []
+    assert ranges.received == 100
+
+
+def test_concurrent_downlinks(downlinker):
+    """Test interleaved downlinks are each attributed their packets by sequence id"""
+    contents = {name: os.urandom(1050) for name in ["first.bin", "second.bin"]}
+    first, second = (packets(name, content) for name, content in contents.items())
+    downlinker.data_callback(first[0])
+    for packet in first[1][:3]:
+        downlinker.data_callback(packet)
+    downlinker.data_callback(second[0])
+    assert downlinker.state == FileStates.RUNNING
+    assert len(downlinker.downlinks) == 2
+    for first_packet, second_packet in zip(first[1][3:] + [first[2]], second[1]):
+        downlinker.data_callback(second_packet)
+        downlinker.data_callback(first_packet)
+    assert len(downlinker.downlinks) == 1
+    for packet in second[1][len(first[1]) - 2 :] + [second[2]]:
+        downlinker.data_callback(packet)
+    assert downlinker.state == FileStates.IDLE
+    for name, content in contents.items():
+        with open(os.path.join(downlinker.directory, name), "rb") as file_handle:
+            assert file_handle.read() == content
+    assert [item["state"] for item in downlinker.current_files()] == ["FINISHED", "FINISHED"]
+    assert [item["current"] for item in downlinker.current_files()] == [1050, 1050]
+
+
+def test_lockstep_downlinks_aborted(downlinker, caplog):
+    """Test downlinks expecting the same sequence ids are aborted rather than attributed packets by guessing"""
+    first, second = (packets(name, bytes([index]) * 500) for index, name in enumerate(["first.bin", "second.bin"]))
+    downlinker.data_callback(first[0])
+    downlinker.data_callback(second[0])
+    with caplog.at_level(logging.WARNING, logger="downlink"):
+        for first_packet, second_packet in zip(first[1], second[1]):
+            downlinker.data_callback(first_packet)
+            downlinker.data_callback(second_packet)
+    assert "Received DATA packet 1 expected by 2 downlinks, aborting them" in caplog.text
+    assert downlinker.state == FileStates.IDLE
+    assert [item["state"] for item in downlinker.current_files()] == ["CANCELED", "CANCELED"]
+    assert [item["current"] for item in downlinker.current_files()] == [0, 0]
+
+
+def test_downlink_after_lost_end(downlinker, caplog):
+    """Test a downlink whose END packet was lost is canceled rather than aborting the next downlink"""
+    first = packets("first.bin", bytes(500))
+    content = os.urandom(2000)
+    second = packets("second.bin", content)
+    downlinker.data_callback(first[0])
+    for packet in first[1][:3]:
+        downlinker.data_callback(packet)
+    with caplog.at_level(logging.WARNING, logger="downlink"):
+        for packet in [second[0]] + second[1] + [second[2]]:
+            downlinker.data_callback(packet)
+    assert "No packets received since another downlink started, canceling" in caplog.text
+    assert downlinker.state == FileStates.IDLE
+    with open(os.path.join(downlinker.directory, "second.bin"), "rb") as file_handle:
+        assert file_handle.read() == content
+    assert [item["state"] for item in downlinker.current_files()] == ["CANCELED", "FINISHED"]
+
+
+def test_quiet_downlink_canceled_on_start(downlinker):
+    """Test a START cancels downlinks that received no packets recently, and not those still receiving"""
+    first, second, third = (packets(name, bytes(500)) for name in ["first.bin", "second.bin", "third.bin"])
+    for downlink in [first, second]:
+        downlinker.data_callback(downlink[0])
+        downlinker.data_callback(downlink[1][0])
+    downlinker.downlinks["/src/first.bin"].last_packet -= FileDownlinker.QUIET_INTERVAL
+    downlinker.data_callback(third[0])
+    assert sorted(downlinker.downlinks) == ["/src/second.bin", "/src/third.bin"]
+    assert [item["state"] for item in downlinker.current_files()] == ["CANCELED", "TRANSMITTING", "TRANSMITTING"]
+
+
+def test_downlink_timeout(tmp_path):
+    """Test a downlink receiving no packets times out"""
+    downlinker = FileDownlinker(str(tmp_path / "down"), timeout=0.05, log_dir=str(tmp_path))
+    start, data, _ = packets("timeout.bin", bytes(500))
+    downlinker.data_callback(start)
+    downlinker.data_callback(data[0])
+    deadline = time.monotonic() + 5
+    while downlinker.downlinks and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert downlinker.state == FileStates.IDLE
+    assert downlinker.current_files()[0]["state"] == "TIMEOUT"
+
+
+def test_unattributable_packet_dropped(downlinker, caplog):
+    """Test a packet expected by none of several downlinks is dropped"""
+    first, second = (packets(name, bytes(500)) for name in ["first.bin", "second.bin"])
+    downlinker.data_callback(first[0])
+    downlinker.data_callback(first[1][0])
+    downlinker.data_callback(second[0])
+    with caplog.at_level(logging.WARNING, logger="downlink"):
+        downlinker.data_callback(first[1][3])
+    assert "Received DATA packet 4 expected by none of 2 downlinks, dropping it" in caplog.text
+    assert [item["current"] for item in downlinker.current_files()] == [100, 0]
+
+
+def test_out_of_order_downlink(downlinker):
+    """Test DATA packets out of order are written by offset"""
+    content = os.urandom(1050)
+    start, data, end = packets("unordered.bin", content)
+    downlinker.data_callback(start)
+    for packet in data[::-1]:
+        downlinker.data_callback(packet)
+    downlinker.data_callback(end)
+    with open(os.path.join(downlinker.directory, "unordered.bin"), "rb") as file_handle:
+        assert file_handle.read() == content
+    assert downlinker.current_files()[0]["current"] == 1050
+
+
+def test_missing_ranges_reported(downlinker, caplog):
+    """Test the ranges never received are reported at END"""
+    start, data, end = packets("gaps.bin", bytes(1000))
+    downlinker.data_callback(start)
+    for packet in data[:3] + data[5:9]:
+        downlinker.data_callback(packet)
+    with caplog.at_level(logging.WARNING, logger="downlink"):
+        downlinker.data_callback(end)
+    assert "Missing 300 bytes in 2 ranges (offset, length): (300, 200), (900, 100)" in caplog.text
+    assert downlinker.current_files()[0]["current"] == 700
+
+
+def test_restart_and_cancel(downlinker):
+    """Test a START for a source in progress aborts it, and a CANCEL stops the downlink"""
+    start, data, _ = packets("restart.bin", bytes(500))
+    downlinker.data_callback(start)
+    downlinker.data_callback(data[0])
+    downlinker.data_callback(start)
+    assert len(downlinker.downlinks) == 1
+    assert [item["state"] for item in downlinker.current_files()] == ["CANCELED", "TRANSMITTING"]
+    downlinker.data_callback(CancelPacketData(1))
+    assert downlinker.state == FileStates.IDLE
+    assert downlinker.current_files()[1]["state"] == "CANCELED"
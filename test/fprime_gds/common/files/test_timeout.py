@@ -0,0 +1,105 @@
+"""
+Tests the file transfer timeouts run by the timer service
+"""
+import threading
+import time
+import weakref
+
+import pytest
+
+from fprime_gds.common.files.helpers import Timeout, TimerService
+
+
+@pytest.fixture
+def service():
+    """Timer service private to the test"""
+    return TimerService()
+
+
+def make_timeout(service, duration):
+    """Make a timeout recording the times it expired"""
+    expired = []
+    event = threading.Event()
+
+    def callback(name):
+        expired.append((name, time.monotonic()))
+        event.set()
+
+    timeout = Timeout(service)
+    timeout.setup(callback, duration, args=("timeout",))
+    return timeout, expired, event
+
+
+def test_timeout_expires(service):
+    """Test a started timeout calls back once after its duration"""
+    timeout, expired, event = make_timeout(service, 0.05)
+    start = time.monotonic()
+    timeout.start()
+    assert event.wait(5)
+    assert expired[0][0] == "timeout"
+    assert expired[0][1] - start >= 0.05
+    time.sleep(0.1)
+    assert len(expired) == 1
+
+
+def test_timeout_restart_delays(service):
+    """Test restarting moves the deadline without creating threads"""
+    timeout, expired, event = make_timeout(service, 0.1)
+    threads = threading.active_count()
+    start = time.monotonic()
+    timeout.restart()
+    while time.monotonic() - start < 0.3:
+        timeout.restart()
+        assert threading.active_count() == threads
+        time.sleep(0.001)
+    last_restart = time.monotonic()
+    assert not expired
+    assert event.wait(5)
+    assert expired[0][1] - last_restart >= 0.09
+    time.sleep(0.2)
+    assert len(expired) == 1
+
+
+def test_timeout_stop(service):
+    """Test stopped timeouts do not call back and may be started again"""
+    timeout, expired, event = make_timeout(service, 0.05)
+    other, other_expired, other_event = make_timeout(service, 0.1)
+    timeout.start()
+    other.start()
+    timeout.stop()
+    assert other_event.wait(5)
+    assert not expired
+    timeout.start()
+    assert event.wait(5)
+    assert len(expired) == 1 and len(other_expired) == 1
+
+
+def test_timeout_stop_releases_arguments(service):
+    """Test stopping a timeout removes it from the service, which then holds no reference to its callback arguments"""
+
+    class Transfer:
+        """Stand-in for the file transfer a timeout callback refers to"""
+
+    transfer = Transfer()
+    reference = weakref.ref(transfer)
+    timeout = Timeout(service)
+    timeout.setup(lambda _: None, 60, args=(transfer,))
+    timeout.start()
+    assert len(service) == 1
+    timeout.stop()
+    assert len(service) == 0
+    del timeout, transfer
+    assert reference() is None
+
+
+def test_timeout_restart_racing_expiry(service):
+    """Test a restart while the service expires the timeout moves the deadline instead of calling back"""
+    timeout, expired, event = make_timeout(service, 0.05)
+    timeout.start()
+    # Hold the timeout lock over its deadline, such that the service expires it while restarting
+    with timeout._Timeout__lock:
+        time.sleep(0.1)
+        timeout._Timeout__deadline = time.monotonic() + 0.1
+    last_restart = time.monotonic()
+    assert event.wait(5)
+    assert expired[0][1] - last_restart >= 0.09
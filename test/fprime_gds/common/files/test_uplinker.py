@@ -0,0 +1,118 @@
+"""
+Tests the windowed file uplink against a flight side handshaking the packets it received
+"""
+import os
+import struct
+import threading
+import time
+
+import pytest
+
+from fprime_gds.common.encoders.file_encoder import FileEncoder
+from fprime_gds.common.files.helpers import FileStates
+from fprime_gds.common.files.uplinker import FileUplinker
+from fprime_gds.common.handlers import DataHandler
+
+
+class Flight(DataHandler):
+    """Flight side receiving the file packets, which are handshaken by the test"""
+
+    def __init__(self):
+        self.pending = []
+        self.received = threading.Event()
+        self.data = {}
+        self.checksum = None
+
+    def data_callback(self, data, sender=None):
+        packet_type, _ = struct.unpack_from(">BI", data, 12)
+        if packet_type == 1:
+            offset, length = struct.unpack_from(">IH", data, 17)
+            self.data[offset] = data[23 : 23 + length]
+        elif packet_type == 2:
+            self.checksum = struct.unpack_from(">I", data, 17)[0]
+        self.pending.append(data)
+        self.received.set()
+
+    def handshake(self, uplinker, count=None):
+        """Wait for packets then handshake count of them, all by default, returning the number outstanding before"""
+        assert self.pending or self.received.wait(5)
+        outstanding = len(self.pending)
+        count = outstanding if count is None else count
+        handshakes, self.pending = self.pending[:count], self.pending[count:]
+        self.received.clear()
+        for packet in handshakes:
+            uplinker.data_callback(packet[8:])
+        return outstanding
+
+
+def reference_checksum(data):
+    """CFDP checksum of the whole file, the sum of its zero padded big-endian 32 bit words"""
+    data += bytes(-len(data) % 4)
+    return sum(struct.unpack(f">{len(data) // 4}I", data)) & 0xFFFFFFFF
+
+
+@pytest.fixture
+def uplink(tmp_path):
+    """Uplinker registered to a flight side, with a source file to uplink"""
+    encoder = FileEncoder()
+    flight = Flight()
+    encoder.register(flight)
+    uplinker = FileUplinker(encoder)
+    source = tmp_path / "source.bin"
+    source.write_bytes(os.urandom(10007))
+    yield uplinker, flight, source
+    # Unblock the queue thread of an uplink left unfinished by a failure
+    if uplinker.state != FileStates.IDLE:
+        uplinker.queue.busy.release()
+    uplinker.exit()
+
+
+def wait_for_state(uplinker, state):
+    """Wait for the uplinked file to reach the state"""
+    deadline = time.monotonic() + 5
+    while uplinker.current_files()[0]["state"] != state and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return uplinker.current_files()[0]["state"]
+
+
+@pytest.mark.parametrize("window,chunk", [(1, 256), (8, 256), (8, 1000), (64, 1000)])
+def test_windowed_uplink(uplink, window, chunk):
+    """Test the window bounds outstanding packets and the file and checksum arrive intact"""
+    uplinker, flight, source = uplink
+    uplinker.window = window
+    uplinker.chunk = chunk
+    content = source.read_bytes()
+    uplinker.enqueue(str(source), "/dest.bin")
+    assert flight.handshake(uplinker) == 1  # START
+    packets = -(-len(content) // chunk)
+    outstanding = []
+    while flight.checksum is None:
+        outstanding.append(flight.handshake(uplinker, 1))
+    # The window fills after START, and is refilled on each handshake until the file was read
+    assert outstanding[0] == min(window, packets)
+    assert max(outstanding) <= window
+    assert flight.handshake(uplinker) == 1  # END
+    assert wait_for_state(uplinker, "FINISHED") == "FINISHED"
+    assert b"".join(flight.data[offset] for offset in sorted(flight.data)) == content
+    assert flight.checksum == reference_checksum(content)
+    assert not source.exists()
+
+
+def test_windowed_uplink_cancel(uplink):
+    """Test a cancel abandons the outstanding packets and ignores their handshakes"""
+    uplinker, flight, source = uplink
+    uplinker.window = 4
+    uplinker.enqueue(str(source), "/dest.bin")
+    flight.handshake(uplinker)  # START
+    assert len(flight.pending) == 4
+    stale = flight.pending[1:]
+    uplinker.cancel()
+    assert flight.handshake(uplinker, 1) == 4
+    cancel = flight.pending[-1]
+    assert struct.unpack_from(">B", cancel, 12)[0] == 3
+    for packet in stale:
+        uplinker.data_callback(packet[8:])
+    assert wait_for_state(uplinker, "CANCELED") == "CANCELED"
+    uplinker.data_callback(cancel[8:])
+    assert uplinker.state == FileStates.IDLE
+    assert not source.exists()
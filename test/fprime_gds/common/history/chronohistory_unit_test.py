@@ -201,6 +201,22 @@ class HistoryTestCases(unittest.TestCase):
         self.cHistory.clear(25)
         assert len(self.cHistory) == 25, "starting history is empty"
 
+    def test_out_of_order_and_time_start(self):
+        temp1 = ChTemplate(1, "Test Channel 1", "Chrono_Hist_Tester", I32Type)
+        times = [5, 1, 3, 3, 9, 0, 7, 2]
+        items = [ChData(I32Type(i), TimeType(2, 0, seconds, 0), temp1) for i, seconds in enumerate(times)]
+        for item in items:
+            self.cHistory.data_callback(item)
+        ordered = self.cHistory.retrieve()
+        assert [item.get_time().seconds for item in ordered] == sorted(times)
+        # Equal times are ordered latest received first
+        assert [item.get_val() for item in ordered[3:5]] == [3, 2]
+        self.assert_lists_equal(ordered[3:], self.cHistory.retrieve(TimeType(2, 0, 3, 0)))
+        self.assert_lists_equal(ordered[5:], self.cHistory.retrieve(TimeType(2, 0, 4, 999999)))
+        self.assert_lists_equal([], self.cHistory.retrieve(TimeType(2, 0, 10, 0)))
+        self.cHistory.clear(TimeType(2, 0, 5, 0))
+        self.assert_lists_equal(ordered[5:], self.cHistory.retrieve())
+
     def test_history_filter(self):
         class is_even(predicates.predicate):
             def __call__(self, item):
@@ -0,0 +1,125 @@
+import unittest
+
+from fprime.common.models.serialize.bool_type import BoolType
+from fprime.common.models.serialize.enum_type import EnumType
+from fprime.common.models.serialize.numerical_types import F32Type, I32Type, U64Type
+from fprime.common.models.serialize.string_type import StringType
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.history.columnar import ColumnarHistory
+from fprime_gds.common.pipeline.histories import Histories
+from fprime_gds.common.templates.ch_template import ChTemplate
+
+ENUM_TYPE = EnumType.construct_type("ColumnarTestEnum", {"OFF": 0, "ON": 7})
+STRING_TYPE = StringType.construct_type("ColumnarTestString", 10)
+
+TEMPLATES = [
+    (ChTemplate(1, "i32", "Columnar_Hist_Tester", I32Type), lambda i: I32Type(-i)),
+    (ChTemplate(2, "f32", "Columnar_Hist_Tester", F32Type), lambda i: F32Type(i + 0.5)),
+    (ChTemplate(3, "u64", "Columnar_Hist_Tester", U64Type), lambda i: U64Type(2**63 + i)),
+    (ChTemplate(4, "bool", "Columnar_Hist_Tester", BoolType), lambda i: BoolType(i % 2 == 0)),
+    (ChTemplate(5, "enum", "Columnar_Hist_Tester", ENUM_TYPE), lambda i: ENUM_TYPE("ON" if i % 2 else "OFF")),
+    (ChTemplate(6, "string", "Columnar_Hist_Tester", STRING_TYPE), lambda i: STRING_TYPE(str(i))),
+]
+
+
+class Coders:
+    """Coders accepting the consumers registered by the histories"""
+
+    def __getattr__(self, name):
+        return lambda consumer: None
+
+
+class ColumnarHistoryTestCases(unittest.TestCase):
+    def setUp(self):
+        self.history = ColumnarHistory(capacity=20)
+
+    @staticmethod
+    def get_range(length):
+        """Build length samples cycling through each of the test channels"""
+        ch_list = []
+        for item in range(length):
+            template, value = TEMPLATES[item % len(TEMPLATES)]
+            ch_list.append(ChData(value(item), TimeType(2, 1, 1000 + item, item), template))
+        return ch_list
+
+    def assert_lists_equal(self, expected, actual):
+        assert len(expected) == len(actual), f"expected {len(expected)} items, but found {len(actual)}"
+        for exp, act in zip(expected, actual):
+            self.assertIs(exp.template, act.template)
+            self.assertEqual(type(exp.val_obj), type(act.val_obj))
+            self.assertEqual(exp.get_val(), act.get_val())
+            self.assertEqual(exp.time.serialize(), act.time.serialize())
+
+    def test_push_and_retrieve(self):
+        self.assert_lists_equal([], self.history.retrieve())
+        items = self.get_range(60)
+        for item in items:
+            self.history.data_callback(item)
+        self.assertEqual(self.history.size(), 60)
+        self.assert_lists_equal(items, self.history.retrieve())
+
+    def test_capacity(self):
+        items = self.get_range(600)
+        for item in items:
+            self.history.data_callback(item)
+        # Each channel retains its last 20 samples
+        self.assertEqual(self.history.size(), 20 * len(TEMPLATES))
+        self.assert_lists_equal(items[-20 * len(TEMPLATES):], self.history.retrieve())
+
+    def test_sessions(self):
+        items = self.get_range(30)
+        for item in items[:10]:
+            self.history.data_callback(item)
+        self.assert_lists_equal(items[:10], self.history.retrieve())
+        # New sessions start at the newest data
+        self.assert_lists_equal([], self.history.retrieve("session"))
+        for item in items[10:]:
+            self.history.data_callback(item)
+        self.assert_lists_equal(items[10:15], self.history.retrieve("session", limit=5))
+        self.assert_lists_equal(items[15:], self.history.retrieve_new())
+        self.assert_lists_equal(items[15:], self.history.retrieve("session"))
+        self.assert_lists_equal([], self.history.retrieve("session"))
+        self.assertEqual(self.history.sessions(), 2)
+
+    def test_clear(self):
+        items = self.get_range(30)
+        self.history.retrieve("old")
+        for item in items:
+            self.history.data_callback(item)
+        self.history.retrieve("session")
+        # Sessions retain everything the oldest session has not seen
+        self.history.clear()
+        self.assertEqual(self.history.size(), 30)
+        self.history.retrieve("old", limit=10)
+        self.history.clear()
+        self.assertEqual(self.history.size(), 20)
+        self.history.clear("old")
+        self.assertEqual(self.history.size(), 0)
+        self.assertEqual(self.history.sessions(), 1)
+
+    def test_clear_time(self):
+        items = self.get_range(12)
+        self.history.set_clear_time(60)
+        self.history.retrieve("stale")
+        self.history.retrieve("active")
+        for item in items:
+            self.history.data_callback(item)
+        self.history.retrieve("active")
+        # Sessions not retrieved for the clear time are forgotten, releasing what only they had not seen
+        self.history.last_request["stale"] -= 120
+        self.history.clear()
+        self.assertEqual(self.history.sessions(), 1)
+        self.assertEqual(self.history.size(), 0)
+
+    def test_histories_capacity(self):
+        histories = Histories()
+        histories.implementation = ColumnarHistory
+        histories.implementation_arguments = {"capacity": 5}
+        histories.setup_histories(Coders())
+        for history in [histories.commands, histories.events, histories.channels]:
+            self.assertIsInstance(history, ColumnarHistory)
+            self.assertEqual(history.capacity, 5)
+
+if __name__ == "__main__":
+    unittest.main()
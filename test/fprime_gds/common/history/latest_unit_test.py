@@ -0,0 +1,51 @@
+import unittest
+
+from fprime.common.models.serialize.numerical_types import U32Type
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.history.latest import LatestValueIndex
+from fprime_gds.common.templates.ch_template import ChTemplate
+
+TEMPLATES = [ChTemplate(ident, f"ch{ident}", "Latest_Index_Tester", U32Type) for ident in range(5)]
+
+
+class LatestValueIndexTestCases(unittest.TestCase):
+    def setUp(self):
+        self.index = LatestValueIndex()
+
+    @staticmethod
+    def sample(ident, value):
+        return ChData(U32Type(value), TimeType(), TEMPLATES[ident])
+
+    def test_latest_values(self):
+        for value in range(20):
+            self.index.data_callback(self.sample(value % 5, value))
+        counter, latest = self.index.retrieve()
+        assert counter == 20
+        assert [item.get_val() for item in latest] == [15, 16, 17, 18, 19]
+        assert self.index.get(2).get_val() == 17
+        assert self.index.get(7) is None
+        assert self.index.size() == 5
+
+    def test_changed_since(self):
+        for value in range(5):
+            self.index.data_callback(self.sample(value, value))
+        counter, _ = self.index.retrieve()
+        assert self.index.retrieve(counter) == (counter, [])
+
+        self.index.data_callback(self.sample(3, 30))
+        self.index.data_callback(self.sample(1, 10))
+        self.index.data_callback(self.sample(3, 31))
+        new_counter, changed = self.index.retrieve(counter)
+        assert new_counter == counter + 3
+        assert [(item.id, item.get_val()) for item in changed] == [(1, 10), (3, 31)]
+
+    def test_counter_from_previous_index(self):
+        self.index.data_callback(self.sample(0, 1))
+        counter, latest = self.index.retrieve(100)
+        assert counter == 1
+        assert len(latest) == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
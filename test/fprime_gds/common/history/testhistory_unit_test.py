@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 import unittest
 
 from fprime_gds.common.history.test import TestHistory
@@ -175,5 +176,15 @@ class HistoryTestCases(unittest.TestCase):
         assert correct_error, "The History should have raised a TypeError"
 
 
+    def test_history_wait_for_update(self):
+        seen = self.tHistory.update_count
+        assert not self.tHistory.wait_for_update(seen, 0.01), "no update should have been seen"
+        timer = threading.Timer(0.01, self.tHistory.data_callback, args=(1,))
+        timer.start()
+        assert self.tHistory.wait_for_update(seen, 5), "the update should have woken the wait"
+        timer.join()
+        assert self.tHistory.update_count == seen + 1
+        self.assert_lists_equal([1], self.tHistory.retrieve_new())
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests the on-disk cache of the dictionaries constructed from XML dictionaries
+"""
+import os
+
+import pytest
+from fprime.common.models.serialize.type_base import DictionaryType
+
+from fprime_gds.common.loaders import dictionary_cache
+from fprime_gds.common.loaders.dictionary_cache import DictionaryCache
+from fprime_gds.common.pipeline.dictionaries import Dictionaries
+
+DICTIONARY = """<dictionary topology="CacheTest" framework_version="3.1.0" project_version="{version}">
+  <enums>
+    <enum type="cacheComp::Mode"><item name="OFF" value="0"/><item name="ON" value="1"/></enum>
+  </enums>
+  <serializables>
+    <serializable type="cacheComp::Status"><members>
+      <member name="mode" type="cacheComp::Mode" format_specifier="%s"/>
+      <member name="count" type="U32" format_specifier="%d"/>
+    </members></serializable>
+  </serializables>
+  <arrays>
+    <array name="cacheComp::Counts" type="U16" size="3" format="%d"><defaults><value>0</value><value>0</value><value>0</value></defaults></array>
+  </arrays>
+  <commands>
+    <command component="cacheComp" mnemonic="SET_MODE" opcode="0x1"><args>
+      <arg name="mode" type="cacheComp::Mode"/><arg name="label" type="string" len="20"/>
+    </args></command>
+  </commands>
+  <events>
+    <event component="cacheComp" name="ModeSet" id="0x1" severity="ACTIVITY_HI" format_string="Mode %s status %s">
+      <args><arg name="mode" type="cacheComp::Mode"/><arg name="status" type="cacheComp::Status"/></args>
+    </event>
+  </events>
+  <channels>
+    <channel component="cacheComp" name="Status" id="1" type="cacheComp::Status"/>
+    <channel component="cacheComp" name="Counts" id="2" type="cacheComp::Counts"/>
+  </channels>
+</dictionary>
+"""
+
+
+@pytest.fixture
+def dictionary(tmp_path, monkeypatch):
+    """XML dictionary path, with the cache in a temporary directory"""
+    monkeypatch.setenv("FPRIME_GDS_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "CacheTestTopologyAppDictionary.xml"
+    path.write_text(DICTIONARY.format(version="1.0.0"))
+    return str(path)
+
+
+def load(path):
+    """Load the dictionaries of the path, building every kind of dictionary"""
+    dictionaries = Dictionaries()
+    dictionaries.load_dictionaries(path, None)
+    for name in ["command_id", "event_id", "channel_id"]:
+        getattr(dictionaries, name)
+    return dictionaries
+
+
+def entries(tmp_path):
+    """Cache entries written"""
+    return sorted(name for name in os.listdir(tmp_path / "cache" / "dictionaries") if name.endswith(".pickle"))
+
+
+def test_warm_load_matches_cold(dictionary, tmp_path, monkeypatch):
+    """Test the cached dictionaries are those parsed, constructing the types in a process without them"""
+    cold = load(dictionary)
+    assert len(entries(tmp_path)) == 3
+    # A new process has not constructed the dictionary types yet
+    monkeypatch.setattr(DictionaryType, "_CONSTRUCTS", {})
+    warm = load(dictionary)
+    assert warm.project_version == cold.project_version == "1.0.0"
+    for name in ["command_name", "event_name", "channel_name"]:
+        assert getattr(warm, name).keys() == getattr(cold, name).keys()
+    status = warm.channel_name["cacheComp.Status"].ch_type_obj
+    mode = warm.command_name["cacheComp.SET_MODE"].arguments[0][2]
+    assert status.MEMBER_LIST[0][1] is mode
+    assert warm.event_name["cacheComp.ModeSet"].get_args()[0][2] is mode
+    assert mode.ENUM_DICT == {"OFF": 0, "ON": 1}
+    assert warm.channel_name["cacheComp.Counts"].ch_type_obj.LENGTH == 3
+    # Values serialize alike with types of either load
+    assert mode("ON").serialize() == cold.command_name["cacheComp.SET_MODE"].arguments[0][2]("ON").serialize()
+
+
+def test_changed_dictionary_invalidates(dictionary, tmp_path):
+    """Test changing the dictionary content loads the new content"""
+    load(dictionary)
+    with open(dictionary, "w") as file_handle:
+        file_handle.write(DICTIONARY.format(version="2.0.0"))
+    assert load(dictionary).project_version == "2.0.0"
+    assert len(entries(tmp_path)) == 6
+
+
+def test_unreadable_entry_ignored(dictionary, tmp_path):
+    """Test a corrupt entry is reparsed rather than failing the load"""
+    load(dictionary)
+    for name in entries(tmp_path):
+        (tmp_path / "cache" / "dictionaries" / name).write_bytes(b"corrupt")
+    assert load(dictionary).command_name["cacheComp.SET_MODE"].mnemonic == "SET_MODE"
+
+
+def test_cache_disabled_and_evicted(dictionary, tmp_path, monkeypatch):
+    """Test an empty cache directory disables the cache and entries beyond the limit are evicted"""
+    monkeypatch.setenv("FPRIME_GDS_CACHE_DIR", "")
+    assert DictionaryCache().directory is None
+    load(dictionary)
+    assert not (tmp_path / "cache").exists()
+    cache = DictionaryCache(str(tmp_path / "cache"))
+    monkeypatch.setattr(DictionaryCache, "LIMIT", 2)
+    for kind in range(4):
+        cache.store(str(kind), dictionary, {"kind": kind})
+    remaining = sorted(name for name in os.listdir(tmp_path / "cache") if name.endswith(".pickle"))
+    assert len(remaining) == 2
+    assert cache.load("3", dictionary) == {"kind": 3}
+
+
+def test_cache_disabled_when_unsupported(dictionary, monkeypatch):
+    """Test the cache is disabled without the package versions keying it or fprime tracking its constructed types"""
+    assert DictionaryCache().directory is not None
+    with monkeypatch.context() as patch:
+        patch.setattr(dictionary_cache, "_package_version", lambda package: None)
+        assert DictionaryCache().directory is None
+    with monkeypatch.context() as patch:
+        patch.delattr(DictionaryType, "_CONSTRUCTS")
+        assert not dictionary_cache.types_picklable()
+        assert DictionaryCache().directory is None
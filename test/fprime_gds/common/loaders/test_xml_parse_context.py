@@ -0,0 +1,115 @@
+"""
+Tests the XML dictionary is parsed once and only the dictionaries used are built
+"""
+import pytest
+
+from fprime_gds.common.loaders import ch_xml_loader, cmd_xml_loader, event_xml_loader
+from fprime_gds.common.loaders.xml_loader import XmlLoader, XmlParseContext
+from fprime_gds.common.pipeline.dictionaries import Dictionaries
+
+DICTIONARY = """<dictionary topology="ContextTest" framework_version="3.1.0" project_version="2.0.0">
+  <enums>
+    <enum type="ctxComp::Mode"><item name="OFF" value="0"/><item name="ON" value="1"/></enum>
+  </enums>
+  <serializables>
+    <serializable type="ctxComp::Status"><members>
+      <member name="mode" type="ctxComp::Mode" format_specifier="%s"/>
+      <member name="count" type="U32" format_specifier="%d"/>
+    </members></serializable>
+  </serializables>
+  <commands>
+    <command component="ctxComp" mnemonic="SET_MODE" opcode="0x1"><args>
+      <arg name="mode" type="ctxComp::Mode"/>
+    </args></command>
+  </commands>
+  <events>
+    <event component="ctxComp" name="ModeSet" id="0x1" severity="ACTIVITY_HI" format_string="Mode %s">
+      <args><arg name="mode" type="ctxComp::Mode"/></args>
+    </event>
+  </events>
+  <channels>
+    <channel component="ctxComp" name="Status" id="1" type="ctxComp::Status"/>
+  </channels>
+</dictionary>
+"""
+
+
+@pytest.fixture
+def dictionary(tmp_path, monkeypatch):
+    """XML dictionary path, with the dictionary cache disabled and the parses counted"""
+    monkeypatch.setenv("FPRIME_GDS_CACHE_DIR", "")
+    parses = []
+    original = XmlLoader.get_xml_tree
+
+    def counting_get_xml_tree(path):
+        parses.append(path)
+        return original(path)
+
+    monkeypatch.setattr(XmlLoader, "get_xml_tree", staticmethod(counting_get_xml_tree))
+    path = tmp_path / "ContextTestTopologyAppDictionary.xml"
+    path.write_text(DICTIONARY)
+    return str(path), parses
+
+
+def test_shared_context_parses_once(dictionary):
+    """Test loaders sharing a context parse the file once and share its types"""
+    path, parses = dictionary
+    context = XmlParseContext(path)
+    loaders = [
+        loader(context)
+        for loader in (cmd_xml_loader.CmdXmlLoader, event_xml_loader.EventXmlLoader, ch_xml_loader.ChXmlLoader)
+    ]
+    commands, events, channels = (loader.get_name_dict(path) for loader in loaders)
+    assert len(parses) == 1
+    mode = commands["ctxComp.SET_MODE"].get_args()[0][2]
+    assert events["ctxComp.ModeSet"].get_args()[0][2] is mode
+    assert list(context.enums) == ["ctxComp::Mode"]
+    assert channels["ctxComp.Status"].get_type_obj() is context.serializable_types["ctxComp::Status"]
+
+
+def test_private_context_per_loader(dictionary):
+    """Test loaders without a shared context parse on their own"""
+    path, parses = dictionary
+    event_xml_loader.EventXmlLoader().get_id_dict(path)
+    ch_xml_loader.ChXmlLoader().get_id_dict(path)
+    assert len(parses) == 2
+
+
+def test_dictionaries_built_once_used(dictionary):
+    """Test Dictionaries parse the file when loaded and only build the kinds of dictionaries used"""
+    path, parses = dictionary
+    dictionaries = Dictionaries()
+    dictionaries.load_dictionaries(path, None)
+    assert len(parses) == 1
+    assert dictionaries.project_version == "2.0.0"
+    assert dictionaries.framework_version == "3.1.0"
+    assert dictionaries._event_id_dict is None
+    assert list(dictionaries.event_id) == [1]
+    assert dictionaries._command_id_dict is None
+    assert dictionaries._channel_id_dict is None
+    assert list(dictionaries.command_name) == ["ctxComp.SET_MODE"]
+    assert list(dictionaries.channel_id) == [1]
+    assert len(parses) == 1
+
+
+def test_malformed_dictionary_fails_load(dictionary):
+    """Test a malformed file fails loading the dictionaries rather than their first use"""
+    path, _ = dictionary
+    with open(path, "a") as file_handle:
+        file_handle.write("<unclosed>")
+    with pytest.raises(Exception, match="unclosed|Extra content"):
+        Dictionaries().load_dictionaries(path, None)
+
+
+def test_cached_dictionaries_not_parsed(dictionary, tmp_path, monkeypatch):
+    """Test a file whose dictionaries are all cached is not parsed when loaded"""
+    path, parses = dictionary
+    monkeypatch.setenv("FPRIME_GDS_CACHE_DIR", str(tmp_path / "cache"))
+    for loader in Dictionaries.XML_LOADERS:
+        loader().get_id_dict(path)
+    parses.clear()
+    dictionaries = Dictionaries()
+    dictionaries.load_dictionaries(path, None)
+    assert not parses
+    assert list(dictionaries.channel_id) == [1]
+    assert not parses
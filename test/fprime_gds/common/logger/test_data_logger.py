@@ -0,0 +1,98 @@
+"""
+Tests the data loggers
+"""
+import logging
+import threading
+import time
+
+from fprime.common.models.serialize.numerical_types import U32Type
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.logger.data_logger import BatchedDataLogger, DataLogger
+from fprime_gds.common.templates.ch_template import ChTemplate
+
+TEMPLATE = ChTemplate(1, "Counter", "Logger_Tester", U32Type)
+
+
+class BlockingChData(ChData):
+    """Channel whose formatting blocks until released"""
+
+    def __init__(self, release):
+        super().__init__(U32Type(0), TimeType(), TEMPLATE)
+        self.release = release
+
+    def get_str(self, time_zone=None, verbose=False, csv=False):
+        self.release.wait()
+        return super().get_str(time_zone, verbose, csv)
+
+
+def feed(logger):
+    """Feed channels and binary data to the logger"""
+    for value in range(100):
+        logger.data_callback(ChData(U32Type(value), TimeType(2, 0, value, 0), TEMPLATE))
+        logger.on_recv(bytearray(b"recv%d" % value))
+        logger.send(b"sent%d" % value, None)
+
+
+def test_batched_logger_matches_logger(tmp_path):
+    """Test that the batched logger writes the same logs as the synchronous logger"""
+    directories = [tmp_path / "sync", tmp_path / "batched"]
+    for directory in directories:
+        directory.mkdir()
+    feed(DataLogger(str(directories[0]), verbose=True, csv=True))
+    batched = BatchedDataLogger(str(directories[1]), verbose=True, csv=True, flush_interval=10)
+    feed(batched)
+    assert batched.flush(timeout=5)
+    assert batched.written == {"telem": 100, "event": 0, "command": 0, "recv": 100, "send": 100}
+    assert batched.dropped == {"telem": 0, "event": 0, "command": 0, "recv": 0, "send": 0}
+    for name in ["channel.log", "recv.bin", "sent.bin"]:
+        assert (directories[0] / name).read_bytes() == (directories[1] / name).read_bytes()
+    batched.close()
+
+
+def test_batched_logger_flush_interval(tmp_path):
+    """Test that pending items are written once the flush interval passes"""
+    batched = BatchedDataLogger(str(tmp_path), flush_interval=0.05, flush_size=1 << 20)
+    batched.on_recv(b"data")
+    deadline = time.monotonic() + 5
+    while batched.written["recv"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert (tmp_path / "recv.bin").read_bytes() == b"data"
+    batched.close()
+
+
+def test_batched_logger_drops_when_full(tmp_path, caplog):
+    """Test that items are dropped and counted rather than blocking when the queue is full"""
+    release = threading.Event()
+    batched = BatchedDataLogger(str(tmp_path), queue_size=1)
+    batched.data_callback(BlockingChData(release))
+    # Wait for the writer to be blocked formatting the first item
+    deadline = time.monotonic() + 5
+    while not batched.queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    batched.on_recv(b"queued")
+    batched.on_recv(b"dropped")
+    assert batched.dropped["recv"] == 1
+    release.set()
+    assert batched.flush(timeout=5)
+    assert (tmp_path / "recv.bin").read_bytes() == b"queued"
+    assert batched.written["telem"] == 1
+    with caplog.at_level(logging.WARNING, logger="data_logger"):
+        batched.close()
+    assert "dropped 1 items with its queue full: recv 1" in caplog.text
+
+
+def test_batched_logger_close(tmp_path):
+    """Test that closing writes the queued items, stops the writer thread and closes the files"""
+    writers = [thread for thread in threading.enumerate() if thread.name == "DataLoggerWriter"]
+    batched = BatchedDataLogger(str(tmp_path), flush_interval=10)
+    feed(batched)
+    batched.close()
+    assert [thread for thread in threading.enumerate() if thread.name == "DataLoggerWriter"] == writers
+    assert batched.f_r.closed and batched.f_telem.closed
+    assert batched.written["recv"] == 100
+    assert (tmp_path / "recv.bin").read_bytes() == b"".join(b"recv%d" % value for value in range(100))
+    # Items received once closed are dropped
+    batched.on_recv(b"late")
+    assert batched.dropped["recv"] == 1
+    batched.close()
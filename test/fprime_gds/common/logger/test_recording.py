@@ -0,0 +1,101 @@
+"""
+Tests the indexed downlink recording
+"""
+import struct
+
+import pytest
+
+from fprime_gds.common.logger import recording
+from fprime_gds.common.pipeline.standard import StandardPipeline
+from fprime_gds.common.utils.config_manager import ConfigManager
+from fprime_gds.common.logger.recording import RecordingFormatException, RecordingLogger, RecordingReader
+from fprime_gds.common.utils.data_desc_type import DataDescType
+
+
+def message(index):
+    """Build a raw telemetry message of varying length"""
+    payload = struct.pack(">I", index) * (1 + index % 3)
+    return struct.pack(">II", len(payload) + 4, DataDescType.FW_PACKET_TELEM.value) + payload
+
+
+@pytest.fixture
+def recorded(tmp_path, monkeypatch):
+    """Record 100 messages received one per second in chunks splitting messages"""
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(recording.time, "time", lambda: float(next(clock)))
+    recorder = RecordingLogger(str(tmp_path), index_interval=8)
+    for index in range(100):
+        data = message(index)
+        recorder.on_recv(data[:5])
+        recorder.on_recv(data[5:])
+    recorder.close()
+    return recorder.path
+
+
+def test_record_and_read(recorded):
+    """Test that every message is recorded with its receive time and descriptor"""
+    with RecordingReader(recorded) as reader:
+        assert len(reader) == 100
+        records = list(reader.records())
+        assert [record.number for record in records] == list(range(100))
+        assert [record.data for record in records] == [message(index) for index in range(100)]
+        # The first half of each message was received at the earlier time
+        assert records[3].time == 1007.0
+        assert all(record.descriptor == DataDescType.FW_PACKET_TELEM.value for record in records)
+        assert len(reader.offsets) == 13
+
+
+def test_seek(recorded):
+    """Test seeking to record numbers and ground times"""
+    with RecordingReader(recorded) as reader:
+        assert [record.number for record in reader.records(37, 41)] == [37, 38, 39, 40]
+        assert reader.seek_time(1007.0) == 3
+        assert reader.seek_time(1006.5) == 3
+        assert reader.seek_time(0) == 0
+        assert reader.seek_time(5000) == 100
+        assert [record.number for record in reader.records_between(1100.0, 1104.0)] == [50, 51]
+
+
+def test_unindexed_and_truncated(recorded, tmp_path):
+    """Test reading without an index and continuing a recording ending with a partial record"""
+    (tmp_path / "recv.rec.idx").unlink()
+    with open(recorded, "ab") as file_handle:
+        file_handle.write(b"\x00\x00")
+    with RecordingReader(recorded, index_interval=8) as reader:
+        assert len(reader) == 100
+        assert reader.seek_time(1007.0) == 3
+
+    recorder = RecordingLogger(str(tmp_path), index_interval=8)
+    recorder.on_recv(message(100))
+    recorder.close()
+    with RecordingReader(recorded) as reader:
+        assert len(reader) == 101
+        assert list(reader.records(100))[0].data == message(100)
+
+
+def test_not_a_recording(tmp_path):
+    """Test that other files are rejected"""
+    path = tmp_path / "recv.bin"
+    path.write_bytes(b"raw downlink bytes")
+    with pytest.raises(RecordingFormatException):
+        RecordingReader(str(path))
+
+
+@pytest.mark.parametrize("record_downlink", [False, True])
+def test_pipeline_records_when_enabled(tmp_path, monkeypatch, record_downlink):
+    """Test the standard pipeline only records the downlink when enabled, closing the recording on disconnect"""
+    monkeypatch.setenv("FPRIME_GDS_CACHE_DIR", "")
+    dictionary = tmp_path / "RecordTestTopologyAppDictionary.xml"
+    dictionary.write_text(
+        '<dictionary topology="RecordTest" framework_version="3.1.0" project_version="1.0.0">'
+        "<commands/><events/><channels/></dictionary>"
+    )
+    pipeline = StandardPipeline()
+    pipeline.record_downlink = record_downlink
+    pipeline.setup(ConfigManager.get_instance(), str(dictionary), str(tmp_path), logging_prefix=str(tmp_path))
+    try:
+        assert (pipeline.recorder is not None) == record_downlink
+        assert (tmp_path / "recv.rec").exists() == record_downlink
+    finally:
+        pipeline.disconnect()
+    assert pipeline.recorder is None or pipeline.recorder.f_rec.closed
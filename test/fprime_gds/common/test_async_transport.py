@@ -0,0 +1,113 @@
+"""
+Tests the event loop transport clients
+"""
+import socket
+import threading
+import time
+
+import pytest
+import zmq
+
+from fprime_gds.common.async_transport import AsyncTCPSocketClient, AsyncZmqClient, EventLoopThread
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.common.transport import RoutingTag
+
+
+class Collector(DataHandler):
+    """Registrant collecting the batches dispatched by a client"""
+
+    def __init__(self):
+        self.batches = []
+        self.event = threading.Event()
+
+    def data_callback(self, data, sender=None):
+        assert isinstance(data, bytes)
+        self.batches.append(data)
+        self.event.set()
+
+    def wait_for(self, size, timeout=5.0, ignore=None):
+        """Wait for size bytes to be collected, not counting occurrences of ignore, returning them without ignore"""
+        deadline = time.monotonic() + timeout
+        while True:
+            data = b"".join(self.batches)
+            data = data if ignore is None else data.replace(ignore, b"")
+            if len(data) >= size or time.monotonic() > deadline:
+                return data
+            self.event.wait(0.05)
+            self.event.clear()
+
+
+@pytest.fixture
+def loop_thread():
+    """Event loop thread private to the test"""
+    thread = EventLoopThread()
+    yield thread
+    thread.stop()
+
+
+def test_tcp_client(loop_thread):
+    """Test the tcp client registers, dispatches received data in batches and sends with routing headers"""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    data = bytes(range(256)) * 1000
+
+    clients = [AsyncTCPSocketClient(loop_thread, buffer_size=4096) for _ in range(2)]
+    collectors = [Collector() for _ in clients]
+    connections = []
+    for client, collector in zip(clients, collectors):
+        client.register(collector)
+        client.connect(f"tcp://127.0.0.1:{server.getsockname()[1]}", RoutingTag.GUI, RoutingTag.FSW)
+        connection, _ = server.accept()
+        connections.append(connection)
+        assert connection.recv(100) == b"Register GUI\n"
+    for connection in connections:
+        for offset in range(0, len(data), 1000):
+            connection.sendall(data[offset : offset + 1000])
+    for collector in collectors:
+        assert collector.wait_for(len(data)) == data
+        assert max(len(batch) for batch in collector.batches) <= 4096
+    clients[0].send(b"hello")
+    assert connections[0].recv(100) == b"A5A5 FSW hello"
+    for client, connection in zip(clients, connections):
+        client.disconnect()
+        connection.close()
+    server.close()
+
+
+def test_zmq_client(loop_thread, tmp_path):
+    """Test the zmq client drains messages into batches without topics and sends with its topic"""
+    urls = (f"ipc://{tmp_path}/in", f"ipc://{tmp_path}/out")
+    context = zmq.Context()
+    server_in = context.socket(zmq.SUB)
+    server_in.setsockopt(zmq.SUBSCRIBE, b"")
+    server_in.bind(urls[0])
+    server_out = context.socket(zmq.PUB)
+    server_out.bind(urls[1])
+
+    client = AsyncZmqClient(loop_thread)
+    collector = Collector()
+    client.register(collector)
+    client.connect(urls, RoutingTag.GUI, RoutingTag.FSW)
+    # Wait out the subscription handshake
+    while not collector.batches:
+        server_out.send(b"GUIready")
+        collector.event.wait(0.05)
+    for index in range(100):
+        server_out.send(b"GUI%d," % index)
+        server_out.send(b"FSW ignored")
+    expected = b"".join(b"%d," % index for index in range(100))
+    assert collector.wait_for(len(expected), ignore=b"ready") == expected
+
+    # Wait out the subscription handshake of the sending direction likewise
+    while not server_in.poll(50):
+        client.send(b"ZZZZready")
+    while server_in.poll(50):
+        assert server_in.recv() == b"FSWready"
+    client.send(b"ZZZZcommand")
+    assert server_in.poll(5000)
+    assert server_in.recv() == b"FSWcommand"
+    client.disconnect()
+    server_in.close()
+    server_out.close()
+    context.term()
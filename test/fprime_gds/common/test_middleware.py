@@ -0,0 +1,204 @@
+"""
+Tests the event loop middleware server
+"""
+import json
+import socket
+import struct
+import threading
+
+import pytest
+
+from fprime_gds.common.middleware import MiddlewareClient, MiddlewareServer
+
+
+def receive(sock, size):
+    """Receive exactly size bytes"""
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        assert chunk, "Connection closed"
+        data += chunk
+    return data
+
+
+def list_clients(sock, last):
+    """Request the names of the registered clients, up to the client last registered"""
+    sock.sendall(b"List\n")
+    names = []
+    while not names or names[-1] != b"List " + last:
+        (size,) = struct.unpack("i", receive(sock, 4))
+        names.append(receive(sock, size))
+    return names
+
+
+def connect(server, name, registered):
+    """Connect and register a client, waiting for the registration as registered"""
+    sock = socket.create_connection(server.server_address)
+    sock.settimeout(5)
+    sock.sendall(b"Register %s\n" % name)
+    list_clients(sock, registered)
+    return sock
+
+
+class FakeSocket:
+    """Socket accepting a set number of bytes per sendmsg"""
+
+    def __init__(self):
+        self.accept = 0
+        self.data = b""
+
+    def sendmsg(self, buffers):
+        data = b"".join(buffers)[: self.accept]
+        self.data += data
+        if not data:
+            raise BlockingIOError()
+        return len(data)
+
+
+@pytest.fixture
+def server(request):
+    """Middleware server running on a thread, given the limits of the test parameter"""
+    server = MiddlewareServer(("127.0.0.1", 0), **getattr(request, "param", {}))
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def test_routing(server):
+    """Test messages are routed to all clients of their destination, whatever their fragmentation"""
+    fsw = connect(server, b"FSW", b"FSW_0")
+    guis = [connect(server, b"GUI", b"GUI_%d" % index) for index in range(2)]
+    assert list_clients(guis[0], b"GUI_1") == [b"List FSW_0", b"List GUI_0", b"List GUI_1"]
+
+    packets = [struct.pack(">I", 100 + index) + bytes([index]) * (100 + index) for index in range(50)]
+    stream = b"".join(b"A5A5 GUI " + packet for packet in packets)
+    for offset in range(0, len(stream), 7):
+        fsw.sendall(stream[offset : offset + 7])
+    for gui in guis:
+        assert receive(gui, len(b"".join(packets))) == b"".join(packets)
+
+    command = b"ZZZZ" + struct.pack(">I", 5) + b"hello"
+    guis[1].sendall(b"A5A5 FSW " + command)
+    assert receive(fsw, len(command)) == command
+
+    datagram = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    datagram.sendto(b"A5A5 GUI " + packets[0], server.server_address)
+    for gui in guis:
+        assert receive(gui, len(packets[0])) == packets[0]
+
+    # Closed clients are no longer routed to
+    guis[0].close()
+    fsw.sendall(b"A5A5 GUI " + packets[1])
+    assert receive(guis[1], len(packets[1])) == packets[1]
+    for sock in [fsw, guis[1], datagram]:
+        sock.close()
+
+
+def test_slow_client(server):
+    """Test messages are buffered for clients not keeping up, without holding up other clients"""
+    fsw = connect(server, b"FSW", b"FSW_0")
+    slow = connect(server, b"GUI", b"GUI_0")
+    fast = connect(server, b"GUI", b"GUI_1")
+    packet = struct.pack(">I", 60000) + bytes(60000)
+    for _ in range(100):
+        fsw.sendall(b"A5A5 GUI " + packet)
+        assert receive(fast, len(packet)) == packet
+    assert receive(slow, len(packet) * 100) == packet * 100
+    for sock in [fsw, slow, fast]:
+        sock.close()
+
+
+def test_quit(server):
+    """Test quit is acknowledged and stops the server"""
+    gui = connect(server, b"GUI", b"GUI_0")
+    gui.sendall(b"Quit\n")
+    assert receive(gui, 4) == struct.pack(">I", 0xA5A5A5A5)
+    gui.close()
+
+
+@pytest.mark.parametrize(
+    "policy, kept, accepted",
+    [("drop-oldest", [b"c", b"d", b"e"], True), ("drop-newest", [b"a", b"b", b"c"], True), ("disconnect", [], False)],
+)
+def test_overflow_policy(policy, kept, accepted):
+    """Test the overflow policies once the message limit is reached"""
+    client = MiddlewareClient(FakeSocket(), ("127.0.0.1", 0), max_messages=3, policy=policy)
+    results = [client.queue(message) for message in [b"a", b"b", b"c", b"d", b"e"]]
+    assert results[-1] == accepted
+    if accepted:
+        assert list(client.outbuf) == kept
+        assert client.dropped_messages == 2
+        assert client.statistics()["queued_messages"] == (5 if policy == "drop-oldest" else 3)
+
+
+def test_drop_oldest_keeps_partial_message():
+    """Test dropping the oldest messages never drops a partially sent message"""
+    sock = FakeSocket()
+    client = MiddlewareClient(sock, ("127.0.0.1", 0), max_bytes=12)
+    for message in [b"1111", b"2222", b"3333"]:
+        client.queue(message)
+    sock.accept = 2
+    assert not client.flush()
+    client.queue(b"4444")
+    client.queue(b"5555")
+    sock.accept = 100
+    assert client.flush()
+    assert sock.data == b"1111" + b"4444" + b"5555"
+    counters = client.statistics()
+    assert counters["sent_messages"] == 3
+    assert counters["sent_bytes"] == 12
+    assert counters["dropped_messages"] == 2
+    assert counters["pending_bytes"] == 0
+
+
+def test_drop_report_rate_limited():
+    """Test drops are reported as they start, then at most once per interval and when forced"""
+    client = MiddlewareClient(FakeSocket(), ("127.0.0.1", 0), max_messages=1)
+    client.name = b"GUI_0"
+    assert client.drop_report() is None
+    for message in [b"a", b"bb", b"ccc"]:
+        client.queue(message)
+    assert client.drop_report() == "Client GUI_0 overflowed its output buffer, dropped 2 messages (3 bytes), 2 in total."
+    client.queue(b"dddd")
+    assert client.drop_report() is None
+    assert client.drop_report(force=True) == (
+        "Client GUI_0 overflowed its output buffer, dropped 1 messages (3 bytes), 3 in total."
+    )
+    assert client.drop_report(force=True) is None
+
+
+@pytest.mark.parametrize("server", [{"max_bytes": 1024 * 1024}], indirect=True)
+def test_slow_client_dropped(server):
+    """Test a stalled client drops messages, whole, without holding up other clients and reports it in its counters"""
+    fsw = connect(server, b"FSW", b"FSW_0")
+    stalled = connect(server, b"GUI", b"GUI_0")
+    fast = connect(server, b"GUI", b"GUI_1")
+    packets = [struct.pack(">II", 60004, index) + bytes(60000) for index in range(300)]
+    for packet in packets:
+        fsw.sendall(b"A5A5 GUI " + packet)
+        assert receive(fast, len(packet)) == packet
+
+    fsw.sendall(b"Stat\n")
+    (size,) = struct.unpack(">I", receive(fsw, 4))
+    counters = json.loads(receive(fsw, size))
+    assert counters["GUI_1"]["dropped_messages"] == 0
+    # Sent messages include the three List replies awaited by connect
+    assert counters["GUI_1"]["sent_messages"] == len(packets) + 3
+    assert counters["GUI_0"]["dropped_messages"] > 0
+    assert counters["GUI_0"]["pending_bytes"] <= 1024 * 1024
+
+    # The stalled client receives whole messages, the latest ones
+    expected = len(packets) - counters["GUI_0"]["dropped_messages"]
+    indices = []
+    for _ in range(expected):
+        size, index = struct.unpack(">II", receive(stalled, 8))
+        assert size == 60004
+        assert receive(stalled, 60000) == bytes(60000)
+        indices.append(index)
+    assert indices == sorted(indices)
+    assert indices[-1] == len(packets) - 1
+    for sock in [fsw, stalled, fast]:
+        sock.close()
@@ -0,0 +1,107 @@
+"""
+Tests the ZeroMQ transport between the ground handler and the GDS client
+"""
+import struct
+import threading
+import time
+
+import pytest
+
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.common.transport import RoutingTag
+from fprime_gds.common.zmq_transport import ZmqClient, ZmqGround
+
+
+class Collector(DataHandler):
+    """Registrant collecting the data dispatched by a client"""
+
+    def __init__(self):
+        self.chunks = []
+        self.event = threading.Event()
+
+    def data_callback(self, data, sender=None):
+        assert isinstance(data, bytes)
+        self.chunks.append(data)
+        self.event.set()
+
+    def wait_for(self, size, timeout=5.0, ignore=None):
+        """Wait for size bytes to be collected, not counting occurrences of ignore, returning them without ignore"""
+        deadline = time.monotonic() + timeout
+        while True:
+            data = b"".join(self.chunks)
+            data = data if ignore is None else data.replace(ignore, b"")
+            if len(data) >= size or time.monotonic() > deadline:
+                return data
+            self.event.wait(0.05)
+            self.event.clear()
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_ground_to_client(tmp_path, batched):
+    """Test packets sent by the ground handler reach the client with sizes, and commands reach the ground handler"""
+    urls = [f"ipc://{tmp_path}/in", f"ipc://{tmp_path}/out"]
+    ground = ZmqGround(urls, batched)
+    ground.make_server()
+    assert ground.open()
+    ground.receive_all()  # Binds the incoming socket
+    ground.send_all([])  # Binds the outgoing socket
+
+    client = ZmqClient(batched)
+    collector = Collector()
+    client.register(collector)
+    client.connect(urls, RoutingTag.GUI, RoutingTag.FSW)
+    # Wait out the subscription handshake with an empty packet, carrying only its size
+    while not collector.chunks:
+        ground.send_all([b""])
+        collector.event.wait(0.05)
+
+    packets = [b"packet%d" % index for index in range(1000)]
+    for offset in range(0, len(packets), 100):
+        ground.send_all(packets[offset : offset + 100])
+    expected = b"".join(struct.pack(">I", len(packet)) + packet for packet in packets)
+    assert collector.wait_for(len(expected), ignore=struct.pack(">I", 0)) == expected
+    if batched:
+        assert len(collector.chunks) < len(packets)
+
+    # Wait out the subscription handshake of the uplink direction likewise
+    commands = []
+    while not commands:
+        client.send(b"ZZZZ" + struct.pack(">I", 0))
+        commands = ground.receive_all()
+    commands = []
+    for index in range(3):
+        client.send(b"ZZZZ" + struct.pack(">I", 8) + b"command%d" % index)
+    deadline = time.monotonic() + 5
+    while len(commands) < 3 and time.monotonic() < deadline:
+        commands.extend(command for command in ground.receive_all() if command)
+    assert commands == [b"command%d" % index for index in range(3)]
+
+    client.disconnect()
+    ground.close()
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_batch_mode_mismatch(tmp_path, batched, caplog):
+    """Test messages of a peer in the other batch mode are dropped with an error, keeping the receive thread alive"""
+    urls = [f"ipc://{tmp_path}/in", f"ipc://{tmp_path}/out"]
+    ground = ZmqGround(urls, not batched)
+    ground.make_server()
+    assert ground.open()
+    ground.receive_all()
+    ground.send_all([])
+
+    client = ZmqClient(batched)
+    collector = Collector()
+    client.register(collector)
+    client.connect(urls, RoutingTag.GUI, RoutingTag.FSW)
+    deadline = time.monotonic() + 5
+    while not client.zmq.mismatches and time.monotonic() < deadline:
+        ground.send_all([b"packet"])
+        time.sleep(0.05)
+    assert client.zmq.mismatches
+    assert "ZMQ batch mode mismatch" in caplog.text
+    assert collector.chunks == []
+    assert "TTSReceiverThread" in [thread.name for thread in threading.enumerate()]
+
+    client.disconnect()
+    ground.close()
@@ -192,6 +192,34 @@ class APITestCases(unittest.TestCase):
             result is None
         ), f"The search should have returned None, but found {result}"
 
+    def test_find_history_item_fractional_timeout(self):
+        pred = predicates.equal_to(5)
+        self.fill_history_async(self.tHistory.data_callback, range(10), 0.01)
+        start = time.monotonic()
+        result = self.api.find_history_item(pred, self.tHistory, timeout=0.5)
+        assert result == 5, f"The search should have returned 5, but found {result}"
+        assert time.monotonic() - start < 0.5, "The search should have woken on the arriving item"
+
+        pred = predicates.equal_to(100)
+        start = time.monotonic()
+        result = self.api.find_history_item(pred, self.tHistory, timeout=0.25)
+        elapsed = time.monotonic() - start
+        assert result is None, f"The search should have returned None, but found {result}"
+        assert 0.25 <= elapsed < 1, f"The search should have timed out after 0.25 s, but took {elapsed} s"
+
+    def test_find_history_item_from_thread(self):
+        results = []
+        pred = predicates.equal_to(25)
+
+        def search():
+            results.append(self.api.find_history_item(pred, self.tHistory, timeout=2))
+
+        searcher = threading.Thread(target=search, name="SearchFromThread")
+        searcher.start()
+        self.fill_history(self.tHistory.data_callback, range(50), 0.001)
+        searcher.join()
+        assert results == [25], f"The threaded search should have returned 25, but found {results}"
+
     def test_find_history_item_timeout(self):
         pred = predicates.equal_to(25)
 
@@ -727,7 +755,8 @@ class APITestCases(unittest.TestCase):
 
         self.api.clear_histories()
 
-        t1 = self.fill_history_async(self.pipeline.enqueue_telemetry, count_seq, 0.05)
+        # Searches wake on each update, so Counter 19 must arrive well after the timeout for the search to fail
+        t1 = self.fill_history_async(self.pipeline.enqueue_telemetry, count_seq, 0.07)
         t2 = self.fill_history_async(self.pipeline.enqueue_telemetry, sin_seq, 0.01)
         results = self.api.await_telemetry_sequence(search_seq, timeout=1)
         assert len(results) < len(
@@ -6,7 +6,7 @@ Tests format_string util
 """
 
 import unittest
-from fprime_gds.common.utils.string_util import format_string_template
+from fprime_gds.common.utils.string_util import compile_template, format_string_template
 
 
 class TestFormatString(unittest.TestCase):
@@ -123,6 +123,23 @@ class TestFormatString(unittest.TestCase):
         actual = format_string_template(template, values)
         self.assertEqual(expected, actual)
 
+    def test_format_compiled_once(self):
+        template = "Cached template %d of %s"
+        compile_template.cache_clear()
+        for i in range(10):
+            self.assertEqual(f"Cached template {i} of all", format_string_template(template, (i, "all")))
+        info = compile_template.cache_info()
+        self.assertEqual(1, info.misses)
+        self.assertEqual(9, info.hits)
+
+    def test_format_int_fallback_cached(self):
+        template = "State %d"
+        compile_template.cache_clear()
+        for _ in range(2):
+            with self.assertLogs("string_util_logger", level="WARNING"):
+                self.assertEqual("State ON", format_string_template(template, "ON"))
+        self.assertEqual(1, compile_template.cache_info().misses)
+
 
 if __name__ == "__main__":
     unittest.main()
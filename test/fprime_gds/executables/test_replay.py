@@ -0,0 +1,176 @@
+"""
+Tests the replay of downlink recordings
+"""
+import json
+import struct
+import sys
+
+import pytest
+
+from fprime_gds.common.decoders.decoder import Decoder, DecodingException
+from fprime_gds.common.distributor.distributor import Distributor
+from fprime_gds.common.handlers import DataHandler
+from fprime_gds.common.logger import recording
+from fprime_gds.common.logger.recording import RecordingLogger
+from fprime_gds.common.utils.data_desc_type import DataDescType
+from fprime_gds.executables.replay import (
+    DistributorSink,
+    GroundSink,
+    Replayer,
+    ReplayStatistics,
+    is_indexed_recording,
+    main,
+    read_indexed,
+    read_raw,
+)
+
+
+def message(index, descriptor=DataDescType.FW_PACKET_TELEM):
+    """Build a raw message carrying its index"""
+    payload = struct.pack(">I", index)
+    return struct.pack(">II", len(payload) + 4, descriptor.value) + payload
+
+
+class IndexDecoder(Decoder):
+    """Decoder producing the index of a message, failing on indices divisible by 10"""
+
+    def decode_api(self, data):
+        (index,) = struct.unpack(">I", data)
+        if index % 10 == 0:
+            raise DecodingException(f"Bad index {index}")
+        return [index]
+
+
+class Collector(DataHandler):
+    """Consumer collecting decoded items"""
+
+    def __init__(self):
+        self.items = []
+
+    def data_callback(self, data, sender=None):
+        self.items.append(data)
+
+
+class FakeClock:
+    """Clock advanced only by sleeping"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def recorded(tmp_path, monkeypatch):
+    """Record 30 messages, three per second, every tenth a command the pipeline cannot decode"""
+    clock = iter(range(100))
+    monkeypatch.setattr(recording.time, "time", lambda: 1000.0 + next(clock) // 3)
+    recorder = RecordingLogger(str(tmp_path))
+    for index in range(30):
+        descriptor = DataDescType.FW_PACKET_COMMAND if index % 10 == 5 else DataDescType.FW_PACKET_TELEM
+        recorder.on_recv(message(index, descriptor))
+    recorder.close()
+    return recorder.path
+
+
+def build_sink(statistics):
+    """Build a distributor sink decoding telemetry with an IndexDecoder"""
+    distributor = Distributor()
+    decoder = IndexDecoder()
+    collector = Collector()
+    decoder.register(collector)
+    distributor.register("FW_PACKET_TELEM", decoder)
+    return DistributorSink(distributor, {"FW_PACKET_TELEM": decoder}, statistics), collector
+
+
+def test_replay_as_fast_as_possible(recorded):
+    """Test replaying a recording into a distributor counts decoded and dropped messages"""
+    assert is_indexed_recording(recorded)
+    statistics = ReplayStatistics()
+    sink, collector = build_sink(statistics)
+    Replayer(sink, statistics, speed=0).run(read_indexed(recorded))
+    assert collector.items == [index for index in range(30) if index % 10 not in (0, 5)]
+    assert statistics.messages == 30
+    assert statistics.bytes == 30 * 12
+    assert statistics.batches == 1
+    assert statistics.items == 24
+    assert statistics.decode_errors == 3
+    assert statistics.undecoded == 3
+    assert statistics.descriptors == {"FW_PACKET_TELEM": 27, "FW_PACKET_COMMAND": 3}
+    assert statistics.to_dict()["dropped"] == {"decode_errors": 3, "undecoded": 3, "truncated_bytes": 0}
+    assert "Replayed 30 messages" in str(statistics)
+
+
+def test_replay_paced(recorded):
+    """Test messages are sent at the recorded times scaled by the speed, batching messages due together"""
+    statistics = ReplayStatistics()
+    sink, collector = build_sink(statistics)
+    clock = FakeClock()
+    Replayer(sink, statistics, speed=2.0, clock=clock.clock, sleep=clock.sleep).run(read_indexed(recorded, start=2.0))
+    # Records from the third second onward, one batch per recorded second spaced by half a second
+    assert collector.items[0] == 6
+    assert statistics.messages == 24
+    assert statistics.batches == 8
+    assert clock.sleeps == [0.5] * 7
+    assert statistics.elapsed == 3.5
+    assert statistics.to_dict()["achieved_speed"] == 2.0
+
+
+def test_replay_limited_batches(recorded):
+    """Test batches are limited in size"""
+    statistics = ReplayStatistics()
+    sink, _ = build_sink(statistics)
+    Replayer(sink, statistics, speed=0, batch_bytes=36).run(read_indexed(recorded, end=5.0))
+    assert statistics.messages == 15
+    assert statistics.batches == 5
+
+
+def test_read_raw(tmp_path):
+    """Test raw recordings are split into messages and truncated data is counted"""
+    path = tmp_path / "recv.bin"
+    path.write_bytes(b"".join(message(index) for index in range(5)) + message(5)[:7])
+    assert not is_indexed_recording(str(path))
+    statistics = ReplayStatistics()
+    messages = list(read_raw(str(path), statistics=statistics))
+    assert messages == [(None, DataDescType.FW_PACKET_TELEM.value, message(index)) for index in range(5)]
+    assert statistics.truncated_bytes == 7
+
+
+def test_ground_sink():
+    """Test the ground sink sends packets without their length, which ground handlers add"""
+
+    class FakeGround:
+        def __init__(self):
+            self.frames = []
+
+        def send_all(self, frames):
+            self.frames.extend(frames)
+
+    ground = FakeGround()
+    sink = GroundSink(ground)
+    sink.send([(DataDescType.FW_PACKET_TELEM.value, message(3))])
+    assert ground.frames == [message(3)[4:]]
+
+
+def test_raw_replayed_unpaced_by_default(tmp_path, monkeypatch):
+    """Test a raw recording replays as fast as possible without --speed, and is rejected with a pacing speed"""
+    monkeypatch.setenv("FPRIME_GDS_CACHE_DIR", "")
+    path = tmp_path / "recv.bin"
+    path.write_bytes(b"".join(message(index) for index in range(5)))
+    dictionary = tmp_path / "ReplayTestTopologyAppDictionary.xml"
+    dictionary.write_text(
+        '<dictionary topology="ReplayTest" framework_version="3.1.0" project_version="1.0.0">'
+        "<commands/><events/><channels/></dictionary>"
+    )
+    arguments = ["fprime-replay", str(path), "--dictionary", str(dictionary), "--json", str(tmp_path / "stats.json")]
+    monkeypatch.setattr(sys, "argv", arguments)
+    assert main() == 0
+    assert json.loads((tmp_path / "stats.json").read_text())["messages"] == 5
+    monkeypatch.setattr(sys, "argv", arguments + ["--speed", "1"])
+    assert main() == -1
@@ -0,0 +1,123 @@
+"""
+Tests the executables import only what their startup needs, and the --startup-profile breakdown
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from fprime_gds.executables.startup_profile import StartupProfile
+
+# Modules only the subcommands or the launched processes need
+HEAVY_MODULES = [
+    "flask",
+    "lxml",
+    "openpyxl",
+    "zmq",
+    "webbrowser",
+    "argcomplete",
+    "fprime_gds.common.gds_cli",
+    "fprime_gds.common.pipeline",
+    "fprime_gds.common.testing_fw",
+]
+
+DICTIONARY = """<dictionary topology="StartupTest" framework_version="3.1.0" project_version="1.0.0">
+  <events>
+    <event component="startComp" name="Started" id="0x1" severity="ACTIVITY_HI" format_string="Started"><args/></event>
+  </events>
+</dictionary>
+"""
+
+
+def imported_modules(module):
+    """Import the module in a fresh interpreter, returning the names of all modules imported along with it"""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout))
+
+
+def heavy_modules(modules):
+    """Heavy modules, or their submodules, among the given module names"""
+    return sorted(name for name in modules for prefix in HEAVY_MODULES if name == prefix or name.startswith(f"{prefix}."))
+
+
+@pytest.mark.parametrize(
+    "module", ["fprime_gds.executables.fprime_cli", "fprime_gds.executables.run_deployment"]
+)
+def test_entry_point_skips_heavy_modules(module):
+    """Test the entry points import none of the heavy dependencies"""
+    modules = imported_modules(module)
+    assert module in modules
+    assert heavy_modules(modules) == []
+
+
+def test_subcommand_skips_unused_dependencies():
+    """Test a subcommand imports neither the test log workbook nor the xml parser before needing them"""
+    modules = imported_modules("fprime_gds.common.gds_cli.events")
+    assert "openpyxl" not in modules
+    assert "lxml" not in modules
+
+
+def test_profile_times_phases_and_imports(tmp_path, monkeypatch):
+    """Test the profile times phases and the imports, nested imports counting towards the importing module"""
+    (tmp_path / "startup_outer.py").write_text("import time\nimport startup_inner\ntime.sleep(0.02)\n")
+    (tmp_path / "startup_inner.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profile = StartupProfile(enabled=True)
+    try:
+        with profile.phase("import modules"):
+            import startup_outer  # noqa: F401
+    finally:
+        profile.stop()
+        sys.modules.pop("startup_outer", None)
+        sys.modules.pop("startup_inner", None)
+    outer, outer_self = profile.imports["startup_outer"]
+    inner, inner_self = profile.imports["startup_inner"]
+    assert inner >= 0.05 and inner_self == pytest.approx(inner, abs=0.005)
+    assert outer >= inner + 0.02 and outer_self == pytest.approx(outer - inner, abs=0.005)
+    output = io.StringIO()
+    profile.report(file=output)
+    assert "import modules" in output.getvalue()
+    assert output.getvalue().index("startup_outer") < output.getvalue().index("startup_inner")
+
+
+def test_profile_disabled_reports_nothing():
+    """Test a profile without the flag neither hooks imports nor reports"""
+    meta_path = list(sys.meta_path)
+    profile = StartupProfile.from_arguments(["fprime-cli", "events"])
+    assert sys.meta_path == meta_path
+    output = io.StringIO()
+    profile.report(file=output)
+    assert output.getvalue() == ""
+
+
+def test_cli_startup_profile(tmp_path):
+    """Test fprime-cli prints the startup profile after running the command"""
+    dictionary = tmp_path / "StartupTestTopologyAppDictionary.xml"
+    dictionary.write_text(DICTIONARY)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "fprime_gds.executables.fprime_cli",
+            "--startup-profile",
+            "events",
+            "--list",
+            "--dictionary",
+            str(dictionary),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ, FPRIME_GDS_CACHE_DIR=""),
+    )
+    assert "startComp.Started" in result.stdout
+    for phase in ["parse arguments", "run command", "fprime_gds.common.gds_cli.events"]:
+        assert phase in result.stderr
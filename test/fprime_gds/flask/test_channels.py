@@ -0,0 +1,37 @@
+"""
+Tests the latest channel value endpoint
+"""
+import flask
+import flask_restful
+
+from fprime.common.models.serialize.numerical_types import U32Type
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.ch_data import ChData
+from fprime_gds.common.history.latest import LatestValueIndex
+from fprime_gds.common.templates.ch_template import ChTemplate
+from fprime_gds.flask.channels import ChannelLatest
+from fprime_gds.flask.json import GDSJsonEncoder
+
+
+def test_channel_latest_endpoint():
+    """Test that only the channels changed since the supplied counter are returned"""
+    templates = [ChTemplate(ident, f"ch{ident}", "Latest_Endpoint_Tester", U32Type, "%d") for ident in range(3)]
+    index = LatestValueIndex()
+    app = flask.Flask(__name__)
+    app.json_encoder = GDSJsonEncoder
+    app.config["RESTFUL_JSON"] = {"cls": app.json_encoder}
+    api = flask_restful.Api(app)
+    api.add_resource(ChannelLatest, "/channels/latest", resource_class_args=[index])
+    client = app.test_client()
+
+    for value in range(6):
+        index.data_callback(ChData(U32Type(value), TimeType(), templates[value % 3]))
+    response = client.get("/channels/latest").get_json()
+    assert response["counter"] == 6
+    assert [item["val"] for item in response["history"]] == [3, 4, 5]
+    assert response["history"][0]["display_text"] == "3"
+
+    index.data_callback(ChData(U32Type(10), TimeType(), templates[1]))
+    response = client.get(f"/channels/latest?since={response['counter']}").get_json()
+    assert response["counter"] == 7
+    assert [(item["id"], item["val"]) for item in response["history"]] == [(1, 10)]
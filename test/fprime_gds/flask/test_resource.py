@@ -0,0 +1,47 @@
+"""
+Tests the history resources serving cached JSON
+"""
+import flask
+import flask_restful
+
+from fprime.common.models.serialize.numerical_types import U32Type
+from fprime.common.models.serialize.time_type import TimeType
+from fprime_gds.common.data_types.event_data import EventData
+from fprime_gds.common.history.ram import RamHistory
+from fprime_gds.common.templates.event_template import EventTemplate
+from fprime_gds.common.utils.event_severity import EventSeverity
+from fprime_gds.flask.events import EventHistory
+from fprime_gds.flask.json import JSON_CACHE_ATTRIBUTE, GDSJsonEncoder
+
+
+def test_event_history_cached_json():
+    """Test that events are served to every session while being encoded once"""
+    template = EventTemplate(
+        1, "Counted", "Resource_Tester", [("count", None, U32Type)], EventSeverity.ACTIVITY_HI, "Count %d"
+    )
+    history = RamHistory()
+    app = flask.Flask(__name__)
+    app.json_encoder = GDSJsonEncoder
+    api = flask_restful.Api(app)
+    api.add_resource(EventHistory, "/events", resource_class_args=[history])
+    client = app.test_client()
+
+    # Register both sessions before the events arrive
+    for session in ["one", "two"]:
+        assert client.get(f"/events?session={session}").get_json()["history"] == []
+    events = [EventData((U32Type(i),), TimeType(2, 0, i, 0), template) for i in range(3)]
+    for event in events:
+        history.data_callback(event)
+
+    for session in ["one", "two"]:
+        response = client.get(f"/events?session={session}")
+        assert response.mimetype == "application/json"
+        body = response.get_json()
+        assert body["errors"] == []
+        assert [event["display_text"] for event in body["history"]] == ["Count 0", "Count 1", "Count 2"]
+        assert body["history"][1]["time"]["seconds"] == 1
+    assert all(getattr(event, JSON_CACHE_ATTRIBUTE) is not None for event in events)
+    # Cached text is served as-is
+    setattr(events[0], JSON_CACHE_ATTRIBUTE, '"cached"')
+    history.data_callback(events[0])
+    assert client.get("/events?session=one").get_json()["history"] == ["cached"]
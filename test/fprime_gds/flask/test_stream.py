@@ -0,0 +1,100 @@
+"""
+Tests the server-push streaming of histories
+"""
+import json
+
+import flask
+import flask_restful
+
+from fprime_gds.flask.stream import HistoryStream, StreamHub
+
+
+def parse_message(text):
+    """Parse one server-sent event into a dictionary of its fields"""
+    fields = {}
+    for line in text.strip().split("\n"):
+        key, _, value = line.partition(": ")
+        fields[key] = value
+    return fields
+
+
+def test_stream_batches_and_cursors():
+    """Test that subscriptions receive batched deltas with resumable cursors"""
+    hub = StreamHub(capacity=100)
+    events = hub.add_stream("events", lambda item: {"value": item})
+    hub.add_stream("channels")
+    for i in range(5):
+        events.data_callback(i)
+
+    # New subscribers start at the next item, known cursors resume
+    stream = hub.subscribe(["events", "channels"], {"events": 2}, json.JSONEncoder, 2, 0.0, 0.01)
+    assert next(stream).startswith("retry:")
+    message = parse_message(next(stream))
+    assert message["event"] == "events"
+    assert message["id"] == "events:4,channels:0"
+    assert json.loads(message["data"]) == {
+        "history": [{"value": 2}, {"value": 3}],
+        "dropped": 0,
+        "errors": [],
+        "cursor": 4,
+    }
+    message = parse_message(next(stream))
+    assert json.loads(message["data"])["history"] == [{"value": 4}]
+    assert next(stream) == ": heartbeat\n\n"
+    assert hub.subscribers == 1
+    stream.close()
+    assert hub.subscribers == 0
+    assert hub.parse_cursors(message["id"]) == {"events": 5, "channels": 0}
+
+
+def test_stream_drops_overwritten_items():
+    """Test that slow subscribers skip items overwritten in the stream and count them as dropped"""
+    hub = StreamHub(capacity=10)
+    events = hub.add_stream("events")
+    stream = hub.subscribe(["events"], {}, json.JSONEncoder, 100, 0.0, 0.01)
+    next(stream)
+    for i in range(25):
+        events.data_callback(i)
+    data = json.loads(parse_message(next(stream))["data"])
+    assert data["dropped"] == 15
+    assert data["history"] == list(range(15, 25))
+    assert data["cursor"] == 25
+    stream.close()
+
+
+def test_stream_process_errors_and_reset():
+    """Test that processing errors are reported and cursors from another server restart the stream"""
+    hub = StreamHub(capacity=10)
+    events = hub.add_stream("events", lambda item: 1 // item)
+    for i in range(3):
+        events.data_callback(i)
+    stream = hub.subscribe(["events"], {"events": 1000}, json.JSONEncoder, 100, 0.0, 0.01)
+    next(stream)
+    data = json.loads(parse_message(next(stream))["data"])
+    assert data["history"] == [1, 0]
+    assert len(data["errors"]) == 1
+    stream.close()
+
+
+def test_stream_endpoint():
+    """Test the streaming endpoint serves server-sent events"""
+    hub = StreamHub(capacity=10)
+    events = hub.add_stream("events")
+    hub.add_stream("channels")
+    app = flask.Flask(__name__)
+    api = flask_restful.Api(app)
+    api.add_resource(HistoryStream, "/stream", resource_class_args=[hub])
+    client = app.test_client()
+
+    assert client.get("/stream?streams=unknown").status_code == 400
+
+    events.data_callback(7)
+    response = client.get("/stream?streams=events&interval=0", headers={"Last-Event-ID": "events:0"})
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    chunks = response.response
+    assert next(chunks).startswith(b"retry:")
+    message = parse_message(next(chunks).decode())
+    assert message["id"] == "events:1"
+    assert json.loads(message["data"])["history"] == [7]
+    response.close()